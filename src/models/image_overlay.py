@@ -6,6 +6,8 @@ import bisect
 from dataclasses import dataclass, field
 from pathlib import Path
 
+from src.models.interval_tree import CenteredIntervalTree
+
 
 @dataclass(slots=True)
 class ImageOverlay:
@@ -58,27 +60,43 @@ class ImageOverlayTrack:
     overlays: list[ImageOverlay] = field(default_factory=list)
     locked: bool = False
     hidden: bool = False
+    # 변경 카운터 — 구간 인덱스를 (version, 리스트, 개수)가 바뀔 때만 재구축
+    version: int = field(default=0, compare=False, repr=False)
+    _index: tuple | None = field(default=None, init=False, compare=False, repr=False)
 
     def overlays_at(self, position_ms: int) -> list[ImageOverlay]:
-        """Return all overlays active at the given position.
+        """Return all overlays active at the given position (start <= position < end)."""
+        return [self.overlays[i] for i in self.indices_at(position_ms)]
 
-        이진 탐색으로 시작점 한정 후 선형 탐색 — start_ms > position_ms인 항목은 스킵.
-        """
+    def indices_at(self, position_ms: int) -> list[int]:
+        """Indices of overlays active at the given position, ascending. O(log n + k)."""
         if not self.overlays:
             return []
-        # position_ms보다 뒤에 시작하는 첫 인덱스
-        idx = bisect.bisect_right(self.overlays, position_ms, key=lambda o: o.start_ms)
-        # start_ms <= position_ms인 overlays[0:idx] 중 end_ms > position_ms인 것만
-        return [ov for ov in self.overlays[:idx] if ov.end_ms > position_ms]
+        return self._interval_tree().indices_at(position_ms)
+
+    def mark_modified(self) -> None:
+        """overlay의 시간을 직접 수정한 뒤 호출 — 다음 질의에서 인덱스를 재구축."""
+        self.version += 1
+
+    def _interval_tree(self) -> CenteredIntervalTree:
+        key = (self.version, id(self.overlays), len(self.overlays))
+        if self._index is None or self._index[0] != key:
+            tree = CenteredIntervalTree(
+                [o.start_ms for o in self.overlays], [o.end_ms for o in self.overlays],
+            )
+            self._index = (key, tree)
+        return self._index[1]
 
     def add_overlay(self, overlay: ImageOverlay) -> None:
         """Add an overlay and keep the list sorted by start time. bisect.insort O(n)."""
         bisect.insort(self.overlays, overlay, key=lambda o: o.start_ms)
+        self.version += 1
 
     def remove_overlay(self, index: int) -> None:
         """Remove the overlay at *index*."""
         if 0 <= index < len(self.overlays):
             self.overlays.pop(index)
+            self.version += 1
 
     def __len__(self) -> int:
         return len(self.overlays)
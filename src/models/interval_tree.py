@@ -0,0 +1,78 @@
+"""Centered interval tree for point queries (pure Python, no Qt dependency).
+
+정적 구간 집합 [start, end)에 대해 "시점 p에 활성인 항목" 질의를 O(log n + k)로 처리한다
+(CLRS Ch.14 / de Berg Ch.10.1). 각 노드는 중심점을 포함하는 구간을 시작 오름차순·끝 내림차순
+두 목록으로 보관하므로, 질의는 조건이 깨지는 지점에서 바로 멈춘다. 트랙이 바뀌면 새로 만든다.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+
+class _Node:
+    __slots__ = ("center", "by_start", "by_end", "left", "right")
+
+    def __init__(self, center: int, by_start: list, by_end: list,
+                 left: _Node | None, right: _Node | None) -> None:
+        self.center = center
+        self.by_start = by_start  # (start, index) 오름차순
+        self.by_end = by_end      # (end, index) 내림차순
+        self.left = left
+        self.right = right
+
+
+class CenteredIntervalTree:
+    """반열린 구간 [start, end) 목록의 인덱스를 보관. 길이 0 구간은 어떤 시점에도 활성이 아니다."""
+
+    __slots__ = ("_root", "_size")
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]) -> None:
+        items = [(s, e, i) for i, (s, e) in enumerate(zip(starts, ends)) if e > s]
+        self._size = len(starts)
+        self._root = self._build(items)
+
+    def __len__(self) -> int:
+        return self._size
+
+    @classmethod
+    def _build(cls, items: list) -> _Node | None:
+        if not items:
+            return None
+        # 중심: 시작점의 중앙값 — 그 시작점의 구간은 반드시 이 노드에 남고(end > start),
+        # 좌우 부분 트리는 각각 절반 이하가 되어 깊이가 O(log n)
+        starts = sorted(s for s, _, _ in items)
+        center = starts[len(starts) // 2]
+        left, right, here = [], [], []
+        for item in items:
+            if item[1] <= center:
+                left.append(item)
+            elif item[0] > center:
+                right.append(item)
+            else:
+                here.append(item)
+        by_start = sorted((s, i) for s, _, i in here)
+        by_end = sorted(((e, i) for _, e, i in here), reverse=True)
+        return _Node(center, by_start, by_end, cls._build(left), cls._build(right))
+
+    def indices_at(self, position: int) -> list[int]:
+        """start <= position < end 인 항목 인덱스 (오름차순)."""
+        result: list[int] = []
+        node = self._root
+        while node is not None:
+            if position < node.center:
+                # 노드 구간은 모두 center를 포함 → end > center > position. 시작만 확인
+                for s, i in node.by_start:
+                    if s > position:
+                        break
+                    result.append(i)
+                node = node.left
+            else:
+                # start <= center <= position. 끝만 확인
+                for e, i in node.by_end:
+                    if e <= position:
+                        break
+                    result.append(i)
+                node = node.right if position > node.center else None
+        result.sort()
+        return result
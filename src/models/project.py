@@ -6,7 +6,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 
 from src.models.image_overlay import ImageOverlayTrack
-from src.models.style import SubtitleStyle
+from src.models.style import StyleRegistry, SubtitleStyle
 from src.models.subtitle import SubtitleTrack
 from src.models.timeline_marker import TimelineMarker
 from src.models.video_clip import VideoClipTrack
@@ -29,6 +29,10 @@ class ProjectState:
     text_overlay_track: TextOverlayTrack = field(default_factory=TextOverlayTrack)
     bgm_tracks: list[AudioTrack] = field(default_factory=lambda: [AudioTrack()])
     markers: list[TimelineMarker] = field(default_factory=list)
+    # 세그먼트 스타일 인터닝 풀 (로드·스타일 편집 시 같은 값은 한 인스턴스 공유)
+    style_registry: StyleRegistry = field(default_factory=StyleRegistry, compare=False, repr=False)
+    # 미디어 경로 → 내용 지문 (저장 시점 기록, 옮겨진 파일을 다시 찾을 때 사용)
+    media_fingerprints: dict[str, str] = field(default_factory=dict, compare=False, repr=False)
 
     @property
     def video_clip_track(self) -> VideoClipTrack:
@@ -83,6 +87,32 @@ class ProjectState:
                     paths.add(Path(clip.source_path))
         return sorted(paths)
 
+    def all_media_paths(self) -> list[str]:
+        """Return every media file the project references (videos + overlay images)."""
+        paths = {str(p) for p in self.all_video_paths()}
+        paths.update(ov.image_path for ov in self.image_overlay_track.overlays if ov.image_path)
+        return sorted(paths)
+
+    def relink_media(self, mapping: dict[str, str]) -> int:
+        """Replace moved media paths (old → new). Returns the number of references changed."""
+        if not mapping:
+            return 0
+        changed = 0
+        if self.video_path is not None and str(self.video_path) in mapping:
+            self.video_path = Path(mapping[str(self.video_path)])
+            changed += 1
+        for vt in self.video_tracks:
+            for clip in vt:
+                if clip.source_path in mapping:
+                    clip.source_path = mapping[clip.source_path]
+                    changed += 1
+        for ov in self.image_overlay_track.overlays:
+            if ov.image_path in mapping:
+                ov.image_path = mapping[ov.image_path]
+                changed += 1
+        self.media_fingerprints = {mapping.get(p, p): fp for p, fp in self.media_fingerprints.items()}
+        return changed
+
     def insert_marker(self, marker: TimelineMarker) -> None:
         """시간 순서를 유지하며 마커를 삽입한다."""
         import bisect
@@ -99,3 +129,5 @@ class ProjectState:
         self.text_overlay_track = TextOverlayTrack()
         self.bgm_tracks = [AudioTrack()]
         self.markers = []
+        self.style_registry = StyleRegistry()
+        self.media_fingerprints = {}
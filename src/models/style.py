@@ -38,3 +38,34 @@ class SubtitleStyle:
             custom_x=self.custom_x,
             custom_y=self.custom_y,
         )
+
+    def key(self) -> tuple:
+        """값 키 — 같은 값의 스타일은 같은 키 (인터닝·ASS 스타일 이름 매핑용)."""
+        return (
+            self.font_family, self.font_size, self.font_bold, self.font_italic,
+            self.font_color, self.outline_color, self.outline_width, self.bg_color,
+            self.position, self.margin_bottom, self.custom_x, self.custom_y,
+        )
+
+
+class StyleRegistry:
+    """세그먼트 스타일 flyweight 풀 — 같은 값의 스타일은 한 인스턴스를 공유한다.
+
+    인터닝된 스타일은 불변으로 다룬다: 바꿀 때는 copy()로 새 스타일을 만들어 교체한다
+    (StyleDialog·EditStyleCommand가 그렇게 동작). 제자리에서 고치는 project.default_style은
+    인터닝하지 않는다.
+    """
+
+    __slots__ = ("_by_key",)
+
+    def __init__(self) -> None:
+        self._by_key: dict[tuple, SubtitleStyle] = {}
+
+    def intern(self, style: SubtitleStyle | None) -> SubtitleStyle | None:
+        """style과 값이 같은 공유 인스턴스 (처음 보는 값이면 style 자신을 등록)."""
+        if style is None:
+            return None
+        return self._by_key.setdefault(style.key(), style)
+
+    def __len__(self) -> int:
+        return len(self._by_key)
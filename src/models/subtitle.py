@@ -5,7 +5,7 @@ from __future__ import annotations
 import bisect
 import textwrap
 from dataclasses import dataclass, field
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 if TYPE_CHECKING:
     from src.models.style import SubtitleStyle
@@ -44,6 +44,35 @@ class SubtitleTrack:
     locked: bool = False
     muted: bool = False
     hidden: bool = False
+    # 변경 카운터 — 재생 커서 등 파생 인덱스를 (version, 리스트, 개수)가 바뀔 때만 재구축
+    version: int = field(default=0, compare=False, repr=False)
+    # 지연 로드 — segments 슬롯을 비워 두고 처음 접근할 때 호출 (defer_segments)
+    _segment_loader: Callable[[], list[SubtitleSegment]] | None = field(
+        default=None, init=False, compare=False, repr=False,
+    )
+
+    def mark_modified(self) -> None:
+        """세그먼트 시간을 직접 수정한 뒤 호출 — 파생 인덱스를 무효화."""
+        self.version += 1
+
+    def defer_segments(self, loader: Callable[[], list[SubtitleSegment]]) -> None:
+        """segments를 처음 접근할 때 loader()로 만든다 (큰 트랙은 필요할 때만 객체화)."""
+        self._segment_loader = loader
+        del self.segments
+
+    @property
+    def segments_loaded(self) -> bool:
+        return self._segment_loader is None
+
+    def __getattr__(self, name: str):
+        # 비워 둔 segments 슬롯에 처음 접근할 때만 호출된다 — 이후에는 일반 속성 접근
+        if name == "segments":
+            loader = self._segment_loader
+            if loader is not None:
+                self._segment_loader = None
+                self.segments = loader()
+                return self.segments
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
 
     def segment_at(self, position_ms: int) -> SubtitleSegment | None:
         """Return the segment active at the given position, or None.
@@ -66,9 +95,11 @@ class SubtitleTrack:
         bisect.insort로 O(n) 삽입 (전체 정렬 O(n log n) 대비 개선).
         """
         bisect.insort(self.segments, segment, key=lambda s: s.start_ms)
+        self.version += 1
 
     def clear(self) -> None:
         self.segments.clear()
+        self.version += 1
 
     def __len__(self) -> int:
         return len(self.segments)
@@ -83,6 +114,7 @@ class SubtitleTrack:
         """Remove the segment at *index*."""
         if 0 <= index < len(self.segments):
             self.segments.pop(index)
+            self.version += 1
 
     def update_segment_text(self, index: int, text: str) -> None:
         """Change the text of the segment at *index*."""
@@ -99,14 +131,13 @@ class SubtitleTrack:
             seg.start_ms = start_ms
             seg.end_ms = end_ms
             bisect.insort(self.segments, seg, key=lambda s: s.start_ms)
+            self.version += 1
 
     def find_overlapping_pairs(self) -> list[tuple[int, int]]:
-        """연속 세그먼트 중 겹치는 쌍의 인덱스 (0-based) 반환."""
-        return [
-            (i, i + 1)
-            for i in range(len(self.segments) - 1)
-            if self.segments[i].end_ms > self.segments[i + 1].start_ms
-        ]
+        """연속 세그먼트 중 겹치는 쌍의 인덱스 (0-based) 반환 — 열 단위 비교 (SubtitleColumns)."""
+        from src.utils.subtitle_columns import SubtitleColumns  # 순환 import 방지
+
+        return [(i, i + 1) for i in SubtitleColumns(self.segments).overlapping_pairs().tolist()]
 
     def wrap_all_texts(self, max_chars: int) -> list[tuple[int, str, str]]:
         """(index, old_text, new_text) 변경 목록 반환."""
@@ -6,6 +6,8 @@ import bisect
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING
 
+from src.models.interval_tree import CenteredIntervalTree
+
 if TYPE_CHECKING:
     from src.models.style import SubtitleStyle
 
@@ -72,25 +74,43 @@ class TextOverlayTrack:
     overlays: list[TextOverlay] = field(default_factory=list)
     locked: bool = False
     hidden: bool = False
+    # 변경 카운터 — 구간 인덱스를 (version, 리스트, 개수)가 바뀔 때만 재구축
+    version: int = field(default=0, compare=False, repr=False)
+    _index: tuple | None = field(default=None, init=False, compare=False, repr=False)
 
     def overlays_at(self, position_ms: int) -> list[TextOverlay]:
-        """Return all text overlays active at the given position.
+        """Return all text overlays active at the given position (start <= position < end)."""
+        return [self.overlays[i] for i in self.indices_at(position_ms)]
 
-        이진 탐색으로 시작점 한정 후 선형 탐색.
-        """
+    def indices_at(self, position_ms: int) -> list[int]:
+        """Indices of text overlays active at the given position, ascending. O(log n + k)."""
         if not self.overlays:
             return []
-        idx = bisect.bisect_right(self.overlays, position_ms, key=lambda o: o.start_ms)
-        return [ov for ov in self.overlays[:idx] if ov.end_ms > position_ms]
+        return self._interval_tree().indices_at(position_ms)
+
+    def mark_modified(self) -> None:
+        """overlay의 시간을 직접 수정한 뒤 호출 — 다음 질의에서 인덱스를 재구축."""
+        self.version += 1
+
+    def _interval_tree(self) -> CenteredIntervalTree:
+        key = (self.version, id(self.overlays), len(self.overlays))
+        if self._index is None or self._index[0] != key:
+            tree = CenteredIntervalTree(
+                [o.start_ms for o in self.overlays], [o.end_ms for o in self.overlays],
+            )
+            self._index = (key, tree)
+        return self._index[1]
 
     def add_overlay(self, overlay: TextOverlay) -> None:
         """Add a text overlay and keep the list sorted by start time. bisect.insort O(n)."""
         bisect.insort(self.overlays, overlay, key=lambda o: o.start_ms)
+        self.version += 1
 
     def remove_overlay(self, index: int) -> None:
         """Remove the text overlay at *index*."""
         if 0 <= index < len(self.overlays):
             self.overlays.pop(index)
+            self.version += 1
 
     def __len__(self) -> int:
         return len(self.overlays)
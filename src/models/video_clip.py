@@ -9,6 +9,16 @@ from dataclasses import dataclass, field
 # Distinct from None, which means "only clips with source_path=None (primary video)".
 _NO_SOURCE_FILTER = object()
 
+# 타임라인 길이에 영향을 주는 속성이 바뀔 때마다 증가하는 전역 카운터.
+# 클립은 소속 트랙을 모르므로(트랙 간 이동·복제) 트랙의 접두사 합 캐시는 이 값으로 무효화 여부를 판단.
+_timing_epoch = 0
+_CLIP_TIMING_FIELDS = frozenset({"source_in_ms", "source_out_ms", "speed", "transition_out"})
+
+
+def _bump_timing_epoch() -> None:
+    global _timing_epoch
+    _timing_epoch += 1
+
 
 @dataclass(slots=True)
 class TransitionInfo:
@@ -17,6 +27,11 @@ class TransitionInfo:
     type: str = "fade"  # xfade types: fade, wipeleft, wiperight, etc.
     duration_ms: int = 500
 
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name == "duration_ms":
+            _bump_timing_epoch()
+
     def to_dict(self) -> dict:
         return {"type": self.type, "duration_ms": self.duration_ms}
 
@@ -65,6 +80,11 @@ class VideoClip:
     transition_out: TransitionInfo | None = None  # Effect transitioning into the NEXT clip
     color_label: str = "none"  # 컬러 레이블: none/red/orange/yellow/green/blue/purple/pink
 
+    def __setattr__(self, name: str, value) -> None:
+        object.__setattr__(self, name, value)
+        if name in _CLIP_TIMING_FIELDS:
+            _bump_timing_epoch()
+
     def get_volume_at(self, offset_ms: int) -> float:
         """Calculate the interpolated volume at a given offset within the clip.
 
@@ -227,6 +247,76 @@ class VideoClip:
         )
 
 
+def _mutated(method):
+    def wrapper(self, *args, **kwargs):
+        self.version += 1
+        return method(self, *args, **kwargs)
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+class ClipList(list):
+    """변경 시 version이 증가하는 클립 목록 — 삽입·삭제·재배치를 접두사 합 캐시가 감지."""
+
+    version = 0  # 인스턴스 값은 첫 변경 때 생긴다 (pickle 복원 시 항목이 상태보다 먼저 들어옴)
+
+    __setitem__ = _mutated(list.__setitem__)
+    __delitem__ = _mutated(list.__delitem__)
+    __iadd__ = _mutated(list.__iadd__)
+    __imul__ = _mutated(list.__imul__)
+    append = _mutated(list.append)
+    extend = _mutated(list.extend)
+    insert = _mutated(list.insert)
+    pop = _mutated(list.pop)
+    remove = _mutated(list.remove)
+    clear = _mutated(list.clear)
+    sort = _mutated(list.sort)
+    reverse = _mutated(list.reverse)
+
+
+class _SourceIndex:
+    """한 소스의 클립을 source_in_ms 오름차순으로 정렬한 정적 인덱스.
+
+    같은 소스 구간을 여러 클립이 재사용할 수 있으므로(겹침 허용) 끝 시각의 누적 최댓값으로
+    후보 범위를 이진 탐색하고, 그중 타임라인 순서가 가장 빠른 클립을 고른다 — 보통 O(log n).
+    """
+
+    __slots__ = ("ins", "outs", "order", "max_out", "suffix_min", "last")
+
+    def __init__(self, clips: list[VideoClip], indices: list[int]) -> None:
+        self.order = sorted(indices, key=lambda i: clips[i].source_in_ms)
+        self.ins = [clips[i].source_in_ms for i in self.order]
+        self.outs = [clips[i].source_out_ms for i in self.order]
+        self.max_out: list[int] = []
+        running = None
+        for out in self.outs:
+            running = out if running is None or out > running else running
+            self.max_out.append(running)
+        # suffix_min[k] = order[k:] 중 가장 작은 클립 인덱스 (next_clip_source_in용)
+        self.suffix_min = list(self.order)
+        for k in range(len(self.order) - 2, -1, -1):
+            self.suffix_min[k] = min(self.suffix_min[k], self.suffix_min[k + 1])
+        self.last = max(indices) if indices else None
+
+    def first_containing(self, source_ms: int, tolerance_ms: int = 0) -> int | None:
+        """in - tol <= source_ms < out + tol 인 클립 중 타임라인 순서가 가장 빠른 인덱스."""
+        hi = bisect.bisect_right(self.ins, source_ms + tolerance_ms)
+        lo = bisect.bisect_right(self.max_out, source_ms - tolerance_ms, hi=hi)
+        best = None
+        for k in range(lo, hi):
+            if self.outs[k] + tolerance_ms > source_ms:
+                i = self.order[k]
+                if best is None or i < best:
+                    best = i
+        return best
+
+    def first_after(self, source_ms: int) -> int | None:
+        """source_in_ms > source_ms 인 클립 중 타임라인 순서가 가장 빠른 인덱스."""
+        k = bisect.bisect_right(self.ins, source_ms)
+        return self.suffix_min[k] if k < len(self.order) else None
+
+
 @dataclass(slots=True)
 class VideoClipTrack:
     """Ordered collection of video clips defining the output timeline.
@@ -237,9 +327,10 @@ class VideoClipTrack:
 
     내부적으로 접두사 합(prefix sum) 캐시를 유지하여
     clip_at_timeline(), clip_timeline_start() 등을 O(log n)에 수행.
+    캐시는 (track.version, 목록 version, 클립 타이밍 전역 카운터)가 바뀔 때만 재구축한다.
     """
 
-    clips: list[VideoClip] = field(default_factory=list)
+    clips: list[VideoClip] = field(default_factory=ClipList)
     locked: bool = False
     muted: bool = False
     hidden: bool = False
@@ -248,16 +339,36 @@ class VideoClipTrack:
     chroma_color: str = "#00FF00"    # 크로마키 키 컬러 (hex)
     chroma_similarity: float = 0.3   # 0.01 – 1.0
     chroma_blend: float = 0.1        # 0.0 – 1.0
+    # 변경 카운터 — 목록/클립 변경은 자동 감지되므로 그 밖의 경우에만 mark_modified()
+    version: int = field(default=0, compare=False, repr=False)
+    _prefix_cache: tuple | None = field(default=None, init=False, compare=False, repr=False)
+    _source_cache: tuple | None = field(default=None, init=False, compare=False, repr=False)
+
+    def __setattr__(self, name: str, value) -> None:
+        if name == "clips" and not isinstance(value, ClipList):
+            value = ClipList(value)
+        object.__setattr__(self, name, value)
+
+    def mark_modified(self) -> None:
+        """접두사 합 캐시를 강제로 무효화."""
+        self.version += 1
+
+    def _cache_key(self) -> tuple:
+        clips = self.clips
+        return (self.version, id(clips), clips.version, len(clips), _timing_epoch)
 
     def _build_prefix(self) -> list[int]:
-        """접두사 합 배열을 구축한다. O(n).
+        """접두사 합 배열 (캐시). 무효화됐을 때만 O(n) 재구축, 그 외 O(1).
 
         _prefix[i] = clips[0..i-1]의 누적 timeline 시작 offset.
         _prefix[-1] = output_duration_ms.
 
-        외부에서 clip 속성(transition_out, speed 등)을 직접 수정할 수 있으므로
-        캐시 대신 매번 재계산. n이 작으므로(보통 <100) 비용 무시 가능.
+        반환 목록은 캐시 자체이므로 호출자가 수정하면 안 된다.
         """
+        key = self._cache_key()
+        cached = self._prefix_cache
+        if cached is not None and cached[0] == key:
+            return cached[1]
         offsets: list[int] = []
         offset = 0
         for i, clip in enumerate(self.clips):
@@ -266,8 +377,25 @@ class VideoClipTrack:
             if clip.transition_out and i < len(self.clips) - 1:
                 offset -= clip.transition_out.duration_ms
         offsets.append(offset)
+        self._prefix_cache = (key, offsets)
         return offsets
 
+    def _source_index(self, source_path=_NO_SOURCE_FILTER) -> _SourceIndex:
+        """소스별 인덱스 (캐시). 접두사 합과 같은 키로 무효화, 소스마다 처음 질의될 때 구축."""
+        key = self._cache_key()
+        if self._source_cache is None or self._source_cache[0] != key:
+            self._source_cache = (key, {})
+        by_source = self._source_cache[1]
+        index = by_source.get(source_path)
+        if index is None:
+            clips = self.clips
+            if source_path is _NO_SOURCE_FILTER:
+                indices = list(range(len(clips)))
+            else:
+                indices = [i for i, c in enumerate(clips) if c.source_path == source_path]
+            index = by_source[source_path] = _SourceIndex(clips, indices)
+        return index
+
     @classmethod
     def from_full_video(cls, duration_ms: int, source_path: str | None = None) -> VideoClipTrack:
         """Create a track with one clip spanning the full video."""
@@ -305,7 +433,7 @@ class VideoClipTrack:
     def source_to_timeline(self, source_ms: int, source_path=_NO_SOURCE_FILTER) -> int | None:
         """Convert source-video position to output-timeline position.
 
-        접두사 합 캐시를 사용하여 offset 재계산 방지.
+        소스별 인덱스 + 접두사 합 캐시로 O(log n).
         Returns timeline position within the first clip containing source_ms,
         or None if source_ms is not in any clip (deleted region).
 
@@ -315,20 +443,14 @@ class VideoClipTrack:
         - ``"path.mp4"``: only clips with that exact source_path.
         """
         prefix = self._build_prefix()
-        last_match_clip: VideoClip | None = None
-        last_match_offset: int = 0
-        for i, clip in enumerate(self.clips):
-            if source_path is not _NO_SOURCE_FILTER and clip.source_path != source_path:
-                continue
-            offset = prefix[i]
-            if clip.source_in_ms <= source_ms < clip.source_out_ms:
-                local_source = source_ms - clip.source_in_ms
-                return offset + int(local_source / clip.speed)
-            last_match_clip = clip
-            last_match_offset = offset
+        index = self._source_index(source_path)
+        i = index.first_containing(source_ms)
+        if i is not None:
+            clip = self.clips[i]
+            return prefix[i] + int((source_ms - clip.source_in_ms) / clip.speed)
         # 마지막 매칭 클립의 끝과 정확히 일치
-        if last_match_clip is not None and source_ms == last_match_clip.source_out_ms:
-            return last_match_offset + last_match_clip.duration_ms
+        if index.last is not None and source_ms == self.clips[index.last].source_out_ms:
+            return prefix[index.last] + self.clips[index.last].duration_ms
         # 전체 클립 끝 Fallback
         if source_path is _NO_SOURCE_FILTER and self.clips and source_ms == self.clips[-1].source_out_ms:
             return prefix[-1]
@@ -364,15 +486,24 @@ class VideoClipTrack:
         """Return list of clip boundary timestamps (ms): starts + final end. O(1) 캐시."""
         return list(self._build_prefix())
 
-    def next_clip_source_in(self, source_ms: int) -> int | None:
+    def clip_index_at_source(
+        self, source_ms: int, source_path=_NO_SOURCE_FILTER, tolerance_ms: int = 0,
+    ) -> int | None:
+        """Index of the first clip (timeline order) whose source range contains source_ms.
+
+        범위는 양쪽으로 tolerance_ms만큼 넓혀 [in - tol, out + tol). *source_path*는
+        source_to_timeline과 같은 규칙으로 거른다. 소스별 인덱스로 O(log n).
+        """
+        return self._source_index(source_path).first_containing(source_ms, tolerance_ms)
+
+    def next_clip_source_in(self, source_ms: int, source_path=_NO_SOURCE_FILTER) -> int | None:
         """Find the source_in_ms of the next clip after source_ms.
 
         Used for auto-skipping deleted regions during playback.
+        타임라인 순서상 첫 번째로 source_in_ms > source_ms 인 클립 — 소스별 인덱스로 O(log n).
         """
-        for clip in self.clips:
-            if clip.source_in_ms > source_ms:
-                return clip.source_in_ms
-        return None
+        i = self._source_index(source_path).first_after(source_ms)
+        return self.clips[i].source_in_ms if i is not None else None
 
     # -------------------------------------------------------- Editing
 
@@ -3,10 +3,10 @@ Audio merger service using FFmpeg for concatenating and mixing audio tracks.
 """
 from pathlib import Path
 from typing import List
-import json
 import tempfile
 
 from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
+from src.services.media_metadata import MediaProbeError, probe_media
 
 
 class AudioMerger:
@@ -30,29 +30,10 @@ class AudioMerger:
         if not audio_path.exists():
             raise FileNotFoundError(f"Audio file not found: {audio_path}")
 
-        runner = get_ffmpeg_runner()
-        if not runner.ffprobe_path:
-            raise Exception("FFprobe not found")
-
-        try:
-            result = runner.run_ffprobe(
-                [
-                    "-v", "quiet",
-                    "-print_format", "json",
-                    "-show_format",
-                    str(audio_path),
-                ],
-                check=True,
-            )
-            data = json.loads(result.stdout)
-            duration = float(data["format"]["duration"])
-            return duration
-        except Exception as e:
-            if "FFprobe" in str(e) or "ffprobe" in str(e).lower():
-                raise Exception(f"FFprobe failed: {e}") from e
-            raise
-        except (KeyError, ValueError, json.JSONDecodeError) as e:
-            raise Exception(f"Failed to parse FFprobe output: {e}")
+        meta = probe_media(audio_path)  # MediaProbeError if FFprobe is missing or fails
+        if meta.duration_s <= 0:
+            raise MediaProbeError("Failed to parse FFprobe output: no duration")
+        return meta.duration_s
 
     @staticmethod
     def merge_audio_files(
@@ -175,22 +156,8 @@ class AudioMerger:
         Returns:
             True if the file has an audio stream, False otherwise
         """
-        runner = get_ffmpeg_runner()
-        if not runner.ffprobe_path:
-            return False
-
         try:
-            result = runner.run_ffprobe(
-                [
-                    "-v", "quiet",
-                    "-select_streams", "a:0",
-                    "-show_entries", "stream=codec_type",
-                    "-of", "csv=p=0",
-                    str(file_path),
-                ],
-                check=True,
-            )
-            return result.stdout.strip() == "audio"
+            return probe_media(file_path).has_audio
         except Exception:
             return False
 
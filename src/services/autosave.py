@@ -2,14 +2,68 @@
 
 import json
 import os
+import re
 import time
+import weakref
 from pathlib import Path
+from glob import escape as glob_escape
 from typing import Callable, Dict, List, Optional
 
-from PySide6.QtCore import QObject, QSettings, QTimer, Signal, Slot
+from PySide6.QtCore import QObject, QRunnable, QSettings, QThreadPool, QTimer, Signal, Slot
 
 from src.models.project import ProjectState
-from src.services.project_io import save_project, load_project
+from src.services.edit_journal import EditJournal, batch_ops, read_journal, replay
+from src.services.project_io import (
+    load_project,
+    media_sources,
+    media_table,
+    project_from_dict,
+    project_to_dict,
+    read_project_data,
+    write_project_data,
+)
+
+_SNAPSHOT_SUFFIX = ".fmm.json"
+_JOURNAL_SUFFIX = ".fmm.journal"
+_STAMPED_NAME = re.compile(r"^(.*?)(\d+)\.fmm\.(json|journal)$")
+
+# Journal compaction: a new full snapshot once the journal grows past either limit
+_JOURNAL_COMPACT_ENTRIES = 500
+_JOURNAL_COMPACT_BYTES = 4 * 1024 * 1024
+
+
+class _SaveSignals(QObject):
+    """QRunnable has no signals; results are delivered through this QObject."""
+    finished = Signal(object, int, float, str)  # path, generation, latency_ms, error
+
+
+class _SaveWorker(QRunnable):
+    """Serializes, compresses and atomically writes a project snapshot off the main thread."""
+
+    def __init__(self, data: dict, media: tuple, path: Path, generation: int, started: float) -> None:
+        super().__init__()
+        self.signals = _SaveSignals()
+        self._data = data
+        self._media = media
+        self._path = path
+        self._generation = generation
+        self._started = started
+
+    def run(self) -> None:
+        error = ""
+        try:
+            _write_autosave(self._data, self._media, self._path)
+        except Exception as e:  # disk full, permissions, ...
+            error = str(e) or type(e).__name__
+        latency_ms = (time.perf_counter() - self._started) * 1000
+        self.signals.finished.emit(self._path, self._generation, latency_ms, error)
+
+
+def _write_autosave(data: dict, media: tuple, path: Path) -> None:
+    # 미디어 지문은 파일을 stat(처음 보는 파일은 해시)하므로 여기서 채운다
+    data["media"] = media_table(*media)
+    # Recovery files favour speed over size: compact JSON, light compression
+    write_project_data(data, path, indent=None, compresslevel=1)
 
 
 class AutoSaveManager(QObject):
@@ -20,10 +74,27 @@ class AutoSaveManager(QObject):
     - Automatic saving after edits (default: 5 seconds idle)
     - Crash recovery from autosave files
     - Recent projects list management
+
+    Saves only happen when the edit generation (bumped by notify_edit and by
+    the attached undo stack) is newer than the last saved one. The project is
+    snapshotted to plain dicts on the main thread; media fingerprinting, JSON
+    encoding, gzip and the atomic write run on the global QThreadPool. Each
+    project keeps at most ``max_recovery_files`` autosave files.
+
+    Journal mode (``autosave/journal``, default on): every command the undo
+    stack executes is appended to ``<snapshot>.fmm.journal`` as compact ops
+    (see edit_journal), so such edits are saved at O(edit) cost right away.
+    Full snapshots are only taken when the journal outgrows its limits or for
+    edits the journal cannot express (direct model changes reported through
+    notify_edit, project-wide commands). Journaled commands are tracked one by
+    one, so a controller's notify_edit(command) for one of them is not a new
+    edit. Recovery replays the newest snapshot plus every later journal of the
+    same project.
     """
 
     recovery_available = Signal(Path)  # Emitted when a recoverable file is found
     save_completed = Signal(Path)      # Emitted when autosave completes
+    save_failed = Signal(str)          # Emitted with the error message when a write fails
 
     def __init__(self, parent: QObject = None):
         super().__init__(parent)
@@ -38,13 +109,26 @@ class AutoSaveManager(QObject):
         self._autosave_interval = self._settings.value("autosave/interval", 30, int)  # seconds
         self._idle_timeout = self._settings.value("autosave/idle_timeout", 5, int)    # seconds
         self._max_recent = self._settings.value("recent/max_files", 10, int)
+        self._max_recovery_files = max(1, self._settings.value("autosave/max_files", 5, int))
+        self._journal_enabled = self._settings.value("autosave/journal", True, bool)
 
         # State
         self._project: Optional[ProjectState] = None
-        self._edited = False
+        self._generation = 0        # bumped on every edit
+        self._saved_generation = 0  # generation of the newest completed save
+        self._in_flight = False     # a worker is writing; at most one at a time
         self._last_save_time = 0
+        self._last_latency_ms = 0.0
+        self._last_stamp = 0
         self._active_file_path: Optional[Path] = None
 
+        # Journal state
+        self._journal: Optional[EditJournal] = None
+        self._stack_ref = None
+        self._stack_index = 0
+        self._stack_count = 0
+        self._journaled = weakref.WeakSet()  # commands whose ops are in the current journal
+
         # Timers
         self._timer = QTimer(self)
         self._timer.timeout.connect(self._on_timer)
@@ -54,19 +138,54 @@ class AutoSaveManager(QObject):
         self._idle_timer.setSingleShot(True)
         self._idle_timer.timeout.connect(self._on_idle_timeout)
 
-    def set_project(self, project: ProjectState) -> None:
-        """Set the current project to be autosaved."""
+    def set_project(self, project: Optional[ProjectState]) -> None:
+        """Set the current project to be autosaved (treated as saved until edited; None pauses)."""
         self._project = project
+        self._saved_generation = self._generation
+        self._close_journal()  # the next journaled edit starts from a fresh snapshot
+
+    @property
+    def is_dirty(self) -> bool:
+        """True when edits happened since the last completed autosave."""
+        return self._generation != self._saved_generation
+
+    @property
+    def last_save_latency_ms(self) -> float:
+        """Snapshot-to-file time of the last autosave in milliseconds."""
+        return self._last_latency_ms
 
     def set_active_file(self, path: Optional[Path]) -> None:
         """Set the current project file path."""
         if path:
+            if path.stem != (self._active_file_path.stem if self._active_file_path else None):
+                self._close_journal()  # autosave file names follow the project name
             self._active_file_path = path
             self._add_recent_file(path)
 
-    def notify_edit(self) -> None:
-        """Called whenever the project is edited."""
-        self._edited = True
+    def attach_undo_stack(self, stack) -> None:
+        """Count (and in journal mode, journal) every command the stack executes."""
+        self._stack_ref = weakref.ref(stack)
+        self._stack_index = stack.index()
+        self._stack_count = stack.count()
+        stack.indexChanged.connect(self._on_stack_index_changed)
+
+    @property
+    def journal_entries(self) -> int:
+        """Entries in the current journal (0 when none is open)."""
+        return self._journal.entries if self._journal else 0
+
+    def notify_edit(self, command=None) -> None:
+        """Called whenever the project is edited.
+
+        Controllers that just pushed *command* pass it: if the stack already
+        journaled that command, only the idle timer restarts. Anything else
+        (direct model changes, unjournaled commands) needs a full snapshot.
+        """
+        if command is None or command not in self._journaled:
+            self._generation += 1
+        self._restart_idle_timer()
+
+    def _restart_idle_timer(self) -> None:
         try:
             self._idle_timer.start(self._idle_timeout * 1000)
         except RuntimeError:
@@ -74,9 +193,18 @@ class AutoSaveManager(QObject):
             pass
 
     def save_now(self) -> None:
-        """Force an immediate autosave."""
-        if self._project:
-            self._do_autosave()
+        """Synchronously autosave pending edits (e.g. on close)."""
+        if not self._project or not self.is_dirty:
+            return
+        started = time.perf_counter()
+        path, data, media = self._take_snapshot()
+        generation = self._generation
+        error = ""
+        try:
+            _write_autosave(data, media, path)
+        except Exception as e:
+            error = str(e) or type(e).__name__
+        self._record_save(path, generation, (time.perf_counter() - started) * 1000, error)
 
     def set_autosave_interval(self, seconds: int) -> None:
         """Change the autosave interval."""
@@ -95,7 +223,7 @@ class AutoSaveManager(QObject):
         Returns:
             Path to the most recent recovery file, or None if none exist.
         """
-        recovery_files = list(self._autosave_dir.glob("*.fmm.json"))
+        recovery_files = [p for p in self._autosave_dir.glob("*.fmm.json") if p.is_file()]
         if not recovery_files:
             return None
 
@@ -104,16 +232,31 @@ class AutoSaveManager(QObject):
         return recovery_files[0]
 
     def load_recovery(self, path: Path) -> ProjectState:
-        """Load a project from a recovery file."""
-        return load_project(path)
+        """Load a project from a recovery file, replaying the journals written after it."""
+        match = _STAMPED_NAME.match(path.name)
+        journals = []
+        if match:
+            prefix, stamp = match.group(1), int(match.group(2))
+            journals = sorted(
+                (int(m.group(2)), p) for p in path.parent.glob(f"{glob_escape(prefix)}*{_JOURNAL_SUFFIX}")
+                if (m := _STAMPED_NAME.match(p.name)) and m.group(1) == prefix and int(m.group(2)) >= stamp
+            )
+        if not journals:
+            return load_project(path)
+        data = read_project_data(path)
+        for _, journal in journals:
+            replay(data, read_journal(journal))
+        return project_from_dict(data)
 
     def cleanup_recovery_files(self) -> None:
         """Clean up autosave files after successful recovery or discard."""
-        for path in self._autosave_dir.glob("*.fmm.json"):
-            try:
-                path.unlink()
-            except (PermissionError, OSError):
-                pass  # Ignore errors during cleanup
+        self._close_journal()
+        for pattern in ("*.fmm.json", "*.fmm.journal"):
+            for path in self._autosave_dir.glob(pattern):
+                try:
+                    path.unlink()
+                except (PermissionError, OSError):
+                    pass  # Ignore errors during cleanup
 
     def get_recent_files(self) -> List[Path]:
         """Get the list of recent project files."""
@@ -144,32 +287,149 @@ class AutoSaveManager(QObject):
         # Save
         self._settings.setValue("recent/files", [str(p) for p in recent_files])
 
-    def _do_autosave(self) -> None:
-        """Perform the actual autosave."""
-        if not self._project:
-            return
-
-        # Use current project name if saved, or timestamp if unsaved
-        timestamp = int(time.time())
+    def _autosave_prefix(self) -> str:
         if self._active_file_path:
-            name = f"{self._active_file_path.stem}_autosave_{timestamp}.fmm.json"
-        else:
-            name = f"autosave_{timestamp}.fmm.json"
+            return f"{self._active_file_path.stem}_autosave_"
+        return "autosave_"
+
+    def _next_save_path(self) -> Path:
+        """Use current project name if saved, or timestamp if unsaved."""
+        # Strictly increasing stamps: journals are ordered by the stamp of their snapshot
+        self._last_stamp = max(int(time.time()), self._last_stamp + 1)
+        return self._autosave_dir / f"{self._autosave_prefix()}{self._last_stamp}{_SNAPSHOT_SUFFIX}"
+
+    def _stamped_files(self, suffix: str) -> list[tuple[int, Path]]:
+        prefix = self._autosave_prefix()
+        files = []
+        for path in self._autosave_dir.glob(f"{glob_escape(prefix)}*{suffix}"):
+            stamp = path.name[len(prefix):-len(suffix)]
+            if stamp.isdigit():  # "autosave_" must not match "<stem>_autosave_" files
+                files.append((int(stamp), path))
+        return sorted(files, reverse=True)
+
+    def _prune_recovery_files(self) -> None:
+        """Keep only the newest ``max_recovery_files`` autosaves of the current project.
+
+        Journals older than the oldest kept snapshot can no longer be replayed and go too.
+        """
+        snapshots = self._stamped_files(_SNAPSHOT_SUFFIX)
+        stale = [path for _, path in snapshots[self._max_recovery_files:]]
+        kept = snapshots[:self._max_recovery_files]
+        if kept:
+            oldest = kept[-1][0]
+            stale += [
+                path for stamp, path in self._stamped_files(_JOURNAL_SUFFIX)
+                if stamp < oldest and (self._journal is None or path != self._journal.path)
+            ]
+        for path in stale:
+            try:
+                path.unlink()
+            except OSError:
+                pass
 
-        save_path = self._autosave_dir / name
-        save_project(self._project, save_path)
-        self._last_save_time = timestamp
-        self._edited = False
-        self.save_completed.emit(save_path)
+    def _take_snapshot(self) -> tuple[Path, dict, tuple]:
+        """Capture the project as plain dicts and (journal mode) start its journal.
+
+        The dicts are built here on the main thread (the model must not change
+        underneath); only the media fingerprint table is left to the writer.
+        """
+        path = self._next_save_path()
+        data = project_to_dict(self._project, media=False)
+        media = media_sources(self._project)
+        if self._journal_enabled:
+            self._close_journal()
+            try:
+                self._journal = EditJournal(path.with_name(path.name[:-len(_SNAPSHOT_SUFFIX)] + _JOURNAL_SUFFIX))
+            except OSError as e:
+                self.save_failed.emit(str(e))
+        return path, data, media
+
+    def _close_journal(self) -> None:
+        self._journaled.clear()
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+
+    def _journal_needs_compaction(self) -> bool:
+        journal = self._journal
+        return journal is not None and (
+            journal.entries >= _JOURNAL_COMPACT_ENTRIES or journal.bytes >= _JOURNAL_COMPACT_BYTES
+        )
+
+    def _do_autosave(self) -> None:
+        """Snapshot the project and hand serialization to a worker thread."""
+        if not self._project or self._in_flight:
+            return
+        if not (self.is_dirty or self._journal_needs_compaction()):
+            return
+        started = time.perf_counter()
+        path, data, media = self._take_snapshot()
+        worker = _SaveWorker(data, media, path, self._generation, started)
+        worker.signals.finished.connect(self._on_save_finished)
+        self._in_flight = True
+        QThreadPool.globalInstance().start(worker)
+
+    @Slot(object, int, float, str)
+    def _on_save_finished(self, path: Path, generation: int, latency_ms: float, error: str) -> None:
+        self._in_flight = False
+        self._record_save(path, generation, latency_ms, error)
+
+    def _record_save(self, path: Path, generation: int, latency_ms: float, error: str) -> None:
+        if error:
+            self.save_failed.emit(error)
+            return
+        self._saved_generation = max(self._saved_generation, generation)
+        self._last_save_time = int(time.time())
+        self._last_latency_ms = latency_ms
+        self._prune_recovery_files()
+        self.save_completed.emit(path)
+
+    @Slot(int)
+    def _on_stack_index_changed(self, index: int) -> None:
+        """Undo stack executed commands (push/undo/redo): journal them or mark dirty."""
+        stack = self._stack_ref() if self._stack_ref else None
+        if stack is None:
+            return
+        try:
+            count = stack.count()
+        except RuntimeError:  # stack being destroyed
+            return
+        old_index, old_count = self._stack_index, self._stack_count
+        self._stack_index, self._stack_count = index, count
+        was_clean = not self.is_dirty
+        self._generation += 1
+        self._restart_idle_timer()
+        if not self._journal_enabled or self._project is None:
+            return
+        if not was_clean or self._journal is None:
+            return  # waiting for a snapshot; the journal would miss earlier edits
+
+        ops = None
+        # Push (redo side discarded) or plain undo/redo. clear(), merges, undo limits
+        # and removed obsolete commands change the stack in ways we cannot replay.
+        if index != old_index and (count == old_count or index == old_index + 1 == count):
+            if index > old_index:
+                executed = [(stack.command(i), False) for i in range(old_index, index)]
+            else:
+                executed = [(stack.command(i), True) for i in reversed(range(index, old_index))]
+            ops = batch_ops(self._project, executed)
+        if ops is None:
+            return
+        try:
+            self._journal.append(self._generation, ops)
+        except OSError as e:
+            self._close_journal()
+            self.save_failed.emit(str(e))
+            return
+        self._saved_generation = self._generation
+        self._journaled.update(command for command, _ in executed)
 
     @Slot()
     def _on_timer(self) -> None:
         """Called when the periodic timer fires."""
-        if self._project:
-            self._do_autosave()
+        self._do_autosave()
 
     @Slot()
     def _on_idle_timeout(self) -> None:
         """Called when the idle timer fires (edits, then no activity)."""
-        if self._edited and self._project:
-            self._do_autosave()
\ No newline at end of file
+        self._do_autosave()
@@ -0,0 +1,259 @@
+"""Append-only edit journal replayed onto the last autosave snapshot (no Qt dependency).
+
+전체 프로젝트 저장은 자막 하나를 옮겨도 프로젝트 크기만큼 든다. 저널은 undo 스택이 실행한
+명령마다 그 편집만 담은 작은 연산을 JSON 한 줄로 덧붙이고, 복구 시 마지막 스냅샷 dict 위에
+같은 순서로 재생한다. 연산은 모델 메서드를 그대로 흉내 내므로(예: retime = pop + insort)
+재생 결과가 편집 당시 목록과 같다.
+
+- 자주 쓰는 자막 항목 명령은 journal_ops(undone)로 논리 연산을 낸다 — O(edit).
+- 그 밖의 명령은 붙잡고 있는 트랙 전체를 기록한다 (트랙 단위 폴백).
+- 프로젝트 전체를 붙잡는 명령(ProjectState 참조)이나 알 수 없는 트랙은 None → 새 스냅샷 필요.
+
+줄 형식: {"g": 편집 세대, "ops": [{"sec": "sub:0", "op": "set", ...}, ...]}
+"""
+
+from __future__ import annotations
+
+import bisect
+import json
+from operator import itemgetter
+from pathlib import Path
+
+from src.models.image_overlay import ImageOverlayTrack
+from src.models.style import SubtitleStyle
+from src.models.subtitle import SubtitleSegment, SubtitleTrack
+from src.models.subtitle_animation import SubtitleAnimation
+from src.models.text_overlay import TextOverlayTrack
+from src.models.video_clip import VideoClipTrack
+from src.services.project_io import (
+    _animation_to_dict,
+    _segment_to_dict,
+    _style_to_dict,
+    overlay_track_to_dict,
+    subtitle_track_to_dict,
+    video_track_to_dict,
+)
+
+_TRACK_TYPES = (SubtitleTrack, VideoClipTrack, ImageOverlayTrack, TextOverlayTrack)
+_start_key = itemgetter("start_ms")
+
+
+# ---- 명령이 쓰는 연산 생성기 — (트랙, 연산) 쌍을 돌려준다 ----
+
+def _item_to_dict(item) -> dict:
+    return _segment_to_dict(item) if isinstance(item, SubtitleSegment) else item.to_dict()
+
+
+def _field_value(value):
+    if isinstance(value, SubtitleStyle):
+        return _style_to_dict(value)
+    if isinstance(value, SubtitleAnimation):
+        return _animation_to_dict(value)
+    return value
+
+
+def set_op(track, index: int, **fields) -> tuple[object, dict]:
+    """items[index]의 필드를 바꾼다 (None은 키 삭제 = 기본값)."""
+    return track, {"op": "set", "i": index, "f": {k: _field_value(v) for k, v in fields.items()}}
+
+
+def retime_op(track, index: int, start_ms: int, end_ms: int) -> tuple[object, dict]:
+    """update_segment_time과 같이 items[index]를 빼서 시간을 바꾸고 정렬 위치에 다시 넣는다."""
+    return track, {"op": "retime", "i": index, "s": start_ms, "e": end_ms}
+
+
+def insort_op(track, item) -> tuple[object, dict]:
+    return track, {"op": "insort", "d": _item_to_dict(item)}
+
+
+def pop_op(track, index: int) -> tuple[object, dict]:
+    return track, {"op": "pop", "i": index}
+
+
+def remove_op(track, item) -> tuple[object, dict]:
+    """내용이 같은 첫 항목을 뺀다 (같은 내용의 항목끼리는 구별할 필요가 없다)."""
+    return track, {"op": "remove", "d": _item_to_dict(item)}
+
+
+def insert_op(track, index: int, item, sort: bool = False) -> tuple[object, dict]:
+    return track, {"op": "insert", "i": index, "d": _item_to_dict(item), "sort": sort}
+
+
+# ---- 명령 → 저널 연산 ----
+
+def section_of(project, track) -> str | None:
+    """프로젝트 안에서 track의 위치 키 ("sub:0", "video:1", "image", "text")."""
+    for i, t in enumerate(project.subtitle_tracks):
+        if t is track:
+            return f"sub:{i}"
+    for i, t in enumerate(project.video_tracks):
+        if t is track:
+            return f"video:{i}"
+    if project.image_overlay_track is track:
+        return "image"
+    if project.text_overlay_track is track:
+        return "text"
+    return None
+
+
+def _section_to_dict(project, sec: str) -> dict:
+    kind, _, idx = sec.partition(":")
+    if kind == "sub":
+        return subtitle_track_to_dict(project.subtitle_tracks[int(idx)])
+    if kind == "video":
+        return video_track_to_dict(project.video_tracks[int(idx)])
+    if kind == "image":
+        return overlay_track_to_dict(project.image_overlay_track)
+    return overlay_track_to_dict(project.text_overlay_track)
+
+
+def _command_pairs(command, undone: bool) -> list[tuple[object, dict]] | None:
+    count = command.childCount() if hasattr(command, "childCount") else 0
+    if count:
+        # 매크로: redo는 자식 순서대로, undo는 역순으로 실행된다
+        children = [command.child(i) for i in range(count)]
+        pairs: list = []
+        for child in reversed(children) if undone else children:
+            child_pairs = _command_pairs(child, undone)
+            if child_pairs is None:
+                return None
+            pairs.extend(child_pairs)
+        return pairs
+    journal_ops = getattr(command, "journal_ops", None)
+    if journal_ops is not None:
+        return journal_ops(undone)
+    attrs = getattr(command, "__dict__", {})
+    if "_project" in attrs:
+        return None
+    tracks = [v for v in attrs.values() if isinstance(v, _TRACK_TYPES)]
+    if not tracks:
+        return None
+    return [(t, {"op": "track"}) for t in tracks]
+
+
+def batch_ops(project, executed: list[tuple[object, bool]]) -> list[dict] | None:
+    """실행된 (명령, undone) 목록의 저널 연산. 저널로 표현할 수 없으면 None.
+
+    트랙 전체 기록은 배치가 끝난 뒤 상태이므로, 같은 트랙의 논리 연산과 섞이면
+    그 트랙은 최종 상태 한 번만 기록한다.
+    """
+    pairs: list = []
+    for command, undone in executed:
+        if command is None:
+            return None
+        command_pairs = _command_pairs(command, undone)
+        if command_pairs is None:
+            return None
+        pairs.extend(command_pairs)
+
+    ops: list[dict] = []
+    whole: dict[str, None] = {}
+    for track, op in pairs:
+        sec = section_of(project, track)
+        if sec is None:
+            return None
+        if op["op"] == "track":
+            whole[sec] = None
+        else:
+            ops.append({"sec": sec, **op})
+    if whole:
+        ops = [op for op in ops if op["sec"] not in whole]
+        ops.extend({"sec": sec, "op": "track", "d": _section_to_dict(project, sec)} for sec in whole)
+    return ops
+
+
+# ---- 재생 ----
+
+def _locate(data: dict, sec: str) -> tuple[dict | list, object, str]:
+    """(부모 컨테이너, 키, 항목 목록 키)."""
+    kind, _, idx = sec.partition(":")
+    if kind == "sub":
+        return data["tracks"], int(idx), "segments"
+    if kind == "video":
+        return data["video_tracks"], int(idx), "items"
+    return data, "image_overlays" if kind == "image" else "text_overlays", "items"
+
+
+def _apply(data: dict, op: dict) -> None:
+    parent, key, items_key = _locate(data, op["sec"])
+    kind = op["op"]
+    if kind == "track":
+        parent[key] = op["d"]
+        return
+    items: list = parent[key][items_key]
+    i = op.get("i", 0)
+    if kind == "set":
+        if 0 <= i < len(items):
+            item = items[i]
+            for name, value in op["f"].items():
+                if value is None:
+                    item.pop(name, None)
+                else:
+                    item[name] = value
+    elif kind == "retime":
+        if 0 <= i < len(items):
+            item = items.pop(i)
+            item["start_ms"] = op["s"]
+            item["end_ms"] = op["e"]
+            bisect.insort(items, item, key=_start_key)
+    elif kind == "insort":
+        bisect.insort(items, op["d"], key=_start_key)
+    elif kind == "pop":
+        if 0 <= i < len(items):
+            items.pop(i)
+    elif kind == "remove":
+        for j, item in enumerate(items):
+            if item == op["d"]:
+                del items[j]
+                break
+    elif kind == "insert":
+        items.insert(i, op["d"])
+        if op.get("sort"):
+            items.sort(key=_start_key)
+    else:
+        raise ValueError(f"Unknown journal op: {kind}")
+
+
+def replay(data: dict, entries: list[dict]) -> dict:
+    """스냅샷 dict 위에 저널 항목을 순서대로 재생 (data를 직접 바꾸고 반환)."""
+    for entry in entries:
+        for op in entry["ops"]:
+            _apply(data, op)
+    if data.get("video_tracks"):
+        data["video_clips"] = data["video_tracks"][0]
+    return data
+
+
+# ---- 파일 ----
+
+class EditJournal:
+    """저널 파일 — 항목마다 한 줄을 덧붙이고 flush (프로세스가 죽어도 남는다)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.entries = 0
+        self.bytes = 0
+        self._file = open(path, "ab")
+
+    def append(self, generation: int, ops: list[dict]) -> None:
+        line = json.dumps({"g": generation, "ops": ops}, ensure_ascii=False, separators=(",", ":"))
+        raw = line.encode("utf-8") + b"\n"
+        self._file.write(raw)
+        self._file.flush()
+        self.entries += 1
+        self.bytes += len(raw)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+def read_journal(path: Path) -> list[dict]:
+    """저널 항목 목록. 쓰다 만 마지막 줄(충돌)은 버린다."""
+    entries = []
+    with open(path, "rb") as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                break
+    return entries
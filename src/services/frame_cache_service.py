@@ -12,6 +12,7 @@ from pathlib import Path
 from PySide6.QtGui import QImage
 from src.services.ffmpeg_logger import log_ffmpeg_command, log_ffmpeg_line
 from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
+from src.services.media_fingerprint import media_cache_key
 
 
 def _ms_from_path(path: Path) -> int:
@@ -64,13 +65,15 @@ class FrameCacheService:
         LRU eviction: 소스 디렉토리 수가 _MAX_SOURCE_DIRS를 초과하면
         가장 오래된 소스의 캐시를 삭제.
         """
-        h = hashlib.md5(source_path.encode()).hexdigest()[:12]
+        # 내용 지문으로 찾는다 — 옮긴 파일도 같은 캐시, 같은 경로라도 내용이 바뀌면 새 캐시
+        key = media_cache_key(source_path)
+        h = hashlib.md5(key.encode()).hexdigest()[:12]
         d = self.initialize() / h
         d.mkdir(exist_ok=True)
         # LRU 순서 갱신
-        if source_path in self._access_order:
-            self._access_order.remove(source_path)
-        self._access_order.append(source_path)
+        if key in self._access_order:
+            self._access_order.remove(key)
+        self._access_order.append(key)
         # Eviction
         while len(self._access_order) > self._MAX_SOURCE_DIRS:
             oldest = self._access_order.pop(0)
@@ -0,0 +1,176 @@
+"""Content fingerprints for media files — the shared key of every media cache.
+
+경로 해시로 캐시를 찾으면 프로젝트 폴더를 옮기는 순간 캐시가 모두 버려지고, 같은 경로의 파일이
+바뀌면 낡은 캐시가 그대로 쓰인다. 지문은 내용에서 만든다: 파일 크기 + 앞·가운데·끝 블록의
+blake2b. 계산 결과는 (장치, inode, 크기, mtime)으로 기억하므로 이미 본 파일은 stat 한 번이면
+된다 (이름을 바꾸거나 같은 볼륨 안에서 옮겨도 다시 읽지 않는다).
+
+지문 형식: "<크기 16진수>-<blake2b 20자>" — 크기가 앞에 있어 relink가 후보를 크기로 먼저 거른다.
+"""
+
+from __future__ import annotations
+
+import collections
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Callable, Iterable, Mapping
+
+_BLOCK = 64 * 1024
+_DIGEST_SIZE = 10
+
+
+def compute_fingerprint(path: Path | str) -> str:
+    """Hash size + head/middle/tail blocks of *path* (raises OSError if unreadable)."""
+    h = hashlib.blake2b(digest_size=_DIGEST_SIZE)
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= 3 * _BLOCK:
+            h.update(f.read())
+        else:
+            for offset in (0, (size - _BLOCK) // 2, size - _BLOCK):
+                f.seek(offset)
+                h.update(f.read(_BLOCK))
+    return f"{size:x}-{h.hexdigest()}"
+
+
+def fingerprint_size(fingerprint: str) -> int:
+    """File size encoded in a fingerprint (-1 if malformed)."""
+    try:
+        return int(fingerprint.partition("-")[0], 16)
+    except ValueError:
+        return -1
+
+
+class MediaFingerprint:
+    """Memoized content keys for media files, plus relinking of moved media."""
+
+    def __init__(self, max_entries: int = 4096) -> None:
+        self._memo: collections.OrderedDict[tuple[int, int, int, int], str] = collections.OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+        self.hash_count = 0  # 실제로 파일을 읽은 횟수 (진단용)
+        self.relink_epoch = 0  # relink가 옮긴 미디어를 찾을 때마다 증가 — CacheKeyMemo가 비운다
+
+    def fingerprint(self, path: Path | str) -> str:
+        """Content fingerprint of *path* (raises OSError if it cannot be read)."""
+        st = os.stat(path)
+        ident = (st.st_dev, st.st_ino, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            fp = self._memo.get(ident)
+            if fp is not None:
+                self._memo.move_to_end(ident)
+                return fp
+        fp = compute_fingerprint(path)
+        with self._lock:
+            self.hash_count += 1
+            self._memo[ident] = fp
+            while len(self._memo) > self._max_entries:
+                self._memo.popitem(last=False)
+        return fp
+
+    def cache_key(self, path: Path | str) -> str:
+        """Key for media caches: the fingerprint, or the path itself when the file is unreadable."""
+        try:
+            return self.fingerprint(path)
+        except OSError:
+            return str(path)
+
+    def relink(
+        self,
+        wanted: Mapping[str, str],
+        search_roots: Iterable[Path | str],
+        max_files: int = 20_000,
+    ) -> dict[str, str]:
+        """Find new locations for missing media by fingerprint.
+
+        *wanted* maps recorded paths to fingerprints; paths that still exist are
+        skipped. Returns {old path: new path} for every file found. Hidden
+        directories (.proxies 등) are not searched, and only files whose size
+        matches a wanted fingerprint are hashed.
+        """
+        missing: dict[str, list[str]] = {}
+        for old, fp in wanted.items():
+            if fp and not os.path.exists(old):
+                missing.setdefault(fp, []).append(old)
+        found: dict[str, str] = {}
+        if not missing:
+            return found
+        sizes = {fingerprint_size(fp) for fp in missing}
+        visited = 0
+        for root in search_roots:
+            for dirpath, dirnames, filenames in os.walk(root):
+                dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+                for name in filenames:
+                    if not missing:
+                        return found
+                    visited += 1
+                    if visited > max_files:
+                        return found
+                    candidate = os.path.join(dirpath, name)
+                    try:
+                        if os.path.getsize(candidate) not in sizes:
+                            continue
+                        fp = self.fingerprint(candidate)
+                    except OSError:
+                        continue
+                    for old in missing.pop(fp, ()):
+                        found[old] = candidate
+                        self.relink_epoch += 1
+        return found
+
+
+class CacheKeyMemo:
+    """path → media_cache_key without a stat per lookup, for paint-path callers.
+
+    항목은 forget(path) (파일이 바뀜 — 호출자가 QFileSystemWatcher 등으로 알린다)나
+    relink로 미디어가 옮겨졌을 때 (relink_epoch) 버린다. 읽을 수 없는 파일의 경로 키는
+    기억하지 않는다 — 파일이 생기면 바로 내용 지문으로 바뀌어야 한다.
+    *on_added*는 새로 기억한 경로마다 불린다 (감시 등록용).
+    """
+
+    def __init__(self, on_added: Callable[[str], object] | None = None) -> None:
+        self._keys: dict[str, str] = {}
+        self._epoch = -1
+        self._on_added = on_added
+
+    def key(self, path: Path | str) -> str:
+        fingerprints = get_media_fingerprint()
+        if self._epoch != fingerprints.relink_epoch:
+            self._keys.clear()
+            self._epoch = fingerprints.relink_epoch
+        path = str(path)
+        key = self._keys.get(path)
+        if key is None:
+            key = fingerprints.cache_key(path)
+            if key != path:
+                self._keys[path] = key
+                if self._on_added is not None:
+                    self._on_added(path)
+        return key
+
+    def forget(self, path: Path | str) -> None:
+        self._keys.pop(str(path), None)
+
+    def clear(self) -> None:
+        self._keys.clear()
+
+
+# 싱글톤 인스턴스 (get_ffmpeg_runner와 같은 방식)
+_default: MediaFingerprint | None = None
+_default_lock = threading.Lock()
+
+
+def get_media_fingerprint() -> MediaFingerprint:
+    """앱 전체가 공유하는 지문 서비스."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = MediaFingerprint()
+        return _default
+
+
+def media_cache_key(path: Path | str) -> str:
+    """Shortcut for ``get_media_fingerprint().cache_key(path)``."""
+    return get_media_fingerprint().cache_key(path)
@@ -0,0 +1,427 @@
+"""Single-pass media ingest — one FFmpeg decode feeds every derived product.
+
+새 소스를 가져오면 프록시, 프레임 캐시, 타임라인 썸네일, 미디어 라이브러리 포스터, 파형이 각자
+FFmpeg를 띄워 같은 파일을 여러 번 디코딩했다. 인제스트는 FFmpeg 프로세스 하나에서 ``split`` /
+``asplit`` 필터 그래프로 디코딩한 프레임과 오디오를 나눠 모든 결과를 동시에 만든다 — 4K 소스의
+가져오기 비용이 디코딩 한 번에 가까워진다.
+
+- 비디오: 프록시(720p) · 프레임 캐시 JPEG · 썸네일 스트립 · 포스터 PNG
+- 오디오: 프록시 AAC · s16le PCM 파이프(stdout) → 파형 피크를 스트리밍 계산
+
+결과는 모두 임시 이름(.part)으로 쓰고 성공해야 제자리로 옮긴다.
+"""
+
+from __future__ import annotations
+
+import logging
+import shutil
+import subprocess
+import threading
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable
+
+from src.infrastructure.ffmpeg_runner import FFmpegRunner, get_ffmpeg_runner
+from src.services.ffmpeg_logger import log_ffmpeg_command, log_ffmpeg_line
+from src.services.media_fingerprint import get_media_fingerprint
+from src.services.media_metadata import probe_media
+from src.services.proxy_service import (
+    _PROXY_ENCODER_FLAGS,
+    _SOFTWARE_ENCODER,
+    _proxy_pre_input,
+    _proxy_video_filter,
+    disable_hw_proxy_encoder,
+    get_proxy_dir,
+    get_proxy_path,
+    is_proxy_valid,
+    partial_proxy_path,
+)
+from src.services.waveform_service import WaveformData, compute_peaks_from_pcm
+from src.utils.config import AUDIO_SAMPLE_RATE
+
+logger = logging.getLogger(__name__)
+
+PRODUCT_PROXY = "proxy"
+PRODUCT_FRAMES = "frames"
+PRODUCT_THUMBNAILS = "thumbnails"
+PRODUCT_POSTER = "poster"
+PRODUCT_WAVEFORM = "waveform"
+
+# 썸네일 스트립 — 타임라인 필름스트립이 FFmpeg 없이 가장 가까운 장면을 쓴다
+STRIP_INTERVAL_MS = 1000
+STRIP_HEIGHT = 90
+# 미디어 라이브러리 포스터 (MediaLibraryService와 같은 위치·크기)
+POSTER_TIME_MS = 1000
+POSTER_WIDTH = 160
+
+
+def get_thumbnail_strip_dir(video_path: Path | str) -> Path:
+    """썸네일 스트립 폴더 — 이름은 원본의 내용 지문 (OSError if the source is unreadable)."""
+    fingerprint = get_media_fingerprint().fingerprint(video_path)
+    return get_proxy_dir() / f"thumbs_{fingerprint}"
+
+
+def get_poster_path(video_path: Path | str) -> Path:
+    fingerprint = get_media_fingerprint().fingerprint(video_path)
+    return get_proxy_dir() / f"poster_{fingerprint}.png"
+
+
+def find_strip_thumbnail(video_path: Path | str, timestamp_ms: int) -> Path | None:
+    """*timestamp_ms*에 가장 가까운 스트립 썸네일 (인제스트 전이면 None)."""
+    try:
+        strip_dir = get_thumbnail_strip_dir(video_path)
+    except OSError:
+        return None
+    ms = max(0, round(timestamp_ms / STRIP_INTERVAL_MS) * STRIP_INTERVAL_MS)
+    path = strip_dir / f"thumb_{ms:09d}.jpg"
+    if path.exists():
+        return path
+    # 끝부분 — 마지막 썸네일보다 뒤를 요청한 경우
+    if not strip_dir.is_dir():
+        return None
+    last = max(strip_dir.glob("thumb_*.jpg"), default=None)
+    if last is not None and int(last.stem.split("_")[1]) < ms:
+        return last
+    return None
+
+
+def find_poster(video_path: Path | str) -> Path | None:
+    try:
+        path = get_poster_path(video_path)
+    except OSError:
+        return None
+    return path if path.exists() else None
+
+
+@dataclass(slots=True)
+class IngestPlan:
+    """What one ingest pass produces. A product is skipped when its path is None."""
+
+    duration_ms: int
+    has_audio: bool
+    encoder: str = _SOFTWARE_ENCODER
+    proxy_path: Path | None = None
+    frames_dir: Path | None = None
+    frame_interval_ms: int = 1000
+    frame_width: int = 640
+    frame_quality: int = 5
+    thumbs_dir: Path | None = None
+    poster_path: Path | None = None
+    waveform: bool = False
+
+    @property
+    def products(self) -> list[str]:
+        names = []
+        if self.proxy_path is not None:
+            names.append(PRODUCT_PROXY)
+        if self.frames_dir is not None:
+            names.append(PRODUCT_FRAMES)
+        if self.thumbs_dir is not None:
+            names.append(PRODUCT_THUMBNAILS)
+        if self.poster_path is not None:
+            names.append(PRODUCT_POSTER)
+        if self.waveform:
+            names.append(PRODUCT_WAVEFORM)
+        return names
+
+    @property
+    def frames_staging(self) -> Path | None:
+        return self.frames_dir / ".ingest" if self.frames_dir is not None else None
+
+    @property
+    def thumbs_staging(self) -> Path | None:
+        return self.thumbs_dir.with_name(f"{self.thumbs_dir.name}.part") if self.thumbs_dir is not None else None
+
+    @property
+    def poster_staging(self) -> Path | None:
+        return self.poster_path.with_name(f"{self.poster_path.stem}.part.png") if self.poster_path is not None else None
+
+
+@dataclass(slots=True)
+class IngestResult:
+    proxy_path: str = ""
+    frame_count: int = 0
+    thumbs_dir: str = ""
+    poster_path: str = ""
+    waveform: WaveformData | None = None
+
+
+def plan_ingest(
+    video_path: Path,
+    *,
+    proxy: bool = False,
+    frames_dir: Path | None = None,
+    waveform: bool = False,
+    encoder: str | None = None,
+    frame_quality: int = 5,
+) -> IngestPlan:
+    """Probe *video_path* and decide which products are still missing.
+
+    Thumbnail strip and poster are always made when absent (they are cheap
+    branches of the same decode); proxy / frames / waveform only on request.
+    """
+    meta = probe_media(video_path)
+    plan = IngestPlan(
+        duration_ms=meta.duration_ms,
+        has_audio=meta.has_audio,
+        encoder=encoder or _SOFTWARE_ENCODER,
+        frame_quality=frame_quality,
+        waveform=waveform and meta.has_audio,
+    )
+    if meta.has_video:
+        if proxy:
+            proxy_path = get_proxy_path(video_path)
+            if not is_proxy_valid(video_path, proxy_path):
+                plan.proxy_path = proxy_path
+        plan.frames_dir = frames_dir
+        thumbs_dir = get_thumbnail_strip_dir(video_path)
+        if not thumbs_dir.is_dir():
+            plan.thumbs_dir = thumbs_dir
+        poster_path = get_poster_path(video_path)
+        if not poster_path.exists():
+            plan.poster_path = poster_path
+    return plan
+
+
+def _poster_time_ms(duration_ms: int) -> int:
+    # 1초보다 짧은 클립은 가운데 프레임
+    return min(POSTER_TIME_MS, duration_ms // 2) if duration_ms > 0 else 0
+
+
+def build_ingest_args(video_path: Path, plan: IngestPlan) -> list[str]:
+    """One FFmpeg command writing every product of *plan* (to its staging path)."""
+    chains: list[tuple[str, str]] = []  # (출력 라벨, 필터)
+    if plan.proxy_path is not None:
+        chains.append(("vproxy", _proxy_video_filter(plan.encoder)))
+    if plan.frames_dir is not None:
+        chains.append(("vframes", f"fps={1000.0 / plan.frame_interval_ms},scale={plan.frame_width}:-1"))
+    if plan.thumbs_dir is not None:
+        chains.append(("vthumbs", f"fps={1000.0 / STRIP_INTERVAL_MS},scale=-2:{STRIP_HEIGHT}"))
+    if plan.poster_path is not None:
+        start = _poster_time_ms(plan.duration_ms) / 1000
+        chains.append(("vposter", f"trim=start={start:.3f},setpts=PTS-STARTPTS,scale={POSTER_WIDTH}:-1"))
+
+    graph: list[str] = []
+    if len(chains) > 1:
+        taps = "".join(f"[s{i}]" for i in range(len(chains)))
+        graph.append(f"[0:v:0]split={len(chains)}{taps}")
+        graph += [f"[s{i}]{vf}[{label}]" for i, (label, vf) in enumerate(chains)]
+    elif chains:
+        label, vf = chains[0]
+        graph.append(f"[0:v:0]{vf}[{label}]")
+
+    proxy_audio = plan.proxy_path is not None and plan.has_audio
+    pcm = f"aresample={AUDIO_SAMPLE_RATE},aformat=sample_fmts=s16:channel_layouts=mono"
+    if plan.waveform and proxy_audio:
+        graph.append("[0:a:0]asplit=2[aproxy][awave]")
+        graph.append(f"[awave]{pcm}[apcm]")
+    elif plan.waveform:
+        graph.append(f"[0:a:0]{pcm}[apcm]")
+
+    args = [
+        "-y",
+        "-nostats",
+        "-loglevel", "error",
+        "-progress", "pipe:2",
+        *(_proxy_pre_input(plan.encoder) if plan.proxy_path is not None else []),
+        "-i", str(video_path),
+    ]
+    if graph:
+        args += ["-filter_complex", ";".join(graph)]
+
+    if plan.proxy_path is not None:
+        args += ["-map", "[vproxy]"]
+        if proxy_audio:
+            args += ["-map", "[aproxy]" if plan.waveform else "0:a:0", "-c:a", "aac", "-b:a", "128k"]
+        args += [
+            "-c:v", plan.encoder,
+            *_PROXY_ENCODER_FLAGS.get(plan.encoder, []),
+            str(partial_proxy_path(plan.proxy_path)),
+        ]
+    if plan.frames_dir is not None:
+        args += ["-map", "[vframes]", "-q:v", str(plan.frame_quality), "-vsync", "vfr",
+                 str(plan.frames_staging / "frame_%06d.jpg")]
+    if plan.thumbs_dir is not None:
+        args += ["-map", "[vthumbs]", "-q:v", "5", "-vsync", "vfr",
+                 str(plan.thumbs_staging / "thumb_%06d.jpg")]
+    if plan.poster_path is not None:
+        args += ["-map", "[vposter]", "-frames:v", "1", str(plan.poster_staging)]
+    if plan.waveform:
+        args += ["-map", "[apcm]", "-f", "s16le", "pipe:1"]
+    return args
+
+
+def _discard_staging(plan: IngestPlan) -> None:
+    if plan.proxy_path is not None:
+        partial_proxy_path(plan.proxy_path).unlink(missing_ok=True)
+    for staging in (plan.frames_staging, plan.thumbs_staging):
+        if staging is not None:
+            shutil.rmtree(staging, ignore_errors=True)
+    if plan.poster_staging is not None:
+        plan.poster_staging.unlink(missing_ok=True)
+
+
+def _prepare_staging(plan: IngestPlan) -> None:
+    _discard_staging(plan)
+    for staging in (plan.frames_staging, plan.thumbs_staging):
+        if staging is not None:
+            staging.mkdir(parents=True)
+
+
+def _rename_sequence(staging: Path, prefix: str, interval_ms: int, target: Path) -> int:
+    """FFmpeg의 1부터 시작하는 번호를 ms 기반 이름으로 바꿔 *target*에 옮긴다."""
+    count = 0
+    for i, path in enumerate(sorted(staging.glob(f"{prefix}_*.jpg"))):
+        path.replace(target / f"{prefix}_{i * interval_ms:09d}.jpg")
+        count += 1
+    return count
+
+
+def _finalize(plan: IngestPlan, waveform: WaveformData | None) -> IngestResult:
+    result = IngestResult(waveform=waveform)
+    if plan.proxy_path is not None:
+        partial_proxy_path(plan.proxy_path).replace(plan.proxy_path)
+        result.proxy_path = str(plan.proxy_path)
+    if plan.frames_dir is not None:
+        result.frame_count = _rename_sequence(plan.frames_staging, "frame", plan.frame_interval_ms, plan.frames_dir)
+        shutil.rmtree(plan.frames_staging, ignore_errors=True)
+    if plan.thumbs_dir is not None:
+        staging = plan.thumbs_staging
+        _rename_sequence(staging, "thumb", STRIP_INTERVAL_MS, staging)
+        if plan.thumbs_dir.exists():  # 다른 인제스트가 먼저 끝냈다
+            shutil.rmtree(staging, ignore_errors=True)
+        else:
+            staging.replace(plan.thumbs_dir)
+        result.thumbs_dir = str(plan.thumbs_dir)
+    if plan.poster_path is not None:
+        staging = plan.poster_staging
+        if staging.exists() and staging.stat().st_size > 0:
+            staging.replace(plan.poster_path)
+            result.poster_path = str(plan.poster_path)
+    return result
+
+
+def run_ingest(
+    video_path: Path,
+    plan: IngestPlan,
+    on_progress: Callable[[str, int], None] | None = None,
+    cancel_check: Callable[[], bool] | None = None,
+) -> IngestResult | None:
+    """Run the single-pass ingest for *plan*.
+
+    ``on_progress(product, percent)`` is called per product (the video
+    products advance together with the decode position; the waveform follows
+    the PCM actually consumed). Returns None if cancelled and raises
+    RuntimeError if FFmpeg fails. A hardware proxy encoder that fails to
+    start is retried once with libx264, like generate_proxy.
+    """
+    runner = get_ffmpeg_runner()
+    if not runner.is_available():
+        raise FileNotFoundError("FFmpeg not found")
+    if not plan.products:
+        return IngestResult()
+
+    last: dict[str, int] = {}
+
+    def _report(product: str, pct: int) -> None:
+        pct = max(0, min(100, pct))
+        if on_progress and last.get(product) != pct:
+            last[product] = pct
+            on_progress(product, pct)
+
+    returncode, stderr, waveform = _run_once(runner, video_path, plan, _report, cancel_check)
+    if returncode and plan.proxy_path is not None and plan.encoder != _SOFTWARE_ENCODER:
+        from src.services.video_exporter import _looks_like_hw_failure
+
+        if _looks_like_hw_failure(stderr):
+            logger.warning(f"Hardware proxy encode failed ({plan.encoder}), retrying ingest with software encoder")
+            disable_hw_proxy_encoder()
+            plan.encoder = _SOFTWARE_ENCODER
+            last.clear()
+            returncode, stderr, waveform = _run_once(runner, video_path, plan, _report, cancel_check)
+
+    if returncode is None:
+        _discard_staging(plan)
+        return None
+    if returncode != 0:
+        _discard_staging(plan)
+        raise RuntimeError(stderr[-500:].strip() or f"FFmpeg exit code {returncode}")
+
+    result = _finalize(plan, waveform)
+    for product in plan.products:
+        _report(product, 100)
+    return result
+
+
+def _run_once(
+    runner: FFmpegRunner,
+    video_path: Path,
+    plan: IngestPlan,
+    report: Callable[[str, int], None],
+    cancel_check: Callable[[], bool] | None,
+) -> tuple[int | None, str, WaveformData | None]:
+    """Returns (returncode, stderr tail, waveform); returncode None = cancelled."""
+    _prepare_staging(plan)
+    args = build_ingest_args(video_path, plan)
+    log_ffmpeg_command(args)
+    proc = runner.run_async(
+        args,
+        stdout=subprocess.PIPE if plan.waveform else subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+
+    video_products = [p for p in plan.products if p != PRODUCT_WAVEFORM]
+    duration_ms = plan.duration_ms
+    stderr_tail: list[str] = []
+
+    # -progress는 stderr로 — stdout은 PCM 파이프가 쓴다
+    def _drain_stderr():
+        try:
+            for raw in proc.stderr:
+                line = raw.decode("utf-8", "replace").strip()
+                if line.startswith("out_time_us="):
+                    try:
+                        ms = int(line.split("=")[1]) // 1000
+                    except (ValueError, IndexError):
+                        continue
+                    if duration_ms > 0:
+                        for product in video_products:
+                            report(product, ms * 100 // duration_ms)
+                elif "=" not in line and line:
+                    log_ffmpeg_line(line)
+                    stderr_tail.append(line)
+                    del stderr_tail[:-20]
+        except Exception:
+            pass
+
+    stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
+    stderr_thread.start()
+
+    def _stop() -> None:
+        proc.kill()
+        proc.wait()
+
+    waveform = None
+    if plan.waveform:
+        waveform = compute_peaks_from_pcm(
+            proc.stdout,
+            AUDIO_SAMPLE_RATE,
+            duration_ms,
+            on_progress=lambda done, total: report(PRODUCT_WAVEFORM, done * 100 // total),
+            cancel_check=cancel_check,
+        )
+        if waveform is None:
+            _stop()
+            return None, "", None
+    while True:
+        try:
+            proc.wait(timeout=0.2)
+            break
+        except subprocess.TimeoutExpired:
+            if cancel_check and cancel_check():
+                _stop()
+                return None, "", None
+    stderr_thread.join(timeout=5)
+    if cancel_check and cancel_check():
+        return None, "", None
+    return proc.returncode, "\n".join(stderr_tail), waveform
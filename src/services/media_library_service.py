@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import shutil
 import uuid
 from datetime import datetime, timezone
 from pathlib import Path
 
 from src.services.ffmpeg_logger import log_ffmpeg_command
 from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
+from src.services.media_metadata import probe_media
 from src.models.media_item import MediaItem
 from src.utils.config import IMAGE_EXTENSIONS, VIDEO_EXTENSIONS
 
@@ -254,6 +256,14 @@ class MediaLibraryService:
         return None
 
     def _generate_video_thumbnail(self, video_path: Path, thumb_path: Path) -> Path | None:
+        # 인제스트에서 이미 만든 포스터가 있으면 디코딩 없이 복사
+        from src.services.media_ingest import find_poster
+
+        poster = find_poster(video_path)
+        if poster is not None:
+            shutil.copyfile(poster, thumb_path)
+            return thumb_path
+
         runner = get_ffmpeg_runner()
         if not runner.is_available():
             return None
@@ -294,34 +304,11 @@ class MediaLibraryService:
 
     def _get_video_info(self, video_path: Path) -> tuple[int, int, int]:
         """Returns (width, height, duration_ms)."""
-        runner = get_ffmpeg_runner()
-        if not runner.ffprobe_path:
-            return 0, 0, 0
-
         try:
-            args = [
-                "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "stream=width,height",
-                "-show_entries", "format=duration",
-                "-of", "json",
-                str(video_path),
-            ]
-            log_ffmpeg_command(["ffprobe"] + args)
-            result = runner.run_ffprobe(args, timeout=10)
-            data = json.loads(result.stdout)
-            width = 0
-            height = 0
-            if data.get("streams"):
-                stream = data["streams"][0]
-                width = stream.get("width", 0)
-                height = stream.get("height", 0)
-            duration_ms = 0
-            if data.get("format", {}).get("duration"):
-                duration_ms = int(float(data["format"]["duration"]) * 1000)
-            return width, height, duration_ms
+            meta = probe_media(video_path)
         except Exception:
             return 0, 0, 0
+        return meta.width, meta.height, meta.duration_ms
 
     def _get_image_dimensions(self, image_path: Path) -> tuple[int, int]:
         """Returns (width, height)."""
@@ -0,0 +1,348 @@
+"""Memoized media metadata — one ffprobe per file, shared by every caller.
+
+probe_video, 내보내기, 미디어 라이브러리, 오디오 길이 조회가 같은 파일마다 ffprobe를 따로
+띄우던 것을 한곳으로 모은다. 한 번의 ffprobe(-show_streams -show_format)로 스트림·코덱·
+fps·길이·오디오 채널·회전을 모두 읽고 (경로, 크기, mtime) 키로 기억한다.
+
+- 메모리 LRU → 영구 저장소(sqlite) → ffprobe 순으로 찾는다.
+- 스레드 안전. 같은 파일을 동시에 요청하면 첫 호출자만 ffprobe를 실행하고 나머지는 그 결과를
+  기다린다 (request coalescing).
+- 실패(ffprobe 없음, 파싱 오류)는 기억하지 않는다 — 다음 호출에서 다시 시도.
+"""
+
+from __future__ import annotations
+
+import collections
+import json
+import os
+import sqlite3
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+from src.infrastructure.ffmpeg_runner import FFmpegRunner, get_ffmpeg_runner
+from src.services.ffmpeg_logger import log_ffmpeg_command
+
+_PROBE_ARGS = ["-v", "error", "-show_streams", "-show_format", "-of", "json"]
+
+
+class MediaProbeError(Exception):
+    """ffprobe could not be run or its output could not be parsed."""
+
+
+@dataclass(frozen=True, slots=True)
+class StreamInfo:
+    """One stream from ffprobe -show_streams."""
+
+    index: int
+    codec_type: str
+    codec_name: str = ""
+    width: int = 0
+    height: int = 0
+    fps: float = 0.0
+    rotation: int = 0
+    channels: int = 0
+    channel_layout: str = ""
+    sample_rate: int = 0
+
+
+@dataclass(frozen=True, slots=True)
+class MediaMetadata:
+    """Everything the app needs from one ffprobe run, tagged with the file identity."""
+
+    path: str
+    size: int
+    mtime_ns: int
+    duration_s: float = 0.0
+    format_name: str = ""
+    streams: tuple[StreamInfo, ...] = ()
+
+    @property
+    def duration_ms(self) -> int:
+        return int(self.duration_s * 1000)
+
+    @property
+    def video(self) -> StreamInfo | None:
+        return next((s for s in self.streams if s.codec_type == "video"), None)
+
+    @property
+    def audio(self) -> StreamInfo | None:
+        return next((s for s in self.streams if s.codec_type == "audio"), None)
+
+    @property
+    def has_video(self) -> bool:
+        return self.video is not None
+
+    @property
+    def has_audio(self) -> bool:
+        return self.audio is not None
+
+    @property
+    def width(self) -> int:
+        v = self.video
+        return v.width if v else 0
+
+    @property
+    def height(self) -> int:
+        v = self.video
+        return v.height if v else 0
+
+    @property
+    def fps(self) -> float:
+        v = self.video
+        return v.fps if v else 0.0
+
+    @property
+    def rotation(self) -> int:
+        v = self.video
+        return v.rotation if v else 0
+
+    def to_dict(self) -> dict:
+        return asdict(self)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> MediaMetadata:
+        streams = tuple(StreamInfo(**s) for s in data.get("streams", ()))
+        return cls(
+            path=data["path"],
+            size=data["size"],
+            mtime_ns=data["mtime_ns"],
+            duration_s=data.get("duration_s", 0.0),
+            format_name=data.get("format_name", ""),
+            streams=streams,
+        )
+
+
+def _parse_rate(rate: str | None) -> float:
+    """"30000/1001" → 29.97 ("0/0"과 잘못된 값은 0)."""
+    if not rate:
+        return 0.0
+    num, _, den = rate.partition("/")
+    try:
+        n = float(num)
+        d = float(den) if den else 1.0
+    except ValueError:
+        return 0.0
+    return n / d if d else 0.0
+
+
+def _parse_rotation(stream: dict) -> int:
+    rotate = stream.get("tags", {}).get("rotate")
+    if rotate is None:
+        for side in stream.get("side_data_list", ()):
+            if "rotation" in side:
+                rotate = side["rotation"]
+                break
+    try:
+        return int(float(rotate)) % 360 if rotate is not None else 0
+    except (TypeError, ValueError):
+        return 0
+
+
+def _parse_stream(stream: dict) -> StreamInfo:
+    return StreamInfo(
+        index=int(stream.get("index", 0)),
+        codec_type=stream.get("codec_type", ""),
+        codec_name=stream.get("codec_name", ""),
+        width=int(stream.get("width", 0) or 0),
+        height=int(stream.get("height", 0) or 0),
+        fps=_parse_rate(stream.get("avg_frame_rate")) or _parse_rate(stream.get("r_frame_rate")),
+        rotation=_parse_rotation(stream),
+        channels=int(stream.get("channels", 0) or 0),
+        channel_layout=stream.get("channel_layout", ""),
+        sample_rate=int(stream.get("sample_rate", 0) or 0),
+    )
+
+
+def parse_ffprobe_output(stdout: str, path: str, size: int, mtime_ns: int) -> MediaMetadata:
+    """Build MediaMetadata from ``ffprobe -show_streams -show_format -of json`` output."""
+    try:
+        data = json.loads(stdout)
+        fmt = data.get("format", {})
+        duration = fmt.get("duration")
+        return MediaMetadata(
+            path=path,
+            size=size,
+            mtime_ns=mtime_ns,
+            duration_s=float(duration) if duration not in (None, "N/A") else 0.0,
+            format_name=fmt.get("format_name", ""),
+            streams=tuple(_parse_stream(s) for s in data.get("streams", [])),
+        )
+    except (AttributeError, TypeError, ValueError) as e:
+        raise MediaProbeError(f"Failed to parse FFprobe output: {e}") from e
+
+
+class _Pending:
+    """진행 중인 probe — 늦게 온 호출자는 done을 기다렸다가 같은 결과를 받는다."""
+
+    __slots__ = ("done", "result", "error")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: MediaMetadata | None = None
+        self.error: BaseException | None = None
+
+
+class MediaMetadataStore:
+    """Thread-safe metadata cache: in-memory LRU in front of an optional sqlite store."""
+
+    def __init__(self, db_path: Path | None = None, max_entries: int = 512) -> None:
+        self._db_path = db_path
+        self._db: sqlite3.Connection | None = None
+        self._max_entries = max_entries
+        self._memory: collections.OrderedDict[str, MediaMetadata] = collections.OrderedDict()
+        self._pending: dict[tuple[str, int, int], _Pending] = {}
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        self.probe_count = 0  # 실제로 띄운 ffprobe 수 (진단용)
+
+    def get(self, path: Path | str, runner: FFmpegRunner | None = None) -> MediaMetadata:
+        """Metadata for *path*, probing at most once per (path, size, mtime).
+
+        Raises FileNotFoundError when the file does not exist and
+        MediaProbeError when ffprobe is unavailable or fails.
+        """
+        p = str(path)
+        st = os.stat(p)
+        key = (p, st.st_size, st.st_mtime_ns)
+        with self._lock:
+            meta = self._memory.get(p)
+            if meta is not None and (meta.size, meta.mtime_ns) == key[1:]:
+                self._memory.move_to_end(p)
+                return meta
+            pending = self._pending.get(key)
+            owner = pending is None
+            if owner:
+                pending = self._pending[key] = _Pending()
+        if not owner:
+            pending.done.wait()
+            if pending.error is not None:
+                raise pending.error
+            return pending.result
+
+        try:
+            meta = self._load_stored(key)
+            if meta is None:
+                meta = self._probe(key, runner or get_ffmpeg_runner())
+                self._store(meta)
+            pending.result = meta
+            with self._lock:
+                self._remember(meta)
+            return meta
+        except BaseException as e:
+            pending.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._pending[key]
+            pending.done.set()
+
+    def invalidate(self, path: Path | str) -> None:
+        """Forget *path* (memory only — the stored entry is re-validated by size/mtime)."""
+        with self._lock:
+            self._memory.pop(str(path), None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._memory.clear()
+        with self._db_lock:
+            db = self._connect()
+            if db is not None:
+                with db:
+                    db.execute("DELETE FROM media")
+
+    def close(self) -> None:
+        with self._db_lock:
+            if self._db is not None:
+                self._db.close()
+                self._db = None
+
+    # ---- internals ----
+
+    def _remember(self, meta: MediaMetadata) -> None:
+        self._memory[meta.path] = meta
+        self._memory.move_to_end(meta.path)
+        while len(self._memory) > self._max_entries:
+            self._memory.popitem(last=False)
+
+    def _probe(self, key: tuple[str, int, int], runner: FFmpegRunner) -> MediaMetadata:
+        path, size, mtime_ns = key
+        if not runner.ffprobe_path:
+            raise MediaProbeError("FFprobe not found")
+        args = _PROBE_ARGS + [path]
+        log_ffmpeg_command(["ffprobe"] + args)
+        with self._lock:
+            self.probe_count += 1
+        try:
+            result = runner.run_ffprobe(args, timeout=15)
+        except Exception as e:
+            raise MediaProbeError(f"FFprobe failed: {e}") from e
+        if result.returncode != 0:
+            raise MediaProbeError(f"FFprobe failed (code {result.returncode}): {(result.stderr or '')[:200]}")
+        return parse_ffprobe_output(result.stdout, path, size, mtime_ns)
+
+    def _connect(self) -> sqlite3.Connection | None:
+        """영구 저장소 연결 (처음 쓸 때 연다). 열 수 없으면 메모리 캐시만 쓴다."""
+        if self._db is None and self._db_path is not None:
+            try:
+                self._db_path.parent.mkdir(parents=True, exist_ok=True)
+                db = sqlite3.connect(str(self._db_path), check_same_thread=False)
+                db.execute(
+                    "CREATE TABLE IF NOT EXISTS media "
+                    "(path TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER, data TEXT)"
+                )
+                self._db = db
+            except sqlite3.Error:
+                self._db_path = None
+        return self._db
+
+    def _load_stored(self, key: tuple[str, int, int]) -> MediaMetadata | None:
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return None
+            try:
+                row = db.execute(
+                    "SELECT data FROM media WHERE path = ? AND size = ? AND mtime_ns = ?", key
+                ).fetchone()
+            except sqlite3.Error:
+                return None
+        if row is None:
+            return None
+        try:
+            return MediaMetadata.from_dict(json.loads(row[0]))
+        except (KeyError, TypeError, ValueError):
+            return None
+
+    def _store(self, meta: MediaMetadata) -> None:
+        with self._db_lock:
+            db = self._connect()
+            if db is None:
+                return
+            try:
+                with db:
+                    db.execute(
+                        "INSERT OR REPLACE INTO media (path, size, mtime_ns, data) VALUES (?, ?, ?, ?)",
+                        (meta.path, meta.size, meta.mtime_ns, json.dumps(meta.to_dict())),
+                    )
+            except sqlite3.Error:
+                pass
+
+
+# 싱글톤 인스턴스 (get_ffmpeg_runner와 같은 방식)
+_default_store: MediaMetadataStore | None = None
+_default_lock = threading.Lock()
+
+
+def get_media_metadata_store() -> MediaMetadataStore:
+    """앱 전체가 공유하는 메타데이터 저장소 (~/.fastmoviemaker/media_metadata.sqlite3)."""
+    global _default_store
+    with _default_lock:
+        if _default_store is None:
+            _default_store = MediaMetadataStore(Path.home() / ".fastmoviemaker" / "media_metadata.sqlite3")
+        return _default_store
+
+
+def probe_media(path: Path | str, runner: FFmpegRunner | None = None) -> MediaMetadata:
+    """Shortcut for ``get_media_metadata_store().get(path, runner)``."""
+    return get_media_metadata_store().get(path, runner)
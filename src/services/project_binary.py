@@ -0,0 +1,244 @@
+"""Compact binary project container (opt-in .fmm) with lazily loaded subtitle tracks.
+
+v12 JSON은 세그먼트마다 dict와 스타일 전체 사본을 들고 있어, 큰 프로젝트는 압축 해제·파싱·
+객체 생성을 모두 끝내야 창을 띄울 수 있다. 이 컨테이너는 섹션별로 따로 압축해 두고
+목차(TOC)로 찾아가므로, 열 때는 메타데이터만 읽고 자막 트랙은 처음 접근할 때 객체화한다.
+
+Layout (little-endian)::
+
+    header   b"FMMB" | u16 format version | u16 section count
+    toc      per section: u8 name length | name (utf-8) | u8 codec | u64 offset
+             | u64 stored length | u64 raw length
+    payload  sections, each compressed on its own (codec 1 = zlib)
+
+Sections:
+
+    meta     JSON: the v12 project dict with every subtitle track's "segments" empty
+    strings  interned string table: u32 count | u32 byte length[count] | utf-8 blob
+    styles   JSON: {"styles": [style dict, ...], "animations": [animation dict, ...]}
+    sub:<i>  subtitle track i, columnar: u32 n | int64 start_ms[n] | int64 end_ms[n]
+             | int32 text[n] | int32 audio_file[n] | int32 voice[n] | int32 style[n]
+             | int32 animation[n] | float64 volume[n] | float64 speed[n]
+             (table indices; -1 = None, speed NaN = None)
+"""
+
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from pathlib import Path
+from typing import Iterator
+
+import numpy as np
+
+from src.models.project import ProjectState
+from src.models.style import StyleRegistry
+from src.models.subtitle import SubtitleSegment, SubtitleTrack
+from src.models.subtitle_animation import SubtitleAnimation
+from src.services.project_io import (
+    _animation_to_dict,
+    _dict_to_style,
+    _StyleTable,
+    build_project,
+    iter_project_sections,
+    project_to_dict,
+    write_atomic,
+)
+
+MAGIC = b"FMMB"
+FORMAT_VERSION = 1
+
+_CODEC_ZLIB = 1
+_HEADER = struct.Struct("<4sHH")
+_TOC_ENTRY = struct.Struct("<BQQQ")
+_INDEX_COLUMNS = ("text", "audio_file", "voice", "style", "animation")
+
+
+class _Interner:
+    """값 → 테이블 인덱스. 같은 값은 한 번만 저장된다."""
+
+    __slots__ = ("values", "_index")
+
+    def __init__(self) -> None:
+        self.values: list = []
+        self._index: dict = {}
+
+    def add(self, key, value=None) -> int:
+        idx = self._index.get(key)
+        if idx is None:
+            idx = self._index[key] = len(self.values)
+            self.values.append(key if value is None else value)
+        return idx
+
+
+def _encode_strings(values: list[str]) -> bytes:
+    blobs = [v.encode("utf-8") for v in values]
+    lengths = np.fromiter((len(b) for b in blobs), dtype="<u4", count=len(blobs))
+    return struct.pack("<I", len(blobs)) + lengths.tobytes() + b"".join(blobs)
+
+
+def _decode_strings(buf: bytes) -> list[str]:
+    (count,) = struct.unpack_from("<I", buf)
+    lengths = np.frombuffer(buf, dtype="<u4", count=count, offset=4)
+    ends = (np.cumsum(lengths, dtype=np.int64) + 4 + 4 * count).tolist()
+    starts = [4 + 4 * count] + ends[:-1]
+    return [buf[s:e].decode("utf-8") for s, e in zip(starts, ends)]
+
+
+def _encode_track(
+    track: SubtitleTrack, strings: _Interner, styles: _StyleTable, animations: _Interner,
+) -> bytes:
+    cols: dict[str, list] = {name: [] for name in ("start", "end", *_INDEX_COLUMNS, "volume", "speed")}
+    start, end, text, audio, voice = cols["start"], cols["end"], cols["text"], cols["audio_file"], cols["voice"]
+    style, anim, volume, speed = cols["style"], cols["animation"], cols["volume"], cols["speed"]
+    for seg in track:
+        start.append(seg.start_ms)
+        end.append(seg.end_ms)
+        text.append(strings.add(seg.text))
+        audio.append(-1 if seg.audio_file is None else strings.add(seg.audio_file))
+        voice.append(-1 if seg.voice is None else strings.add(seg.voice))
+        style.append(-1 if seg.style is None else styles.ref(seg.style))
+        if seg.animation is None:
+            anim.append(-1)
+        else:
+            d = _animation_to_dict(seg.animation)
+            anim.append(animations.add(tuple(d.items()), d))
+        volume.append(seg.volume)
+        speed.append(np.nan if seg.speed is None else seg.speed)
+    parts = [struct.pack("<I", len(start)), np.array(start, "<i8").tobytes(), np.array(end, "<i8").tobytes()]
+    parts += [np.array(cols[name], "<i4").tobytes() for name in _INDEX_COLUMNS]
+    parts += [np.array(volume, "<f8").tobytes(), np.array(speed, "<f8").tobytes()]
+    return b"".join(parts)
+
+
+def save_binary_project(project: ProjectState, path: Path, compresslevel: int = 6) -> None:
+    """Write *project* as a binary container (atomically, like save_project)."""
+    strings, styles, animations = _Interner(), _StyleTable(), _Interner()
+    sections: list[tuple[str, bytes]] = []
+    meta = project_to_dict(project, include_segments=False)
+    sections.append(("meta", json.dumps(meta, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+    tracks = [
+        (f"sub:{i}", _encode_track(track, strings, styles, animations))
+        for i, track in enumerate(project.subtitle_tracks)
+    ]
+    tables = {"styles": styles.styles, "animations": animations.values}
+    sections.append(("styles", json.dumps(tables, ensure_ascii=False, separators=(",", ":")).encode("utf-8")))
+    sections.append(("strings", _encode_strings(strings.values)))
+    sections.extend(tracks)
+
+    stored = [(name, raw, zlib.compress(raw, compresslevel)) for name, raw in sections]
+    toc_size = sum(1 + len(name.encode("utf-8")) + _TOC_ENTRY.size for name, _, _ in stored)
+    offset = _HEADER.size + toc_size
+    header = [_HEADER.pack(MAGIC, FORMAT_VERSION, len(stored))]
+    for name, raw, data in stored:
+        encoded = name.encode("utf-8")
+        header.append(bytes([len(encoded)]) + encoded + _TOC_ENTRY.pack(_CODEC_ZLIB, offset, len(data), len(raw)))
+        offset += len(data)
+    write_atomic(path, b"".join(header) + b"".join(data for _, _, data in stored))
+
+
+class _Container:
+    """열린 컨테이너 — 섹션은 처음 요청할 때 압축을 풀고, 문자열·스타일 표는 한 번만 만든다."""
+
+    def __init__(self, raw: bytes) -> None:
+        magic, version, count = _HEADER.unpack_from(raw)
+        if magic != MAGIC:
+            raise ValueError("Not a FastMovieMaker binary project")
+        if version > FORMAT_VERSION:
+            raise ValueError(f"Unsupported binary project version {version} (max {FORMAT_VERSION})")
+        self._raw = raw
+        self._toc: dict[str, tuple[int, int, int, int]] = {}
+        pos = _HEADER.size
+        for _ in range(count):
+            name_len = raw[pos]
+            name = raw[pos + 1:pos + 1 + name_len].decode("utf-8")
+            pos += 1 + name_len
+            self._toc[name] = _TOC_ENTRY.unpack_from(raw, pos)
+            pos += _TOC_ENTRY.size
+        self._strings: list[str] | None = None
+        self._tables: dict | None = None
+
+    def has_section(self, name: str) -> bool:
+        return name in self._toc
+
+    def section(self, name: str) -> bytes:
+        codec, offset, length, raw_len = self._toc[name]
+        if codec != _CODEC_ZLIB:
+            raise ValueError(f"Unsupported section codec {codec} in {name!r}")
+        data = zlib.decompress(self._raw[offset:offset + length])
+        if len(data) != raw_len:
+            raise ValueError(f"Corrupt section {name!r}")
+        return data
+
+    def strings(self) -> list[str]:
+        if self._strings is None:
+            self._strings = _decode_strings(self.section("strings"))
+        return self._strings
+
+    def tables(self) -> dict:
+        if self._tables is None:
+            self._tables = json.loads(self.section("styles"))
+        return self._tables
+
+    def segments(self, index: int, registry: StyleRegistry) -> list[SubtitleSegment]:
+        buf = self.section(f"sub:{index}")
+        (n,) = struct.unpack_from("<I", buf)
+        pos = 4
+
+        def column(dtype: str) -> list:
+            nonlocal pos
+            arr = np.frombuffer(buf, dtype=dtype, count=n, offset=pos)
+            pos += arr.nbytes
+            return arr.tolist()
+
+        start, end = column("<i8"), column("<i8")
+        text, audio, voice, style, anim = (column("<i4") for _ in _INDEX_COLUMNS)
+        volume = column("<f8")
+        speed_arr = np.frombuffer(buf, dtype="<f8", count=n, offset=pos)
+        speed = [None if v != v else v for v in speed_arr.tolist()]  # NaN → None
+
+        strings = self.strings()
+        tables = self.tables()
+        # 스타일은 표 항목마다 한 번 만들어 프로젝트 풀에 인터닝 — 세그먼트끼리 공유한다.
+        # 애니메이션은 세그먼트마다 새 객체 (제자리 수정 여부를 보장하지 않는다)
+        styles = [registry.intern(_dict_to_style(d)) for d in tables["styles"]]
+        anim_dicts = tables["animations"]
+        return [
+            SubtitleSegment(
+                start_ms=s, end_ms=e, text=strings[t],
+                style=styles[st] if st >= 0 else None,
+                audio_file=strings[a] if a >= 0 else None,
+                volume=vol,
+                voice=strings[v] if v >= 0 else None,
+                speed=sp,
+                animation=SubtitleAnimation(**anim_dicts[an]) if an >= 0 else None,
+            )
+            for s, e, t, a, v, st, an, vol, sp in zip(start, end, text, audio, voice, style, anim, volume, speed)
+        ]
+
+
+def is_binary_project(path: Path) -> bool:
+    with open(path, "rb") as f:
+        return f.read(len(MAGIC)) == MAGIC
+
+
+def iter_binary_project_sections(path: Path, lazy: bool = True) -> Iterator[tuple[str, object]]:
+    """iter_project_sections for a binary container (subtitle tracks deferred when *lazy*)."""
+    container = _Container(path.read_bytes())
+    for name, payload in iter_project_sections(json.loads(container.section("meta"))):
+        if name == "subtitles":
+            tracks, _, registry = payload
+            for i, track in enumerate(tracks):
+                if not container.has_section(f"sub:{i}"):
+                    continue
+                if lazy:
+                    track.defer_segments(lambda i=i: container.segments(i, registry))
+                else:
+                    track.segments = container.segments(i, registry)
+        yield name, payload
+
+
+def load_binary_project(path: Path, lazy: bool = True) -> ProjectState:
+    """Open a binary container. With *lazy*, subtitle segments are built on first access."""
+    return build_project(iter_binary_project_sections(path, lazy))
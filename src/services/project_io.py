@@ -4,18 +4,22 @@ from __future__ import annotations
 
 import gzip
 import json
+import os
+import threading
 from pathlib import Path
+from typing import Iterable, Iterator
 
 from src.models.image_overlay import ImageOverlay, ImageOverlayTrack
 from src.models.project import ProjectState
-from src.models.style import SubtitleStyle
+from src.models.style import StyleRegistry, SubtitleStyle
 from src.models.subtitle import SubtitleSegment, SubtitleTrack
 from src.models.subtitle_animation import SubtitleAnimation
 from src.models.timeline_marker import TimelineMarker
 from src.models.video_clip import VideoClip, VideoClipTrack
 from src.models.text_overlay import TextOverlay, TextOverlayTrack
+from src.services.media_fingerprint import get_media_fingerprint
 
-PROJECT_VERSION = 12
+PROJECT_VERSION = 13
 
 
 def _style_to_dict(style: SubtitleStyle) -> dict:
@@ -52,14 +56,39 @@ def _dict_to_style(d: dict) -> SubtitleStyle:
     )
 
 
-def _segment_to_dict(seg: SubtitleSegment) -> dict:
+class _StyleTable:
+    """저장용 스타일 표 (v13) — 세그먼트는 스타일 대신 표 인덱스를 싣는다.
+
+    인터닝된 스타일은 인스턴스를 공유하므로 id로 먼저 찾고, 처음 보는 객체만 값 키를 만든다.
+    """
+
+    __slots__ = ("styles", "_by_id", "_by_key")
+
+    def __init__(self) -> None:
+        self.styles: list[dict] = []
+        self._by_id: dict[int, int] = {}
+        self._by_key: dict[tuple, int] = {}
+
+    def ref(self, style: SubtitleStyle) -> int:
+        idx = self._by_id.get(id(style))
+        if idx is None:
+            key = style.key()
+            idx = self._by_key.get(key)
+            if idx is None:
+                idx = self._by_key[key] = len(self.styles)
+                self.styles.append(_style_to_dict(style))
+            self._by_id[id(style)] = idx
+        return idx
+
+
+def _segment_to_dict(seg: SubtitleSegment, styles: _StyleTable | None = None) -> dict:
     d = {
         "start_ms": seg.start_ms,
         "end_ms": seg.end_ms,
         "text": seg.text,
     }
     if seg.style is not None:
-        d["style"] = _style_to_dict(seg.style)
+        d["style"] = _style_to_dict(seg.style) if styles is None else styles.ref(seg.style)
     if seg.audio_file is not None:
         d["audio_file"] = seg.audio_file
     if seg.volume != 1.0:
@@ -69,19 +98,32 @@ def _segment_to_dict(seg: SubtitleSegment) -> dict:
     if seg.speed is not None:
         d["speed"] = seg.speed
     if seg.animation is not None:
-        a = seg.animation
-        d["animation"] = {
-            "in_effect": a.in_effect,
-            "out_effect": a.out_effect,
-            "in_duration_ms": a.in_duration_ms,
-            "out_duration_ms": a.out_duration_ms,
-            "slide_offset_px": a.slide_offset_px,
-        }
+        d["animation"] = _animation_to_dict(seg.animation)
     return d
 
 
-def _dict_to_segment(d: dict) -> SubtitleSegment:
-    style = _dict_to_style(d["style"]) if "style" in d else None
+def _animation_to_dict(a: SubtitleAnimation) -> dict:
+    return {
+        "in_effect": a.in_effect,
+        "out_effect": a.out_effect,
+        "in_duration_ms": a.in_duration_ms,
+        "out_duration_ms": a.out_duration_ms,
+        "slide_offset_px": a.slide_offset_px,
+    }
+
+
+def _dict_to_segment(
+    d: dict, styles: list[SubtitleStyle] | None = None, registry: StyleRegistry | None = None,
+) -> SubtitleSegment:
+    style_data = d.get("style")
+    if style_data is None:
+        style = None
+    elif isinstance(style_data, int):  # v13: style table reference
+        style = styles[style_data]
+    else:  # v12 and below: inline style
+        style = _dict_to_style(style_data)
+        if registry is not None:
+            style = registry.intern(style)
     anim_data = d.get("animation")
     animation = SubtitleAnimation(**anim_data) if anim_data else None
     return SubtitleSegment(
@@ -97,131 +139,215 @@ def _dict_to_segment(d: dict) -> SubtitleSegment:
     )
 
 
-def save_project(project: ProjectState, path: Path) -> None:
-    """Serialize *project* to a JSON file (v4 format)."""
-    tracks_data = []
-    for track in project.subtitle_tracks:
-        tracks_data.append({
-            "name": track.name,
-            "language": track.language,
-            "audio_path": track.audio_path,
-            "audio_start_ms": track.audio_start_ms,
-            "audio_duration_ms": track.audio_duration_ms,
-            "locked": track.locked,
-            "muted": track.muted,
-            "hidden": track.hidden,
-            "segments": [_segment_to_dict(seg) for seg in track],
-        })
-
-    # Image overlays
-    image_overlays_data = {
-        "locked": project.image_overlay_track.locked,
-        "hidden": project.image_overlay_track.hidden,
-        "items": [ov.to_dict() for ov in project.image_overlay_track]
+def subtitle_track_to_dict(
+    track: SubtitleTrack, include_segments: bool = True, styles: _StyleTable | None = None,
+) -> dict:
+    return {
+        "name": track.name,
+        "language": track.language,
+        "audio_path": track.audio_path,
+        "audio_start_ms": track.audio_start_ms,
+        "audio_duration_ms": track.audio_duration_ms,
+        "locked": track.locked,
+        "muted": track.muted,
+        "hidden": track.hidden,
+        "segments": [_segment_to_dict(seg, styles) for seg in track] if include_segments else [],
+    }
+
+
+def video_track_to_dict(vt: VideoClipTrack) -> dict:
+    # v6, blend_mode/chroma_key from v11
+    return {
+        "locked": vt.locked,
+        "muted": vt.muted,
+        "hidden": vt.hidden,
+        "name": vt.name,
+        "blend_mode": vt.blend_mode,
+        "chroma_color": vt.chroma_color,
+        "chroma_similarity": vt.chroma_similarity,
+        "chroma_blend": vt.chroma_blend,
+        "items": [c.to_dict() for c in vt.clips]
     }
 
-    # Video tracks (v6, blend_mode/chroma_key from v11)
-    video_tracks_data = []
-    for vt in project.video_tracks:
-        video_tracks_data.append({
-            "locked": vt.locked,
-            "muted": vt.muted,
-            "hidden": vt.hidden,
-            "name": vt.name,
-            "blend_mode": vt.blend_mode,
-            "chroma_color": vt.chroma_color,
-            "chroma_similarity": vt.chroma_similarity,
-            "chroma_blend": vt.chroma_blend,
-            "items": [c.to_dict() for c in vt.clips]
-        })
 
+def overlay_track_to_dict(track: ImageOverlayTrack | TextOverlayTrack) -> dict:
+    return {
+        "locked": track.locked,
+        "hidden": track.hidden,
+        "items": [ov.to_dict() for ov in track]
+    }
+
+
+def project_to_dict(project: ProjectState, include_segments: bool = True, media: bool = True) -> dict:
+    """Build the JSON-ready project dict.
+
+    Only fresh dicts/lists of plain values are returned, so the result can be
+    serialized on another thread while the project keeps being edited.
+    With ``include_segments=False`` subtitle tracks carry empty segment lists
+    (the binary container stores segments in its own columnar sections).
+    With ``media=False`` the ``"media"`` table is left empty — fingerprinting
+    stats (and on first sight hashes) every file, so callers can fill it later
+    with ``media_table(*media_sources(project))`` on a worker thread.
+    Segment styles are stored once in ``"styles"`` and referenced by index (v13).
+    """
+    video_tracks_data = [video_track_to_dict(vt) for vt in project.video_tracks]
+    styles = _StyleTable()
+    tracks_data = [subtitle_track_to_dict(t, include_segments, styles) for t in project.subtitle_tracks]
     data = {
         "version": PROJECT_VERSION,
         "video_path": str(project.video_path) if project.video_path else None,
         "duration_ms": project.duration_ms,
         "default_style": _style_to_dict(project.default_style),
         "active_track_index": project.active_track_index,
+        "styles": styles.styles,
         "tracks": tracks_data,
-        "image_overlays": image_overlays_data,
+        "image_overlays": overlay_track_to_dict(project.image_overlay_track),
         "video_tracks": video_tracks_data,
         "video_clips": video_tracks_data[0] if video_tracks_data else None,
-        "text_overlays": {
-            "locked": project.text_overlay_track.locked,
-            "hidden": project.text_overlay_track.hidden,
-            "items": [ov.to_dict() for ov in project.text_overlay_track]
-        },
+        "text_overlays": overlay_track_to_dict(project.text_overlay_track),
         "markers": [m.to_dict() for m in project.markers],
+        "media": media_table(*media_sources(project)) if media else {},
     }
-    raw = json.dumps(data, ensure_ascii=False, indent=2).encode("utf-8")
-    path.write_bytes(gzip.compress(raw, compresslevel=6))
+    return data
 
 
-def load_project(path: Path) -> ProjectState:
-    """Deserialize a project from a JSON file (v1-v4)."""
+def media_sources(project: ProjectState) -> tuple[list[str], dict[str, str]]:
+    """media_table 입력 (참조 경로, 마지막 지문) — 복사본이라 다른 스레드로 넘겨도 된다."""
+    return project.all_media_paths(), dict(project.media_fingerprints)
+
+
+def media_table(paths: list[str], known: dict[str, str]) -> dict[str, str]:
+    """경로 → 내용 지문. 지금 읽을 수 없는 파일은 마지막으로 기록된 지문(*known*)을 유지한다."""
+    fingerprints = get_media_fingerprint()
+    table = {}
+    for path in paths:
+        try:
+            table[path] = fingerprints.fingerprint(path)
+        except OSError:
+            fp = known.get(path)
+            if fp:
+                table[path] = fp
+    return table
+
+
+def write_project_data(data: dict, path: Path, indent: int | None = 2, compresslevel: int = 6) -> None:
+    """Serialize and gzip *data* to *path* atomically (temp file + rename).
+
+    A crash mid-write leaves the previous file intact instead of a truncated one.
+    """
+    if indent is None:
+        raw = json.dumps(data, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+    else:
+        raw = json.dumps(data, ensure_ascii=False, indent=indent).encode("utf-8")
+    write_atomic(path, gzip.compress(raw, compresslevel=compresslevel))
+
+
+def write_atomic(path: Path, payload: bytes) -> None:
+    """Write *payload* to a temp file next to *path*, then rename over it."""
+    # Per-thread temp name; open() honours the umask like a plain write would
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+    try:
+        with open(tmp, "wb") as f:
+            f.write(payload)
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+def save_project(project: ProjectState, path: Path, binary: bool = False) -> None:
+    """Serialize *project* to *path* — gzipped JSON (v4+ format) by default.
+
+    ``binary=True`` writes the compact binary container instead (see
+    project_binary). The extension does not decide the format; load_project
+    detects either one from the file header.
+    """
+    if binary:
+        from src.services.project_binary import save_binary_project
+        save_binary_project(project, path)
+        return
+    write_project_data(project_to_dict(project), path)
+
+
+def read_project_data(path: Path) -> dict:
+    """Read the raw project dict from a (optionally gzipped) JSON file."""
     raw = path.read_bytes()
     text = gzip.decompress(raw).decode("utf-8-sig") if raw[:2] == b'\x1f\x8b' else raw.decode("utf-8-sig")
-    data = json.loads(text)
+    return json.loads(text)
+
+
+def iter_load_project(path: Path) -> Iterator[tuple[str, object]]:
+    """load_project를 단계별로 — (섹션 이름, 내용)을 만들어지는 대로 내보낸다.
+
+    파일 읽기·파싱은 첫 섹션 전에 끝난다. 바이너리 컨테이너는 메타데이터만 읽고
+    자막 세그먼트는 트랙에 처음 접근할 때 만든다 (project_binary 참고).
+    """
+    from src.services.project_binary import is_binary_project, iter_binary_project_sections
+    if is_binary_project(path):
+        return iter_binary_project_sections(path)
+    return iter_project_sections(read_project_data(path))
+
+
+def load_project(path: Path) -> ProjectState:
+    """Deserialize a project from a JSON file (v1-v4) or a binary container."""
+    return build_project(iter_load_project(path))
+
+
+def project_from_dict(data: dict) -> ProjectState:
+    """Build a ProjectState from a project dict (any version)."""
+    return build_project(iter_project_sections(data))
+
+
+def build_project(sections: Iterable[tuple[str, object]]) -> ProjectState:
+    """Assemble the sections of iter_project_sections into one ProjectState."""
+    it = iter(sections)
+    _, project = next(it)
+    for name, payload in it:
+        apply_project_section(project, name, payload)
+    return project
+
+
+def apply_project_section(project: ProjectState, name: str, payload: object) -> None:
+    """Attach a "subtitles" or "overlays" section to the project from the "video" section."""
+    if name == "subtitles":
+        project.subtitle_tracks, project.active_track_index, project.style_registry = payload
+    elif name == "overlays":
+        project.image_overlay_track, project.text_overlay_track, project.markers = payload
+    else:
+        raise ValueError(f"Unknown project section: {name}")
+
+
+def iter_project_sections(data: dict) -> Iterator[tuple[str, object]]:
+    """Build a project from *data* in the order the UI needs it.
+
+    - "video": ProjectState with path, duration, default style and video tracks
+      (플레이어와 타임라인을 먼저 띄울 수 있다)
+    - "subtitles": (subtitle tracks, active track index, StyleRegistry)
+    - "overlays": (ImageOverlayTrack, TextOverlayTrack, markers)
+
+    뒤 섹션은 앞 섹션의 객체를 건드리지 않고 새 객체만 만든다 — 작업 스레드에서 만들고
+    메인 스레드에서 apply_project_section으로 붙여도 안전하다.
+    """
     version = data.get("version", 1)
+    yield "video", _project_header(data, version)
+    yield "subtitles", _subtitle_section(data, version)
+    yield "overlays", _overlay_section(data)
 
+
+def _project_header(data: dict, version: int) -> ProjectState:
     project = ProjectState()
     if data.get("video_path"):
         project.video_path = Path(data["video_path"])
     project.duration_ms = data.get("duration_ms", 0)
-
+    project.media_fingerprints = dict(data.get("media", {}))
     if version >= 2:
-        # v2 format
         project.default_style = _dict_to_style(data.get("default_style", {}))
-        project.active_track_index = data.get("active_track_index", 0)
-        tracks = []
-        for track_data in data.get("tracks", []):
-            track = SubtitleTrack(
-                language=track_data.get("language", ""),
-                name=track_data.get("name", ""),
-                audio_path=track_data.get("audio_path", ""),
-                audio_start_ms=track_data.get("audio_start_ms", 0),
-                audio_duration_ms=track_data.get("audio_duration_ms", 0),
-                locked=track_data.get("locked", False),
-                muted=track_data.get("muted", False),
-                hidden=track_data.get("hidden", False),
-            )
-            for seg_data in track_data.get("segments", []):
-                track.add_segment(_dict_to_segment(seg_data))
-            tracks.append(track)
-        if tracks:
-            project.subtitle_tracks = tracks
-        else:
-            project.subtitle_tracks = [SubtitleTrack(name="Default")]
     else:
-        # v1 migration: single track, no style
-        track = SubtitleTrack(
-            language=data.get("language", ""),
-            name="Default",
-        )
-        for seg_data in data.get("segments", []):
-            track.add_segment(SubtitleSegment(
-                start_ms=seg_data["start_ms"],
-                end_ms=seg_data["end_ms"],
-                text=seg_data["text"],
-            ))
-        project.subtitle_tracks = [track]
-        project.active_track_index = 0
         project.default_style = SubtitleStyle()
 
-    # Image overlays (backward-compatible: key may not exist)
-    io_track = ImageOverlayTrack()
-    io_data = data.get("image_overlays", [])
-    if isinstance(io_data, dict):
-        # v5 format
-        io_track.locked = io_data.get("locked", False)
-        io_track.hidden = io_data.get("hidden", False)
-        for ov_data in io_data.get("items", []):
-            io_track.add_overlay(ImageOverlay.from_dict(ov_data))
-    else:
-        # v4 and below
-        for ov_data in io_data:
-            io_track.add_overlay(ImageOverlay.from_dict(ov_data))
-    project.image_overlay_track = io_track
-
     # Video tracks (v6, with backward compatibility for v3-v5)
     video_tracks = []
     if version >= 6:
@@ -254,6 +380,60 @@ def load_project(path: Path) -> ProjectState:
         project.video_tracks = video_tracks
     else:
         project.video_tracks = [VideoClipTrack()]
+    return project
+
+
+def _subtitle_section(data: dict, version: int) -> tuple[list[SubtitleTrack], int, StyleRegistry]:
+    registry = StyleRegistry()
+    if version < 2:
+        # v1 migration: single track, no style
+        track = SubtitleTrack(
+            language=data.get("language", ""),
+            name="Default",
+        )
+        for seg_data in data.get("segments", []):
+            track.add_segment(SubtitleSegment(
+                start_ms=seg_data["start_ms"],
+                end_ms=seg_data["end_ms"],
+                text=seg_data["text"],
+            ))
+        return [track], 0, registry
+
+    styles = [registry.intern(_dict_to_style(d)) for d in data.get("styles", [])]
+    tracks = []
+    for track_data in data.get("tracks", []):
+        track = SubtitleTrack(
+            language=track_data.get("language", ""),
+            name=track_data.get("name", ""),
+            audio_path=track_data.get("audio_path", ""),
+            audio_start_ms=track_data.get("audio_start_ms", 0),
+            audio_duration_ms=track_data.get("audio_duration_ms", 0),
+            locked=track_data.get("locked", False),
+            muted=track_data.get("muted", False),
+            hidden=track_data.get("hidden", False),
+        )
+        for seg_data in track_data.get("segments", []):
+            track.add_segment(_dict_to_segment(seg_data, styles, registry))
+        tracks.append(track)
+    if not tracks:
+        tracks = [SubtitleTrack(name="Default")]
+    return tracks, data.get("active_track_index", 0), registry
+
+
+def _overlay_section(data: dict) -> tuple[ImageOverlayTrack, TextOverlayTrack, list[TimelineMarker]]:
+    # Image overlays (backward-compatible: key may not exist)
+    io_track = ImageOverlayTrack()
+    io_data = data.get("image_overlays", [])
+    if isinstance(io_data, dict):
+        # v5 format
+        io_track.locked = io_data.get("locked", False)
+        io_track.hidden = io_data.get("hidden", False)
+        for ov_data in io_data.get("items", []):
+            io_track.add_overlay(ImageOverlay.from_dict(ov_data))
+    else:
+        # v4 and below
+        for ov_data in io_data:
+            io_track.add_overlay(ImageOverlay.from_dict(ov_data))
 
     # Text overlays (v7)
     to_track = TextOverlayTrack()
@@ -263,9 +443,7 @@ def load_project(path: Path) -> ProjectState:
         to_track.hidden = to_data.get("hidden", False)
         for ov_data in to_data.get("items", []):
             to_track.add_overlay(TextOverlay.from_dict(ov_data))
-    project.text_overlay_track = to_track
 
     # Markers (v10)
-    project.markers = [TimelineMarker.from_dict(m) for m in data.get("markers", [])]
-
-    return project
+    markers = [TimelineMarker.from_dict(m) for m in data.get("markers", [])]
+    return io_track, to_track, markers
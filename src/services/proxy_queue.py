@@ -0,0 +1,317 @@
+"""Proxy generation queue — bounded concurrency, viewport priority, resumable.
+
+소스마다 워커를 바로 띄우면 클립을 여러 개 넣는 순간 FFmpeg 인코딩이 한꺼번에 돌아 CPU와
+하드웨어 인코더 세션을 모두 잡아먹는다. 요청은 대기열에 쌓이고 인코더에 맞춘 개수만 동시에
+실행되며, 타임라인 화면에 오래 보이는 소스부터 시작한다 (TimelineWaveformService와 같은 방식).
+여러 대기열이 EncodeSlots 하나를 공유하면 한도도 합쳐서 센다.
+
+대기 중·실행 중인 작업은 상태 파일에 기록된다. 앱이 중간에 종료되면 다음 실행에서
+resume()으로 이어서 만든다 (작업 중 파일은 .part로 쓰므로 반쯤 만든 프록시가 남지 않는다).
+"""
+
+from __future__ import annotations
+
+import itertools
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Callable, Dict, Optional
+
+from PySide6.QtCore import QObject, QThread, Signal
+
+from src.services.proxy_service import get_proxy_path, is_proxy_valid, proxy_encoder
+from src.services.project_io import write_atomic
+from src.workers.proxy_worker import ProxyWorker
+
+logger = logging.getLogger(__name__)
+
+_STATE_VERSION = 1
+
+# 동시에 열 수 있는 인코딩 세션 — 소비자용 NVENC는 세션 수가 제한된다
+_HW_SESSIONS = {"nvenc": 3, "videotoolbox": 2, "vaapi": 2}
+
+
+def default_state_path(name: str = "proxy_queue.json") -> Path:
+    return Path.home() / ".fastmoviemaker" / name
+
+
+def default_proxy_concurrency(encoder: str, cpu_count: int | None = None) -> int:
+    """인코더에 맞춘 동시 작업 수.
+
+    libx264는 작업 하나가 이미 여러 코어를 쓰므로 코어 4개당 1개 (최대 4).
+    하드웨어 인코더는 세션 한도까지 — 디코딩은 CPU에서 하므로 코어 2개당 1개를 넘지 않는다.
+    """
+    cpu = cpu_count or os.cpu_count() or 2
+    for name, sessions in _HW_SESSIONS.items():
+        if name in encoder:
+            return max(1, min(sessions, cpu // 2))
+    return max(1, min(4, cpu // 4))
+
+
+def _has_valid_proxy(source: Path) -> bool:
+    return is_proxy_valid(source, get_proxy_path(source))
+
+
+class EncodeSlots:
+    """여러 대기열이 나눠 쓰는 동시 인코딩 한도.
+
+    프록시·스크럽 티어·인제스트 대기열이 각자 한도를 가지면 합계가 CPU/세션 한도를 넘는다.
+    슬롯을 공유하는 대기열은 모두 합쳐 ``limit()`` 개까지만 실행하고, 작업 하나가 끝나면
+    등록 순서대로 빈 슬롯을 채운다.
+    """
+
+    def __init__(self, max_workers: int | None = None, encoder: Callable[[], str] = proxy_encoder):
+        self._max_workers = max_workers if max_workers and max_workers > 0 else None
+        self._encoder = encoder
+        self._queues: list[ProxyQueue] = []
+
+    def limit(self) -> int:
+        if self._max_workers is not None:
+            return self._max_workers
+        return default_proxy_concurrency(self._encoder())
+
+    def active_count(self) -> int:
+        return sum(q.active_count() for q in self._queues)
+
+    def has_free(self) -> bool:
+        return self.active_count() < self.limit()
+
+    def register(self, queue: ProxyQueue) -> None:
+        self._queues.append(queue)
+
+    def dispatch(self) -> None:
+        for queue in self._queues:
+            queue._dispatch()
+
+
+class _ProxyJobRelay(QObject):
+    """워커 신호를 메인 스레드로 넘긴다 — 대기열 상태는 메인 스레드에서만 바뀐다."""
+
+    progress = Signal(int)
+    finished = Signal(str)
+    error = Signal(str)
+    thread_finished = Signal()
+
+
+class ProxyQueue(QObject):
+    """Runs ProxyWorkers from a priority queue, at most ``max_workers`` at a time.
+
+    Signals:
+        started(str): source_path — the job left the queue and is encoding.
+        progress(str, int): source_path, percent.
+        finished(str, str): source_path, proxy path ("" if failed).
+        failed(str, str): source_path, error message.
+    """
+
+    started = Signal(str)
+    progress = Signal(str, int)
+    finished = Signal(str, str)
+    failed = Signal(str, str)
+
+    def __init__(
+        self,
+        parent: Optional[QObject] = None,
+        state_path: Path | None = None,
+        max_workers: int | None = None,
+        encoder: Callable[[], str] = proxy_encoder,
+        worker_factory: Callable[[str, str], QObject] | None = None,
+        is_done: Callable[[Path], bool] = _has_valid_proxy,
+        slots: EncodeSlots | None = None,
+    ):
+        super().__init__(parent)
+        self._state_path = state_path
+        self._max_workers = max_workers if max_workers and max_workers > 0 else None
+        self._encoder = encoder
+        # (source, encoder) -> 워커. 스크럽 티어처럼 다른 종류의 작업도 같은 대기열 로직을 쓴다
+        self._worker_factory = worker_factory or ProxyWorker
+        self._is_done = is_done  # resume()에서 이미 끝난 작업을 거른다
+        # 대기열: path -> (priority, seq). seq는 동일 우선순위 내 FIFO 보장용
+        self._pending: Dict[str, tuple[float, int]] = {}
+        self._seq = itertools.count()
+        # 마지막으로 받은 화면 우선순위 — 나중에 들어온 요청에도 적용
+        self._priorities: Dict[str, float] = {}
+        self._workers: Dict[str, tuple[QThread, QObject, _ProxyJobRelay]] = {}
+        self._running_priority: Dict[str, float] = {}
+        # 취소됐지만 FFmpeg가 아직 끝나지 않은 작업 — 스레드가 끝날 때까지 참조 유지
+        self._retired: list[tuple[QThread, QObject, _ProxyJobRelay]] = []
+        # 다른 대기열과 나눠 쓰는 한도 (없으면 이 대기열 한도만)
+        self._slots = slots
+        if slots is not None:
+            slots.register(self)
+
+    # ---- 조회 ----
+
+    def max_workers(self) -> int:
+        if self._max_workers is not None:
+            return self._max_workers
+        if self._slots is not None:
+            return self._slots.limit()
+        # 하드웨어 인코더가 실패해 소프트웨어로 바뀌면 한도도 다시 계산된다
+        return default_proxy_concurrency(self._encoder())
+
+    def active_count(self) -> int:
+        return len(self._workers)
+
+    def is_busy(self) -> bool:
+        return bool(self._workers or self._pending)
+
+    def is_queued(self, source_path: str) -> bool:
+        return source_path in self._pending or source_path in self._workers
+
+    def pending_sources(self) -> list[str]:
+        """대기 중인 소스 (시작될 순서)."""
+        return sorted(self._pending, key=lambda p: (-self._pending[p][0], self._pending[p][1]))
+
+    # ---- 요청 / 우선순위 / 취소 ----
+
+    def request(self, source_path: str, priority: float = 0.0) -> None:
+        """Queue proxy generation; an already queued source only gets its priority raised."""
+        if source_path in self._workers:
+            return
+        priority = max(priority, self._priorities.get(source_path, 0.0))
+        queued = self._pending.get(source_path)
+        if queued is not None:
+            if priority > queued[0]:
+                self._pending[source_path] = (priority, queued[1])
+            return
+        self._pending[source_path] = (priority, next(self._seq))
+        self._save_state()
+        self._dispatch()
+
+    def update_priorities(self, priorities: Dict[str, float]) -> None:
+        """뷰포트 기반 우선순위 반영 (``compute_source_priorities`` 결과). 목록에 없는 소스는 0."""
+        self._priorities = dict(priorities)
+        for path, (_, seq) in self._pending.items():
+            self._pending[path] = (priorities.get(path, 0.0), seq)
+
+    def cancel(self, source_path: str) -> None:
+        """대기 중이거나 실행 중인 작업을 취소하고 상태 파일에서도 지운다."""
+        if self._pending.pop(source_path, None) is None:
+            job = self._workers.pop(source_path, None)
+            if job is None:
+                return
+            self._running_priority.pop(source_path, None)
+            thread, worker, _ = job
+            worker.cancel()
+            thread.quit()
+            self._retired.append(job)
+        self._save_state()
+        self._refill()
+
+    def shutdown(self) -> None:
+        """Stop every job for app exit, keeping them in the state file for resume()."""
+        self._pending.clear()
+        jobs = list(self._workers.values()) + self._retired
+        for _, worker, _ in jobs:
+            worker.cancel()
+        for thread, _, _ in jobs:
+            thread.quit()
+            thread.wait(2000)
+        self._workers.clear()
+        self._running_priority.clear()
+        self._retired.clear()
+
+    def saved_sources(self) -> list[str]:
+        """상태 파일에 남은 소스 — 요청마다 옵션이 있는 대기열은 resume() 대신 이것으로 다시 요청한다."""
+        return [job["source"] for job in self._load_state() if job.get("source")]
+
+    def resume(self) -> int:
+        """Re-queue jobs interrupted by the last exit. Returns how many were queued."""
+        count = 0
+        for job in self._load_state():
+            source = job.get("source")
+            if not source or self.is_queued(source) or not Path(source).is_file():
+                continue
+            try:
+                if self._is_done(Path(source)):
+                    continue
+            except OSError:
+                continue
+            self._pending[source] = (float(job.get("priority", 0.0)), next(self._seq))
+            count += 1
+        self._save_state()
+        self._dispatch()
+        return count
+
+    # ---- 내부 ----
+
+    def _dispatch(self) -> None:
+        """빈 슬롯만큼 우선순위가 가장 높은 대기 요청을 시작한다."""
+        if not self._pending:
+            return
+        limit = self.max_workers()
+        slots = self._slots
+        while self._pending and self.active_count() < limit and (slots is None or slots.has_free()):
+            source = self.pending_sources()[0]
+            priority, _ = self._pending.pop(source)
+            self._start_worker(source, priority)
+
+    def _refill(self) -> None:
+        """슬롯이 비었다 — 공유 중이면 다른 대기열의 작업도 시작할 수 있다."""
+        if self._slots is not None:
+            self._slots.dispatch()
+        else:
+            self._dispatch()
+
+    def _start_worker(self, source: str, priority: float) -> None:
+        thread = QThread()
+        worker = self._worker_factory(source, self._encoder())
+        worker.moveToThread(thread)
+        relay = _ProxyJobRelay()
+        worker.progress.connect(relay.progress)
+        worker.error.connect(relay.error)
+        worker.finished.connect(relay.finished)
+        relay.progress.connect(lambda pct, p=source: self.progress.emit(p, pct))
+        relay.error.connect(lambda msg, p=source: self.failed.emit(p, msg))
+        relay.finished.connect(lambda proxy, p=source, r=relay: self._on_worker_finished(p, r, proxy))
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        thread.finished.connect(relay.thread_finished)
+        relay.thread_finished.connect(lambda t=thread: self._on_thread_finished(t))
+        self._workers[source] = (thread, worker, relay)
+        self._running_priority[source] = priority
+        self.started.emit(source)
+        thread.start()
+
+    def _on_worker_finished(self, source: str, relay: _ProxyJobRelay, proxy_path: str) -> None:
+        job = self._workers.get(source)
+        if job is None or job[2] is not relay:
+            return  # 취소된 작업
+        del self._workers[source]
+        self._running_priority.pop(source, None)
+        # 스레드가 끝날 때까지 참조 유지 (실행 중 QThread 파괴 방지)
+        self._retired.append(job)
+        self._save_state()
+        self.finished.emit(source, proxy_path)
+        self._refill()
+
+    def _on_thread_finished(self, thread: QThread) -> None:
+        thread.wait()  # finished는 스레드가 완전히 끝나기 직전에 온다
+        self._retired = [job for job in self._retired if job[0] is not thread]
+
+    def _jobs(self) -> list[dict]:
+        running = [{"source": p, "priority": self._running_priority.get(p, 0.0)} for p in self._workers]
+        queued = [{"source": p, "priority": self._pending[p][0]} for p in self.pending_sources()]
+        # 실행 중이던 작업을 먼저 — 다시 시작할 때 이어서 처리
+        return running + queued
+
+    def _save_state(self) -> None:
+        if self._state_path is None:
+            return
+        data = {"version": _STATE_VERSION, "jobs": self._jobs()}
+        try:
+            self._state_path.parent.mkdir(parents=True, exist_ok=True)
+            write_atomic(self._state_path, json.dumps(data, ensure_ascii=False).encode("utf-8"))
+        except OSError as e:
+            logger.warning(f"Could not save proxy queue state: {e}")
+
+    def _load_state(self) -> list[dict]:
+        if self._state_path is None or not self._state_path.exists():
+            return []
+        try:
+            data = json.loads(self._state_path.read_text(encoding="utf-8"))
+            jobs = data.get("jobs", [])
+            return [j for j in jobs if isinstance(j, dict)]
+        except (OSError, ValueError, AttributeError):
+            return []
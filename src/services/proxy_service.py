@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import logging
-import hashlib
 import subprocess
 import threading
 from pathlib import Path
 from typing import Callable
 
 from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
+from src.services.media_fingerprint import get_media_fingerprint
 from src.services.video_probe import probe_video
 
 logger = logging.getLogger(__name__)
@@ -28,11 +28,83 @@ def get_proxy_dir(project_path: Path | None = None) -> Path:
     return proxy_dir
 
 def get_proxy_path(video_path: Path, project_path: Path | None = None) -> Path:
-    """Generate a unique proxy path for a given source video."""
-    # Use MD5 of absolute path to avoid collisions and keep filenames manageable
-    path_hash = hashlib.md5(str(video_path.absolute()).encode()).hexdigest()
+    """Generate a unique proxy path for a given source video.
+
+    The name carries the source's content fingerprint, so a moved source keeps
+    its proxy and a changed file at the same path gets a new one.
+    Raises OSError if the source cannot be read.
+    """
+    fingerprint = get_media_fingerprint().fingerprint(video_path)
     proxy_dir = get_proxy_dir(project_path)
-    return proxy_dir / f"proxy_{path_hash}.mp4"
+    return proxy_dir / f"proxy_{fingerprint}.mp4"
+
+# 프록시용 인코더 설정 — 화질보다 속도 (편집 미리보기 전용)
+_SOFTWARE_ENCODER = "libx264"
+_PROXY_ENCODER_FLAGS = {
+    "libx264": ["-preset", "veryfast", "-crf", "30", "-pix_fmt", "yuv420p"],
+    "h264_nvenc": ["-preset", "p1", "-cq", "30", "-pix_fmt", "yuv420p"],
+    "h264_videotoolbox": ["-q:v", "45", "-pix_fmt", "yuv420p"],
+    "h264_vaapi": ["-qp", "30"],
+}
+_VAAPI_DEVICE = "/dev/dri/renderD128"
+# 하드웨어 인코더가 한 번 실패하면 이번 세션 동안은 소프트웨어만 쓴다
+_hw_encoder_failed = False
+_hw_encoder: str | None = None
+
+
+def proxy_encoder() -> str:
+    """Encoder for new proxies: the platform's hardware H.264 encoder, else libx264.
+
+    Detection (``ffmpeg -encoders``) runs once per session.
+    """
+    global _hw_encoder
+    if _hw_encoder_failed:
+        return _SOFTWARE_ENCODER
+    if _hw_encoder is None:
+        from src.utils.hw_accel import get_hw_encoder
+
+        encoder, _ = get_hw_encoder("h264")
+        _hw_encoder = encoder if encoder in _PROXY_ENCODER_FLAGS else _SOFTWARE_ENCODER
+    return _hw_encoder
+
+
+def disable_hw_proxy_encoder() -> None:
+    """하드웨어 인코더 실패 후 — 이번 세션의 나머지 프록시는 libx264로 만든다."""
+    global _hw_encoder_failed
+    _hw_encoder_failed = True
+
+
+def _proxy_pre_input(encoder: str) -> list[str]:
+    # VAAPI는 GPU 메모리의 프레임만 받는다 — 장치를 열고 축소 후 업로드
+    return ["-vaapi_device", _VAAPI_DEVICE] if encoder == "h264_vaapi" else []
+
+
+def _proxy_video_filter(encoder: str) -> str:
+    vf = "scale=-2:720"
+    if encoder == "h264_vaapi":
+        vf += ",format=nv12,hwupload"
+    return vf
+
+
+def _proxy_args(video_path: Path, output_path: Path, encoder: str) -> list[str]:
+    return [
+        "-y",
+        *_proxy_pre_input(encoder),
+        "-i", str(video_path),
+        "-vf", _proxy_video_filter(encoder),
+        "-c:v", encoder,
+        *_PROXY_ENCODER_FLAGS.get(encoder, []),
+        "-c:a", "aac",
+        "-b:a", "128k",
+        "-progress", "pipe:1",
+        str(output_path),
+    ]
+
+
+def partial_proxy_path(proxy_path: Path) -> Path:
+    """작업 중인 프록시 파일 — 성공해야 proxy_path로 이름을 바꾼다 (중단된 작업이 유효해 보이지 않게)."""
+    return proxy_path.with_name(f"{proxy_path.stem}.part{proxy_path.suffix}")
+
 
 def generate_proxy(
     video_path: Path,
@@ -40,6 +112,7 @@ def generate_proxy(
     force: bool = False,
     on_progress: Callable[[int], None] | None = None,
     cancel_check: Callable[[], bool] | None = None,
+    encoder: str | None = None,
 ) -> bool:
     """Generate a low-res (720p) proxy of the video.
     
@@ -49,6 +122,8 @@ def generate_proxy(
         force: If True, overwrite existing proxy.
         on_progress: Optional callback(percentage) for progress updates.
         cancel_check: Optional callback returning True to abort generation.
+        encoder: Video encoder (default libx264). A hardware encoder that fails
+            to start is retried once with libx264, like export_video.
         
     Returns:
         True if proxy was generated successfully or already exists.
@@ -64,7 +139,8 @@ def generate_proxy(
         logger.error("FFmpeg not found for proxy generation.")
         return False
 
-    logger.info(f"Generating proxy for {video_path} -> {proxy_path}")
+    encoder = encoder or _SOFTWARE_ENCODER
+    logger.info(f"Generating proxy for {video_path} -> {proxy_path} ({encoder})")
 
     # Get duration for progress calculation
     total_duration_sec = 0.0
@@ -75,20 +151,17 @@ def generate_proxy(
         except Exception:
             pass
 
-    args = [
-        "-y",
-        "-i", str(video_path),
-        "-vf", "scale=-2:720",
-        "-c:v", "libx264",
-        "-preset", "veryfast",
-        "-crf", "30",
-        "-c:a", "aac",
-        "-b:a", "128k",
-        "-progress", "pipe:1",
-        str(proxy_path),
-    ]
+    part_path = partial_proxy_path(proxy_path)
 
-    try:
+    def _stop(process) -> None:
+        process.terminate()
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+
+    def _run_once(args: list[str]) -> tuple[int | None, str]:
+        """Returns (returncode, stderr tail); returncode None = cancelled."""
         process = runner.run_async(
             args,
             stdout=subprocess.PIPE,
@@ -97,12 +170,14 @@ def generate_proxy(
             encoding="utf-8",
             errors="replace",
         )
+        stderr_tail: list[str] = []
 
-        # Drain stderr in background to prevent deadlock
+        # Drain stderr in background to prevent deadlock (keep the tail for fallback detection)
         def _drain_stderr():
             try:
-                for _ in process.stderr:
-                    pass
+                for line in process.stderr:
+                    stderr_tail.append(line)
+                    del stderr_tail[:-20]
             except Exception:
                 pass
 
@@ -113,14 +188,8 @@ def generate_proxy(
         if process.stdout:
             for line in process.stdout:
                 if cancel_check and cancel_check():
-                    process.terminate()
-                    try:
-                        process.wait(timeout=1)
-                    except subprocess.TimeoutExpired:
-                        process.kill()
-                    if proxy_path.exists():
-                        proxy_path.unlink(missing_ok=True)
-                    return False
+                    _stop(process)
+                    return None, ""
 
                 line = line.strip()
                 if on_progress and total_duration_sec > 0 and line.startswith("out_time_us="):
@@ -134,40 +203,51 @@ def generate_proxy(
 
         if cancel_check and cancel_check():
             if process.poll() is None:
-                process.terminate()
-                try:
-                    process.wait(timeout=1)
-                except subprocess.TimeoutExpired:
-                    process.kill()
-            if proxy_path.exists():
-                proxy_path.unlink(missing_ok=True)
-            return False
+                _stop(process)
+            return None, ""
 
         process.wait()
         stderr_thread.join(timeout=5)
+        return process.returncode, "".join(stderr_tail)
 
-        if process.returncode != 0:
-            logger.error(f"Proxy generation failed with code {process.returncode}")
-            if proxy_path.exists():
-                proxy_path.unlink(missing_ok=True)
+    try:
+        returncode, stderr = _run_once(_proxy_args(video_path, part_path, encoder))
+        if returncode and encoder != _SOFTWARE_ENCODER:
+            from src.services.video_exporter import _looks_like_hw_failure
+
+            if _looks_like_hw_failure(stderr):
+                logger.warning(f"Hardware proxy encode failed ({encoder}), retrying with software encoder")
+                disable_hw_proxy_encoder()
+                returncode, stderr = _run_once(_proxy_args(video_path, part_path, _SOFTWARE_ENCODER))
+
+        if returncode is None:
+            part_path.unlink(missing_ok=True)
             return False
-            
+
+        if returncode != 0:
+            logger.error(f"Proxy generation failed with code {returncode}")
+            part_path.unlink(missing_ok=True)
+            return False
+
+        part_path.replace(proxy_path)
         if on_progress:
             on_progress(100)
             
         return True
     except Exception as e:
         logger.exception(f"Error during proxy generation: {e}")
+        part_path.unlink(missing_ok=True)
         return False
 
 def is_proxy_valid(video_path: Path, proxy_path: Path) -> bool:
-    """Check if proxy is still valid (e.g. source hasn't changed)."""
+    """Check if *proxy_path* exists and was made from the source's current content."""
     if not proxy_path.exists():
         return False
-    
-    # Basic check: source modification time vs proxy modification time
-    # This is a bit simplified, but works for most cases.
-    return video_path.stat().st_mtime <= proxy_path.stat().st_mtime
+    try:
+        fingerprint = get_media_fingerprint().fingerprint(video_path)
+    except OSError:
+        return False
+    return proxy_path.name == f"proxy_{fingerprint}.mp4"
 
 
 class ProxyService:
@@ -175,14 +255,17 @@ class ProxyService:
 
     def has_proxy(self, source_path: str) -> bool:
         path = Path(source_path)
-        proxy = get_proxy_path(path)
+        try:
+            proxy = get_proxy_path(path)
+        except OSError:
+            return False
         return is_proxy_valid(path, proxy)
 
     def get_proxy_path(self, source_path: str) -> str:
         return str(get_proxy_path(Path(source_path)))
 
-    def create_worker(self, source_path: str):
+    def create_worker(self, source_path: str, encoder: str | None = None):
         """Create a worker to generate proxy."""
         # Import here to avoid circular imports if any
         from src.workers.proxy_worker import ProxyWorker
-        return ProxyWorker(source_path)
+        return ProxyWorker(source_path, encoder)
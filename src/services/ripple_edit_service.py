@@ -1,79 +1,367 @@
 """
 Service for handling ripple edits across multiple tracks.
 """
+import bisect
+from dataclasses import dataclass
+from operator import attrgetter
+
 from src.models.project import ProjectState
 
+_SPAN_FIELDS = ("start_ms", "end_ms")
+_START_ONLY = ("start_ms",)
+_start_key = attrgetter("start_ms")
+
+
+@dataclass(slots=True)
+class RippleDelta:
+    """한 컬렉션의 접미사 이동 기록 — items[start:]의 fields가 delta만큼 이동했다.
+
+    되돌리기는 같은 접미사를 -delta만큼 옮기면 되므로 항목별 스냅샷이 필요 없다.
+    owner가 있으면 이동 후 owner.mark_modified()로 파생 인덱스를 무효화한다.
+    """
+
+    items: list
+    start: int
+    delta: int
+    fields: tuple[str, ...] = _SPAN_FIELDS
+    owner: object = None
+    stop: int | None = None  # None이면 목록 끝까지 (구간 삭제는 구간 사이마다 한 덩어리)
+
+    @property
+    def count(self) -> int:
+        return (len(self.items) if self.stop is None else self.stop) - self.start
+
+
+@dataclass(slots=True)
+class RippleCut:
+    """구간 삭제 기록 — 제거된 항목(원래 인덱스 오름차순), 값이 개별로 바뀐(잘린) 항목의
+    이전 값, 균일하게 당겨진 항목 덩어리의 델타, 시작 순서를 다시 맞춘 경우 그 순열.
+    되돌리기는 RippleEditService.restore_cut."""
+
+    items: list
+    removed: list[tuple[int, object]]
+    changed: list[tuple[int, int, int]]
+    deltas: list[RippleDelta]
+    owner: object = None
+    order: list[int] | None = None  # 재정렬 후 i번째 항목의 재정렬 전 인덱스
+
+
+class RangeShiftMap:
+    """삭제된 타임라인 구간들의 누적 이동 맵.
+
+    겹치는 구간은 합치고(맞닿은 구간은 클립별 삭제와 결과가 같도록 따로 둔다),
+    정렬된 구간 시작/끝과 그 앞 구간 길이의 접두 합을 둔다.
+    시각 t는 앞에서 끝난 구간 길이만큼 당겨지고, 구간 안의 t는 그 구간의 잘린 지점으로 모인다.
+    """
+
+    __slots__ = ("starts", "ends", "removed")
+
+    def __init__(self, ranges) -> None:
+        merged: list[list[int]] = []
+        for start, end in sorted(r for r in ranges if r[1] > r[0]):
+            if merged and start < merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+        self.starts = [a for a, _ in merged]
+        self.ends = [b for _, b in merged]
+        # removed[k] = 구간 k 앞에 있는 구간들의 길이 합 (len = 구간 수 + 1)
+        self.removed = [0]
+        for a, b in merged:
+            self.removed.append(self.removed[-1] + b - a)
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    @property
+    def total_ms(self) -> int:
+        return self.removed[-1]
+
+    def map(self, t: int) -> int:
+        """삭제 후 타임라인에서 t의 위치."""
+        k = bisect.bisect_right(self.ends, t)
+        if k < len(self.starts) and self.starts[k] <= t:
+            return self.starts[k] - self.removed[k]
+        return t - self.removed[k]
+
+    def overlaps(self, start_ms: int, end_ms: int) -> bool:
+        """[start_ms, end_ms)가 삭제 구간과 겹치는가."""
+        k = bisect.bisect_right(self.ends, start_ms)
+        return k < len(self.starts) and self.starts[k] < end_ms
+
+
 class RippleEditService:
     """
     Provides logic to propagate time shifts (ripples) to other tracks
     when a clip is inserted, deleted, or trimmed in the main video track.
+
+    모든 컬렉션은 start_ms 오름차순(모델의 insort 불변식)이므로 이동 대상은 항상 접미사다 —
+    이진 탐색(CLRS Ch.2.3)으로 첫 항목을 찾고 그 뒤만 옮긴다. 비용은 O(log n + 이동 수).
     """
 
     @staticmethod
-    def apply_ripple(project: ProjectState, ripple_start_ms: int, delta_ms: int, exclude_track_indices: list[int] = None) -> int:
+    def shift_suffix(
+        items: list, threshold_ms: int, delta_ms: int,
+        fields: tuple[str, ...] = _SPAN_FIELDS, owner=None,
+    ) -> RippleDelta | None:
+        """start_ms >= threshold_ms 인 접미사를 delta_ms만큼 이동. 옮긴 것이 없으면 None."""
+        start = bisect.bisect_left(items, threshold_ms, key=_start_key)
+        if start >= len(items) or delta_ms == 0:
+            return None
+        delta = RippleDelta(items, start, delta_ms, fields, owner)
+        RippleEditService._shift(delta, delta_ms)
+        return delta
+
+    @staticmethod
+    def shift_attr(obj, name: str, threshold_ms: int, delta_ms: int) -> RippleDelta | None:
+        """단일 시각 속성(예: TTS audio_start_ms)을 기준점 이후일 때만 이동."""
+        if delta_ms == 0 or getattr(obj, name) < threshold_ms:
+            return None
+        setattr(obj, name, getattr(obj, name) + delta_ms)
+        return RippleDelta([obj], 0, delta_ms, (name,))
+
+    @staticmethod
+    def _shift(delta: RippleDelta, amount: int) -> None:
+        items = delta.items
+        stop = len(items) if delta.stop is None else delta.stop
+        if delta.fields == _SPAN_FIELDS:
+            for i in range(delta.start, stop):
+                item = items[i]
+                item.start_ms += amount
+                item.end_ms += amount
+        else:
+            for i in range(delta.start, stop):
+                item = items[i]
+                for name in delta.fields:
+                    setattr(item, name, getattr(item, name) + amount)
+        if delta.owner is not None:
+            delta.owner.mark_modified()
+
+    @staticmethod
+    def revert(deltas: list[RippleDelta]) -> None:
+        """shift_* 결과를 역순으로 되돌린다. 컬렉션이 그 사이 바뀌지 않았어야 한다 (undo 스택 순서)."""
+        for delta in reversed(deltas):
+            RippleEditService._shift(delta, -delta.delta)
+
+    @staticmethod
+    def shift_ranges(
+        items: list, shift_map: RangeShiftMap,
+        fields: tuple[str, ...] = _SPAN_FIELDS, owner=None,
+    ) -> RippleCut | None:
+        """삭제 구간 뒤에서 시작하는 항목을 앞에서 끝난 구간 길이만큼 당긴다 (자르지 않음).
+
+        항목과 구간 모두 시작 순이므로 포인터 하나로 병합하듯 한 번 훑는다 — O(n + 구간 수).
+        같은 이동량이 이어지는 항목은 델타 하나(start..stop)로 기록한다. 구간 안에서 시작한
+        항목은 덜 당겨지므로 덩어리 경계에서 순서가 뒤집히면 안정 정렬로 불변식을 되살린다.
         """
-        Apply a time shift to all applicable elements in the project starting from ripple_start_ms.
-        
-        Args:
-            project: The project state to modify.
-            ripple_start_ms: The timeline position where the ripple begins.
-            delta_ms: The amount of time to shift (positive = push, negative = pull).
-            exclude_track_indices: Optional list of video track indices to exclude (e.g. the track being edited).
-            
-        Returns:
-            The number of items moved.
+        if not shift_map or not items:
+            return None
+        ends, removed = shift_map.ends, shift_map.removed
+        n_ranges = len(ends)
+        deltas: list[RippleDelta] = []
+        k = 0
+        run_start, run_shift = -1, 0
+        first = bisect.bisect_left(items, ends[0], key=_start_key)
+        for i in range(first, len(items)):
+            start = items[i].start_ms
+            while k < n_ranges and ends[k] <= start:
+                k += 1
+            if removed[k] != run_shift:
+                if run_shift:
+                    deltas.append(RippleDelta(items, run_start, -run_shift, fields, owner, i))
+                run_start, run_shift = i, removed[k]
+        if run_shift:
+            deltas.append(RippleDelta(items, run_start, -run_shift, fields, owner, len(items)))
+        if not deltas:
+            return None
+        for delta in deltas:
+            RippleEditService._shift(delta, delta.delta)
+
+        order = None
+        if any(d.start > 0 and items[d.start - 1].start_ms > items[d.start].start_ms for d in deltas):
+            order = sorted(range(len(items)), key=lambda i: items[i].start_ms)
+            items[:] = [items[i] for i in order]
+            if owner is not None:
+                owner.mark_modified()
+        return RippleCut(items, [], [], deltas, owner, order)
+
+    @staticmethod
+    def cut_ranges(items: list, shift_map: RangeShiftMap, owner=None) -> RippleCut | None:
+        """구간 삭제 리플 — 구간 안에 들어가는 항목은 제거, 걸친 항목은 자르고, 뒤는 당긴다.
+
+        항목 하나에 대한 결과는 구간을 뒤에서부터 하나씩 지우는 것과 같다: 끝은 시작 뒤 첫
+        구간 시작에서 잘리고, 시작이 구간 안이면 잘린 지점으로 모이며, 나머지는 앞에서 끝난
+        구간 길이만큼 당겨진다. 포인터 병합으로 한 번 훑는다 — O(n + 구간 수).
         """
+        if not shift_map or not items:
+            return None
+        starts, ends, removed_ms = shift_map.starts, shift_map.ends, shift_map.removed
+        n_ranges = len(starts)
+        first = starts[0]
+        removed: list[tuple[int, object]] = []
+        changed: list[tuple[int, int, int]] = []
+        deltas: list[RippleDelta] = []
+        run_start, run_shift = -1, 0
+
+        def close_run(stop: int) -> None:
+            nonlocal run_shift
+            if run_shift:
+                deltas.append(RippleDelta(items, run_start, -run_shift, _SPAN_FIELDS, owner, stop))
+            run_shift = 0
+
+        lo = bisect.bisect_left(items, first, key=_start_key)
+        # 첫 구간 앞에서 시작해 걸쳐 들어오는 항목 — 시작 순 정렬이라 끝 시각은 접두사를 확인
+        for i in range(lo):
+            item = items[i]
+            if item.end_ms > first:
+                changed.append((i, item.start_ms, item.end_ms))
+                item.end_ms = first
+
+        k = 0
+        for i in range(lo, len(items)):
+            item = items[i]
+            s, e = item.start_ms, item.end_ms
+            while k < n_ranges and ends[k] <= s:
+                k += 1
+            inside = k < n_ranges and starts[k] <= s
+            # 시작 뒤 첫 구간 시작에서 끝을 자른다
+            nxt = k + 1 if inside else k
+            e2 = e if nxt >= n_ranges or e <= starts[nxt] else starts[nxt]
+            if inside:
+                if e2 <= ends[k]:
+                    close_run(i)
+                    removed.append((i, item))
+                    continue
+                ns = starts[k] - removed_ms[k]
+                ne = e2 - removed_ms[k + 1]
+            else:
+                ns = s - removed_ms[k]
+                ne = e2 - removed_ms[k]
+            shift = s - ns
+            if not inside and e2 == e:
+                # 균일 이동 — 덩어리 델타로 기록
+                if shift != run_shift:
+                    close_run(i)
+                    run_start, run_shift = i, shift
+            else:
+                close_run(i)
+                changed.append((i, s, e))
+            item.start_ms = ns
+            item.end_ms = ne
+        close_run(len(items))
+
+        if removed:
+            gone = {i for i, _ in removed}
+            items[lo:] = [items[i] for i in range(lo, len(items)) if i not in gone]
+        if owner is not None:
+            owner.mark_modified()
+        return RippleCut(items, removed, changed, deltas, owner)
+
+    @staticmethod
+    def restore_cut(cut: RippleCut) -> None:
+        """cut_ranges/shift_ranges를 정확히 되돌린다.
+
+        재정렬 취소 → 제거 항목 재삽입 → 덩어리 이동 복원 → 개별 값 복원 (redo의 역순).
+        """
+        items = cut.items
+        if cut.order is not None:
+            unsorted = [None] * len(items)
+            for pos, original in enumerate(cut.order):
+                unsorted[original] = items[pos]
+            items[:] = unsorted
+        if cut.removed:
+            merged: list = []
+            src = 0
+            for i, item in cut.removed:
+                take = i - len(merged)
+                merged.extend(items[src:src + take])
+                src += take
+                merged.append(item)
+            merged.extend(items[src:])
+            items[:] = merged
+        for delta in reversed(cut.deltas):
+            RippleEditService._shift(delta, -delta.delta)
+        for i, start, end in cut.changed:
+            items[i].start_ms = start
+            items[i].end_ms = end
+        if cut.owner is not None:
+            cut.owner.mark_modified()
+
+    @staticmethod
+    def shift_timeline(
+        project: ProjectState, subtitle_track, image_overlay_track,
+        threshold_ms: int, delta_ms: int,
+    ) -> list[RippleDelta]:
+        """편집 명령(트림·삽입·속도·전환)의 리플 — 활성 자막 트랙, 이미지/텍스트 오버레이,
+        BGM 클립, TTS 오디오 시작점을 옮기고 되돌리기용 델타 목록을 반환한다."""
+        shift = RippleEditService.shift_suffix
+        deltas = [
+            shift(subtitle_track.segments, threshold_ms, delta_ms, owner=subtitle_track),
+        ]
+        if image_overlay_track:
+            deltas.append(shift(image_overlay_track.overlays, threshold_ms, delta_ms, owner=image_overlay_track))
+        tt = project.text_overlay_track
+        if tt and not tt.locked:
+            deltas.append(shift(tt.overlays, threshold_ms, delta_ms, owner=tt))
+        for bgm_track in project.bgm_tracks:
+            if not bgm_track.locked:
+                deltas.append(shift(bgm_track.clips, threshold_ms, delta_ms, _START_ONLY))
+        deltas.append(
+            RippleEditService.shift_attr(subtitle_track, "audio_start_ms", threshold_ms, delta_ms)
+        )
+        return [d for d in deltas if d is not None]
+
+    @staticmethod
+    def ripple(
+        project: ProjectState, ripple_start_ms: int, delta_ms: int,
+    ) -> list[RippleDelta]:
+        """apply_ripple과 같은 범위를 옮기고 되돌리기용 델타 목록을 반환."""
         if delta_ms == 0:
-            return 0
-            
-        moved_count = 0
-        exclude_tracks = exclude_track_indices or []
+            return []
+        shift = RippleEditService.shift_suffix
+        deltas: list[RippleDelta | None] = []
 
-        # 1. Subtitle Tracks
+        # 1. Subtitle Tracks (+ associated TTS audio)
         for track in project.subtitle_tracks:
             if track.locked:
                 continue
-            
-            # Shift segments
-            for seg in track.segments:
-                if seg.start_ms >= ripple_start_ms:
-                    seg.start_ms += delta_ms
-                    seg.end_ms += delta_ms
-                    moved_count += 1
-                elif seg.end_ms > ripple_start_ms:
-                    # Segment overlaps the ripple point - extend/shrink or split?
-                    # For simplicity in this version, we only move fully subsequent items.
-                    # Alternatively, we could extend the end time if it's a push.
-                    pass
-            
-            # Shift audio track associated with subtitles (if any)
-            if track.audio_path and track.audio_start_ms >= ripple_start_ms:
-                track.audio_start_ms += delta_ms
+            deltas.append(shift(track.segments, ripple_start_ms, delta_ms, owner=track))
+            if track.audio_path:
+                deltas.append(
+                    RippleEditService.shift_attr(track, "audio_start_ms", ripple_start_ms, delta_ms)
+                )
 
         # 2. Image Overlays
-        if project.image_overlay_track and not project.image_overlay_track.locked:
-            for overlay in project.image_overlay_track.overlays:
-                if overlay.start_ms >= ripple_start_ms:
-                    overlay.start_ms += delta_ms
-                    overlay.end_ms += delta_ms
-                    moved_count += 1
+        iot = project.image_overlay_track
+        if iot and not iot.locked:
+            deltas.append(shift(iot.overlays, ripple_start_ms, delta_ms, owner=iot))
 
         # 3. Text Overlays
-        if project.text_overlay_track and not project.text_overlay_track.locked:
-            for overlay in project.text_overlay_track.overlays:
-                if overlay.start_ms >= ripple_start_ms:
-                    overlay.start_ms += delta_ms
-                    overlay.end_ms += delta_ms
-                    moved_count += 1
+        tt = project.text_overlay_track
+        if tt and not tt.locked:
+            deltas.append(shift(tt.overlays, ripple_start_ms, delta_ms, owner=tt))
 
         # 4. BGM Tracks
-        if hasattr(project, "bgm_tracks"):
-            for track in project.bgm_tracks:
-                if track.locked:
-                    continue
-                for clip in track.clips:
-                    if clip.start_ms >= ripple_start_ms:
-                        clip.start_ms += delta_ms
-                        moved_count += 1
+        for track in getattr(project, "bgm_tracks", ()):
+            if not track.locked:
+                deltas.append(shift(track.clips, ripple_start_ms, delta_ms, _START_ONLY))
+
+        return [d for d in deltas if d is not None]
+
+    @staticmethod
+    def apply_ripple(project: ProjectState, ripple_start_ms: int, delta_ms: int, exclude_track_indices: list[int] = None) -> int:
+        """
+        Apply a time shift to all applicable elements in the project starting from ripple_start_ms.
 
-        return moved_count
\ No newline at end of file
+        Args:
+            project: The project state to modify.
+            ripple_start_ms: The timeline position where the ripple begins.
+            delta_ms: The amount of time to shift (positive = push, negative = pull).
+            exclude_track_indices: Optional list of video track indices to exclude (e.g. the track being edited).
+
+        Returns:
+            The number of items moved.
+        """
+        deltas = RippleEditService.ripple(project, ripple_start_ms, delta_ms)
+        # TTS 오디오 시작점은 항목 수에 포함하지 않는다
+        return sum(d.count for d in deltas if d.fields != ("audio_start_ms",))
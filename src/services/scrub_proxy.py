@@ -0,0 +1,206 @@
+"""Scrub proxy tier — all-intra, preview-sized, usable while it is still being built.
+
+720p 프록시는 long-GOP라 재생에는 좋지만, 플레이헤드를 끌 때마다 직전 키프레임부터 디코딩해야
+한다. 스크럽 티어는 모든 프레임이 키프레임(H.264 ``-g 1``)이고 미리보기 위젯 높이에 맞춰 작게
+만들어 어느 위치든 한 프레임만 디코딩하면 된다.
+
+파일은 MPEG-TS로, 앞에서부터 ``chunk_ms`` 단위로 인코딩한 조각을 이어 붙인다. TS는 이어 붙여도
+유효한 스트림이라 다 만들기 전에도 준비된 앞부분(``ready_ms``까지)을 바로 쓸 수 있고, 중단되면
+manifest에 기록된 지점부터 이어서 만든다.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import os
+import subprocess
+import threading
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable
+
+from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
+from src.services.media_fingerprint import get_media_fingerprint
+from src.services.media_metadata import probe_media
+from src.services.project_io import write_atomic
+from src.services.proxy_service import get_proxy_dir
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_CHUNK_MS = 10_000
+_MIN_HEIGHT = 144
+_MAX_HEIGHT = 540
+
+
+def scrub_height_for_widget(widget_height: int, device_pixel_ratio: float = 1.0) -> int:
+    """미리보기 위젯 크기에 맞춘 스크럽 티어 높이 (짝수, 144~540)."""
+    h = int(widget_height * device_pixel_ratio)
+    h = max(_MIN_HEIGHT, min(_MAX_HEIGHT, h))
+    return h - h % 2
+
+
+@dataclass(slots=True)
+class ScrubManifest:
+    """스크럽 티어 진행 상태 — ready_ms까지 준비됐고 ts 파일은 size 바이트까지 유효하다."""
+
+    duration_ms: int
+    height: int
+    chunk_ms: int = DEFAULT_CHUNK_MS
+    ready_ms: int = 0
+    size: int = 0
+
+    @property
+    def complete(self) -> bool:
+        return self.ready_ms >= self.duration_ms > 0
+
+    @classmethod
+    def load(cls, path: Path) -> ScrubManifest | None:
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            return cls(**{k: int(data[k]) for k in ("duration_ms", "height", "chunk_ms", "ready_ms", "size")})
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+
+    def save(self, path: Path) -> None:
+        write_atomic(path, json.dumps(asdict(self)).encode("utf-8"))
+
+
+def get_scrub_paths(video_path: Path, project_path: Path | None = None) -> tuple[Path, Path]:
+    """(ts 파일, manifest) — 이름은 원본의 내용 지문 (OSError if the source is unreadable)."""
+    fingerprint = get_media_fingerprint().fingerprint(video_path)
+    proxy_dir = get_proxy_dir(project_path)
+    return proxy_dir / f"scrub_{fingerprint}.ts", proxy_dir / f"scrub_{fingerprint}.json"
+
+
+# manifest 읽기 캐시 — 스크럽 중 시크마다 호출되므로 파일이 그대로면 다시 파싱하지 않는다.
+# manifest는 write_atomic으로 교체되므로 inode가 바뀐다 (mtime 해상도가 거친 파일시스템 대비)
+_manifest_cache: dict[str, tuple[tuple[int, int, int], ScrubManifest | None]] = {}
+_manifest_lock = threading.Lock()
+
+
+def _cached_manifest(path: Path) -> ScrubManifest | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    key, ident = str(path), (st.st_ino, st.st_mtime_ns, st.st_size)
+    with _manifest_lock:
+        cached = _manifest_cache.get(key)
+        if cached is not None and cached[0] == ident:
+            return cached[1]
+    manifest = ScrubManifest.load(path)
+    with _manifest_lock:
+        _manifest_cache[key] = (ident, manifest)
+    return manifest
+
+
+def find_scrub_tier(video_path: Path, position_ms: int | None = None) -> str | None:
+    """*position_ms*까지 준비된 스크럽 티어 경로 (없거나 아직 그 위치까지 안 됐으면 None)."""
+    try:
+        ts_path, manifest_path = get_scrub_paths(video_path)
+    except OSError:
+        return None
+    manifest = _cached_manifest(manifest_path)
+    if manifest is None or manifest.ready_ms <= 0:
+        return None
+    if position_ms is not None and not manifest.complete and position_ms >= manifest.ready_ms:
+        return None
+    return str(ts_path)
+
+
+def is_scrub_tier_complete(video_path: Path) -> bool:
+    """스크럽 티어를 끝까지 만들었는지 (OSError if the source is unreadable)."""
+    manifest = _cached_manifest(get_scrub_paths(video_path)[1])
+    return manifest is not None and manifest.complete
+
+
+def is_scrub_tier(path: str | Path | None) -> bool:
+    return path is not None and Path(path).name.startswith("scrub_") and Path(path).suffix == ".ts"
+
+
+def _chunk_args(video_path: Path, out: Path, start_ms: int, length_ms: int, height: int) -> list[str]:
+    start = start_ms / 1000
+    return [
+        "-y",
+        "-ss", f"{start:.3f}",
+        "-i", str(video_path),
+        "-t", f"{length_ms / 1000:.3f}",
+        "-an",
+        "-vf", f"scale=-2:{height}",
+        "-c:v", "libx264",
+        "-preset", "ultrafast",
+        "-tune", "fastdecode",
+        "-g", "1",
+        "-bf", "0",
+        "-crf", "28",
+        "-pix_fmt", "yuv420p",
+        # 조각마다 원본 시각을 유지 — 이어 붙인 파일의 위치 = 원본 위치
+        "-output_ts_offset", f"{start:.3f}",
+        "-muxdelay", "0",
+        "-muxpreload", "0",
+        "-f", "mpegts",
+        str(out),
+    ]
+
+
+def generate_scrub_tier(
+    video_path: Path,
+    height: int,
+    on_progress: Callable[[int], None] | None = None,
+    cancel_check: Callable[[], bool] | None = None,
+    chunk_ms: int = DEFAULT_CHUNK_MS,
+) -> bool:
+    """Build (or continue building) the scrub tier for *video_path*.
+
+    Each chunk is appended to the ts file and recorded in the manifest right
+    away, so callers can use the prefix while later chunks are encoding.
+    Returns True when the tier is complete.
+    """
+    ts_path, manifest_path = get_scrub_paths(video_path)
+    manifest = ScrubManifest.load(manifest_path)
+    if manifest is None or manifest.height < height * 3 // 4:
+        duration_ms = probe_media(video_path).duration_ms
+        if duration_ms <= 0:
+            logger.error(f"Unknown duration, cannot build scrub tier: {video_path}")
+            return False
+        manifest = ScrubManifest(duration_ms=duration_ms, height=height, chunk_ms=chunk_ms)
+        ts_path.unlink(missing_ok=True)
+
+    runner = get_ffmpeg_runner()
+    if not manifest.complete and not runner.is_available():
+        logger.error("FFmpeg not found for scrub tier generation.")
+        return False
+
+    # 마지막 조각을 붙이다 중단됐으면 기록된 크기로 되돌린다
+    if ts_path.exists() and ts_path.stat().st_size != manifest.size:
+        with open(ts_path, "r+b") as f:
+            f.truncate(manifest.size)
+
+    chunk_path = ts_path.with_name(f"{ts_path.stem}.chunk.ts")
+    try:
+        while not manifest.complete:
+            if cancel_check and cancel_check():
+                return False
+            length = min(manifest.chunk_ms, manifest.duration_ms - manifest.ready_ms)
+            args = _chunk_args(video_path, chunk_path, manifest.ready_ms, length, manifest.height)
+            result = runner.run(args, timeout=max(60, length // 100))
+            if result.returncode != 0 or not chunk_path.exists():
+                logger.error(f"Scrub chunk failed at {manifest.ready_ms} ms: {(result.stderr or '')[-200:]}")
+                return False
+            with open(ts_path, "ab") as out, open(chunk_path, "rb") as chunk:
+                out.write(chunk.read())
+            manifest.ready_ms += length
+            manifest.size = ts_path.stat().st_size
+            manifest.save(manifest_path)
+            if on_progress:
+                on_progress(min(100, manifest.ready_ms * 100 // manifest.duration_ms))
+    except (OSError, subprocess.SubprocessError) as e:
+        logger.exception(f"Error during scrub tier generation: {e}")
+        return False
+    finally:
+        chunk_path.unlink(missing_ok=True)
+
+    if on_progress:
+        on_progress(100)
+    return True
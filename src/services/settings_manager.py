@@ -81,6 +81,14 @@ class SettingsManager:
         """Set the snap tolerance in pixels."""
         self._settings.setValue("editing/snap_tolerance", pixels)
 
+    def get_undo_memory_limit_mb(self) -> int:
+        """Get the undo history memory limit in MB (default: 256)."""
+        return self._settings.value("editing/undo_memory_limit_mb", 256, int)
+
+    def set_undo_memory_limit_mb(self, mb: int) -> None:
+        """Set the undo history memory limit in MB (oldest history is dropped beyond it)."""
+        self._settings.setValue("editing/undo_memory_limit_mb", mb)
+
     def get_frame_seek_fps(self) -> int:
         """Get the FPS for frame-by-frame seeking (default: 30)."""
         return self._settings.value("editing/frame_fps", 30, int)
@@ -6,7 +6,8 @@ import re
 from pathlib import Path
 
 from src.models.subtitle import SubtitleSegment, SubtitleTrack
-from src.utils.time_utils import ms_to_srt_time, srt_time_to_ms
+from src.utils.subtitle_columns import srt_times, time_columns
+from src.utils.time_utils import srt_time_to_ms
 
 
 def export_srt(track: SubtitleTrack, output_path: Path) -> None:
@@ -16,10 +17,12 @@ def export_srt(track: SubtitleTrack, output_path: Path) -> None:
         track: The subtitle track to export.
         output_path: Path to write the SRT file.
     """
+    # 타임코드는 열 단위로 한 번에 포맷 (세그먼트마다 문자열 변환 함수를 부르지 않는다)
+    starts, ends = time_columns(track.segments)
     lines: list[str] = []
-    for i, seg in enumerate(track, start=1):
+    for i, (seg, start, end) in enumerate(zip(track, srt_times(starts), srt_times(ends)), start=1):
         lines.append(str(i))
-        lines.append(f"{ms_to_srt_time(seg.start_ms)} --> {ms_to_srt_time(seg.end_ms)}")
+        lines.append(f"{start} --> {end}")
         lines.append(seg.text)
         lines.append("")
 
@@ -253,19 +256,20 @@ def export_ass(track: SubtitleTrack, output_path: Path, video_width: int = 1920,
     
     # Generate unique styles present in the track
     # Map (style properties) -> Style Name
+    # 인터닝된 스타일은 객체를 공유하므로 키 계산은 객체마다 한 번 (id → 이름)
     style_map = {}
+    style_names: dict[int, str] = {}
     style_counter = 1
     
     for seg in track.segments:
-        if seg.style:
-            # Create a hashable representation of the style
-            s = seg.style
-            key = (s.font_family, s.font_size, s.font_bold, s.font_italic, s.font_color, 
-                   s.outline_color, s.outline_width, s.bg_color, s.position, s.margin_bottom, s.custom_x, s.custom_y)
-            
-            if key not in style_map:
+        s = seg.style
+        if s and id(s) not in style_names:
+            key = s.key()
+            if key in style_map:
+                style_names[id(s)] = style_map[key]
+            else:
                 name = f"Style{style_counter}"
-                style_map[key] = name
+                style_map[key] = style_names[id(s)] = name
                 style_counter += 1
                 
                 # Convert properties to ASS
@@ -316,12 +320,7 @@ def export_ass(track: SubtitleTrack, output_path: Path, video_width: int = 1920,
         start = _ms_to_ass_time(seg.start_ms)
         end = _ms_to_ass_time(seg.end_ms)
 
-        style_name = "Default"
-        if seg.style:
-            s = seg.style
-            key = (s.font_family, s.font_size, s.font_bold, s.font_italic, s.font_color,
-                   s.outline_color, s.outline_width, s.bg_color, s.position, s.margin_bottom, s.custom_x, s.custom_y)
-            style_name = style_map.get(key, "Default")
+        style_name = style_names[id(seg.style)] if seg.style else "Default"
 
         text = seg.text.replace("\n", "\\N")
         anim = seg.animation
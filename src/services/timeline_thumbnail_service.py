@@ -7,10 +7,12 @@ import subprocess
 from pathlib import Path
 from typing import Optional
 
-from PySide6.QtCore import QObject, QRunnable, QThreadPool, Signal, Slot
+from PySide6.QtCore import QFileSystemWatcher, QObject, QRunnable, QThreadPool, Qt, Signal, Slot
 from PySide6.QtGui import QImage
 
 from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
+from src.services.media_fingerprint import CacheKeyMemo
+from src.services.media_ingest import find_strip_thumbnail
 
 
 class ThumbnailRunnable(QRunnable):
@@ -76,6 +78,10 @@ class TimelineThumbnailService(QObject):
         self._cache = collections.OrderedDict()
         self._cache_size = 200  # Max number of thumbnails to keep
         self._pending_requests = set()  # (source_path, timestamp_ms)
+        # 페인트마다 stat하지 않도록 경로 → 캐시 키를 기억한다 (파일이 바뀌면 버림)
+        self._watcher = QFileSystemWatcher(self)
+        self._keys = CacheKeyMemo(on_added=self._watcher.addPath)
+        self._watcher.fileChanged.connect(self._keys.forget)
 
         self._thread_pool = QThreadPool()
         # Limit concurrent FFmpeg processes to avoid system lag
@@ -84,7 +90,8 @@ class TimelineThumbnailService(QObject):
     @Slot(str, int, int)
     def request_thumbnail(self, source_path: str, timestamp_ms: int, height: int) -> Optional[QImage]:
         """Request a thumbnail. Returns image if cached, else returns None and starts worker."""
-        key = (source_path, timestamp_ms)
+        # 내용 지문으로 찾는다 — 같은 내용이면 경로가 달라도 같은 썸네일
+        key = (self._keys.key(source_path), timestamp_ms)
 
         # 1. Check Cache
         if key in self._cache:
@@ -95,7 +102,17 @@ class TimelineThumbnailService(QObject):
         if key in self._pending_requests:
             return None
 
-        # 3. Start Worker
+        # 3. 인제스트가 만든 썸네일 스트립 — FFmpeg 없이 가장 가까운 장면
+        strip = find_strip_thumbnail(source_path, timestamp_ms)
+        if strip is not None:
+            image = QImage(str(strip))
+            if not image.isNull():
+                if image.height() != height:
+                    image = image.scaledToHeight(height, Qt.TransformationMode.SmoothTransformation)
+                self._store(key, image)
+                return image
+
+        # 4. Start Worker
         self._pending_requests.add(key)
         
         worker = ThumbnailRunnable(source_path, timestamp_ms, height)
@@ -110,10 +127,14 @@ class TimelineThumbnailService(QObject):
 
     @Slot(str, int, QImage)
     def _on_thumbnail_ready(self, source_path: str, timestamp_ms: int, image: QImage) -> None:
-        key = (source_path, timestamp_ms)
+        key = (self._keys.key(source_path), timestamp_ms)
         if key in self._pending_requests:
             self._pending_requests.remove(key)
 
+        self._store(key, image)
+        self.thumbnail_ready.emit(source_path, timestamp_ms, image)
+
+    def _store(self, key: tuple[str, int], image: QImage) -> None:
         # Add to cache
         self._cache[key] = image
         self._cache.move_to_end(key)
@@ -122,10 +143,9 @@ class TimelineThumbnailService(QObject):
         if len(self._cache) > self._cache_size:
             self._cache.popitem(last=False)
 
-        self.thumbnail_ready.emit(source_path, timestamp_ms, image)
-
     def clear_cache(self) -> None:
         self._cache.clear()
+        self._keys.clear()
         self._pending_requests.clear()
         # Note: We don't cancel running tasks easily with QThreadPool, but that's acceptable.
 
@@ -3,20 +3,55 @@
 from __future__ import annotations
 
 import collections
+import itertools
+import os
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Iterable, Optional, Dict
 
-from PySide6.QtCore import QObject, QThread, Signal, Slot
+from PySide6.QtCore import QFileSystemWatcher, QObject, QThread, Signal, Slot
 
+from src.services.media_fingerprint import CacheKeyMemo
 from src.services.waveform_service import WaveformData
 from src.workers.waveform_worker import WaveformWorker
 
 
+def _default_max_workers() -> int:
+    """머신 크기에 맞춘 동시 작업 수 — 각 작업이 FFmpeg 프로세스 1개 + 디스크 I/O를 점유."""
+    cpu = os.cpu_count() or 2
+    return max(1, min(4, cpu // 2))
+
+
+def compute_source_priorities(
+    video_tracks: Iterable, visible_start_ms: float, visible_end_ms: float,
+) -> dict[str, int]:
+    """소스별 화면 노출 시간(ms)을 계산한다.
+
+    프로젝트에 존재하는 모든 소스가 키로 포함되며, 뷰포트 밖 소스는 0.
+    값이 클수록 화면에 오래 보이므로 웨이브폼 우선순위가 높다.
+    """
+    priorities: dict[str, int] = {}
+    for vt in video_tracks:
+        if not vt.clips:
+            continue
+        starts = vt.clip_boundaries_ms()
+        for i, clip in enumerate(vt.clips):
+            if not clip.source_path:
+                continue
+            lo = max(starts[i], visible_start_ms)
+            hi = min(starts[i] + clip.duration_ms, visible_end_ms)
+            on_screen = int(hi - lo) if hi > lo else 0
+            priorities[clip.source_path] = priorities.get(clip.source_path, 0) + on_screen
+    return priorities
+
+
 class TimelineWaveformService(QObject):
     """Manages async waveform generation and caching per source file.
-    
+
     This service ensures that each source video's waveform is computed only once
     and is available to all clips referencing that source.
+
+    요청은 대기열에 쌓이고 최대 ``max_workers``개까지만 동시에 실행된다.
+    대기 중인 요청은 화면 노출 시간(우선순위)이 큰 순서로 시작된다.
     """
 
     # (source_path, waveform_data)
@@ -26,12 +61,34 @@ class TimelineWaveformService(QObject):
     # 최대 캐시 항목 수 — 각 WaveformData가 수 MB일 수 있으므로 제한
     _MAX_CACHE_SIZE = 20
 
-    def __init__(self, parent: Optional[QObject] = None):
+    def __init__(self, parent: Optional[QObject] = None, max_workers: int | None = None):
         super().__init__(parent)
         # OrderedDict으로 LRU 구현 (HPP Ch.4 — 해시 테이블 + 순서 유지)
-        self._cache: collections.OrderedDict[str, WaveformData] = collections.OrderedDict()
+        self._cache: collections.OrderedDict[str, WaveformData] = collections.OrderedDict()  # media_cache_key → data
         self._workers: Dict[str, WaveformWorker] = {}
         self._threads: Dict[str, QThread] = {}
+        self._max_workers = max_workers if max_workers and max_workers > 0 else _default_max_workers()
+        # 대기열: path -> (priority, seq). seq는 동일 우선순위 내 FIFO 보장용
+        self._pending: Dict[str, tuple[float, int]] = {}
+        self._seq = itertools.count()
+        # 취소됐지만 FFmpeg가 아직 끝나지 않은 작업 — 슬롯을 계속 점유한다
+        self._retired: list[tuple[WaveformWorker, QThread]] = []
+        # 페인트마다 stat하지 않도록 경로 → 캐시 키를 기억한다 (파일이 바뀌면 버림)
+        self._watcher = QFileSystemWatcher(self)
+        self._keys = CacheKeyMemo(on_added=self._watcher.addPath)
+        self._watcher.fileChanged.connect(self._keys.forget)
+
+    @property
+    def max_workers(self) -> int:
+        return self._max_workers
+
+    def active_count(self) -> int:
+        """실행 중인 작업 수 (취소 후 종료 대기 중인 작업 포함)."""
+        return len(self._threads) + len(self._retired)
+
+    def pending_sources(self) -> list[str]:
+        """대기 중인 소스를 시작 순서(우선순위 내림차순)로 반환."""
+        return sorted(self._pending, key=lambda p: (-self._pending[p][0], self._pending[p][1]))
 
     def get_waveform(self, source_path: str | None) -> Optional[WaveformData]:
         """Get waveform data if available, else return None.
@@ -39,55 +96,111 @@ class TimelineWaveformService(QObject):
         LRU: 접근 시 move_to_end로 최근 사용 순서 갱신.
         Note: This does NOT start generation. Use request_waveform for that.
         """
-        path_str = source_path or ""
-        data = self._cache.get(path_str)
+        if not source_path:
+            return None
+        key = self._keys.key(source_path)
+        data = self._cache.get(key)
         if data is not None:
-            self._cache.move_to_end(path_str)
+            self._cache.move_to_end(key)
         return data
 
-    def request_waveform(self, source_path: str | None) -> None:
-        """Request waveform generation for a source path if not already cached or started."""
+    def request_waveform(self, source_path: str | None, priority: float = 0.0) -> None:
+        """Queue waveform generation for a source path if not already cached or started.
+
+        이미 대기 중이면 더 높은 우선순위로만 갱신한다 (중복 요청 제거).
+        """
         path_str = source_path or ""
         if not path_str:
              return
 
-        # 1. Check Cache
-        if path_str in self._cache:
+        # 1. Check Cache (내용 지문 키 — 옮긴 파일도 같은 파형)
+        if self._keys.key(path_str) in self._cache:
             return
 
         # 2. Check if already working
         if path_str in self._workers:
             return
 
-        # 3. Start Worker
-        video_path = Path(path_str)
-        if not video_path.exists():
+        # 3. Already queued → 우선순위만 갱신
+        queued = self._pending.get(path_str)
+        if queued is not None:
+            if priority > queued[0]:
+                self._pending[path_str] = (priority, queued[1])
+            return
+
+        if not Path(path_str).exists():
             return
 
-        worker = WaveformWorker(video_path)
+        self._pending[path_str] = (priority, next(self._seq))
+        self.status_updated.emit(path_str, "Waveform queued")
+        self._dispatch()
+
+    def update_priorities(self, priorities: Dict[str, float]) -> None:
+        """뷰포트 기반 우선순위를 반영하고, 목록에 없는 소스의 작업은 취소한다.
+
+        *priorities*는 프로젝트에 남아 있는 모든 소스를 포함해야 한다
+        (``compute_source_priorities`` 결과). 제거된 소스는 대기열에서 빠지고
+        실행 중이면 취소된다.
+        """
+        for path in list(self._pending):
+            if path not in priorities:
+                self.cancel(path)
+            else:
+                self._pending[path] = (priorities[path], self._pending[path][1])
+        for path in list(self._workers):
+            if path not in priorities:
+                self.cancel(path)
+
+    def cancel(self, source_path: str) -> None:
+        """대기 중이거나 실행 중인 소스의 웨이브폼 작업을 취소한다."""
+        if self._pending.pop(source_path, None) is not None:
+            self.status_updated.emit(source_path, "Waveform cancelled")
+            return
+        worker = self._workers.pop(source_path, None)
+        thread = self._threads.pop(source_path, None)
+        if worker is None or thread is None:
+            return
+        worker.cancel()
+        thread.quit()
+        self._retired.append((worker, thread))
+        self.status_updated.emit(source_path, "Waveform cancelled")
+
+    def _dispatch(self) -> None:
+        """빈 슬롯만큼 우선순위가 가장 높은 대기 요청을 시작한다."""
+        while self._pending and self.active_count() < self._max_workers:
+            path_str = min(self._pending, key=lambda p: (-self._pending[p][0], self._pending[p][1]))
+            del self._pending[path_str]
+            self._start_worker(path_str)
+
+    def _start_worker(self, path_str: str) -> None:
+        worker = WaveformWorker(Path(path_str))
         thread = QThread()
         worker.moveToThread(thread)
 
         worker.status_update.connect(lambda msg, p=path_str: self.status_updated.emit(p, msg))
         worker.finished.connect(lambda data, p=path_str: self._on_worker_finished(p, data))
         worker.error.connect(lambda msg, p=path_str: self._on_worker_error(p, msg))
-        
+
         thread.started.connect(worker.run)
         # Proper cleanup
         worker.finished.connect(thread.quit)
         worker.error.connect(thread.quit)
         thread.finished.connect(thread.deleteLater)
-        # We don't delete worker immediately because we might need it? 
-        # Actually finished/error should trigger deletion.
-        thread.finished.connect(lambda p=path_str: self._cleanup_worker(p))
+        thread.finished.connect(lambda p=path_str, t=thread: self._cleanup_worker(p, t))
 
         self._workers[path_str] = worker
         self._threads[path_str] = thread
         thread.start()
 
     def _on_worker_finished(self, source_path: str, data: WaveformData) -> None:
-        self._cache[source_path] = data
-        self._cache.move_to_end(source_path)
+        self.put_waveform(source_path, data)
+
+    def put_waveform(self, source_path: str, data: WaveformData) -> None:
+        """외부에서 계산한 파형(미디어 인제스트)을 캐시에 넣는다."""
+        self._pending.pop(source_path, None)
+        key = self._keys.key(source_path)
+        self._cache[key] = data
+        self._cache.move_to_end(key)
         # LRU eviction: 가장 오래 사용하지 않은 항목 제거
         while len(self._cache) > self._MAX_CACHE_SIZE:
             self._cache.popitem(last=False)
@@ -96,18 +209,25 @@ class TimelineWaveformService(QObject):
     def _on_worker_error(self, source_path: str, message: str) -> None:
         print(f"Waveform error for {source_path}: {message}")
 
-    def _cleanup_worker(self, source_path: str) -> None:
-        if source_path in self._workers:
-            del self._workers[source_path]
-        if source_path in self._threads:
-            del self._threads[source_path]
+    def _cleanup_worker(self, source_path: str, thread: QThread | None = None) -> None:
+        # 취소 후 같은 경로로 재요청된 경우 새 작업을 지우지 않도록 스레드 동일성 확인
+        if thread is None or self._threads.get(source_path) is thread:
+            self._workers.pop(source_path, None)
+            self._threads.pop(source_path, None)
+        self._retired = [(w, t) for w, t in self._retired if t is not thread]
+        self._dispatch()
 
     def cancel_all(self) -> None:
-        """Cancel all running waveform computations."""
+        """Cancel all running and queued waveform computations."""
+        self._pending.clear()
+        running = list(self._threads.values()) + [t for _, t in self._retired]
         for worker in self._workers.values():
             worker.cancel()
-        for thread in self._threads.values():
+        for worker, _ in self._retired:
+            worker.cancel()
+        for thread in running:
             thread.quit()
             thread.wait()
         self._workers.clear()
         self._threads.clear()
+        self._retired.clear()
@@ -15,6 +15,7 @@ from src.models.text_overlay import TextOverlay
 from src.services.settings_manager import SettingsManager
 from src.services.subtitle_exporter import export_srt
 from src.services.ffmpeg_logger import log_ffmpeg_command, log_ffmpeg_line
+from src.services.media_metadata import probe_media
 from src.infrastructure.ffmpeg_runner import get_ffmpeg_runner
 
 
@@ -250,6 +251,7 @@ def export_video(
     video_volume: float = 1.0,
     audio_volume: float = 1.0,
     audio_bitrate: str = "192k",
+    loudness_gain_db: float = 0.0,
 ) -> None:
     """Burn subtitles into video using FFmpeg's subtitles filter.
 
@@ -273,6 +275,9 @@ def export_video(
         mix_with_original_audio: If True, mix audio_path with video audio instead of replacing it.
         video_volume: Volume multiplier for the original video audio (0.0-1.0+).
         audio_volume: Volume multiplier for the external audio_path (0.0-1.0+).
+        loudness_gain_db: Gain applied to the original video audio, e.g. from
+            waveform_service.loudness_gain_db() (integrated loudness measured
+            during waveform extraction, so no extra analysis pass).
     """
     runner = get_ffmpeg_runner()
     if not runner.is_available():
@@ -472,6 +477,10 @@ def export_video(
             else:
                 final_a_label = unmuted_a_labels[0]
 
+            if loudness_gain_db:
+                fc_parts.append(f"{final_a_label}volume={loudness_gain_db:.2f}dB[loud_a]")
+                final_a_label = "[loud_a]"
+
             # Template overlay — scale to fill canvas exactly (template is designed for this ratio)
             if template_idx >= 0:
                 fc_parts.append(
@@ -644,12 +653,17 @@ def export_video(
                     str(output_path),
                 ]
             else:
+                if loudness_gain_db:
+                    # 오디오 재인코딩 필요 (copy로는 볼륨 조정 불가)
+                    audio_args = ["-af", f"volume={loudness_gain_db:.2f}dB", *audio_codec_flags]
+                else:
+                    audio_args = ["-c:a", "copy"]
                 args = [
                     "-i", str(video_path),
                     "-vf", vf_string,
                     "-c:v", video_encoder,
                     *encoder_flags,
-                    "-c:a", "copy",
+                    *audio_args,
                     "-y",
                     "-progress", "pipe:1",
                     str(output_path),
@@ -742,41 +756,17 @@ def export_video(
 
 
 def _get_video_resolution(runner: "FFmpegRunner", video_path: Path) -> tuple[int, int]:
-    """Get video width and height using ffprobe."""
+    """Get video width and height (memoized ffprobe)."""
     try:
-        result = runner.run_ffprobe(
-            [
-                "-v", "error",
-                "-select_streams", "v:0",
-                "-show_entries", "stream=width,height",
-                "-of", "csv=s=x:p=0",
-                str(video_path),
-            ],
-            timeout=10,
-        )
-        if result.stdout:
-            parts = result.stdout.strip().split("x")
-            if len(parts) == 2:
-                return int(parts[0]), int(parts[1])
+        meta = probe_media(video_path, runner)
+        return meta.width, meta.height
     except Exception:
-        pass
-    return 0, 0
+        return 0, 0
 
 
 def _get_video_duration(runner: "FFmpegRunner", video_path: Path) -> float:
-    """Get video duration in seconds using ffprobe."""
+    """Get video duration in seconds (memoized ffprobe)."""
     try:
-        result = runner.run_ffprobe(
-            [
-                "-v", "error",
-                "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1",
-                str(video_path),
-            ],
-            timeout=10,
-        )
-        if result.stdout:
-            return float(result.stdout.strip())
+        return probe_media(video_path, runner).duration_s
     except Exception:
-        pass
-    return 0.0
+        return 0.0
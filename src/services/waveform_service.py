@@ -1,6 +1,8 @@
 """Waveform peak computation service (pure Python, no Qt dependency).
 
 Processes audio in chunks to keep memory usage low for long videos.
+The same streaming pass also produces a 10ms RMS envelope and
+K-weighted (ITU-R BS.1770 style) short-term/integrated loudness.
 """
 
 from __future__ import annotations
@@ -8,22 +10,284 @@ from __future__ import annotations
 import wave
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Callable
+from typing import BinaryIO, Callable
 
 import numpy as np
 
 # 1초 분량씩 청크로 읽기 (메모리 ~128KB per chunk at 48kHz/16bit)
 _CHUNK_SECONDS = 1
 
+# RMS 엔벨로프 해상도 / 라우드니스 블록 간격
+RMS_WINDOW_MS = 10
+LOUDNESS_HOP_MS = 100
+_SHORT_TERM_BLOCKS = 30       # 3초 short-term 창
+_GATING_BLOCKS = 4            # 400ms 게이팅 블록 (75% overlap)
+_ABSOLUTE_GATE_LUFS = -70.0
+_RELATIVE_GATE_LU = -10.0
+_SILENCE_LUFS = -120.0        # log10(0) 방지용 하한
+
 
 @dataclass
 class WaveformData:
-    """Pre-computed waveform peak data at 1-peak-per-millisecond resolution."""
+    """Pre-computed waveform peak data at 1-peak-per-millisecond resolution.
+
+    rms / loudness / integrated_lufs are filled by compute_peaks_from_wav in
+    the same decode pass; they stay None for data built elsewhere.
+    """
 
     peaks_pos: np.ndarray  # max amplitude per ms, shape (duration_ms,), float32, [0, 1]
     peaks_neg: np.ndarray  # min amplitude per ms, shape (duration_ms,), float32, [-1, 0]
     duration_ms: int
     sample_rate: int
+    rms: np.ndarray | None = None  # RMS per RMS_WINDOW_MS, float32, [0, 1]
+    loudness: np.ndarray | None = None  # short-term (3s) LUFS per LOUDNESS_HOP_MS, float32
+    integrated_lufs: float | None = None  # gated integrated loudness, None = silence/too short
+
+    def rms_at(self, ms: int) -> float:
+        """Return the RMS level of the 10ms window containing *ms* (0.0 if unknown)."""
+        if self.rms is None or len(self.rms) == 0:
+            return 0.0
+        idx = min(max(int(ms) // RMS_WINDOW_MS, 0), len(self.rms) - 1)
+        return float(self.rms[idx])
+
+    def loudness_at(self, ms: int) -> float | None:
+        """Return the short-term loudness (LUFS) ending at the block containing *ms*."""
+        if self.loudness is None or len(self.loudness) == 0:
+            return None
+        idx = min(max(int(ms) // LOUDNESS_HOP_MS, 0), len(self.loudness) - 1)
+        return float(self.loudness[idx])
+
+
+def loudness_gain_db(
+    data: WaveformData | None, target_lufs: float, max_gain_db: float = 20.0,
+) -> float:
+    """Gain (dB) that brings *data*'s integrated loudness to *target_lufs*.
+
+    Returns 0.0 when loudness is unknown (no data or silent source).
+    추출 경로(audio_extractor, 인제스트 PCM 파이프)는 모노 다운믹스라, 스테레오
+    원본은 채널 합산 측정보다 최대 ~3 LU 낮게 잡힐 수 있다.
+    """
+    if data is None or data.integrated_lufs is None:
+        return 0.0
+    gain = target_lufs - data.integrated_lufs
+    return max(-max_gain_db, min(max_gain_db, gain))
+
+
+def _k_weighting_coefficients(rate: int) -> list[tuple[tuple[float, float, float], tuple[float, float, float]]]:
+    """BS.1770 K-weighting 2단 biquad 계수 (임의 샘플레이트용 재유도).
+
+    Stage 1: high-shelf (~+4 dB above 1.5 kHz), Stage 2: RLB high-pass (~38 Hz).
+    48 kHz에서 규격 표의 계수와 일치한다.
+    """
+    # Stage 1 — pre-filter (high shelf)
+    f0, gain_db, q = 1681.974450955533, 3.999843853973347, 0.7071752369554196
+    k = np.tan(np.pi * f0 / rate)
+    vh = 10.0 ** (gain_db / 20.0)
+    vb = vh ** 0.4996667741545416
+    a0 = 1.0 + k / q + k * k
+    shelf = (
+        ((vh + vb * k / q + k * k) / a0, 2.0 * (k * k - vh) / a0, (vh - vb * k / q + k * k) / a0),
+        (1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0),
+    )
+    # Stage 2 — RLB high-pass
+    f0, q = 38.13547087602444, 0.5003270373238773
+    k = np.tan(np.pi * f0 / rate)
+    a0 = 1.0 + k / q + k * k
+    highpass = (
+        (1.0, -2.0, 1.0),
+        (1.0, 2.0 * (k * k - 1.0) / a0, (1.0 - k / q + k * k) / a0),
+    )
+    return [shelf, highpass]
+
+
+def _k_weighting_power(rate: int, n_fft: int) -> np.ndarray:
+    """rfft 빈별 K-weighting 전력 이득 |H(f)|^2 (두 biquad의 곱)."""
+    z_inv = np.exp(-1j * np.pi * np.arange(n_fft // 2 + 1) / (n_fft / 2))
+    power = np.ones(len(z_inv), dtype=np.float64)
+    for b, a in _k_weighting_coefficients(rate):
+        num = b[0] + b[1] * z_inv + b[2] * z_inv * z_inv
+        den = a[0] + a[1] * z_inv + a[2] * z_inv * z_inv
+        power *= np.abs(num) ** 2 / np.abs(den) ** 2
+    return power
+
+
+class _LevelMeter:
+    """Streaming RMS + K-weighted loudness accumulator fed by the peak pass.
+
+    IIR 필터를 샘플 단위 Python 루프로 돌리는 대신, 100ms 블록마다 rfft 후
+    |H(f)|^2 가중 전력을 합산한다 (Parseval). 블록 경계의 필터 상태는 무시하므로
+    규격 측정기와 소수점 수준의 오차가 있을 수 있다.
+    """
+
+    def __init__(self, frame_rate: int, total_frames: int) -> None:
+        self._rate = frame_rate
+        self._pos = 0  # 지금까지 받은 샘플 수
+        n_windows = -(-total_frames * 1000 // (frame_rate * RMS_WINDOW_MS)) + 1
+        self._sq_sum = np.zeros(max(n_windows, 1), dtype=np.float64)
+        self._count = np.zeros(max(n_windows, 1), dtype=np.int64)
+        # 라우드니스 블록
+        self._block_len = max(1, frame_rate * LOUDNESS_HOP_MS // 1000)
+        power = _k_weighting_power(frame_rate, self._block_len)
+        # 단측 스펙트럼 → 전체 에너지: DC/Nyquist 제외 빈은 2배
+        weights = np.full(len(power), 2.0)
+        weights[0] = 1.0
+        if self._block_len % 2 == 0:
+            weights[-1] = 1.0
+        self._bin_weights = power * weights / float(self._block_len) ** 2
+        self._pending: np.ndarray | None = None  # (samples, channels) — 다음 블록으로 넘길 나머지
+        self._block_power: list[np.ndarray] = []
+
+    def feed(self, samples: np.ndarray) -> None:
+        """*samples*: mono ``(n,)`` or ``(n, channels)``.
+
+        RMS는 첫 채널(웨이브폼과 같은 채널), 라우드니스는 BS.1770처럼 채널별
+        가중 전력을 합산한다. 서라운드 채널 가중치(1.41)는 없다 — 모든 채널 1.0.
+        """
+        n = len(samples)
+        if n == 0:
+            return
+        frames = samples.reshape(n, -1)
+        mono = frames[:, 0]
+        # ---- RMS: 샘플 위치 → 10ms 창 인덱스 (비정수 samples/ms에서도 드리프트 없음)
+        windows = (self._pos + np.arange(n, dtype=np.int64)) * 1000 // (self._rate * RMS_WINDOW_MS)
+        first = int(windows[0])
+        rel = windows - first
+        span = int(rel[-1]) + 1
+        end = min(first + span, len(self._sq_sum))
+        sq = np.bincount(rel, weights=mono.astype(np.float64) ** 2, minlength=span)
+        cnt = np.bincount(rel, minlength=span)
+        self._sq_sum[first:end] += sq[:end - first]
+        self._count[first:end] += cnt[:end - first]
+        self._pos += n
+
+        # ---- Loudness: 완성된 100ms 블록만 FFT
+        buf = np.concatenate([self._pending, frames]) if self._pending is not None else frames
+        n_blocks = len(buf) // self._block_len
+        if n_blocks > 0:
+            blocks = buf[:n_blocks * self._block_len].reshape(n_blocks, self._block_len, buf.shape[1])
+            spec = np.fft.rfft(blocks.astype(np.float64), axis=1)
+            self._block_power.append((np.abs(spec) ** 2).sum(axis=2) @ self._bin_weights)
+        self._pending = buf[n_blocks * self._block_len:].copy()
+
+    def finish(self, duration_ms: int) -> tuple[np.ndarray, np.ndarray, float | None]:
+        """Return (rms per 10ms, short-term LUFS per 100ms, integrated LUFS)."""
+        n_windows = min(-(-duration_ms // RMS_WINDOW_MS), len(self._sq_sum))
+        counts = np.maximum(self._count[:n_windows], 1)
+        rms = np.sqrt(self._sq_sum[:n_windows] / counts).astype(np.float32)
+
+        if not self._block_power:
+            return rms, np.zeros(0, dtype=np.float32), None
+        block_ms = np.concatenate(self._block_power)
+
+        # short-term: 직전 3초(30블록) 평균 전력, 시작 구간은 가용 블록만 평균
+        csum = np.concatenate([[0.0], np.cumsum(block_ms)])
+        idx = np.arange(1, len(block_ms) + 1)
+        lo = np.maximum(idx - _SHORT_TERM_BLOCKS, 0)
+        st_power = (csum[idx] - csum[lo]) / (idx - lo)
+        short_term = _power_to_lufs(st_power).astype(np.float32)
+
+        return rms, short_term, _integrated_lufs(block_ms)
+
+
+def _power_to_lufs(power: np.ndarray) -> np.ndarray:
+    return np.maximum(-0.691 + 10.0 * np.log10(np.maximum(power, 1e-20)), _SILENCE_LUFS)
+
+
+def _integrated_lufs(block_power: np.ndarray) -> float | None:
+    """400ms 게이팅 블록(75% overlap)으로 절대/상대 게이트 적용한 통합 라우드니스."""
+    if len(block_power) < _GATING_BLOCKS:
+        return None
+    csum = np.concatenate([[0.0], np.cumsum(block_power)])
+    gate_power = (csum[_GATING_BLOCKS:] - csum[:-_GATING_BLOCKS]) / _GATING_BLOCKS
+    gate_lufs = _power_to_lufs(gate_power)
+    above_abs = gate_power[gate_lufs > _ABSOLUTE_GATE_LUFS]
+    if len(above_abs) == 0:
+        return None
+    relative_gate = float(_power_to_lufs(np.array([above_abs.mean()]))[0]) + _RELATIVE_GATE_LU
+    kept = gate_power[(gate_lufs > _ABSOLUTE_GATE_LUFS) & (gate_lufs > relative_gate)]
+    if len(kept) == 0:
+        return None
+    return float(_power_to_lufs(np.array([kept.mean()]))[0])
+
+
+class PeakAccumulator:
+    """Streaming per-ms min/max peaks plus the level meter, fed samples in [-1, 1].
+
+    Samples are mono ``(n,)`` or ``(n, channels)``; peaks use the first channel,
+    loudness sums every channel.
+
+    compute_peaks_from_wav와 인제스트의 PCM 파이프가 같은 계산을 쓴다. *total_frames*는
+    결과 배열 크기의 상한 — 파이프는 길이를 미리 모르므로 여유 있게 추정해서 넘긴다.
+    """
+
+    def __init__(self, frame_rate: int, total_frames: int) -> None:
+        self.frame_rate = frame_rate
+        self._samples_per_ms = frame_rate / 1000.0
+        self._samples_per_ms_int = int(np.ceil(self._samples_per_ms))
+        self.total_duration_ms = int(total_frames / self._samples_per_ms)
+        # 결과 배열 미리 할당
+        self._peaks_pos = np.zeros(max(self.total_duration_ms, 0), dtype=np.float32)
+        self._peaks_neg = np.zeros(max(self.total_duration_ms, 0), dtype=np.float32)
+        self._meter = _LevelMeter(frame_rate, total_frames)
+        self.ms_written = 0
+        # 이전 청크에서 남은 샘플(ms 경계에 걸친 부분)
+        self._leftover = np.zeros(0, dtype=np.float32)
+
+    def feed(self, chunk: np.ndarray) -> None:
+        self._meter.feed(chunk)
+        if chunk.ndim > 1:
+            chunk = chunk[:, 0]
+
+        # 이전 남은 샘플과 합치기
+        if len(self._leftover) > 0:
+            chunk = np.concatenate([self._leftover, chunk])
+
+        # 이 청크에서 완전한 ms 수 계산
+        chunk_ms = int(len(chunk) / self._samples_per_ms)
+
+        if chunk_ms > 0 and self.ms_written + chunk_ms <= self.total_duration_ms:
+            padded = np.zeros(chunk_ms * self._samples_per_ms_int, dtype=np.float32)
+            copy_len = min(int(chunk_ms * self._samples_per_ms), len(chunk))
+            padded[:copy_len] = chunk[:copy_len]
+            self._store(padded, chunk_ms)
+
+            # 남은 샘플 보관 (다음 청크와 합칠 것)
+            used_samples = int(chunk_ms * self._samples_per_ms)
+            self._leftover = chunk[used_samples:] if used_samples < len(chunk) else np.zeros(0, dtype=np.float32)
+        else:
+            self._leftover = chunk
+
+    def _store(self, padded: np.ndarray, n_ms: int) -> None:
+        reshaped = padded.reshape(n_ms, self._samples_per_ms_int)
+        self._peaks_pos[self.ms_written:self.ms_written + n_ms] = np.max(reshaped, axis=1)
+        self._peaks_neg[self.ms_written:self.ms_written + n_ms] = np.min(reshaped, axis=1)
+        self.ms_written += n_ms
+
+    def finish(self) -> WaveformData:
+        # 마지막 남은 샘플 처리
+        leftover = self._leftover
+        if len(leftover) > 0 and self.ms_written < self.total_duration_ms:
+            remaining_ms = min(int(len(leftover) / self._samples_per_ms), self.total_duration_ms - self.ms_written)
+            if remaining_ms > 0:
+                padded = np.zeros(remaining_ms * self._samples_per_ms_int, dtype=np.float32)
+                copy_len = min(len(leftover), len(padded))
+                padded[:copy_len] = leftover[:copy_len]
+                self._store(padded, remaining_ms)
+        self._leftover = np.zeros(0, dtype=np.float32)
+
+        ms_written = self.ms_written
+        rms, loudness, integrated = self._meter.finish(ms_written)
+
+        # 실제 쓴 만큼만 잘라서 반환
+        return WaveformData(
+            peaks_pos=self._peaks_pos[:ms_written],
+            peaks_neg=self._peaks_neg[:ms_written],
+            duration_ms=ms_written,
+            sample_rate=self.frame_rate,
+            rms=rms,
+            loudness=loudness,
+            integrated_lufs=integrated,
+        )
 
 
 def compute_peaks_from_wav(
@@ -33,14 +297,16 @@ def compute_peaks_from_wav(
     """Load a WAV file in chunks and compute per-millisecond min/max peaks.
 
     Memory-efficient: only one chunk (~1 second) of audio is in memory at a time,
-    regardless of total file duration.
+    regardless of total file duration. RMS and K-weighted loudness are
+    accumulated from the same chunks, so no second decode is needed.
 
     Args:
         wav_path: Path to a 16-bit or 32-bit PCM mono/stereo WAV file.
         on_progress: Optional callback(processed_ms, total_ms) for progress.
 
     Returns:
-        WaveformData with normalized peaks in [-1, 1].
+        WaveformData with normalized peaks in [-1, 1], 10ms RMS envelope,
+        short-term loudness and integrated loudness.
     """
     with wave.open(str(wav_path), "rb") as wf:
         n_channels = wf.getnchannels()
@@ -57,8 +323,8 @@ def compute_peaks_from_wav(
         else:
             raise ValueError(f"Unsupported sample width: {sample_width}")
 
-        samples_per_ms = frame_rate / 1000.0
-        total_duration_ms = int(n_frames / samples_per_ms)
+        acc = PeakAccumulator(frame_rate, n_frames)
+        total_duration_ms = acc.total_duration_ms
 
         if total_duration_ms <= 0:
             return WaveformData(
@@ -68,71 +334,52 @@ def compute_peaks_from_wav(
                 sample_rate=frame_rate,
             )
 
-        # 결과 배열 미리 할당
-        peaks_pos = np.zeros(total_duration_ms, dtype=np.float32)
-        peaks_neg = np.zeros(total_duration_ms, dtype=np.float32)
-
         chunk_frames = int(frame_rate * _CHUNK_SECONDS)
-        samples_per_ms_int = int(np.ceil(samples_per_ms))
-        ms_written = 0
         frames_read = 0
 
-        # 이전 청크에서 남은 샘플(ms 경계에 걸친 부분)
-        leftover = np.zeros(0, dtype=np.float32)
-
         while frames_read < n_frames:
             read_count = min(chunk_frames, n_frames - frames_read)
             raw = wf.readframes(read_count)
             frames_read += read_count
 
-            chunk = np.frombuffer(raw, dtype=dtype).astype(np.float32)
-            if n_channels > 1:
-                chunk = chunk[::n_channels]
+            chunk = np.frombuffer(raw, dtype=dtype).astype(np.float32).reshape(-1, n_channels)
             chunk /= max_val
+            acc.feed(chunk)
 
-            # 이전 남은 샘플과 합치기
-            if len(leftover) > 0:
-                chunk = np.concatenate([leftover, chunk])
-
-            # 이 청크에서 완전한 ms 수 계산
-            chunk_ms = int(len(chunk) / samples_per_ms)
-            usable_samples = chunk_ms * samples_per_ms_int
-
-            if chunk_ms > 0 and ms_written + chunk_ms <= total_duration_ms:
-                padded = np.zeros(chunk_ms * samples_per_ms_int, dtype=np.float32)
-                copy_len = min(int(chunk_ms * samples_per_ms), len(chunk))
-                padded[:copy_len] = chunk[:copy_len]
+            if on_progress and total_duration_ms > 0:
+                on_progress(acc.ms_written, total_duration_ms)
 
-                reshaped = padded.reshape(chunk_ms, samples_per_ms_int)
-                peaks_pos[ms_written:ms_written + chunk_ms] = np.max(reshaped, axis=1)
-                peaks_neg[ms_written:ms_written + chunk_ms] = np.min(reshaped, axis=1)
-                ms_written += chunk_ms
+    return acc.finish()
 
-                # 남은 샘플 보관 (다음 청크와 합칠 것)
-                used_samples = int(chunk_ms * samples_per_ms)
-                leftover = chunk[used_samples:] if used_samples < len(chunk) else np.zeros(0, dtype=np.float32)
-            else:
-                leftover = chunk
 
-            if on_progress and total_duration_ms > 0:
-                on_progress(ms_written, total_duration_ms)
+def compute_peaks_from_pcm(
+    stream: BinaryIO,
+    sample_rate: int,
+    expected_ms: int,
+    on_progress: Callable[[int, int], None] | None = None,
+    cancel_check: Callable[[], bool] | None = None,
+) -> WaveformData | None:
+    """Compute peaks from a raw s16le mono PCM stream (e.g. FFmpeg's stdout).
 
-        # 마지막 남은 샘플 처리
-        if len(leftover) > 0 and ms_written < total_duration_ms:
-            remaining_ms = min(int(len(leftover) / samples_per_ms), total_duration_ms - ms_written)
-            if remaining_ms > 0:
-                padded = np.zeros(remaining_ms * samples_per_ms_int, dtype=np.float32)
-                copy_len = min(len(leftover), len(padded))
-                padded[:copy_len] = leftover[:copy_len]
-                reshaped = padded.reshape(remaining_ms, samples_per_ms_int)
-                peaks_pos[ms_written:ms_written + remaining_ms] = np.max(reshaped, axis=1)
-                peaks_neg[ms_written:ms_written + remaining_ms] = np.min(reshaped, axis=1)
-                ms_written += remaining_ms
-
-    # 실제 쓴 만큼만 잘라서 반환
-    return WaveformData(
-        peaks_pos=peaks_pos[:ms_written],
-        peaks_neg=peaks_neg[:ms_written],
-        duration_ms=ms_written,
-        sample_rate=frame_rate,
-    )
+    *expected_ms* sizes the result arrays (probe duration — a little slack is
+    added since container durations are approximate). Returns None if cancelled.
+    """
+    # 여유 2초 — 컨테이너 길이와 실제 오디오 길이는 조금씩 다르다
+    acc = PeakAccumulator(sample_rate, (max(expected_ms, 0) + 2000) * sample_rate // 1000)
+    chunk_bytes = int(sample_rate * _CHUNK_SECONDS) * 2
+    carry = b""
+    while True:
+        if cancel_check and cancel_check():
+            return None
+        raw = stream.read(chunk_bytes)
+        if not raw:
+            break
+        raw = carry + raw
+        usable = len(raw) - len(raw) % 2
+        raw, carry = raw[:usable], raw[usable:]
+        if not raw:
+            continue
+        acc.feed(np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0)
+        if on_progress and expected_ms > 0:
+            on_progress(min(acc.ms_written, expected_ms), expected_ms)
+    return acc.finish()
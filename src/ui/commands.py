@@ -2,10 +2,16 @@
 
 from __future__ import annotations
 
+import bisect
 from typing import TYPE_CHECKING
 
+import numpy as np
 from PySide6.QtGui import QUndoCommand
+from src.services.edit_journal import insert_op, insort_op, pop_op, remove_op, retime_op, set_op
+from src.services.ripple_edit_service import RangeShiftMap, RippleCut, RippleEditService
 from src.utils.i18n import tr
+from src.utils.subtitle_columns import SubtitleColumns, write_times
+from src.utils.undo_memory import TimeSnapshot
 
 if TYPE_CHECKING:
     from src.models.project import ProjectState
@@ -22,6 +28,8 @@ if TYPE_CHECKING:
 class EditTextCommand(QUndoCommand):
     """Change the text of a subtitle segment."""
 
+    _history_attrs = ("_old_text", "_new_text")
+
     def __init__(self, track: SubtitleTrack, index: int, old_text: str, new_text: str):
         super().__init__(f"Edit text (segment {index + 1})")
         self._track = track
@@ -35,6 +43,9 @@ class EditTextCommand(QUndoCommand):
     def undo(self) -> None:
         self._track.update_segment_text(self._index, self._old_text)
 
+    def journal_ops(self, undone: bool) -> list:
+        return [set_op(self._track, self._index, text=self._old_text if undone else self._new_text)]
+
 
 class EditTimeCommand(QUndoCommand):
     """Change the start/end times of a subtitle segment."""
@@ -55,10 +66,17 @@ class EditTimeCommand(QUndoCommand):
     def undo(self) -> None:
         self._track.update_segment_time(self._index, self._old_start, self._old_end)
 
+    def journal_ops(self, undone: bool) -> list:
+        if undone:
+            return [retime_op(self._track, self._index, self._old_start, self._old_end)]
+        return [retime_op(self._track, self._index, self._new_start, self._new_end)]
+
 
 class AddSegmentCommand(QUndoCommand):
     """Add a new subtitle segment."""
 
+    _history_attrs = ("_segment",)
+
     def __init__(self, track: SubtitleTrack, segment: SubtitleSegment):
         super().__init__("Add subtitle")
         self._track = track
@@ -74,10 +92,17 @@ class AddSegmentCommand(QUndoCommand):
                 self._track.segments.pop(i)
                 break
 
+    def journal_ops(self, undone: bool) -> list:
+        if undone:
+            return [remove_op(self._track, self._segment)]
+        return [insort_op(self._track, self._segment)]
+
 
 class DeleteSegmentCommand(QUndoCommand):
     """Delete a subtitle segment."""
 
+    _history_attrs = ("_segment",)
+
     def __init__(self, track: SubtitleTrack, index: int, segment: SubtitleSegment):
         super().__init__(f"Delete subtitle (segment {index + 1})")
         self._track = track
@@ -91,6 +116,11 @@ class DeleteSegmentCommand(QUndoCommand):
         self._track.segments.insert(self._index, self._segment)
         self._track.segments.sort(key=lambda s: s.start_ms)
 
+    def journal_ops(self, undone: bool) -> list:
+        if undone:
+            return [insert_op(self._track, self._index, self._segment, sort=True)]
+        return [pop_op(self._track, self._index)]
+
 
 class MoveSegmentCommand(QUndoCommand):
     """Move a subtitle segment (change start/end via timeline drag)."""
@@ -111,10 +141,17 @@ class MoveSegmentCommand(QUndoCommand):
     def undo(self) -> None:
         self._track.update_segment_time(self._index, self._old_start, self._old_end)
 
+    def journal_ops(self, undone: bool) -> list:
+        if undone:
+            return [retime_op(self._track, self._index, self._old_start, self._old_end)]
+        return [retime_op(self._track, self._index, self._new_start, self._new_end)]
+
 
 class EditStyleCommand(QUndoCommand):
     """Change the style of a subtitle segment."""
 
+    _history_attrs = ("_old_style", "_new_style")
+
     def __init__(self, track: SubtitleTrack, index: int,
                  old_style: SubtitleStyle | None, new_style: SubtitleStyle | None):
         super().__init__(f"Edit style (segment {index + 1})")
@@ -131,10 +168,15 @@ class EditStyleCommand(QUndoCommand):
         if 0 <= self._index < len(self._track):
             self._track[self._index].style = self._old_style
 
+    def journal_ops(self, undone: bool) -> list:
+        return [set_op(self._track, self._index, style=self._old_style if undone else self._new_style)]
+
 
 class EditAnimationCommand(QUndoCommand):
     """Change the animation of a subtitle segment."""
 
+    _history_attrs = ("_old", "_new")
+
     def __init__(self, track: SubtitleTrack, index: int,
                  old_anim, new_anim):
         super().__init__(tr("Edit animation"))
@@ -151,10 +193,15 @@ class EditAnimationCommand(QUndoCommand):
         if 0 <= self._index < len(self._track):
             self._track[self._index].animation = self._old
 
+    def journal_ops(self, undone: bool) -> list:
+        return [set_op(self._track, self._index, animation=self._old if undone else self._new)]
+
 
 class SplitCommand(QUndoCommand):
     """Split a subtitle segment at a given time position."""
 
+    _history_attrs = ("_original", "_first", "_second")
+
     def __init__(self, track: SubtitleTrack, index: int,
                  split_ms: int, original: SubtitleSegment,
                  first: SubtitleSegment, second: SubtitleSegment):
@@ -190,6 +237,8 @@ class SplitCommand(QUndoCommand):
 class MergeCommand(QUndoCommand):
     """Merge two consecutive subtitle segments."""
 
+    _history_attrs = ("_first", "_second", "_merged")
+
     def __init__(self, track: SubtitleTrack, index: int,
                  first: SubtitleSegment, second: SubtitleSegment,
                  merged: SubtitleSegment):
@@ -237,6 +286,9 @@ class EditVolumeCommand(QUndoCommand):
         if 0 <= self._index < len(self._track):
             self._track[self._index].volume = self._old_volume
 
+    def journal_ops(self, undone: bool) -> list:
+        return [set_op(self._track, self._index, volume=self._old_volume if undone else self._new_volume)]
+
 class EditSegmentTTSCommand(QUndoCommand):
     """Update TTS audio, voice, and speed for a segment."""
 
@@ -266,10 +318,19 @@ class EditSegmentTTSCommand(QUndoCommand):
             seg.voice = self._old_voice
             seg.speed = self._old_speed
 
+    def journal_ops(self, undone: bool) -> list:
+        if undone:
+            return [set_op(self._track, self._index,
+                           audio_file=self._old_audio, voice=self._old_voice, speed=self._old_speed)]
+        return [set_op(self._track, self._index,
+                       audio_file=self._new_audio, voice=self._new_voice, speed=self._new_speed)]
+
 
 class UpdateSubtitleTrackCommand(QUndoCommand):
     """Replace the active subtitle track (e.g. after Whisper/TTS generation)."""
 
+    _history_attrs = ("_old_track", "_old_segments")
+
     def __init__(self, project: ProjectState, new_track: SubtitleTrack, old_track: SubtitleTrack | None = None):
         super().__init__(tr("Update subtitles"))
         self._project = project
@@ -279,6 +340,8 @@ class UpdateSubtitleTrackCommand(QUndoCommand):
             idx = project.active_track_index
             if 0 <= idx < len(project.subtitle_tracks):
                 self._old_track = project.subtitle_tracks[idx]
+        # 기록 크기 계산용 — 교체된 트랙의 세그먼트 목록은 undo 기록만 붙잡는다
+        self._old_segments = self._old_track.segments if self._old_track is not None else None
 
     def redo(self) -> None:
         if 0 <= self._project.active_track_index < len(self._project.subtitle_tracks):
@@ -292,20 +355,30 @@ class UpdateSubtitleTrackCommand(QUndoCommand):
 class BatchShiftCommand(QUndoCommand):
     """Shift all subtitle times by a given offset."""
 
+    _history_attrs = ("_old_columns",)
+
     def __init__(self, track: SubtitleTrack, offset_ms: int):
         super().__init__(f"Batch shift {'+'if offset_ms >= 0 else ''}{offset_ms}ms")
         self._track = track
         self._offset_ms = offset_ms
+        self._old_columns = None  # 마지막 redo 직전의 (starts, ends) — 0 클램프가 있어도 정확히 복원
 
     def redo(self) -> None:
-        for seg in self._track.segments:
-            seg.start_ms = max(0, seg.start_ms + self._offset_ms)
-            seg.end_ms = max(seg.start_ms + 1, seg.end_ms + self._offset_ms)
+        cols = SubtitleColumns(self._track.segments)
+        self._old_columns = (cols.start_ms, cols.end_ms)
+        cols.shift(self._offset_ms)
+        cols.commit()
+        self._track.mark_modified()
 
     def undo(self) -> None:
-        for seg in self._track.segments:
-            seg.start_ms = max(0, seg.start_ms - self._offset_ms)
-            seg.end_ms = max(seg.start_ms + 1, seg.end_ms - self._offset_ms)
+        segments = self._track.segments
+        if self._old_columns is not None and len(self._old_columns[0]) == len(segments):
+            write_times(segments, *self._old_columns)
+        else:
+            cols = SubtitleColumns(segments)
+            cols.shift(-self._offset_ms)
+            cols.commit()
+        self._track.mark_modified()
 
 
 # ------------------------------------------------------------------ Video clip commands
@@ -314,6 +387,8 @@ class BatchShiftCommand(QUndoCommand):
 class SplitClipCommand(QUndoCommand):
     """Split a video clip into two at a given point on a specific track."""
 
+    _history_attrs = ("_original", "_first", "_second")
+
     def __init__(self, project: ProjectState, track_index: int, clip_index: int,
                  original: VideoClip, first: VideoClip, second: VideoClip):
         super().__init__(f"Split clip {clip_index + 1} on track {track_index + 1}")
@@ -343,204 +418,148 @@ class SplitClipCommand(QUndoCommand):
         vt.clips.insert(self._index, self._original)
 
 
-class DeleteClipCommand(QUndoCommand):
-    """Delete a video clip with subtitle ripple."""
+class _RippleDeleteCommand(QUndoCommand):
+    """클립 삭제 + 리플의 공통 구현.
 
-    def __init__(self, project: ProjectState, track_index: int, clip_index: int,
-                 removed_clip: VideoClip,
+    삭제 구간들을 RangeShiftMap 하나로 합쳐 자막·이미지 오버레이는 자르고(cut_ranges),
+    텍스트 오버레이·BGM은 당긴다(shift_ranges) — 각 목록을 한 번씩만 훑는다.
+    Undo 기록은 제거·잘린 항목과 구간 사이 덩어리 델타뿐이다.
+    """
+
+    _history_attrs = ("_removed_clips", "_cuts")
+
+    def __init__(self, text: str, project: ProjectState,
+                 removals: list[tuple[int, int, VideoClip, int, int]],
                  subtitle_track: SubtitleTrack,
                  image_overlay_track: ImageOverlayTrack | None,
-                 clip_start_tl: int, clip_end_tl: int,
                  ripple: bool = True):
-        super().__init__(f"Delete clip {clip_index + 1} on track {track_index + 1}")
+        """removals: (track_index, clip_index, clip, timeline_start, timeline_end) 목록."""
+        super().__init__(text)
         self._project = project
-        self._track_index = track_index
-        self._clip_index = clip_index
-        self._removed_clip = removed_clip
+        self._removed_clips = sorted((ti, ci, clip) for ti, ci, clip, _, _ in removals)
+        self._shift_map = RangeShiftMap((start, end) for _, _, _, start, end in removals)
         self._sub_track = subtitle_track
         self._overlay_track = image_overlay_track
-        self._clip_start = clip_start_tl
-        self._clip_end = clip_end_tl
-        self._shift = removed_clip.duration_ms
         self._ripple = ripple
-
-        # Snapshot of affected subtitles for undo
-        self._removed_subs: list[tuple[int, SubtitleSegment]] = []
-        self._truncated_subs: list[tuple[int, int, int]] = []  # (seg_index, old_start, old_end)
-        self._shifted_subs: list[tuple[int, int, int]] = []    # (seg_index, old_start, old_end)
-        
-        # Snapshot of affected overlays for undo
-        self._removed_overlays: list[tuple[int, ImageOverlay]] = []
-        self._truncated_overlays: list[tuple[int, int, int]] = []
-        self._shifted_overlays: list[tuple[int, int, int]] = []
+        self._cuts: list[RippleCut] = []
 
         # Snapshot of affected audio track (for undo when TTS invalidated)
         self._old_audio_start = subtitle_track.audio_start_ms
         self._old_audio_duration = subtitle_track.audio_duration_ms
         self._old_audio_path = getattr(subtitle_track, "audio_path", "") or ""
 
-        # Snapshot for BGM and text overlay ripple (undo support)
-        self._shifted_bgm: list[tuple[int, int, int]] = []    # (track_idx, clip_idx, old_start)
-        self._shifted_text: list[tuple[int, int, int]] = []   # (ov_idx, old_start, old_end)
-
     def redo(self) -> None:
-        # 1. Remove the clip
-        vt = self._project.video_tracks[self._track_index]
-        vt.clips.pop(self._clip_index)
+        # 1. Remove the clips (트랙별 한 번에)
+        by_track: dict[int, set[int]] = {}
+        for ti, ci, _ in self._removed_clips:
+            by_track.setdefault(ti, set()).add(ci)
+        for ti, gone in by_track.items():
+            vt = self._project.video_tracks[ti]
+            vt.clips[:] = [c for i, c in enumerate(vt.clips) if i not in gone]
 
         if not self._ripple:
-             return
-        # ... (rest stays same, using _sub_track and _overlay_track)
-
-        # 2. Process subtitles (iterate in reverse for safe removal)
-        self._removed_subs.clear()
-        self._truncated_subs.clear()
-        self._shifted_subs.clear()
-
-        to_remove_subs = []
-        for i, seg in enumerate(self._sub_track.segments):
-            if seg.start_ms >= self._clip_start and seg.end_ms <= self._clip_end:
-                to_remove_subs.append(i)
-            elif seg.start_ms < self._clip_end and seg.end_ms > self._clip_start:
-                self._truncated_subs.append((i, seg.start_ms, seg.end_ms))
-                if seg.start_ms < self._clip_start:
-                    seg.end_ms = self._clip_start
-                else:
-                    seg.start_ms = self._clip_start
-                    seg.end_ms = seg.end_ms - self._shift
-            elif seg.start_ms >= self._clip_end:
-                self._shifted_subs.append((i, seg.start_ms, seg.end_ms))
-                seg.start_ms -= self._shift
-                seg.end_ms -= self._shift
-
-        for i in reversed(to_remove_subs):
-            self._removed_subs.append((i, self._sub_track.segments[i]))
-            self._sub_track.segments.pop(i)
-
-        # 3. Process overlays
-        if self._overlay_track:
-            self._removed_overlays.clear()
-            self._truncated_overlays.clear()
-            self._shifted_overlays.clear()
-            
-            to_remove_ov = []
-            for i, ov in enumerate(self._overlay_track.overlays):
-                if ov.start_ms >= self._clip_start and ov.end_ms <= self._clip_end:
-                    to_remove_ov.append(i)
-                elif ov.start_ms < self._clip_end and ov.end_ms > self._clip_start:
-                    self._truncated_overlays.append((i, ov.start_ms, ov.end_ms))
-                    if ov.start_ms < self._clip_start:
-                         ov.end_ms = self._clip_start
-                    else:
-                         ov.start_ms = self._clip_start
-                         ov.end_ms = ov.end_ms - self._shift
-                elif ov.start_ms >= self._clip_end:
-                     self._shifted_overlays.append((i, ov.start_ms, ov.end_ms))
-                     ov.start_ms -= self._shift
-                     ov.end_ms -= self._shift
-            
-            for i in reversed(to_remove_ov):
-                self._removed_overlays.append((i, self._overlay_track.overlays[i]))
-                self._overlay_track.overlays.pop(i)
+            return
+
+        shift_map = self._shift_map
+        self._cuts = []
 
-        # 4. Process Audio Track (TTS)
+        # 2. Subtitles / image overlays: 구간 안은 제거, 걸친 항목은 자름
+        # 직접 대입된 목록도 처리 — 이미 정렬돼 있으면 timsort는 한 번 훑고 끝난다
+        owners = [self._sub_track]
+        if self._overlay_track:
+            owners.append(self._overlay_track)
+        for owner in owners:
+            items = owner.segments if owner is self._sub_track else owner.overlays
+            items.sort(key=lambda it: it.start_ms)
+            cut = RippleEditService.cut_ranges(items, shift_map, owner)
+            if cut is not None:
+                self._cuts.append(cut)
+
+        # 3. Process Audio Track (TTS)
         # 삭제 구역과 TTS 구간이 겹치면 오디오 무효화(재생 안 함, 재생성 필요)
-        old_audio_end = self._sub_track.audio_start_ms + self._sub_track.audio_duration_ms
-        deleted_overlaps_tts = (
-            self._sub_track.audio_duration_ms > 0
-            and (self._sub_track.audio_start_ms < self._clip_end and old_audio_end > self._clip_start)
-        )
-        if deleted_overlaps_tts:
-            self._sub_track.audio_path = ""
-            self._sub_track.audio_duration_ms = 0
-            self._sub_track.audio_start_ms = 0
-        elif self._sub_track.audio_start_ms >= self._clip_end:
-            self._sub_track.audio_start_ms -= self._shift
-        elif self._sub_track.audio_start_ms > self._clip_start:
-            self._sub_track.audio_start_ms = self._clip_start
-
-        # 5. BGM clips: 삭제 구간 이후 시작하는 클립을 당김
-        self._shifted_bgm.clear()
-        for t_idx, bgm_track in enumerate(self._project.bgm_tracks):
-            if bgm_track.locked:
-                continue
-            for c_idx, clip in enumerate(bgm_track.clips):
-                if clip.start_ms >= self._clip_end:
-                    self._shifted_bgm.append((t_idx, c_idx, clip.start_ms))
-                    clip.start_ms -= self._shift
-
-        # 6. Text overlays: 삭제 구간 이후 오버레이를 당김
-        self._shifted_text.clear()
+        sub = self._sub_track
+        if sub.audio_duration_ms > 0 and shift_map.overlaps(
+            sub.audio_start_ms, sub.audio_start_ms + sub.audio_duration_ms,
+        ):
+            sub.audio_path = ""
+            sub.audio_duration_ms = 0
+            sub.audio_start_ms = 0
+        else:
+            sub.audio_start_ms = shift_map.map(sub.audio_start_ms)
+
+        # 4. BGM clips / text overlays: 삭제 구간 이후 시작하는 항목을 당김
+        shifted = [
+            (bgm_track.clips, ("start_ms",), None)
+            for bgm_track in self._project.bgm_tracks if not bgm_track.locked
+        ]
         tt = self._project.text_overlay_track
         if tt and not tt.locked:
-            for ov_idx, ov in enumerate(tt.overlays):
-                if ov.start_ms >= self._clip_end:
-                    self._shifted_text.append((ov_idx, ov.start_ms, ov.end_ms))
-                    ov.start_ms -= self._shift
-                    ov.end_ms -= self._shift
+            shifted.append((tt.overlays, ("start_ms", "end_ms"), tt))
+        for items, fields, owner in shifted:
+            cut = RippleEditService.shift_ranges(items, shift_map, fields, owner)
+            if cut is not None:
+                self._cuts.append(cut)
 
     def undo(self) -> None:
         if self._ripple:
-            # 1. Restore removed subtitles
-            for i, seg in self._removed_subs:
-                self._sub_track.segments.insert(i, seg)
-
-            # 2. Restore truncated subtitles
-            for i, old_start, old_end in self._truncated_subs:
-                if i < len(self._sub_track.segments):
-                    self._sub_track.segments[i].start_ms = old_start
-                    self._sub_track.segments[i].end_ms = old_end
-
-            # 3. Unshift moved subtitles
-            for i, old_start, old_end in self._shifted_subs:
-                if i < len(self._sub_track.segments):
-                    self._sub_track.segments[i].start_ms = old_start
-                    self._sub_track.segments[i].end_ms = old_end
-
-            # 4. Restore overlays
-            if self._overlay_track is not None:
-                for i, ov in self._removed_overlays:
-                    self._overlay_track.overlays.insert(i, ov)
-                for i, old_start, old_end in self._truncated_overlays:
-                    if i < len(self._overlay_track.overlays):
-                        self._overlay_track.overlays[i].start_ms = old_start
-                        self._overlay_track.overlays[i].end_ms = old_end
-                for i, old_start, old_end in self._shifted_overlays:
-                    if i < len(self._overlay_track.overlays):
-                        self._overlay_track.overlays[i].start_ms = old_start
-                        self._overlay_track.overlays[i].end_ms = old_end
-
-            # 5. Restore audio track
+            for cut in reversed(self._cuts):
+                RippleEditService.restore_cut(cut)
+            self._cuts = []
+
+            # Restore audio track
             self._sub_track.audio_start_ms = self._old_audio_start
             self._sub_track.audio_duration_ms = self._old_audio_duration
             self._sub_track.audio_path = self._old_audio_path
 
-            # 6. Restore BGM clips
-            for t_idx, c_idx, old_start in self._shifted_bgm:
-                tracks = self._project.bgm_tracks
-                if t_idx < len(tracks) and c_idx < len(tracks[t_idx].clips):
-                    tracks[t_idx].clips[c_idx].start_ms = old_start
-
-            # 7. Restore text overlays
-            tt = self._project.text_overlay_track
-            if tt:
-                for ov_idx, old_start, old_end in self._shifted_text:
-                    if ov_idx < len(tt.overlays):
-                        tt.overlays[ov_idx].start_ms = old_start
-                        tt.overlays[ov_idx].end_ms = old_end
-
-        # 8. Restore the clip
-        vt = self._project.video_tracks[self._track_index]
-        vt.clips.insert(self._clip_index, self._removed_clip)
+        # Restore the clips (인덱스 오름차순 삽입 → 원래 위치)
+        for ti, ci, clip in self._removed_clips:
+            self._project.video_tracks[ti].clips.insert(ci, clip)
 
-        self._sub_track.segments.sort(key=lambda s: s.start_ms)
-        if self._overlay_track:
-            self._overlay_track.overlays.sort(key=lambda o: o.start_ms)
+
+class DeleteClipCommand(_RippleDeleteCommand):
+    """Delete a video clip with subtitle ripple."""
+
+    def __init__(self, project: ProjectState, track_index: int, clip_index: int,
+                 removed_clip: VideoClip,
+                 subtitle_track: SubtitleTrack,
+                 image_overlay_track: ImageOverlayTrack | None,
+                 clip_start_tl: int, clip_end_tl: int,
+                 ripple: bool = True):
+        super().__init__(
+            f"Delete clip {clip_index + 1} on track {track_index + 1}", project,
+            [(track_index, clip_index, removed_clip, clip_start_tl, clip_end_tl)],
+            subtitle_track, image_overlay_track, ripple,
+        )
+
+
+class DeleteClipsCommand(_RippleDeleteCommand):
+    """여러 클립을 한 번에 삭제하고 삭제 구간들의 합집합으로 한 번만 리플.
+
+    구간은 모두 삭제 전 타임라인 좌표로 계산한다 — 트랙별로 뒤에서부터 하나씩 지우는
+    것과 결과가 같고, 여러 트랙의 구간이 겹치면 합쳐진다.
+    """
+
+    def __init__(self, project: ProjectState, targets: list[tuple[int, int]],
+                 subtitle_track: SubtitleTrack,
+                 image_overlay_track: ImageOverlayTrack | None,
+                 ripple: bool = True):
+        removals = []
+        for ti, ci in sorted(set(targets)):
+            vt = project.video_tracks[ti]
+            start = vt.clip_timeline_start(ci)
+            clip = vt.clips[ci]
+            removals.append((ti, ci, clip, start, start + clip.duration_ms))
+        super().__init__(
+            tr("Delete %d Clips") % len(removals), project, removals,
+            subtitle_track, image_overlay_track, ripple,
+        )
 
 
 class TrimClipCommand(QUndoCommand):
     """Trim a video clip edge with ripple."""
 
+    _history_attrs = ("_deltas",)
+
     def __init__(self, project: ProjectState, track_index: int, clip_index: int,
                  old_in: int, old_out: int, new_in: int, new_out: int,
                  subtitle_track: SubtitleTrack,
@@ -557,6 +576,7 @@ class TrimClipCommand(QUndoCommand):
         self._sub_track = subtitle_track
         self._overlay_track = image_overlay_track
         self._ripple = ripple
+        self._deltas: list = []
 
         old_duration = old_out - old_in
         new_duration = new_out - new_in
@@ -612,51 +632,23 @@ class TrimClipCommand(QUndoCommand):
             clip.source_out_ms = self._old_out
 
             if self._ripple and self._delta != 0:
-                self._apply_shift(-self._delta, threshold=self._ripple_point + self._delta)
-                # TTS 오디오 복원 (_apply_shift가 audio를 건드린 뒤 덮어씀)
+                RippleEditService.revert(self._deltas)
+                # TTS 오디오 복원 (revert가 audio를 건드린 뒤 덮어씀)
                 self._sub_track.audio_start_ms = self._old_audio_start
                 self._sub_track.audio_duration_ms = self._old_audio_duration
                 self._sub_track.audio_path = self._old_audio_path
                 
-    def _apply_shift(self, delta: int, threshold: int | None = None) -> None:
-        threshold = threshold if threshold is not None else self._ripple_point
-        # Shift subtitles (active track)
-        for seg in self._sub_track.segments:
-            if seg.start_ms >= threshold:
-                seg.start_ms += delta
-                seg.end_ms += delta
-
-        # Shift image overlays
-        if self._overlay_track:
-            for ov in self._overlay_track.overlays:
-                if ov.start_ms >= threshold:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-
-        # Shift text overlays
-        tt = self._project.text_overlay_track
-        if tt and not tt.locked:
-            for ov in tt.overlays:
-                if ov.start_ms >= threshold:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-
-        # Shift BGM clips
-        for bgm_track in self._project.bgm_tracks:
-            if bgm_track.locked:
-                continue
-            for clip in bgm_track.clips:
-                if clip.start_ms >= threshold:
-                    clip.start_ms += delta
-
-        # Shift Audio (TTS)
-        if self._sub_track.audio_start_ms >= threshold:
-            self._sub_track.audio_start_ms += delta
+    def _apply_shift(self, delta: int) -> None:
+        self._deltas = RippleEditService.shift_timeline(
+            self._project, self._sub_track, self._overlay_track, self._ripple_point, delta,
+        )
 
 
 class AddVideoClipCommand(QUndoCommand):
     """Insert a video clip into a specific track with ripple."""
 
+    _history_attrs = ("_clip", "_deltas")
+
     def __init__(self, project: ProjectState, track_index: int, clip: VideoClip,
                  subtitle_track: SubtitleTrack,
                  image_overlay_track: ImageOverlayTrack | None,
@@ -672,6 +664,7 @@ class AddVideoClipCommand(QUndoCommand):
         self._overlay_track = image_overlay_track
         self._index = insert_index
         self._ripple = ripple
+        self._deltas: list = []
         self._shift = clip.duration_ms
 
         vt = project.video_tracks[track_index]
@@ -706,7 +699,7 @@ class AddVideoClipCommand(QUndoCommand):
                  vt.clips.remove(self._clip)
                  
             if self._ripple:
-                 self._apply_shift(-self._shift, threshold=self._ripple_point + self._shift)
+                 RippleEditService.revert(self._deltas)
                  
             # Restore audio exactly to avoid drift
             self._sub_track.audio_start_ms = self._old_audio_start
@@ -715,45 +708,17 @@ class AddVideoClipCommand(QUndoCommand):
         except ValueError:
             pass
 
-    def _apply_shift(self, delta: int, threshold: int | None = None) -> None:
-        threshold = threshold if threshold is not None else self._ripple_point
-        # Shift subtitles (active track)
-        for seg in self._sub_track.segments:
-            if seg.start_ms >= threshold:
-                seg.start_ms += delta
-                seg.end_ms += delta
-
-        # Shift image overlays
-        if self._overlay_track:
-            for ov in self._overlay_track.overlays:
-                if ov.start_ms >= threshold:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-
-        # Shift text overlays
-        tt = self._project.text_overlay_track
-        if tt and not tt.locked:
-            for ov in tt.overlays:
-                if ov.start_ms >= threshold:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-
-        # Shift BGM clips
-        for bgm_track in self._project.bgm_tracks:
-            if bgm_track.locked:
-                continue
-            for clip in bgm_track.clips:
-                if clip.start_ms >= threshold:
-                    clip.start_ms += delta
-
-        # Shift Audio (TTS)
-        if self._sub_track.audio_start_ms >= threshold:
-            self._sub_track.audio_start_ms += delta
+    def _apply_shift(self, delta: int) -> None:
+        self._deltas = RippleEditService.shift_timeline(
+            self._project, self._sub_track, self._overlay_track, self._ripple_point, delta,
+        )
 
 
 class EditSpeedCommand(QUndoCommand):
     """Change the playback speed of a video clip with subtitle ripple."""
 
+    _history_attrs = ("_deltas",)
+
     def __init__(self, project: ProjectState, track_index: int, clip_index: int,
                  old_speed: float, new_speed: float,
                  subtitle_track: SubtitleTrack,
@@ -768,6 +733,7 @@ class EditSpeedCommand(QUndoCommand):
         self._sub_track = subtitle_track
         self._overlay_track = image_overlay_track
         self._ripple = ripple
+        self._deltas: list = []
 
         vt = project.video_tracks[track_index]
         clip = vt.clips[clip_index]
@@ -797,47 +763,19 @@ class EditSpeedCommand(QUndoCommand):
         if 0 <= self._index < len(vt.clips):
             vt.clips[self._index].speed = self._old_speed
             if self._ripple and self._delta != 0:
-                self._apply_shift(-self._delta, threshold=self._ripple_point + self._delta)
-
-    def _apply_shift(self, delta: int, threshold: int | None = None) -> None:
-        threshold = threshold if threshold is not None else self._ripple_point
-        # Shift subtitles (active track)
-        for seg in self._sub_track.segments:
-            if seg.start_ms >= threshold:
-                seg.start_ms += delta
-                seg.end_ms += delta
-
-        # Shift image overlays
-        if self._overlay_track:
-            for ov in self._overlay_track.overlays:
-                if ov.start_ms >= threshold:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
+                RippleEditService.revert(self._deltas)
 
-        # Shift text overlays
-        tt = self._project.text_overlay_track
-        if tt and not tt.locked:
-            for ov in tt.overlays:
-                if ov.start_ms >= threshold:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-
-        # Shift BGM clips
-        for bgm_track in self._project.bgm_tracks:
-            if bgm_track.locked:
-                continue
-            for clip in bgm_track.clips:
-                if clip.start_ms >= threshold:
-                    clip.start_ms += delta
-
-        # Shift Audio (TTS)
-        if self._sub_track.audio_start_ms >= threshold:
-            self._sub_track.audio_start_ms += delta
+    def _apply_shift(self, delta: int) -> None:
+        self._deltas = RippleEditService.shift_timeline(
+            self._project, self._sub_track, self._overlay_track, self._ripple_point, delta,
+        )
 
 
 class EditTransitionCommand(QUndoCommand):
     """Command to add or modify a video transition with ripples."""
 
+    _history_attrs = ("_deltas",)
+
     def __init__(self, project, track_index, clip_index, new_info, ripple=True):
         super().__init__(tr("Edit Transition"))
         self._project = project
@@ -845,6 +783,7 @@ class EditTransitionCommand(QUndoCommand):
         self._index = clip_index
         self._new_info = new_info
         self._ripple = ripple
+        self._deltas: list = []
 
         vt = project.video_tracks[track_index]
         self._clip = vt.clips[clip_index]
@@ -874,43 +813,19 @@ class EditTransitionCommand(QUndoCommand):
     def undo(self) -> None:
         self._clip.transition_out = self._old_info
         if self._ripple and self._delta != 0:
-            self._apply_shift(-self._delta, threshold=self._ripple_point + self._delta)
-
-    def _apply_shift(self, delta: int, threshold: int | None = None) -> None:
-        target = threshold if threshold is not None else self._ripple_point
-        # Subtitles (active track)
-        for seg in self._sub_track.segments:
-            if seg.start_ms >= target:
-                seg.start_ms += delta
-                seg.end_ms += delta
-        # Image overlays
-        if self._overlay_track:
-            for ov in self._overlay_track.overlays:
-                if ov.start_ms >= target:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-        # Text overlays
-        tt = self._project.text_overlay_track
-        if tt and not tt.locked:
-            for ov in tt.overlays:
-                if ov.start_ms >= target:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
-        # BGM clips
-        for bgm_track in self._project.bgm_tracks:
-            if bgm_track.locked:
-                continue
-            for clip in bgm_track.clips:
-                if clip.start_ms >= target:
-                    clip.start_ms += delta
-        # Audio (TTS)
-        if self._sub_track.audio_start_ms >= target:
-            self._sub_track.audio_start_ms += delta
+            RippleEditService.revert(self._deltas)
+
+    def _apply_shift(self, delta: int) -> None:
+        self._deltas = RippleEditService.shift_timeline(
+            self._project, self._sub_track, self._overlay_track, self._ripple_point, delta,
+        )
 
 
 class EditClipPropertiesCommand(QUndoCommand):
     """Adjust video clip properties (volume, brightness, contrast, saturation)."""
 
+    _history_attrs = ("_old", "_new")
+
     def __init__(self, clip: VideoClip, old_values: dict, new_values: dict):
         super().__init__(tr("Edit clip properties"))
         self._clip = clip
@@ -933,6 +848,8 @@ class EditClipPropertiesCommand(QUndoCommand):
 class AddVideoTrackCommand(QUndoCommand):
     """Add a new video track."""
 
+    _history_attrs = ("_track",)
+
     def __init__(self, project: ProjectState):
         super().__init__(tr("Add Video Track"))
         self._project = project
@@ -951,6 +868,8 @@ class AddVideoTrackCommand(QUndoCommand):
 class RemoveVideoTrackCommand(QUndoCommand):
     """Remove a video track."""
 
+    _history_attrs = ("_track",)
+
     def __init__(self, project: ProjectState, index: int):
         super().__init__(tr("Remove Video Track"))
         self._project = project
@@ -966,7 +885,13 @@ class RemoveVideoTrackCommand(QUndoCommand):
 
 
 class MoveVideoClipCommand(QUndoCommand):
-    """Move a video clip from one track/position to another."""
+    """Move a video clip from one track/position to another.
+
+    move_linked이면 클립 구간에서 시작하는 자막·이미지 오버레이를 함께 옮긴다. 이동 전 상태는
+    TimeSnapshot(직전 기록과 청크 공유)으로 남겨 undo에서 순서·시각을 그대로 복원한다.
+    """
+
+    _history_attrs = ("_sub_before", "_overlay_before")
 
     def __init__(self, project: ProjectState,
                  src_track_idx: int, src_clip_idx: int,
@@ -983,6 +908,8 @@ class MoveVideoClipCommand(QUndoCommand):
         self._sub_track = subtitle_track
         self._overlay_track = image_overlay_track
         self._move_linked = move_linked
+        self._sub_before: TimeSnapshot | None = None
+        self._overlay_before: TimeSnapshot | None = None
 
         # Calculate original start time for linked move
         src_track = project.video_tracks[src_track_idx]
@@ -992,166 +919,65 @@ class MoveVideoClipCommand(QUndoCommand):
     def redo(self) -> None:
         src_track = self._project.video_tracks[self._src_track_idx]
         dst_track = self._project.video_tracks[self._dst_track_idx]
-        
+
         clip = src_track.clips.pop(self._src_clip_idx)
-        
+
         # Adjust insertion index if moving within the same track
         insert_idx = self._dst_insert_idx
         if self._src_track_idx == self._dst_track_idx and self._src_clip_idx < self._dst_insert_idx:
             insert_idx -= 1
-            
+
         dst_track.clips.insert(insert_idx, clip)
-        
-        # Handle linked items
+
         if self._move_linked:
-            # Calculate new start time
-            new_start_ms = dst_track.clip_timeline_start(insert_idx)
-            delta = new_start_ms - self._old_start_ms
-            self._shift_linked_items(delta)
+            delta = dst_track.clip_timeline_start(insert_idx) - self._old_start_ms
+            if delta != 0:
+                lo, hi = self._old_start_ms, self._old_start_ms + self._clip_duration
+                if self._sub_track:
+                    self._sub_before = TimeSnapshot.capture(self._sub_track.segments)
+                    self._shift_range(self._sub_track.segments, lo, hi, delta)
+                    self._sub_track.mark_modified()
+                if self._overlay_track:
+                    self._overlay_before = TimeSnapshot.capture(self._overlay_track.overlays)
+                    self._shift_range(self._overlay_track.overlays, lo, hi, delta)
+                    self._overlay_track.mark_modified()
 
     def undo(self) -> None:
-        # To undo, move it back. We need to calculate the new index of the clip.
-        # However, since we know where we inserted it, we can just reverse the operation.
-        # But wait, if same track, indices shifted.
-        # Let's just use the inverse logic.
-        
-        # Current location:
-        curr_track_idx = self._dst_track_idx
+        # Current location (same-track moves shifted the index by one)
         curr_clip_idx = self._dst_insert_idx
         if self._src_track_idx == self._dst_track_idx and self._src_clip_idx < self._dst_insert_idx:
             curr_clip_idx -= 1
-            
-        # Target location (original):
-        target_track_idx = self._src_track_idx
-        target_insert_idx = self._src_clip_idx
-        
-        src_track = self._project.video_tracks[curr_track_idx]
-        dst_track = self._project.video_tracks[target_track_idx]
-        
-        clip = src_track.clips.pop(curr_clip_idx)
-        dst_track.clips.insert(target_insert_idx, clip)
-        
-        if self._move_linked:
-            # Reverse shift
-            # We know the delta from redo, but we can re-calculate or store it.
-            # The clip is now back at _old_start_ms.
-            # The position it was at before undo was... we need to calculate it or store delta.
-            # Let's calculate delta again based on where it was.
-            # Actually, simpler: we know we moved it back to _old_start_ms.
-            # So we just need to find where it WAS.
-            # But wait, we just moved it.
-            # Let's just store delta in redo.
-            # Or re-calculate:
-            # The clip was at `src_track.clip_timeline_start(curr_clip_idx)` before pop.
-            # But we already popped it.
-            # Let's assume redo logic is deterministic.
-            # We can just shift items back by checking what overlaps the "new" position (which is now old).
-            # Actually, simpler:
-            # We moved items that were at [old_start, old_end]. They are now at [new_start, new_end].
-            # We want to move them back.
-            # But wait, if we use the same logic, we need to know the "source" range to find items.
-            # The items are currently at the "new" position.
-            # So we find items at [new_start, new_end] and shift by -delta.
-            
-            # However, calculating new_start here is tricky because we just modified the track.
-            # Let's store delta in self.
-            pass
-            
-        # Re-implementing linked move undo properly requires storing the delta from redo
-        # Since QUndoCommand doesn't persist state easily between redo/undo calls unless we store it in self.
-        # Let's modify redo to store self._applied_delta
 
-    def _shift_linked_items(self, delta: int):
-        if delta == 0:
-            return
-            
-        # Define the source range.
-        # If we are in redo(), we are moving FROM old_start.
-        # If we are in undo(), we are moving FROM new_start (which is old_start + delta).
-        # Wait, undo() calls this? No, I need to handle undo explicitly.
-        
-        # Let's refine:
-        # Items to move are those that were within [self._old_start_ms, self._old_start_ms + self._clip_duration]
-        # But wait, if we already moved them in redo, they are now at [new_start, ...].
-        # So in undo, we should look at [new_start, ...] and move back.
-        
-        # Actually, simpler approach:
-        # Identify items based on the *original* range (before move).
-        # But we don't have persistent IDs for subtitles.
-        # So we must rely on current positions.
-        
-        # In Redo:
-        # Find items in [old_start, old_end]. Shift by delta.
-        # In Undo:
-        # Find items in [old_start + delta, old_end + delta]. Shift by -delta.
-        
-        pass 
-        
-        # Real implementation in redo/undo below
-        
-    def redo(self) -> None:
-        src_track = self._project.video_tracks[self._src_track_idx]
         dst_track = self._project.video_tracks[self._dst_track_idx]
-        
-        clip = src_track.clips.pop(self._src_clip_idx)
-        
-        insert_idx = self._dst_insert_idx
-        if self._src_track_idx == self._dst_track_idx and self._src_clip_idx < self._dst_insert_idx:
-            insert_idx -= 1
-            
-        dst_track.clips.insert(insert_idx, clip)
-        
-        if self._move_linked:
-            new_start_ms = dst_track.clip_timeline_start(insert_idx)
-            self._delta = new_start_ms - self._old_start_ms
-            if self._delta != 0:
-                self._apply_shift(self._old_start_ms, self._old_start_ms + self._clip_duration, self._delta)
-
-    def undo(self) -> None:
-        curr_track_idx = self._dst_track_idx
-        curr_clip_idx = self._dst_insert_idx
-        if self._src_track_idx == self._dst_track_idx and self._src_clip_idx < self._dst_insert_idx:
-            curr_clip_idx -= 1
-            
-        target_track_idx = self._src_track_idx
-        target_insert_idx = self._src_clip_idx
-        
-        src_track = self._project.video_tracks[curr_track_idx]
-        dst_track = self._project.video_tracks[target_track_idx]
-        
-        clip = src_track.clips.pop(curr_clip_idx)
-        dst_track.clips.insert(target_insert_idx, clip)
-        
-        if self._move_linked and hasattr(self, '_delta') and self._delta != 0:
-            # Shift back items that are currently at the new position
-            new_start = self._old_start_ms + self._delta
-            new_end = new_start + self._clip_duration
-            self._apply_shift(new_start, new_end, -self._delta)
-
-    def _apply_shift(self, start_range: int, end_range: int, delta: int) -> None:
-        # Shift subtitles that start within the range
-        if self._sub_track:
-            for seg in self._sub_track.segments:
-                # Check if segment starts within the clip's range
-                # Using a slight tolerance or strict containment?
-                # Let's use strict start time containment.
-                if start_range <= seg.start_ms < end_range:
-                    seg.start_ms += delta
-                    seg.end_ms += delta
-                    if seg.audio_file:
-                        seg.audio_start_ms += delta
-        
-        # Shift overlays
-        if self._overlay_track:
-            for ov in self._overlay_track.overlays:
-                if start_range <= ov.start_ms < end_range:
-                    ov.start_ms += delta
-                    ov.end_ms += delta
+        src_track = self._project.video_tracks[self._src_track_idx]
+        clip = dst_track.clips.pop(curr_clip_idx)
+        src_track.clips.insert(self._src_clip_idx, clip)
+
+        if self._sub_before is not None:
+            self._sub_before.restore(self._sub_track.segments)
+            self._sub_track.mark_modified()
+            self._sub_before = None
+        if self._overlay_before is not None:
+            self._overlay_before.restore(self._overlay_track.overlays)
+            self._overlay_track.mark_modified()
+            self._overlay_before = None
+
+    @staticmethod
+    def _shift_range(items: list, start_ms: int, end_ms: int, delta: int) -> None:
+        """[start_ms, end_ms)에서 시작하는 항목을 delta만큼 옮기고 시작 시각 순서를 유지."""
+        lo = bisect.bisect_left(items, start_ms, key=lambda it: it.start_ms)
+        hi = bisect.bisect_left(items, end_ms, key=lambda it: it.start_ms, lo=lo)
+        for item in items[lo:hi]:
+            item.start_ms += delta
+            item.end_ms += delta
+        items.sort(key=lambda it: it.start_ms)
 
 
 class DuplicateVideoClipCommand(QUndoCommand):
     """Duplicate a video clip to another track/position."""
 
+    _history_attrs = ("_new_clip",)
+
     def __init__(self, project: ProjectState,
                  src_track_idx: int, src_clip_idx: int,
                  dst_track_idx: int, dst_insert_idx: int):
@@ -1185,6 +1011,8 @@ class DuplicateVideoClipCommand(QUndoCommand):
 class AddTextOverlayCommand(QUndoCommand):
     """Add a new text overlay to the project."""
 
+    _history_attrs = ("_overlay",)
+
     def __init__(self, track: TextOverlayTrack, overlay: TextOverlay):
         super().__init__(tr("Add text overlay"))
         self._track = track
@@ -1204,6 +1032,8 @@ class AddTextOverlayCommand(QUndoCommand):
 class DeleteTextOverlayCommand(QUndoCommand):
     """Delete a text overlay from the project."""
 
+    _history_attrs = ("_overlay",)
+
     def __init__(self, project: ProjectState, index: int, overlay: TextOverlay):
         super().__init__(tr("Delete text overlay"))
         self._project = project
@@ -1216,31 +1046,44 @@ class DeleteTextOverlayCommand(QUndoCommand):
     def undo(self) -> None:
         self._project.text_overlay_track.overlays.insert(self._index, self._overlay)
         self._project.text_overlay_track.overlays.sort(key=lambda o: o.start_ms)
+        self._project.text_overlay_track.mark_modified()
 
 
 class MoveTextOverlayCommand(QUndoCommand):
     """Move a text overlay in time (change start/end)."""
 
-    def __init__(self, overlay: TextOverlay, old_start: int, old_end: int, new_start: int, new_end: int):
+    def __init__(self, overlay: TextOverlay, old_start: int, old_end: int, new_start: int, new_end: int,
+                 track: TextOverlayTrack | None = None):
         super().__init__(tr("Move text overlay"))
         self._overlay = overlay
         self._old_start = old_start
         self._old_end = old_end
         self._new_start = new_start
         self._new_end = new_end
+        self._track = track
 
     def redo(self) -> None:
         self._overlay.start_ms = self._new_start
         self._overlay.end_ms = self._new_end
+        self._resort()
 
     def undo(self) -> None:
         self._overlay.start_ms = self._old_start
         self._overlay.end_ms = self._old_end
+        self._resort()
+
+    def _resort(self) -> None:
+        # 시작 순 불변식 유지 — 리플은 이진 탐색으로 접미사만 옮긴다
+        if self._track is not None:
+            self._track.overlays.sort(key=lambda o: o.start_ms)
+            self._track.mark_modified()
 
 
 class UpdateTextOverlayCommand(QUndoCommand):
     """Update text overlay content, style, or position."""
 
+    _history_attrs = ("_old_data", "_new_data")
+
     def __init__(self, overlay: TextOverlay, old_data: dict, new_data: dict):
         super().__init__(tr("Edit text overlay"))
         self._overlay = overlay
@@ -1275,9 +1118,17 @@ class UpdateTextOverlayCommand(QUndoCommand):
 # Audio Clip (BGM) Commands
 # ============================================================================
 
+def _resort_clips(track: AudioTrack | None) -> None:
+    """이동 후 시작 순 불변식 유지 — 리플은 이진 탐색으로 접미사만 옮긴다."""
+    if track is not None:
+        track.clips.sort(key=lambda c: c.start_ms)
+
+
 class AddAudioClipCommand(QUndoCommand):
     """Add a new background music clip."""
 
+    _history_attrs = ("_clip",)
+
     def __init__(self, project: ProjectState, track_index: int, clip: AudioClip):
         super().__init__(tr("Add BGM clip"))
         self._project = project
@@ -1296,43 +1147,51 @@ class AddAudioClipCommand(QUndoCommand):
 class MoveAudioClipCommand(QUndoCommand):
     """Move an audio clip (change start position)."""
 
-    def __init__(self, clip: AudioClip, old_start: int, new_start: int):
+    def __init__(self, clip: AudioClip, old_start: int, new_start: int, track: AudioTrack | None = None):
         super().__init__(tr("Move BGM clip"))
         self._clip = clip
         self._old_start = old_start
         self._new_start = new_start
+        self._track = track
 
     def redo(self) -> None:
         self._clip.start_ms = self._new_start
+        _resort_clips(self._track)
 
     def undo(self) -> None:
         self._clip.start_ms = self._old_start
+        _resort_clips(self._track)
 
 
 class TrimAudioClipCommand(QUndoCommand):
     """Trim an audio clip (change start/duration)."""
 
     def __init__(self, clip: AudioClip, old_start: int, old_duration: int,
-                 new_start: int, new_duration: int):
+                 new_start: int, new_duration: int, track: AudioTrack | None = None):
         super().__init__(tr("Trim BGM clip"))
         self._clip = clip
         self._old_start = old_start
         self._old_duration = old_duration
         self._new_start = new_start
         self._new_duration = new_duration
+        self._track = track
 
     def redo(self) -> None:
         self._clip.start_ms = self._new_start
         self._clip.duration_ms = self._new_duration
+        _resort_clips(self._track)
 
     def undo(self) -> None:
         self._clip.start_ms = self._old_start
         self._clip.duration_ms = self._old_duration
+        _resort_clips(self._track)
 
 
 class DeleteAudioClipCommand(QUndoCommand):
     """Delete a BGM clip."""
 
+    _history_attrs = ("_clip",)
+
     def __init__(self, project: ProjectState, track_index: int, clip_index: int, clip: AudioClip):
         super().__init__(tr("Delete BGM clip"))
         self._project = project
@@ -1354,18 +1213,23 @@ class DeleteAudioClipCommand(QUndoCommand):
 
 
 class AutoAlignSubtitlesCommand(QUndoCommand):
-    """겹치는 자막 자동 정렬."""
+    """겹치는 자막 자동 정렬.
+
+    old_times/new_times: (start, end) 쌍 목록 또는 (n, 2) 배열. 적용 시 값이 바뀐 행만 되쓴다.
+    """
+
+    _history_attrs = ("_old_times", "_new_times")
 
     def __init__(
         self,
         track: SubtitleTrack,
-        old_times: list[tuple[int, int]],
-        new_times: list[tuple[int, int]],
+        old_times: list[tuple[int, int]] | np.ndarray,
+        new_times: list[tuple[int, int]] | np.ndarray,
     ):
         super().__init__(tr("Auto-align subtitles"))
         self._track = track
-        self._old_times = old_times
-        self._new_times = new_times
+        self._old_times = np.asarray(old_times, dtype=np.int64).reshape(-1, 2)
+        self._new_times = np.asarray(new_times, dtype=np.int64).reshape(-1, 2)
 
     def redo(self) -> None:
         self._apply(self._new_times)
@@ -1373,15 +1237,16 @@ class AutoAlignSubtitlesCommand(QUndoCommand):
     def undo(self) -> None:
         self._apply(self._old_times)
 
-    def _apply(self, times: list[tuple[int, int]]) -> None:
-        for i, (s, e) in enumerate(times):
-            self._track.segments[i].start_ms = s
-            self._track.segments[i].end_ms = e
+    def _apply(self, times: np.ndarray) -> None:
+        write_times(self._track.segments, times[:, 0], times[:, 1])
+        self._track.mark_modified()
 
 
 class WrapSubtitlesCommand(QUndoCommand):
     """자막 텍스트 자동 줄바꿈."""
 
+    _history_attrs = ("_changes",)
+
     def __init__(self, track: SubtitleTrack, changes: list[tuple[int, str, str]]):
         super().__init__(tr("Auto-wrap subtitles"))
         self._track = track
@@ -1434,6 +1299,8 @@ class EditColorCorrectionCommand(QUndoCommand):
 class AddMarkerCommand(QUndoCommand):
     """타임라인 마커 추가."""
 
+    _history_attrs = ("_marker",)
+
     def __init__(self, project: ProjectState, marker: TimelineMarker):
         super().__init__(tr("Add marker"))
         self._project = project
@@ -1449,6 +1316,8 @@ class AddMarkerCommand(QUndoCommand):
 class RemoveMarkerCommand(QUndoCommand):
     """타임라인 마커 삭제."""
 
+    _history_attrs = ("_marker",)
+
     def __init__(self, project: ProjectState, marker: TimelineMarker):
         super().__init__(tr("Remove marker"))
         self._project = project
@@ -1508,6 +1377,8 @@ class EditTrackBlendModeCommand(QUndoCommand):
 class ApplyTTSVerificationCommand(QUndoCommand):
     """Whisper 역방향 검증 결과를 자막 트랙에 적용한다."""
 
+    _history_attrs = ("_corrections",)
+
     def __init__(self, track: SubtitleTrack, corrections: list) -> None:
         """
         Args:
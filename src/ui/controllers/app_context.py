@@ -81,6 +81,7 @@ class AppContext:
         # ---- 프록시 ----
         self.use_proxies: bool = False
         self.proxy_map: dict[str, str] = {}
+        self.scrubbing: bool = False  # 플레이헤드 드래그 중 — 스크럽 티어로 재생
 
         # ---- Controller 참조 (MainWindow가 설정) ----
         self.playback_ctrl: Any = None
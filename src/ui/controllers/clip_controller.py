@@ -14,6 +14,7 @@ from src.models.video_clip import VideoClipTrack
 from src.ui.commands import (
     AddVideoClipCommand,
     DeleteClipCommand,
+    DeleteClipsCommand,
     EditColorCorrectionCommand,
     EditColorLabelCommand,
     EditSpeedCommand,
@@ -104,7 +105,6 @@ class ClipController:
         cmd = SplitClipCommand(ctx.project, v_idx, clip_idx, original, first, second)
         ctx.undo_stack.push(cmd)
 
-        ctx.refresh_all()
         self.sync_clip_index_from_position()
         ctx.timeline.select_clip(v_idx, clip_idx + 1)
 
@@ -170,7 +170,7 @@ class ClipController:
     # ---- 멀티 클립 삭제 ----
 
     def on_delete_selected_clips(self) -> None:
-        """선택된 클립들을 역순으로 삭제 (인덱스 오프셋 보정). macro Undo."""
+        """선택된 클립들을 한 명령으로 삭제 (DeleteClipsCommand)."""
         ctx = self.ctx
         if not ctx.project:
             return
@@ -185,34 +185,20 @@ class ClipController:
             if track_idx >= len(ctx.project.video_tracks):
                 continue
             vt = ctx.project.video_tracks[track_idx]
-            if len(vt.clips) - track_delete_counts[track_idx] >= 1:
+            if clip_idx < len(vt.clips) and len(vt.clips) - track_delete_counts[track_idx] >= 1:
                 deletable.append((track_idx, clip_idx))
 
         if not deletable:
             ctx.status_bar().showMessage(tr("Cannot delete the last clip"), 3000)
             return
 
-        # 역순 정렬 (트랙별 내림차순 clip_idx → 이전 인덱스 유지)
-        deletable.sort(key=lambda x: (x[0], x[1]), reverse=True)
-
-        ctx.undo_stack.beginMacro(tr("Delete %d Clips") % len(deletable))
-        ripple = ctx.timeline.is_ripple_mode()
-        for track_idx, clip_idx in deletable:
-            vt = ctx.project.video_tracks[track_idx]
-            if clip_idx >= len(vt.clips):
-                continue
-            clip = vt.clips[clip_idx]
-            clip_start = vt.clip_timeline_start(clip_idx)
-            clip_end = clip_start + clip.duration_ms
-            cmd = DeleteClipCommand(
-                ctx.project, track_idx, clip_idx, clip,
-                ctx.project.subtitle_track,
-                ctx.project.image_overlay_track,
-                clip_start, clip_end,
-                ripple=ripple,
-            )
-            ctx.undo_stack.push(cmd)
-        ctx.undo_stack.endMacro()
+        # 삭제 구간 합집합으로 한 번에 리플 (클립마다 전체 항목을 다시 훑지 않음)
+        ctx.undo_stack.push(DeleteClipsCommand(
+            ctx.project, deletable,
+            ctx.project.subtitle_track,
+            ctx.project.image_overlay_track,
+            ripple=ctx.timeline.is_ripple_mode(),
+        ))
 
         ctx.timeline._clear_selection()
         ctx.refresh_all()
@@ -335,7 +321,6 @@ class ClipController:
             move_linked=move_linked
         )
         ctx.undo_stack.push(cmd)
-        ctx.refresh_all()
 
     # ---- 클립 볼륨/속성 ----
 
@@ -444,7 +429,7 @@ class ClipController:
                 old_hue=old_hue, new_hue=new_hue,
             ))
         ctx.undo_stack.endMacro()
-        ctx.project_ctrl.on_document_edited()
+        ctx.project_ctrl.on_document_edited(ctx.undo_stack.command(ctx.undo_stack.index() - 1))
         ctx.timeline._invalidate_static_cache()
         ctx.timeline.update()
         n = len(vt.clips)
@@ -457,7 +442,6 @@ class ClipController:
         from src.ui.commands import AddVideoTrackCommand
         cmd = AddVideoTrackCommand(self.ctx.project)
         self.ctx.undo_stack.push(cmd)
-        self.ctx.refresh_all()
 
     def on_remove_video_track(self, index: int) -> None:
         """Remove a video track."""
@@ -466,7 +450,6 @@ class ClipController:
         from src.ui.commands import RemoveVideoTrackCommand
         cmd = RemoveVideoTrackCommand(self.ctx.project, index)
         self.ctx.undo_stack.push(cmd)
-        self.ctx.refresh_all()
 
     def on_rename_video_track(self, index: int) -> None:
         """Rename a video track."""
@@ -501,7 +484,7 @@ class ClipController:
                 dlg.chroma_similarity, dlg.chroma_blend,
             )
             ctx.undo_stack.push(cmd)
-            ctx.project_ctrl.on_document_edited()
+            ctx.project_ctrl.on_document_edited(cmd)
             ctx.timeline._invalidate_static_cache()
             ctx.timeline.update()
 
@@ -516,8 +499,9 @@ class ClipController:
         clip = vt.clips[clip_idx]
         if clip.color_label == label:
             return
-        ctx.undo_stack.push(EditColorLabelCommand(clip, clip.color_label, label))
-        ctx.project_ctrl.on_document_edited()
+        cmd = EditColorLabelCommand(clip, clip.color_label, label)
+        ctx.undo_stack.push(cmd)
+        ctx.project_ctrl.on_document_edited(cmd)
         ctx.timeline._invalidate_static_cache()
         ctx.timeline.update()
         label_display = label.capitalize() if label != "none" else tr("None")
@@ -693,8 +677,8 @@ class ClipController:
         )
         ctx.undo_stack.push(cmd)
 
-        if ctx.use_proxies:
-            ctx.media_ctrl.start_proxy_generation(path)
+        # 프록시/프레임 캐시/썸네일을 한 번의 디코딩으로 (파형은 타임라인이 화면 순서대로 요청)
+        ctx.media_ctrl.start_ingest(path, proxy=ctx.use_proxies)
 
         ctx.project.duration_ms = ctx.project.video_tracks[v_idx].output_duration_ms
         ctx.timeline.set_duration(ctx.project.duration_ms, has_video=True)
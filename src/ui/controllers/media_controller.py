@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import subprocess
-import sys
 from pathlib import Path
 from typing import TYPE_CHECKING
 
@@ -13,7 +11,8 @@ from PySide6.QtWidgets import QApplication, QMessageBox, QProgressDialog
 
 from src.models.video_clip import VideoClipTrack
 from src.services.frame_cache_service import FrameCacheService
-from src.utils.config import APP_NAME, find_ffmpeg
+from src.services.media_metadata import probe_media
+from src.utils.config import APP_NAME
 from src.utils.i18n import tr
 from src.workers.video_load_worker import VideoLoadWorker
 from src.workers.waveform_worker import WaveformWorker
@@ -40,8 +39,43 @@ class MediaController(QObject):
         # 프레임 캐시
         self._frame_cache_thread: QThread | None = None
         self._frame_cache_worker: FrameCacheWorker | None = None
-        # 프록시
-        self._proxy_workers: dict[str, tuple[QThread, object]] = {}
+        # 프록시 — 동시 실행 수 제한 + 화면 우선순위 + 재시작 시 이어서 생성
+        # 프록시·스크럽 티어·인제스트는 인코딩 한도 하나를 나눠 쓴다
+        from src.services.proxy_queue import EncodeSlots, ProxyQueue, default_state_path
+        self.encode_slots = EncodeSlots()
+        self.proxy_queue = ProxyQueue(self, state_path=default_state_path(), slots=self.encode_slots)
+        self.proxy_queue.started.connect(self.proxy_started)
+        self.proxy_queue.progress.connect(self._on_proxy_progress)
+        self.proxy_queue.failed.connect(
+            lambda _src, msg: self.ctx.status_bar().showMessage(f"Warning: {msg}", 5000)
+        )
+        self.proxy_queue.finished.connect(self._on_proxy_finished)
+        # 스크럽 티어 — 작고 가벼운 작업이라 한 번에 하나씩
+        from src.services.scrub_proxy import is_scrub_tier_complete
+        from src.workers.scrub_proxy_worker import ScrubProxyWorker
+        self.scrub_queue = ProxyQueue(
+            self,
+            state_path=default_state_path("scrub_queue.json"),
+            max_workers=1,
+            encoder=lambda: "libx264",
+            worker_factory=lambda src, _encoder: ScrubProxyWorker(src, self._scrub_height()),
+            is_done=is_scrub_tier_complete,
+            slots=self.encode_slots,
+        )
+        # 미디어 인제스트 — 새 소스를 한 번 디코딩해 프록시/프레임 캐시/썸네일/포스터/파형을 만든다
+        self.ingest_queue = ProxyQueue(
+            self,
+            state_path=default_state_path("ingest_queue.json"),
+            worker_factory=self._create_ingest_worker,
+            slots=self.encode_slots,
+        )
+        self.ingest_queue.started.connect(self._on_ingest_started)
+        self.ingest_queue.finished.connect(self._on_ingest_finished)
+        self.ingest_queue.failed.connect(
+            lambda _src, msg: self.ctx.status_bar().showMessage(f"Warning: {msg}", 5000)
+        )
+        # source_path -> (frames_dir, proxy, waveform)
+        self._ingest_requests: dict[str, tuple[Path | None, bool, bool]] = {}
         # 비디오 로드
         self._video_thread: QThread | None = None
         self._video_worker: VideoLoadWorker | None = None
@@ -149,15 +183,15 @@ class MediaController(QObject):
         ctx.player.play()
         ctx.refresh_all()
         ctx.refresh_track_selector()
+        # 파형은 오디오만 읽는 빠른 경로로 — 인제스트 패스는 영상 디코딩·프록시 인코딩 속도로
+        # 끝나므로 파형을 거기서 기다리면 로드 직후 타임라인이 한참 비어 있다
         if ctx.project.video_has_audio:
             self.start_waveform_generation(source_path)
         else:
             ctx.timeline.clear_waveform()
         ctx.window.setWindowTitle(f"{source_path.name} – {APP_NAME}")
         ctx.status_bar().showMessage(f"{tr('Loaded')}: {source_path.name}")
-        self.start_frame_cache_generation()
-        if ctx.use_proxies:
-            self.start_proxy_generation(source_path)
+        self.start_ingest(source_path, proxy=ctx.use_proxies)
 
     def _cleanup_temp_video(self) -> None:
         ctx = self.ctx
@@ -167,7 +201,8 @@ class MediaController(QObject):
 
     # ---- 재생 경로 해석 ----
 
-    def resolve_playback_path(self, source_path: str | Path | None) -> str:
+    def resolve_playback_path(self, source_path: str | Path | None, position_ms: int | None = None) -> str:
+        """재생할 파일 경로. 스크럽 중이면 *position_ms*(원본 기준)까지 준비된 스크럽 티어를 쓴다."""
         ctx = self.ctx
         if source_path is None:
             if not ctx.project.video_path:
@@ -176,6 +211,12 @@ class MediaController(QObject):
         else:
             src_str = str(source_path)
 
+        if ctx.scrubbing and position_ms is not None:
+            from src.services.scrub_proxy import find_scrub_tier
+            tier = find_scrub_tier(Path(src_str), position_ms)
+            if tier:
+                return tier
+
         if ctx.use_proxies:
             proxy = ctx.proxy_map.get(src_str)
             if proxy and Path(proxy).exists():
@@ -213,6 +254,31 @@ class MediaController(QObject):
         if ctx.pending_auto_play:
             ctx.player.play()
 
+    def set_scrubbing(self, active: bool) -> None:
+        """플레이헤드 드래그 시작/종료. 끝나면 스크럽 티어에서 재생용 경로로 돌아간다."""
+        ctx = self.ctx
+        ctx.scrubbing = active
+        if active:
+            return
+        from src.services.scrub_proxy import is_scrub_tier
+        if not is_scrub_tier(ctx.current_playback_source):
+            return
+        source = self._current_raw_source()
+        if source:
+            pos = ctx.pending_seek_ms if ctx.pending_seek_ms is not None else ctx.player.position()
+            self.switch_player_source(self.resolve_playback_path(source), pos, auto_play=ctx.play_intent)
+
+    def _current_raw_source(self) -> str | None:
+        """현재 클립의 원본 경로 (프록시·스크럽 티어로 바꾸기 전)."""
+        ctx = self.ctx
+        clip_track = ctx.project.video_clip_track
+        if clip_track and 0 <= ctx.current_clip_index < len(clip_track.clips):
+            clip = clip_track.clips[ctx.current_clip_index]
+            return clip.source_path or (str(ctx.project.video_path) if ctx.project.video_path else None)
+        if ctx.project.video_path:
+            return str(ctx.project.video_path)
+        return None
+
     # ---- 미디어 상태 ----
 
     def on_media_status_changed(self, status) -> None:
@@ -307,43 +373,47 @@ class MediaController(QObject):
                     is_playing = ctx.player.playbackState() == QMediaPlayer.PlaybackState.PlayingState
                     self.switch_player_source(new_path, pos, auto_play=is_playing)
 
-    def start_proxy_generation(self, source_path: Path) -> None:
+    def start_proxy_generation(self, source_path: Path, priority: float = 0.0) -> None:
+        """프록시가 없으면 생성 대기열에 넣는다 (이미 대기·실행 중이면 우선순위만 갱신)."""
         from src.services.proxy_service import ProxyService
         ctx = self.ctx
         proxy_svc = ProxyService()
-        
-        # 이미 진행 중이면 스킵
-        if str(source_path) in self._proxy_workers:
-            return
-            
+
+        self._request_scrub_tier(source_path, priority)
         if proxy_svc.has_proxy(str(source_path)):
             ctx.proxy_map[str(source_path)] = proxy_svc.get_proxy_path(str(source_path))
             return
-        thread = QThread()
-        worker = proxy_svc.create_worker(str(source_path))
-        worker.moveToThread(thread)
-        thread.started.connect(worker.run)
+        self.proxy_queue.request(str(source_path), priority)
 
-        self.proxy_started.emit(str(source_path))
-        
-        # Progress update
-        worker.progress.connect(
-            lambda pct: self._on_proxy_progress(str(source_path), pct), Qt.QueuedConnection
-        )
-        
-        # Error handling
-        worker.error.connect(
-            lambda msg: self.ctx.status_bar().showMessage(f"Warning: {msg}", 5000), Qt.QueuedConnection
-        )
-        
-        worker.finished.connect(lambda p: self._on_proxy_finished(str(source_path), p), Qt.QueuedConnection)
-        worker.finished.connect(thread.quit)
-        worker.finished.connect(worker.deleteLater)
-        worker.finished.connect(lambda: self._cleanup_proxy_worker(str(source_path)), Qt.QueuedConnection)
-        worker.finished.connect(thread.deleteLater)
-        
-        self._proxy_workers[str(source_path)] = (thread, worker)
-        thread.start()
+    def _request_scrub_tier(self, source_path: Path, priority: float = 0.0) -> None:
+        from src.services.scrub_proxy import is_scrub_tier_complete
+        try:
+            if is_scrub_tier_complete(Path(source_path)):
+                return
+        except OSError:
+            return
+        self.scrub_queue.request(str(source_path), priority)
+
+    def _scrub_height(self) -> int:
+        """미리보기 위젯 높이에 맞춘 스크럽 티어 해상도."""
+        from src.services.scrub_proxy import scrub_height_for_widget
+        widget = self.ctx.video_widget
+        if widget is None:
+            return scrub_height_for_widget(360)
+        return scrub_height_for_widget(widget.height(), widget.devicePixelRatioF())
+
+    def resume_proxy_jobs(self) -> None:
+        """지난 실행에서 끝나지 않은 프록시 작업을 이어서 만든다."""
+        count = self.proxy_queue.resume()
+        self.scrub_queue.resume()
+        # 인제스트는 요청마다 옵션이 있다 — 남은 소스를 지금 설정으로 다시 요청한다
+        # (이미 만든 결과는 plan_ingest가 건너뛴다)
+        for source in self.ingest_queue.saved_sources():
+            if Path(source).is_file():
+                self.start_ingest(Path(source), proxy=self.ctx.use_proxies)
+                count += 1
+        if count:
+            self.ctx.status_bar().showMessage(f"{tr('Resuming proxy generation')}: {count}", 5000)
 
     def _on_proxy_progress(self, source_path: str, pct: int) -> None:
         self.ctx.status_bar().showMessage(f"Generating proxy: {Path(source_path).name} ({pct}%)")
@@ -351,10 +421,18 @@ class MediaController(QObject):
 
     def cancel_proxy_generation(self, source_path: str) -> None:
         """Cancel proxy generation for a specific file."""
-        if source_path in self._proxy_workers:
-            thread, worker = self._proxy_workers[source_path]
-            worker.cancel()
-            self.ctx.status_bar().showMessage(f"{tr('Proxy generation canceled')}: {Path(source_path).name}", 3000)
+        request = self._ingest_requests.get(source_path)
+        if request is not None and request[1]:
+            # 프록시가 인제스트 패스 안에 있다 — 패스를 멈추고 나머지는 결과별 작업으로 만든다
+            # (취소된 FFmpeg가 스테이징을 정리하는 중이라 같은 패스를 바로 다시 걸지 않는다)
+            self.ingest_queue.cancel(source_path)
+            frames_dir, _, waveform = self._ingest_requests.pop(source_path)
+            self._start_product_jobs(source_path, frames_dir, False, waveform)
+        elif self.proxy_queue.is_queued(source_path):
+            self.proxy_queue.cancel(source_path)
+        else:
+            return
+        self.ctx.status_bar().showMessage(f"{tr('Proxy generation canceled')}: {Path(source_path).name}", 3000)
 
     def _on_proxy_finished(self, source_path: str, proxy_path: str) -> None:
         if proxy_path:
@@ -381,22 +459,17 @@ class MediaController(QObject):
         else:
             self.proxy_failed.emit(source_path)
 
-    def _cleanup_proxy_worker(self, source_path: str) -> None:
-        if source_path in self._proxy_workers:
-            del self._proxy_workers[source_path]
-
     def cancel_all_proxies(self) -> None:
-        """Cancel all running proxy generations."""
-        for source_path, (thread, worker) in list(self._proxy_workers.items()):
-            worker.cancel()
-            if thread.isRunning():
-                thread.quit()
-                thread.wait(2000)
-        self._proxy_workers.clear()
+        """Stop all proxy generation (unfinished jobs resume on next launch)."""
+        self.proxy_queue.shutdown()
+        self.scrub_queue.shutdown()
+        self.ingest_queue.shutdown()
 
     def is_proxy_generating(self) -> bool:
-        """Check if any proxy generation is currently running."""
-        return bool(self._proxy_workers)
+        """Check if any proxy generation is running or queued."""
+        if any(proxy for _, proxy, _ in self._ingest_requests.values()):
+            return True
+        return self.proxy_queue.is_busy()
 
     # ---- 웨이브폼 생성 ----
 
@@ -435,6 +508,90 @@ class MediaController(QObject):
         self._waveform_thread = None
         self._waveform_worker = None
 
+    # ---- 미디어 인제스트 ----
+
+    def start_ingest(self, source_path: Path, proxy: bool = False, waveform: bool = False) -> None:
+        """Queue the single-pass ingest for a new source.
+
+        프레임 캐시·썸네일 스트립·포스터는 없으면 항상, 프록시와 파형은 요청할 때만 만든다.
+        인제스트가 실패하면 예전처럼 결과별 작업으로 다시 시도한다.
+        """
+        ctx = self.ctx
+        src = str(source_path)
+        if self.ingest_queue.is_queued(src):
+            return
+        if proxy:
+            from src.services.proxy_service import ProxyService
+            self._request_scrub_tier(Path(src))
+            proxy_svc = ProxyService()
+            if proxy_svc.has_proxy(src):
+                ctx.proxy_map[src] = proxy_svc.get_proxy_path(src)
+                proxy = False
+        if ctx.frame_cache_service is None:
+            ctx.frame_cache_service = FrameCacheService()
+        ctx.frame_cache_service.initialize()
+        frames_dir = None
+        if not ctx.frame_cache_service.is_cached(src):
+            frames_dir = ctx.frame_cache_service.source_cache_dir(src)
+        self._ingest_requests[src] = (frames_dir, proxy, waveform)
+        self.ingest_queue.request(src)
+
+    def _create_ingest_worker(self, source_path: str, encoder: str):
+        from src.services.settings_manager import SettingsManager
+        from src.workers.ingest_worker import IngestWorker
+
+        frames_dir, proxy, waveform = self._ingest_requests.get(source_path, (None, False, False))
+        worker = IngestWorker(
+            source_path, encoder, frames_dir=frames_dir, proxy=proxy, waveform=waveform,
+            frame_quality=SettingsManager().get_frame_cache_quality(),
+        )
+        # 바운드 메서드 연결 — 메인 스레드에서 실행된다
+        worker.product_progress.connect(self._on_ingest_progress)
+        worker.ingested.connect(self._on_ingested)
+        return worker
+
+    def _on_ingest_started(self, source_path: str) -> None:
+        if self._ingest_requests.get(source_path, (None, False, False))[1]:
+            self.proxy_started.emit(source_path)
+
+    def _on_ingest_progress(self, source_path: str, product: str, pct: int) -> None:
+        if product == "proxy":
+            self.proxy_progress.emit(source_path, pct)
+        self.ctx.status_bar().showMessage(
+            f"{tr('Importing media')}: {Path(source_path).name} — {tr(product)} {pct}%"
+        )
+
+    def _on_ingested(self, source_path: str, result) -> None:
+        ctx = self.ctx
+        if result.waveform is not None:
+            waveform_svc = getattr(ctx.window, "_waveform_service", None)
+            if waveform_svc:
+                waveform_svc.put_waveform(source_path, result.waveform)
+            if ctx.project.video_path and str(ctx.project.video_path) == source_path:
+                ctx.timeline.set_waveform(result.waveform)
+        if result.thumbs_dir:
+            ctx.timeline.update()
+        if result.proxy_path:
+            self._on_proxy_finished(source_path, result.proxy_path)
+
+    def _on_ingest_finished(self, source_path: str, done: str) -> None:
+        frames_dir, proxy, waveform = self._ingest_requests.pop(source_path, (None, False, False))
+        if done:
+            self.ctx.status_bar().showMessage(f"{tr('Media ready')}: {Path(source_path).name}", 3000)
+            return
+        # 인제스트 실패 — 결과별 작업으로 다시 (하드웨어/필터 문제를 따로 건너뛴다)
+        self._start_product_jobs(source_path, frames_dir, proxy, waveform)
+
+    def _start_product_jobs(self, source_path: str, frames_dir: Path | None, proxy: bool, waveform: bool) -> None:
+        """인제스트 대신 결과마다 따로 만드는 예전 경로."""
+        path = Path(source_path)
+        if waveform and self.ctx.project.video_path and str(self.ctx.project.video_path) == source_path:
+            self.start_waveform_generation(path)
+        if frames_dir is not None:
+            self.start_frame_cache_generation()
+        if proxy:
+            self.start_proxy_generation(path)
+
     # ---- 프레임 캐시 ----
 
     def start_frame_cache_generation(self) -> None:
@@ -459,7 +616,11 @@ class MediaController(QObject):
         if ctx.frame_cache_service is None:
             ctx.frame_cache_service = FrameCacheService()
         ctx.frame_cache_service.initialize()
-        uncached = [sp for sp in source_paths if not ctx.frame_cache_service.is_cached(sp)]
+        # 인제스트가 만들고 있는 소스는 건너뛴다
+        uncached = [
+            sp for sp in source_paths
+            if not ctx.frame_cache_service.is_cached(sp) and self._ingest_requests.get(sp, (None,))[0] is None
+        ]
         if not uncached:
             return
         from src.workers.frame_cache_worker import FrameCacheWorker
@@ -543,10 +704,9 @@ class MediaController(QObject):
         if old_start == new_start_ms:
             return
         from src.ui.commands import MoveAudioClipCommand
-        cmd = MoveAudioClipCommand(clip, old_start, new_start_ms)
+        cmd = MoveAudioClipCommand(clip, old_start, new_start_ms, track)
         ctx.undo_stack.push(cmd)
-        ctx.project_ctrl.on_document_edited()
-        ctx.refresh_all()
+        ctx.project_ctrl.on_document_edited(cmd)
 
     def on_bgm_clip_trimmed(self, track_idx: int, clip_idx: int, new_start_ms: int, new_dur_ms: int) -> None:
         ctx = self.ctx
@@ -561,10 +721,9 @@ class MediaController(QObject):
         if old_start == new_start_ms and old_dur == new_dur_ms:
             return
         from src.ui.commands import TrimAudioClipCommand
-        cmd = TrimAudioClipCommand(clip, old_start, old_dur, new_start_ms, new_dur_ms)
+        cmd = TrimAudioClipCommand(clip, old_start, old_dur, new_start_ms, new_dur_ms, track)
         ctx.undo_stack.push(cmd)
-        ctx.project_ctrl.on_document_edited()
-        ctx.refresh_all()
+        ctx.project_ctrl.on_document_edited(cmd)
 
     def on_bgm_clip_delete_requested(self, track_idx: int, clip_idx: int) -> None:
         ctx = self.ctx
@@ -576,24 +735,12 @@ class MediaController(QObject):
         from src.ui.commands import DeleteAudioClipCommand
         cmd = DeleteAudioClipCommand(ctx.project, track_idx, clip_idx)
         ctx.undo_stack.push(cmd)
-        ctx.project_ctrl.on_document_edited()
-        ctx.refresh_all()
+        ctx.project_ctrl.on_document_edited(cmd)
         ctx.status_bar().showMessage(tr("BGM clip deleted"))
 
     def _get_audio_duration_ms(self, path: Path) -> int:
         try:
-            ffmpeg_bin = find_ffmpeg()
-            if not ffmpeg_bin:
-                return 0
-            ffprobe_bin = str(Path(ffmpeg_bin).parent / "ffprobe")
-            if sys.platform == "win32" and not ffprobe_bin.endswith(".exe"):
-                ffprobe_bin += ".exe"
-            cmd = [
-                ffprobe_bin, "-v", "error", "-show_entries", "format=duration",
-                "-of", "default=noprint_wrappers=1:nokey=1", str(path)
-            ]
-            out = subprocess.check_output(cmd, stderr=subprocess.STDOUT).decode().strip()
-            return int(float(out) * 1000)
+            return probe_media(path).duration_ms
         except Exception as e:
             print(f"Error getting audio duration: {e}")
             return 0
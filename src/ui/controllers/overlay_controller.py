@@ -50,6 +50,7 @@ class OverlayController:
             ov = io_track[index]
             ov.start_ms = new_start
             ov.end_ms = new_end
+            io_track.mark_modified()
             ctx.ensure_timeline_duration()
             ctx.timeline.update()
             ctx.autosave.notify_edit()
@@ -174,7 +175,7 @@ class OverlayController:
         if 0 <= index < len(text_track.overlays):
             ov = text_track.overlays[index]
             from src.ui.commands import MoveTextOverlayCommand
-            cmd = MoveTextOverlayCommand(ov, ov.start_ms, ov.end_ms, new_start, new_end)
+            cmd = MoveTextOverlayCommand(ov, ov.start_ms, ov.end_ms, new_start, new_end, text_track)
             ctx.undo_stack.push(cmd)
             ctx.ensure_timeline_duration()
             ctx.timeline.update()
@@ -215,7 +216,7 @@ class OverlayController:
         ctx.undo_stack.push(cmd)
         ctx.timeline.update()
         ctx.video_widget.update()
-        ctx.autosave.notify_edit()
+        ctx.autosave.notify_edit(cmd)
         ctx.status_bar().showMessage(f"Text overlay {index + 1} updated")
 
     def on_text_overlay_delete_requested(self, index: int) -> None:
@@ -228,7 +229,7 @@ class OverlayController:
         ctx.undo_stack.push(cmd)
         ctx.timeline.update()
         ctx.video_widget.update()
-        ctx.autosave.notify_edit()
+        ctx.autosave.notify_edit(cmd)
         ctx.status_bar().showMessage(f"Text overlay {index + 1} deleted")
 
     def on_text_overlay_position_changed(self, index: int, x_pct: float, y_pct: float) -> None:
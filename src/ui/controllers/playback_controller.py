@@ -9,6 +9,8 @@ from PySide6.QtCore import QUrl, Slot
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import QApplication
 
+from src.utils.playback_cursor import PlaybackCursor
+
 if TYPE_CHECKING:
     from src.ui.controllers.app_context import AppContext
 
@@ -18,6 +20,8 @@ class PlaybackController:
 
     def __init__(self, ctx: AppContext) -> None:
         self.ctx = ctx
+        # TTS 구간 재생 커서: ((audio_path, start, duration), PlaybackCursor)
+        self._tts_cursor: tuple[tuple, PlaybackCursor] | None = None
 
     # ---- 재생 토글 ----
 
@@ -81,8 +85,19 @@ class PlaybackController:
 
     # ---- TTS 동기화 ----
 
-    def sync_tts_playback(self) -> None:
-        """Synchronize TTS audio playback with video position."""
+    def _tts_playback_cursor(self, track) -> PlaybackCursor:
+        key = (track.audio_path, track.audio_start_ms, track.audio_duration_ms)
+        if self._tts_cursor is None or self._tts_cursor[0] != key:
+            start = track.audio_start_ms
+            self._tts_cursor = (key, PlaybackCursor([start], [start + track.audio_duration_ms]))
+        return self._tts_cursor[1]
+
+    def sync_tts_playback(self, tick: bool = False) -> None:
+        """Synchronize TTS audio playback with video position.
+
+        tick=True는 재생 중 위치 콜백 — 커서를 앞으로만 진행시키고 TTS 구간에
+        들어설 때만 위치를 맞춘다. 그 외(시크·재생 토글)는 항상 위치를 다시 맞춘다.
+        """
         try:
             ctx = self.ctx
             track = ctx.project.subtitle_track
@@ -101,16 +116,21 @@ class PlaybackController:
             else:
                 current_pos_ms = ctx.player.position()
 
-            audio_start_ms = track.audio_start_ms
-            audio_end_ms = audio_start_ms + track.audio_duration_ms
-
-            if audio_start_ms <= current_pos_ms < audio_end_ms:
-                tts_pos_ms = current_pos_ms - audio_start_ms
-                current_source = ctx.tts_player.source()
-                new_source = QUrl.fromLocalFile(str(audio_path))
-                if not current_source.isValid() or current_source != new_source:
-                    ctx.tts_player.setSource(new_source)
-                ctx.tts_player.setPosition(tts_pos_ms)
+            cursor = self._tts_playback_cursor(track)
+            if tick:
+                entered, _ = cursor.advance(current_pos_ms)
+            else:
+                cursor.seek(current_pos_ms)
+                entered = list(cursor.active)
+
+            if cursor.active:
+                if entered:
+                    tts_pos_ms = current_pos_ms - track.audio_start_ms
+                    current_source = ctx.tts_player.source()
+                    new_source = QUrl.fromLocalFile(str(audio_path))
+                    if not current_source.isValid() or current_source != new_source:
+                        ctx.tts_player.setSource(new_source)
+                    ctx.tts_player.setPosition(tts_pos_ms)
                 if video_is_playing:
                     if ctx.tts_player.playbackState() != QMediaPlayer.PlaybackState.PlayingState:
                         ctx.tts_player.play()
@@ -182,7 +202,7 @@ class PlaybackController:
                     local_offset = position_ms - clip_track.clip_timeline_start(idx)
                     source_ms = clip.source_in_ms + local_offset
                     target_source_raw = clip.source_path or str(ctx.project.video_path)
-                    target_source = ctx.media_ctrl.resolve_playback_path(target_source_raw)
+                    target_source = ctx.media_ctrl.resolve_playback_path(target_source_raw, source_ms)
 
                     if target_source != ctx.current_playback_source:
                         ctx.media_ctrl.switch_player_source(
@@ -229,7 +249,7 @@ class PlaybackController:
                 local_offset = position_ms - clip_track.clip_timeline_start(idx)
                 source_ms = clip.source_in_ms + local_offset
                 target_source_raw = clip.source_path or str(ctx.project.video_path)
-                target_source = ctx.media_ctrl.resolve_playback_path(target_source_raw)
+                target_source = ctx.media_ctrl.resolve_playback_path(target_source_raw, source_ms)
                 if target_source != ctx.current_playback_source:
                     ctx.media_ctrl.switch_player_source(
                         target_source, source_ms, auto_play=ctx.play_intent
@@ -289,24 +309,24 @@ class PlaybackController:
             ctx.timeline.set_playhead(timeline_ms)
             ctx.controls.set_output_position(timeline_ms)
             ctx.video_widget._update_subtitle(timeline_ms)
-            self.sync_tts_playback()
+            self.sync_tts_playback(tick=True)
             self.update_playback_volume()
         elif position_ms < current_clip.source_in_ms - 100:
-            # 현재 클립 범위보다 훨씬 앞 → stale index, 올바른 클립 검색
-            for ci, c in enumerate(clips):
-                if (c.source_path or str(ctx.project.video_path)) == ctx.current_playback_source:
-                    if c.source_in_ms - 100 <= position_ms <= c.source_out_ms + 100:
-                        ctx.current_clip_index = ci
-                        self._apply_clip_speed(c.speed)
-                        cs = vt.clip_timeline_start(ci)
-                        lo = (position_ms - c.source_in_ms) / c.speed
-                        tms = int(cs + lo)
-                        ctx.timeline.set_playhead(tms)
-                        ctx.controls.set_output_position(tms)
-                        ctx.video_widget._update_subtitle(tms)
-                        self.sync_tts_playback()
-                        self.update_playback_volume()
-                        return
+            # 현재 클립 범위보다 훨씬 앞 → stale index, 올바른 클립 검색 (소스별 인덱스)
+            ci = self._clip_at_playback_source(vt, position_ms)
+            if ci is not None:
+                c = clips[ci]
+                ctx.current_clip_index = ci
+                self._apply_clip_speed(c.speed)
+                cs = vt.clip_timeline_start(ci)
+                lo = (position_ms - c.source_in_ms) / c.speed
+                tms = int(cs + lo)
+                ctx.timeline.set_playhead(tms)
+                ctx.controls.set_output_position(tms)
+                ctx.video_widget._update_subtitle(tms)
+                self.sync_tts_playback(tick=True)
+                self.update_playback_volume()
+                return
 
         if position_ms >= current_clip.source_out_ms - 30:
             # 현재 클립의 타임라인 끝을 계산하여 playhead를 다음 클립 시작점으로 이동
@@ -334,6 +354,19 @@ class PlaybackController:
                 if ctx.play_intent:
                     ctx.player.play()
 
+    def _clip_at_playback_source(self, vt, source_ms: int) -> int | None:
+        """현재 재생 소스에서 source_ms(±100ms)를 담은 첫 클립 인덱스.
+
+        source_path가 None인 클립은 프로젝트 주 영상으로 간주한다.
+        """
+        ctx = self.ctx
+        current = ctx.current_playback_source
+        found = [vt.clip_index_at_source(source_ms, current, tolerance_ms=100)]
+        if current == str(ctx.project.video_path):
+            found.append(vt.clip_index_at_source(source_ms, None, tolerance_ms=100))
+        found = [i for i in found if i is not None]
+        return min(found) if found else None
+
     def on_tts_position_changed(self, position_ms: int) -> None:
         """Handle TTS player position change."""
         ctx = self.ctx
@@ -2,25 +2,48 @@
 
 from __future__ import annotations
 
+import time
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QUrl
+from PySide6.QtCore import QObject, QThread, QTimer, QUrl, Signal
 from PySide6.QtGui import QAction
 from PySide6.QtWidgets import QFileDialog, QMessageBox
 
 from src.utils.config import APP_NAME, find_ffmpeg
 from src.utils.i18n import tr
+from src.workers.project_load_worker import ProjectLoadWorker
 
 if TYPE_CHECKING:
     from src.ui.controllers.app_context import AppContext
 
 
+class _ProjectLoadRelay(QObject):
+    """ProjectLoadWorker 신호를 메인 스레드로 넘긴다 (ProjectController는 QObject가 아니다)."""
+
+    progress = Signal(int, str)
+    section_ready = Signal(str, object)
+    relinked = Signal(object)
+    finished = Signal(float)
+    error = Signal(str)
+
+
+_JSON_FILTER = "FastMovieMaker Project (*.fmm.json)"
+_BINARY_FILTER = "FastMovieMaker Binary Project (*.fmm)"
+
+
 class ProjectController:
     """프로젝트 저장/로드/복구/내보내기 Controller."""
 
     def __init__(self, ctx: AppContext) -> None:
         self.ctx = ctx
+        self._load_job: tuple[QThread, ProjectLoadWorker, _ProjectLoadRelay] | None = None
+        self._load_jobs: list[tuple[QThread, ProjectLoadWorker, _ProjectLoadRelay]] = []
+        self._previous_project = None  # 로딩 실패 시 되돌릴 로딩 전 프로젝트
+        self._load_started = 0.0
+        self._first_section_ms = 0.0
+        self._relinked_count = 0
 
     # ---- 저장 / 로드 ----
 
@@ -29,15 +52,16 @@ class ProjectController:
         if not ctx.project.has_video:
             QMessageBox.warning(ctx.window, tr("No Video"), tr("Please open a video file first."))
             return
-        path, _ = QFileDialog.getSaveFileName(
-            ctx.window, tr("Save Project"), "", "FastMovieMaker Project (*.fmm *.fmm.json);;All Files (*)"
+        # JSON이 기본 — 바이너리 컨테이너는 필터로 골랐을 때만 쓴다
+        path, selected = QFileDialog.getSaveFileName(
+            ctx.window, tr("Save Project"), "", f"{_JSON_FILTER};;{_BINARY_FILTER};;All Files (*)", _JSON_FILTER
         )
         if not path:
             return
         try:
             from src.services.project_io import save_project
             path = Path(path)
-            save_project(ctx.project, path)
+            save_project(ctx.project, path, binary=selected == _BINARY_FILTER)
             ctx.current_project_path = path
             ctx.autosave.set_active_file(path)
             self.update_recent_menu()
@@ -53,42 +77,180 @@ class ProjectController:
             )
             if not path:
                 return
-        try:
-            from src.services.project_io import load_project
-            path = Path(path)
-            project = load_project(path)
-            ctx.project = project
-            ctx.current_project_path = path
-            ctx.autosave.set_project(project)
-            ctx.autosave.set_active_file(path)
-            ctx.undo_stack.clear()
-            ctx.timeline.set_project(project)
-
-            # Waveform service 설정
-            from src.services.timeline_waveform_service import TimelineWaveformService
-            waveform_svc = getattr(ctx.window, "_waveform_service", None)
-            if waveform_svc:
-                ctx.timeline.set_waveform_service(waveform_svc)
-
-            track_headers = getattr(ctx.window, "_track_headers", None)
-            if track_headers:
-                track_headers.set_project(project)
-
-            ctx.refresh_all()
-
-            if project.video_path and project.video_path.is_file():
-                ctx.current_playback_source = str(project.video_path)
-                ctx.current_clip_index = 0
-                ctx.player.setSource(QUrl.fromLocalFile(str(project.video_path)))
-                ctx.player.play()
-                ctx.window.setWindowTitle(f"{project.video_path.name} – {APP_NAME}")
-
-            ctx.timeline.refresh()
-            ctx.media_ctrl.start_frame_cache_generation()
-            self.update_recent_menu()
-            ctx.status_bar().showMessage(f"{tr('Project loaded')}: {path}")
-        except Exception as e:
-            QMessageBox.critical(ctx.window, tr("Load Error"), str(e))
+        self._start_project_load(Path(path))
+
+    def _start_project_load(self, path: Path) -> None:
+        """비동기 프로젝트 로딩 — 섹션이 도착하는 대로 화면에 붙인다.
+
+        워커 신호는 메인 스레드의 relay(QObject)를 거쳐 큐로 전달된다. 새 로딩이 시작되면
+        이전 relay는 버려지므로 늦게 도착한 섹션은 무시된다.
+        """
+        if self._load_job is None:
+            # 취소된 로딩이 붙인 부분 프로젝트가 아니라 그 전의 프로젝트를 기억한다
+            self._previous_project = self.ctx.project
+        self._cancel_project_load()
+        # 섹션이 붙는 동안 편집한 내용은 다음 섹션·로딩 완료 시 사라진다 — 끝날 때까지 잠근다
+        self._set_panels_read_only(True)
+        thread = QThread()
+        worker = ProjectLoadWorker(path)
+        worker.moveToThread(thread)
+        relay = _ProjectLoadRelay()
+        worker.progress.connect(relay.progress)
+        worker.section_ready.connect(relay.section_ready)
+        worker.relinked.connect(relay.relinked)
+        worker.finished.connect(relay.finished)
+        worker.error.connect(relay.error)
+        relay.progress.connect(partial(self._on_load_progress, relay, path))
+        relay.section_ready.connect(partial(self._on_project_section, relay))
+        relay.relinked.connect(partial(self._on_media_relinked, relay))
+        relay.finished.connect(partial(self._on_project_loaded, relay, path))
+        relay.error.connect(partial(self._on_project_load_error, relay))
+
+        thread.started.connect(worker.run)
+        self._load_job = (thread, worker, relay)
+        # 취소된 로딩도 스레드가 끝날 때까지 참조를 유지한다 (실행 중 QThread 파괴 방지)
+        self._load_jobs = [job for job in self._load_jobs if not job[0].isFinished()]
+        self._load_jobs.append(self._load_job)
+        self._load_started = time.perf_counter()
+        self._first_section_ms = 0.0
+        self._relinked_count = 0
+        thread.start()
+
+    def _cancel_project_load(self) -> None:
+        if self._load_job is None:
+            return
+        thread, worker, _ = self._load_job
+        self._load_job = None
+        worker.cancel()
+        thread.quit()
+
+    def cleanup(self) -> None:
+        """앱 종료 시 — 진행 중이거나 취소됐지만 아직 도는 로딩 스레드를 모두 멈추고 기다린다."""
+        self._load_job = None
+        for thread, worker, _ in self._load_jobs:
+            worker.cancel()
+            thread.quit()
+        for thread, _, _ in self._load_jobs:
+            thread.wait(5000)
+        self._load_jobs = []
+
+    def _set_panels_read_only(self, read_only: bool) -> None:
+        ctx = self.ctx
+        if ctx.subtitle_panel is not None:
+            ctx.subtitle_panel.set_read_only(read_only)
+        if ctx.templates_panel is not None:
+            ctx.templates_panel.setEnabled(not read_only)
+
+    def _is_current_load(self, relay) -> bool:
+        return self._load_job is not None and self._load_job[2] is relay
+
+    def _on_load_progress(self, relay, path: Path, percent: int, _section: str) -> None:
+        if self._is_current_load(relay):
+            self.ctx.status_bar().showMessage(f"{tr('Loading project')}: {path.name} ({percent}%)")
+
+    def _on_project_section(self, relay, name: str, payload: object) -> None:
+        if not self._is_current_load(relay):
+            return
+        ctx = self.ctx
+        if name == "video":
+            self._show_loaded_video(payload)
+            # 첫 섹션을 붙인 시점 = 플레이어·타임라인을 쓸 수 있게 된 시점
+            self._first_section_ms = (time.perf_counter() - self._load_started) * 1000
+            return
+        from src.services.project_io import apply_project_section
+        apply_project_section(ctx.project, name, payload)
+        if name == "subtitles":
+            ctx.video_widget.set_default_style(ctx.project.default_style)
+            ctx.refresh_track_selector()
+        ctx.refresh_all()
+        ctx.timeline.refresh()
+
+    def _on_media_relinked(self, relay, mapping: dict) -> None:
+        # 경로는 워커가 이미 바꿨다 — 완료 메시지에 표시할 개수만 기록
+        if self._is_current_load(relay):
+            self._relinked_count = len(mapping)
+
+    def _show_loaded_video(self, project) -> None:
+        """첫 섹션: 비디오 트랙만 든 프로젝트로 플레이어와 타임라인을 띄운다."""
+        ctx = self.ctx
+        # 자막·오버레이가 붙기 전의 프로젝트는 자동 저장하지 않는다 (로딩이 끝나면 연결)
+        ctx.autosave.set_project(None)
+        if self._attach_project(project):
+            ctx.player.play()
+
+    def _attach_project(self, project) -> bool:
+        """프로젝트를 플레이어·타임라인·패널에 붙인다. 비디오 소스를 걸었으면 True."""
+        ctx = self.ctx
+        ctx.project = project
+        ctx.undo_stack.clear()
+        ctx.timeline.set_project(project)
+
+        track_headers = getattr(ctx.window, "_track_headers", None)
+        if track_headers:
+            track_headers.set_project(project)
+
+        ctx.refresh_all()
+
+        has_video = bool(project.video_path and project.video_path.is_file())
+        if has_video:
+            ctx.current_playback_source = str(project.video_path)
+            ctx.current_clip_index = 0
+            ctx.player.setSource(QUrl.fromLocalFile(str(project.video_path)))
+            ctx.window.setWindowTitle(f"{project.video_path.name} – {APP_NAME}")
+
+        ctx.timeline.refresh()
+        return has_video
+
+    def _finish_load_job(self) -> None:
+        # 워커는 마지막 신호를 보낸 직후 끝난다 — 스레드를 바로 정리
+        thread = self._load_job[0]
+        self._load_job = None
+        thread.quit()
+        thread.wait()
+        self._set_panels_read_only(False)
+
+    def _on_project_loaded(self, relay, path: Path, _load_ms: float) -> None:
+        if not self._is_current_load(relay):
+            return
+        self._finish_load_job()
+        self._previous_project = None
+        ctx = self.ctx
+        ctx.current_project_path = path
+        ctx.autosave.set_project(ctx.project)
+        ctx.autosave.set_active_file(path)
+        # 로딩 중 자리표시 트랙을 가리키던 명령이 남지 않게 한다
+        ctx.undo_stack.clear()
+        self.update_recent_menu()
+        total_ms = (time.perf_counter() - self._load_started) * 1000
+        message = f"{tr('Project loaded')}: {path} ({self._first_section_ms:.0f} / {total_ms:.0f} ms)"
+        if self._relinked_count:
+            message += f" — {tr('Relinked moved media')}: {self._relinked_count}"
+        ctx.status_bar().showMessage(message)
+        # 파생 작업(웨이브폼, 프레임 캐시)은 첫 페인트 뒤로 미룬다
+        QTimer.singleShot(0, self._start_derived_work)
+
+    def _on_project_load_error(self, relay, error: str) -> None:
+        if not self._is_current_load(relay):
+            return
+        self._finish_load_job()
+        ctx = self.ctx
+        previous, self._previous_project = self._previous_project, None
+        if previous is not None and ctx.project is not previous:
+            # 비디오 섹션이 이미 붙었다 — 부분 프로젝트 대신 로딩 전 프로젝트로 되돌린다
+            ctx.video_widget.set_default_style(previous.default_style)
+            self._attach_project(previous)
+            ctx.refresh_track_selector()
+        if previous is not None:
+            ctx.autosave.set_project(ctx.project)
+        ctx.status_bar().clearMessage()
+        QMessageBox.critical(ctx.window, tr("Load Error"), error)
+
+    def _start_derived_work(self) -> None:
+        ctx = self.ctx
+        waveform_svc = getattr(ctx.window, "_waveform_service", None)
+        if waveform_svc:
+            ctx.timeline.set_waveform_service(waveform_svc)
+        ctx.media_ctrl.start_frame_cache_generation()
 
     # ---- 내보내기 ----
 
@@ -114,6 +276,7 @@ class ProjectController:
             video_has_audio=ctx.project.video_has_audio, overlay_path=overlay_path,
             overlay_template=overlay_template,
             image_overlays=img_overlays, video_tracks=video_tracks, text_overlays=text_overlays,
+            waveform=ctx.timeline.waveform(),
         )
         dialog.exec()
 
@@ -155,6 +318,7 @@ class ProjectController:
                 recovery_file = dialog.get_selected_file()
                 recovered_project = ctx.autosave.load_recovery(recovery_file)
                 ctx.project = recovered_project
+                ctx.autosave.set_project(recovered_project)
                 if recovered_project.video_path and recovered_project.video_path.is_file():
                     ctx.player.setSource(QUrl.fromLocalFile(str(recovered_project.video_path)))
                     ctx.window.setWindowTitle(f"{recovered_project.video_path.name} – {APP_NAME} (Recovered)")
@@ -216,7 +380,12 @@ class ProjectController:
     # ---- 오토세이브 / 편집 ----
 
     def on_autosave_completed(self, path: Path) -> None:
-        self.ctx.status_bar().showMessage(f"{tr('Autosaved')}: {path.name}", 2000)
+        ms = self.ctx.autosave.last_save_latency_ms
+        self.ctx.status_bar().showMessage(f"{tr('Autosaved')}: {path.name} ({ms:.0f} ms)", 2000)
+
+    def on_autosave_failed(self, error: str) -> None:
+        self.ctx.status_bar().showMessage(f"{tr('Autosave failed')}: {error}", 5000)
 
-    def on_document_edited(self) -> None:
-        self.ctx.autosave.notify_edit()
+    def on_document_edited(self, command=None) -> None:
+        """*command*: the command just pushed, if that is all that changed."""
+        self.ctx.autosave.notify_edit(command)
@@ -5,6 +5,7 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING
 
+import numpy as np
 from PySide6.QtCore import QUrl
 from PySide6.QtMultimedia import QMediaPlayer
 from PySide6.QtWidgets import (
@@ -33,6 +34,7 @@ from src.ui.commands import (
     WrapSubtitlesCommand,
 )
 from src.utils.config import find_ffmpeg
+from src.utils.subtitle_columns import SubtitleColumns
 from src.utils.i18n import tr
 
 if TYPE_CHECKING:
@@ -217,7 +219,7 @@ class SubtitleController:
         dialog = StyleDialog(current_style, parent=ctx.window, title=f"{tr('Style')} - {tr('Segment')} {index + 1}")
         if dialog.exec():
             old_style = seg.style
-            new_style = dialog.result_style()
+            new_style = ctx.project.style_registry.intern(dialog.result_style())
             cmd = EditStyleCommand(ctx.project.subtitle_track, index, old_style, new_style)
             ctx.undo_stack.push(cmd)
             ctx.video_widget.set_default_style(ctx.project.default_style)
@@ -281,7 +283,7 @@ class SubtitleController:
             old_anim = seg.animation.copy() if seg.animation else None
             cmd = EditAnimationCommand(ctx.project.subtitle_track, index, old_anim, new_anim)
             ctx.undo_stack.push(cmd)
-            ctx.project_ctrl.on_document_edited()
+            ctx.project_ctrl.on_document_edited(cmd)
 
     def on_bulk_edit_animation(self, indices: list[int]) -> None:
         """다중 자막 세그먼트 일괄 애니메이션 편집."""
@@ -302,7 +304,7 @@ class SubtitleController:
                 old_anim = seg.animation.copy() if seg.animation else None
                 ctx.undo_stack.push(EditAnimationCommand(track, idx, old_anim, new_anim.copy() if new_anim else None))
         ctx.undo_stack.endMacro()
-        ctx.project_ctrl.on_document_edited()
+        ctx.project_ctrl.on_document_edited(ctx.undo_stack.command(ctx.undo_stack.index() - 1))
         ctx.subtitle_panel.refresh()
         ctx.status_bar().showMessage(
             tr("Animation applied to %d segment(s)") % len(indices), 3000
@@ -815,8 +817,9 @@ class SubtitleController:
         if not changes:
             ctx.status_bar().showMessage(tr("No subtitles need wrapping"))
             return
-        ctx.undo_stack.push(WrapSubtitlesCommand(track, changes))
-        ctx.project_ctrl.on_document_edited()
+        cmd = WrapSubtitlesCommand(track, changes)
+        ctx.undo_stack.push(cmd)
+        ctx.project_ctrl.on_document_edited(cmd)
         ctx.subtitle_panel.refresh()
         ctx.status_bar().showMessage(f"{tr('Subtitles wrapped')}: {len(changes)} {tr('segments')}")
 
@@ -829,21 +832,19 @@ class SubtitleController:
             ctx.status_bar().showMessage(tr("No overlapping subtitles found"))
             return
 
-        old_times = [(s.start_ms, s.end_ms) for s in track.segments]
-        new_times = list(old_times)
-        for i in range(1, len(new_times)):
-            prev_end = new_times[i - 1][1]
-            s, e = new_times[i]
-            if s < prev_end + gap_ms:
-                shift = prev_end + gap_ms - s
-                new_times[i] = (s + shift, e + shift)
+        # 연쇄 이동을 열 단위 벡터 연산으로 계산 (SubtitleColumns.close_gaps)
+        cols = SubtitleColumns(track.segments)
+        old_times = np.column_stack((cols.start_ms, cols.end_ms))
+        cols.close_gaps(gap_ms)
+        new_times = np.column_stack((cols.start_ms, cols.end_ms))
 
-        if old_times == new_times:
+        if np.array_equal(old_times, new_times):
             ctx.status_bar().showMessage(tr("No overlapping subtitles found"))
             return
 
-        ctx.undo_stack.push(AutoAlignSubtitlesCommand(track, old_times, new_times))
-        ctx.project_ctrl.on_document_edited()
+        cmd = AutoAlignSubtitlesCommand(track, old_times, new_times)
+        ctx.undo_stack.push(cmd)
+        ctx.project_ctrl.on_document_edited(cmd)
         ctx.subtitle_panel.refresh()
         ctx.timeline.update()
         ctx.status_bar().showMessage(tr("Auto-aligned subtitles"))
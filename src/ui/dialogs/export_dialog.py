@@ -29,10 +29,14 @@ from PySide6.QtWidgets import (
 from src.models.export_preset import DEFAULT_PRESETS, ExportPreset
 from src.models.subtitle import SubtitleTrack
 from src.services.export_preset_manager import ExportPresetManager
+from src.services.waveform_service import loudness_gain_db
 from src.utils.i18n import tr
 from src.workers.export_worker import ExportWorker
 from src.utils.hw_accel import get_hw_info
 
+# 원본 오디오 라우드니스 정규화 목표 (스트리밍 플랫폼 기준)
+_TARGET_LUFS = -14.0
+
 
 class _ThumbSignals(QObject):
     """QRunnable은 시그널 미지원 → 별도 QObject로 분리."""
@@ -79,6 +83,7 @@ class ExportDialog(QDialog):
         image_overlays: list | None = None,
         video_tracks: list | None = None,
         text_overlays: list | None = None,
+        waveform=None,
     ):
         super().__init__(parent)
         self.setWindowTitle(tr("Export Video"))
@@ -93,6 +98,7 @@ class ExportDialog(QDialog):
         self._image_overlays = image_overlays
         self._video_tracks = video_tracks
         self._text_overlays = text_overlays
+        self._waveform = waveform  # 원본 오디오 WaveformData — 통합 라우드니스를 이미 들고 있다
         self._thread: QThread | None = None
         self._worker: ExportWorker | None = None
         self._temp_audio_path: Path | None = None
@@ -185,6 +191,15 @@ class ExportDialog(QDialog):
         self._seg_vol_checkbox.setEnabled(self._has_tts)
         options_layout.addWidget(self._seg_vol_checkbox)
 
+        # Loudness normalization (웨이브폼 추출 때 잰 값 — 별도 분석 패스 없음)
+        measured = self._waveform.integrated_lufs if self._waveform is not None else None
+        self._loudness_checkbox = QCheckBox(tr("Normalize loudness (-14 LUFS)"))
+        self._loudness_checkbox.setChecked(False)
+        self._loudness_checkbox.setEnabled(self._video_has_audio and measured is not None)
+        if measured is not None:
+            self._loudness_checkbox.setToolTip(f"{measured:.1f} LUFS")
+        options_layout.addWidget(self._loudness_checkbox)
+
         layout.addWidget(self._options_group)
 
         # --- BGM Ducking group ---
@@ -481,6 +496,11 @@ class ExportDialog(QDialog):
         if not checked:
             self._ducking_checkbox.setChecked(False)
 
+    def _loudness_gain_db(self) -> float:
+        if not self._loudness_checkbox.isChecked():
+            return 0.0
+        return loudness_gain_db(self._waveform, _TARGET_LUFS)
+
     def _on_ducking_toggled(self, checked: bool) -> None:
         self._duck_slider.setEnabled(checked)
 
@@ -561,6 +581,7 @@ class ExportDialog(QDialog):
             video_volume=self._bg_slider.value() / 100.0,
             audio_volume=self._tts_slider.value() / 100.0,
             audio_bitrate=self._audio_bitrate_combo.currentText(),
+            loudness_gain_db=self._loudness_gain_db(),
         )
         self._worker.moveToThread(self._thread)
 
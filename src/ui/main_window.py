@@ -57,6 +57,11 @@ class MainWindow(QMainWindow):
         self._autosave = AutoSaveManager(self)
         self._autosave.set_project(self._project)
         self._undo_stack = QUndoStack(self)
+        from src.services.settings_manager import SettingsManager
+        from src.ui.undo_history import UndoHistoryBudget
+        self._undo_budget = UndoHistoryBudget(
+            self._undo_stack, SettingsManager().get_undo_memory_limit_mb() * 1024 * 1024,
+        )
 
         # ---- Media players ----
         self._audio_output = QAudioOutput()
@@ -135,7 +140,8 @@ class MainWindow(QMainWindow):
         self._pending_seek_timer.timeout.connect(self._playback.on_pending_seek_timeout)
         self._render_pause_timer.timeout.connect(self._playback.on_render_pause)
         self._autosave.save_completed.connect(self._project_ctrl.on_autosave_completed)
-        self._undo_stack.indexChanged.connect(lambda _: self._project_ctrl.on_document_edited())
+        self._autosave.save_failed.connect(self._project_ctrl.on_autosave_failed)
+        self._autosave.attach_undo_stack(self._undo_stack)
 
         # ---- Recovery check (UI 필요) ----
         self._project_ctrl.check_recovery()
@@ -157,6 +163,8 @@ class MainWindow(QMainWindow):
             
         # Check proxies for media library items
         self._media_panel.check_proxies()
+        # 지난 실행에서 중단된 프록시 작업 — 창이 뜬 뒤에 이어서 만든다
+        QTimer.singleShot(0, self._media.resume_proxy_jobs)
 
     # ------------------------------------------------------------------ UI
 
@@ -272,6 +280,8 @@ class MainWindow(QMainWindow):
 
         # Seek
         self._timeline.seek_requested.connect(self._playback.on_timeline_seek)
+        self._timeline.scrub_started.connect(lambda: self._media.set_scrubbing(True))
+        self._timeline.scrub_finished.connect(lambda: self._media.set_scrubbing(False))
         self._subtitle_panel.seek_requested.connect(self._playback.on_timeline_seek)
 
         # Subtitle editing → SubtitleController
@@ -351,6 +361,7 @@ class MainWindow(QMainWindow):
         self._media.proxy_started.connect(self._media_panel.on_proxy_started)
         self._media.proxy_progress.connect(self._media_panel.on_proxy_progress)
         self._media.proxy_failed.connect(self._media_panel.on_proxy_failed)
+        self._timeline.set_proxy_queue(self._media.proxy_queue)
         self._media_panel.proxy_generation_requested.connect(
             self._on_proxy_generation_requested
         )
@@ -371,13 +382,13 @@ class MainWindow(QMainWindow):
         self._templates_panel.template_applied.connect(self._on_template_applied)
         self._templates_panel.template_cleared.connect(self._on_template_cleared)
 
-        # Undo stack → refresh
-        self._undo_stack.indexChanged.connect(lambda _: self._refresh_all_widgets())
+        # Undo stack → refresh (autosave counts and journals stack changes itself)
+        self._undo_stack.indexChanged.connect(lambda _: self._refresh_all_widgets(notify=False))
 
     # ------------------------------------------------------------ Refresh
 
-    def _refresh_all_widgets(self) -> None:
-        """Push current model state to all widgets."""
+    def _refresh_all_widgets(self, notify: bool = True) -> None:
+        """Push current model state to all widgets (*notify*: report a direct edit to autosave)."""
         track = self._project.subtitle_track
         font_family = self._project.default_style.font_family
         self._video_widget.set_subtitle_track(track if len(track) > 0 else None)
@@ -402,7 +413,8 @@ class MainWindow(QMainWindow):
 
         self._timeline.set_project(self._project)
         self._track_headers.set_active_track(self._ctx.current_track_index)
-        self._autosave.notify_edit()
+        if notify:
+            self._autosave.notify_edit()
 
     def _ensure_timeline_duration(self) -> None:
         """Ensure the timeline has a non-zero duration even without a video."""
@@ -693,6 +705,7 @@ class MainWindow(QMainWindow):
         settings.setValue("window_geometry", self.saveGeometry())
         settings.setValue("window_state", self.saveState())
         self._player.stop()
+        self._project_ctrl.cleanup()
         self._media.cleanup()
         self._frame_cache.cleanup()
         thumb_svc = getattr(self._timeline, "_thumbnail_service", None)
@@ -735,7 +748,7 @@ class MainWindow(QMainWindow):
                     self._subtitle_ctrl.on_import_srt_new_track(path)
                 else:
                     self._subtitle_ctrl.on_import_srt(path)
-            elif suffix == ".fmm.json":
+            elif path.name.lower().endswith((".fmm", ".fmm.json")):
                 self._project_ctrl.on_load_project(path)
             elif suffix in self._VIDEO_EXTENSIONS:
                 self._media.load_video(path)
@@ -746,4 +759,5 @@ class MainWindow(QMainWindow):
         if not path.is_file():
             return False
         suffix = path.suffix.lower()
-        return suffix in self._VIDEO_EXTENSIONS or suffix == ".srt" or suffix == ".fmm.json"
+        return (suffix in self._VIDEO_EXTENSIONS or suffix == ".srt"
+                or path.name.lower().endswith((".fmm", ".fmm.json")))
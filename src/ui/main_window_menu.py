@@ -197,6 +197,12 @@ def build_main_window_menu(window) -> None:
     window._proxy_action.setChecked(False)
     window._proxy_action.triggered.connect(window._media.toggle_proxies)
     view_menu.addAction(window._proxy_action)
+    loudness_action = QAction(tr("Show &Loudness Overlay"), window)
+    loudness_action.setCheckable(True)
+    loudness_action.setChecked(False)
+    loudness_action.toggled.connect(window._timeline.set_loudness_overlay)
+    view_menu.addAction(loudness_action)
+    window._loudness_action = loudness_action
 
     help_menu = menubar.addMenu(tr("&Help"))
     screenshot_action = QAction(tr("Take &Screenshot"), window)
@@ -50,6 +50,7 @@ class _SubtitleTableModel(QAbstractTableModel):
         super().__init__(parent)
         self._track: SubtitleTrack | None = None
         self._search_rows: set[int] = set()
+        self.read_only = False
 
     def set_track(self, track: SubtitleTrack | None) -> None:
         self.beginResetModel()
@@ -130,7 +131,7 @@ class _SubtitleTableModel(QAbstractTableModel):
 
     def flags(self, index: QModelIndex) -> Qt.ItemFlag:
         base = Qt.ItemFlag.ItemIsEnabled | Qt.ItemFlag.ItemIsSelectable
-        if index.column() in (3, 4):
+        if index.column() in (3, 4) and not self.read_only:
             base |= Qt.ItemFlag.ItemIsEditable
         return base
 
@@ -288,6 +289,14 @@ class SubtitlePanel(QWidget):
         self._font_combo.blockSignals(False)
         self._font_combo.setVisible(track is not None)
 
+    def set_read_only(self, read_only: bool) -> None:
+        """프로젝트 로딩 중 — 목록은 보여 주되 편집(더블클릭, 컨텍스트 메뉴, 글꼴)은 막는다."""
+        self._model.read_only = read_only
+        self._font_combo.setEnabled(not read_only)
+
+    def is_read_only(self) -> bool:
+        return self._model.read_only
+
     def refresh(self, font_family: str = "Arial") -> None:
         """Notify model of external data change and re-apply search."""
         search_visible = self._search_bar.isVisible()
@@ -327,7 +336,7 @@ class SubtitlePanel(QWidget):
 
     def _on_double_clicked(self, index: QModelIndex) -> None:
         row, col = index.row(), index.column()
-        if not self._track or row < 0 or row >= len(self._track):
+        if not self._track or row < 0 or row >= len(self._track) or self._model.read_only:
             return
 
         if col in (3, 4):
@@ -431,6 +440,8 @@ class SubtitlePanel(QWidget):
     # --------------------------------------------------------------- Context Menu
 
     def _on_context_menu(self, pos) -> None:
+        if self._model.read_only:
+            return
         index = self._table.indexAt(pos)
         row = index.row() if index.isValid() else -1
         menu = QMenu(self)
@@ -8,7 +8,6 @@ Strategy 패턴: 드래그 모드별로 start/update/end 메서드 그룹화.
 
 from __future__ import annotations
 
-import bisect
 from enum import Enum, auto
 from typing import TYPE_CHECKING
 
@@ -16,11 +15,25 @@ from PySide6.QtCore import Qt
 from PySide6.QtGui import QCursor
 from PySide6.QtWidgets import QApplication
 from src.utils.i18n import tr
+from src.utils.snap_index import SnapCandidates
+from src.ui.timeline_painter import (
+    LANE_AUDIO,
+    LANE_IMAGE,
+    LANE_SUBTITLE,
+    LANE_TEXT,
+    bgm_lane,
+    video_lane,
+)
 
 if TYPE_CHECKING:
     from src.ui.timeline_widget import TimelineWidget
 
 
+def _index_of(items: list, item) -> int:
+    """동일 객체의 현재 인덱스 — 시작 순 재정렬 뒤 선택 인덱스를 맞출 때."""
+    return next(i for i, it in enumerate(items) if it is item)
+
+
 # ------------------------------------------------------------------ 상수
 
 class DragMode(Enum):
@@ -96,6 +109,12 @@ class TimelineDragManager:
         # PAN_VIEW
         self.start_visible_ms: float = 0.0
 
+        # PLAYHEAD_DRAG / SEEK — 드래그 거리를 넘어야 스크럽으로 본다 (단순 클릭은 일반 시크)
+        self.scrubbing: bool = False
+
+        # 자석 스냅 후보 스냅샷 — 드래그 동안 재사용: (제외 인자, SnapCandidates)
+        self._snap_candidates: tuple | None = None
+
     # ================================================================
     # 드래그 시작
     # ================================================================
@@ -202,16 +221,26 @@ class TimelineDragManager:
         else:
             tw.setCursor(QCursor(Qt.CursorShape.SizeHorCursor))
 
-    def start_playhead(self) -> None:
+    def start_playhead(self, x: float = 0.0) -> None:
         """플레이헤드 드래그 시작."""
         self.mode = DragMode.PLAYHEAD_DRAG
+        self.start_x = x
+        self.scrubbing = False
         self.tw.setCursor(QCursor(Qt.CursorShape.SizeHorCursor))
 
     def start_seek(self, x: float) -> None:
         """빈 공간 시크 시작."""
         self.mode = DragMode.SEEK
+        self.start_x = x
+        self.scrubbing = False
         self.tw._seek_to_x(x)
 
+    def _update_scrub(self, x: float) -> None:
+        """드래그 거리를 넘으면 scrub_started — 클릭만으로 스크럽 티어로 바꾸지 않는다."""
+        if not self.scrubbing and abs(x - self.start_x) >= QApplication.startDragDistance():
+            self.scrubbing = True
+            self.tw.scrub_started.emit()
+
     def start_pan_view(self, x: float) -> None:
         """뷰 팬 시작."""
         tw = self.tw
@@ -239,8 +268,10 @@ class TimelineDragManager:
         if m == DragMode.PAN_VIEW:
             self._handle_pan_view(x)
         elif m == DragMode.PLAYHEAD_DRAG:
+            self._update_scrub(x)
             self._handle_playhead(x)
         elif m == DragMode.SEEK:
+            self._update_scrub(x)
             self.tw._seek_to_x(x)
         elif m in (DragMode.MOVE, DragMode.RESIZE_LEFT, DragMode.RESIZE_RIGHT):
             self._handle_subtitle_drag(x)
@@ -267,6 +298,9 @@ class TimelineDragManager:
         tw = self.tw
         tw.status_message_requested.emit("", 0)  # Clear status message
         m = self.mode
+        if self.scrubbing:
+            self.scrubbing = False
+            tw.scrub_finished.emit()
 
         if m in (DragMode.MOVE, DragMode.RESIZE_LEFT, DragMode.RESIZE_RIGHT):
             if tw._track and 0 <= self.seg_index < len(tw._track):
@@ -283,15 +317,24 @@ class TimelineDragManager:
 
         elif m in (DragMode.IMAGE_MOVE, DragMode.IMAGE_RESIZE_LEFT, DragMode.IMAGE_RESIZE_RIGHT):
             if tw._image_overlay_track and 0 <= self.seg_index < len(tw._image_overlay_track):
-                ov = tw._image_overlay_track[self.seg_index]
+                track = tw._image_overlay_track
+                ov = track[self.seg_index]
                 if ov.start_ms != self.orig_start_ms or ov.end_ms != self.orig_end_ms:
                     tw.image_overlay_moved.emit(self.seg_index, ov.start_ms, ov.end_ms)
+                    # 드래그 중에는 인덱스를 지키고, 끝나면 시작 순 불변식을 되살린다
+                    track.overlays.sort(key=lambda o: o.start_ms)
+                    track.mark_modified()
+                    if tw._selected_overlay_index == self.seg_index:
+                        tw._selected_overlay_index = _index_of(track.overlays, ov)
 
         elif m in (DragMode.TEXT_MOVE, DragMode.TEXT_RESIZE_LEFT, DragMode.TEXT_RESIZE_RIGHT):
             if tw._text_overlay_track and 0 <= self.text_index < len(tw._text_overlay_track.overlays):
                 ov = tw._text_overlay_track.overlays[self.text_index]
                 if ov.start_ms != self.text_orig_start_ms or ov.end_ms != self.text_orig_end_ms:
                     tw.text_overlay_moved.emit(self.text_index, ov.start_ms, ov.end_ms)
+                    # 이동 명령이 시작 순으로 다시 정렬한다 — 선택이 같은 항목을 따라가게
+                    if tw._selected_text_overlay_index == self.text_index:
+                        tw._selected_text_overlay_index = _index_of(tw._text_overlay_track.overlays, ov)
             self.text_index = -1
 
         elif m in (DragMode.CLIP_TRIM_LEFT, DragMode.CLIP_TRIM_RIGHT, DragMode.CLIP_MOVE, DragMode.CLIP_DUPLICATE):
@@ -344,10 +387,14 @@ class TimelineDragManager:
                             tw.bgm_clip_trimmed.emit(
                                 self.bgm_track_index, self.bgm_clip_index, new_start, new_dur
                             )
+                    # 이동/트림 명령이 시작 순으로 다시 정렬한다 — 선택이 같은 클립을 따라가게
+                    if tw._selected_bgm_clip_index == self.bgm_clip_index:
+                        tw._selected_bgm_clip_index = _index_of(track.clips, clip)
 
         # 상태 초기화
         self.mode = DragMode.NONE
         self.seg_index = -1
+        self._snap_candidates = None
         tw.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
         tw.update()
 
@@ -405,56 +452,47 @@ class TimelineDragManager:
         skip_seg_index: int = -1,
         skip_clip_index: int = -1,
         skip_img_index: int = -1,
-    ) -> list[int]:
-        """자석 스냅을 위한 후보 지점(ms) 수집."""
+    ) -> SnapCandidates:
+        """자석 스냅 후보 (클립·자막·TTS 오디오·BGM·이미지 오버레이 경계 + 0/길이/플레이헤드).
+
+        위젯의 스냅 인덱스는 바뀐 레인만 갱신되며, 드래그 동안에는 첫 호출의 스냅샷을 재사용한다.
+        드래그 중인 항목 자신의 경계는 인덱스를 고치지 않고 질의 때 제외한다.
+        """
+        key = (skip_seg_index, skip_clip_index, skip_img_index, self.mode)
+        if self._snap_candidates is not None and self._snap_candidates[0] == key:
+            return self._snap_candidates[1]
+
         tw = self.tw
-        candidates: set[int] = {0}
+        exclude: list[int] = []
+        if tw._clip_track and 0 <= skip_clip_index < len(tw._clip_track.clips):
+            start = tw._clip_track.clip_timeline_start(skip_clip_index)
+            exclude += [start, start + tw._clip_track.clips[skip_clip_index].duration_ms]
+        if tw._track and 0 <= skip_seg_index < len(tw._track):
+            seg = tw._track[skip_seg_index]
+            exclude += [seg.start_ms, seg.end_ms]
+            if seg.audio_file:
+                exclude += [seg.audio_start_ms, seg.audio_start_ms + seg.audio_duration_ms]
+        if self.mode in (DragMode.BGM_MOVE, DragMode.BGM_RESIZE_LEFT, DragMode.BGM_RESIZE_RIGHT):
+            if 0 <= self.bgm_track_index < len(tw._bgm_tracks):
+                clips = tw._bgm_tracks[self.bgm_track_index].clips
+                if 0 <= self.bgm_clip_index < len(clips):
+                    clip = clips[self.bgm_clip_index]
+                    exclude += [clip.start_ms, clip.start_ms + clip.duration_ms]
+        if tw._image_overlay_track and 0 <= skip_img_index < len(tw._image_overlay_track):
+            ov = tw._image_overlay_track[skip_img_index]
+            exclude += [ov.start_ms, ov.end_ms]
+
+        extra = [0, tw._playhead_ms]
         if tw._duration_ms > 0:
-            candidates.add(tw._duration_ms)
-        candidates.add(tw._playhead_ms)
-
-        # Video Clips
-        if tw._clip_track:
-            offset = 0
-            for i, clip in enumerate(tw._clip_track.clips):
-                start = offset
-                end = offset + clip.duration_ms
-                offset += clip.duration_ms
-                if i != skip_clip_index:
-                    candidates.add(start)
-                    candidates.add(end)
-
-        # Subtitle Segments
-        if tw._track:
-            for i, seg in enumerate(tw._track):
-                if i != skip_seg_index:
-                    candidates.add(seg.start_ms)
-                    candidates.add(seg.end_ms)
-                    if seg.audio_file:
-                        candidates.add(seg.audio_start_ms)
-                        candidates.add(seg.audio_start_ms + seg.audio_duration_ms)
-
-        # BGM Clips
-        if hasattr(tw, "_bgm_tracks"):
-            for t_idx, track in enumerate(tw._bgm_tracks):
-                for i, clip in enumerate(track.clips):
-                    if not (t_idx == self.bgm_track_index and i == self.bgm_clip_index):
-                        candidates.add(clip.start_ms)
-                        candidates.add(clip.start_ms + clip.duration_ms)
-
-        # Image Overlays
-        if tw._image_overlay_track:
-            for i, ov in enumerate(tw._image_overlay_track):
-                if i != skip_img_index:
-                    candidates.add(ov.start_ms)
-                    candidates.add(ov.end_ms)
-
-        return sorted(candidates)
-
-    def apply_snap(self, ms: int, candidates: list[int]) -> int:
-        """이진 탐색(CLRS Ch.2.3)으로 가장 가까운 후보에 자석 스냅 적용.
-
-        candidates는 정렬된 상태여야 한다 (get_snap_candidates가 sorted 반환).
+            extra.append(tw._duration_ms)
+        candidates = tw._synced_snap_index().snapshot(exclude, extra)
+        if self.mode != DragMode.NONE:
+            self._snap_candidates = (key, candidates)
+        return candidates
+
+    def apply_snap(self, ms: int, candidates: SnapCandidates) -> int:
+        """가장 가까운 후보에 자석 스냅 적용 (정렬 배열 이진 탐색 + 주변 후보 벡터 비교).
+
         _ms_to_x가 선형 변환이므로 ms 공간의 최근접 = 픽셀 공간의 최근접.
         """
         tw = self.tw
@@ -465,22 +503,11 @@ class TimelineDragManager:
         if not tw._snap_enabled or tw._px_per_ms <= 0:
             tw._snap_guide_x = None
             return ms
-        if not candidates:
+        closest_ms = candidates.nearest(ms)
+        if closest_ms is None:
             tw._snap_guide_x = None
             return ms
 
-        # 이진 탐색으로 ms에 가장 가까운 후보 찾기
-        idx = bisect.bisect_left(candidates, ms)
-        closest_ms = -1
-        min_dist = float("inf")
-        # idx-1, idx 두 후보만 비교하면 충분
-        for i in (idx - 1, idx):
-            if 0 <= i < len(candidates):
-                dist = abs(candidates[i] - ms)
-                if dist < min_dist:
-                    min_dist = dist
-                    closest_ms = candidates[i]
-
         # 픽셀 거리로 threshold 확인
         threshold_px = tw._SNAP_THRESHOLD_PX
         dist_px = abs(tw._ms_to_x(closest_ms) - tw._ms_to_x(ms))
@@ -502,7 +529,6 @@ class TimelineDragManager:
         new_start = self.start_visible_ms + diff_ms
         tw._visible_start_ms = max(0.0, min(float(tw._duration_ms), new_start))
         tw._clamp_visible_start(tw._visible_range_ms())
-        tw._invalidate_static_cache()
         tw.update()
 
     def _handle_playhead(self, x: float) -> None:
@@ -602,7 +628,8 @@ class TimelineDragManager:
             seg.end_ms = new_end
             tw.segment_moved.emit(self.seg_index, seg.start_ms, new_end)
 
-        tw._invalidate_static_cache()
+        tw._track.mark_modified()
+        tw._invalidate_lane(LANE_SUBTITLE, LANE_AUDIO)
         tw.update()
 
     # ---- 오디오 드래그 ----
@@ -677,7 +704,7 @@ class TimelineDragManager:
             max_duration = tw._duration_ms - tw._track.audio_start_ms
             tw._track.audio_duration_ms = min(new_duration, max_duration)
 
-        tw._invalidate_static_cache()
+        tw._invalidate_lane(LANE_AUDIO)
         tw.update()
 
     # ---- 이미지 오버레이 드래그 ----
@@ -750,7 +777,8 @@ class TimelineDragManager:
             ov.end_ms = new_end
             tw.image_overlay_moved.emit(self.seg_index, ov.start_ms, ov.end_ms)
 
-        tw._invalidate_static_cache()
+        tw._image_overlay_track.mark_modified()
+        tw._invalidate_lane(LANE_IMAGE)
         tw.update()
 
     # ---- 텍스트 오버레이 드래그 ----
@@ -778,7 +806,8 @@ class TimelineDragManager:
             new_end = max(self.text_orig_start_ms + 100, self.text_orig_end_ms + dx_ms)
             overlay.end_ms = int(new_end)
 
-        tw._invalidate_static_cache()
+        tw._text_overlay_track.mark_modified()
+        tw._invalidate_lane(LANE_TEXT)
         tw.update()
 
     # ---- 비디오 클립 드래그 ----
@@ -860,7 +889,7 @@ class TimelineDragManager:
                 final_visual_duration = 100 / clip.speed
             clip.source_out_ms = int(clip.source_in_ms + (final_visual_duration * clip.speed))
 
-        tw._invalidate_static_cache()
+        tw._invalidate_lane(video_lane(self.clip_track_index))
         tw.update()
 
     # ---- 볼륨 포인트 드래그 ----
@@ -887,6 +916,7 @@ class TimelineDragManager:
         new_vol = max(0.0, min(2.0, new_vol))
         p.offset_ms = new_offset
         p.volume = new_vol
+        tw._invalidate_lane(video_lane(tw._selected_clip_track_index))
         tw.update()
 
     # ---- BGM 드래그 ----
@@ -917,4 +947,5 @@ class TimelineDragManager:
             new_end = self.apply_snap(new_end, candidates)
             clip.duration_ms = int(max(10, new_end - clip.start_ms))
 
+        tw._invalidate_lane(bgm_lane(self.bgm_track_index))
         tw.update()
@@ -1,4 +1,9 @@
-"""타임라인 (x,y) 히트 테스트. TimelineWidget에서 위임용."""
+"""타임라인 (x,y) 히트 테스트. TimelineWidget에서 위임용.
+
+레인별 공간 인덱스(TimelineWidget._lane_index)로 커서 ±_EDGE_PX 범위의 후보만 검사한다.
+"""
+
+from src.ui.timeline_painter import LANE_AUDIO, LANE_IMAGE, LANE_SUBTITLE, LANE_TEXT, bgm_lane, video_lane
 
 _EDGE_PX = 6
 _PLAYHEAD_HIT_PX = 20
@@ -14,6 +19,13 @@ class TimelineHitTester:
     def __init__(self, widget) -> None:
         self._w = widget
 
+    def _candidates(self, lane, x: float) -> list[int]:
+        """커서 x ± _EDGE_PX에 걸친 레인 항목 인덱스 (원래 순서)."""
+        w = self._w
+        ms = w._x_to_ms(x)
+        tol = _EDGE_PX / w._px_per_ms if w._px_per_ms > 0 else 0.0
+        return w._lane_index(lane).overlapping(ms - tol, ms + tol).tolist()
+
     def hit_test(self, x: float, y: float) -> tuple[int, str, int]:
         """(x,y)에 해당하는 (인덱스, 히트 영역, 트랙 인덱스) 반환. 없으면 (-1, '', -1)."""
         playhead_x = self._w._ms_to_x(self._w._playhead_ms)
@@ -23,12 +35,13 @@ class TimelineHitTester:
         if self._w._project:
             for v_idx, vt in enumerate(self._w._project.video_tracks):
                 track_y = self._w._video_track_y(v_idx)
-                if track_y <= y < track_y + _CLIP_H:
-                    offset = 0
-                    for i, clip in enumerate(vt.clips):
-                        x1 = self._w._ms_to_x(offset)
-                        x2 = self._w._ms_to_x(offset + clip.duration_ms)
-                        offset += clip.duration_ms
+                if track_y <= y < track_y + _CLIP_H and vt.clips:
+                    lane = video_lane(v_idx)
+                    index = self._w._lane_index(lane)
+                    for i in self._candidates(lane, x):
+                        clip = vt.clips[i]
+                        x1 = self._w._ms_to_x(index.starts[i])
+                        x2 = self._w._ms_to_x(index.ends[i])
                         if x < x1 - _EDGE_PX or x > x2 + _EDGE_PX:
                             continue
                         if abs(x - x1) <= _EDGE_PX and i > 0:
@@ -57,7 +70,9 @@ class TimelineHitTester:
         seg_y = self._w._subtitle_track_y()
         if seg_y <= y < seg_y + _SEG_H:
             if self._w._track:
-                for i, seg in enumerate(self._w._track):
+                segments = self._w._track.segments
+                for i in self._candidates(LANE_SUBTITLE, x):
+                    seg = segments[i]
                     x1 = self._w._ms_to_x(seg.start_ms)
                     x2 = self._w._ms_to_x(seg.end_ms)
                     if x < x1 - _EDGE_PX or x > x2 + _EDGE_PX:
@@ -72,7 +87,9 @@ class TimelineHitTester:
         audio_y = self._w._audio_track_y()
         if audio_y <= y < audio_y + _AUDIO_H:
             if self._w._track:
-                for i, seg in enumerate(self._w._track):
+                segments = self._w._track.segments
+                for i in self._candidates(LANE_AUDIO, x):
+                    seg = segments[i]
                     if not seg.audio_file:
                         continue
                     x1 = self._w._ms_to_x(seg.start_ms)
@@ -93,7 +110,9 @@ class TimelineHitTester:
             if img_base_y <= y <= img_base_y + total_h:
                 img_row_h = getattr(self._w, "_IMG_ROW_H", 40)
                 img_gap = getattr(self._w, "_IMG_ROW_GAP", 4)
-                for i, ov in enumerate(self._w._image_overlay_track):
+                overlays = self._w._image_overlay_track.overlays
+                for i in self._candidates(LANE_IMAGE, x):
+                    ov = overlays[i]
                     row = rows[i]
                     ov_y = img_base_y + row * (img_row_h + img_gap)
                     if not (ov_y <= y <= ov_y + img_row_h):
@@ -114,7 +133,9 @@ class TimelineHitTester:
             rows = self._w._compute_text_overlay_rows()
             text_row_h = getattr(self._w, "_TEXT_ROW_H", 28)
             text_gap = getattr(self._w, "_TEXT_ROW_GAP", 4)
-            for i, overlay in enumerate(self._w._text_overlay_track.overlays):
+            overlays = self._w._text_overlay_track.overlays
+            for i in self._candidates(LANE_TEXT, x):
+                overlay = overlays[i]
                 row = rows[i]
                 ov_y = text_base_y + row * (text_row_h + text_gap)
                 if not (ov_y <= y <= ov_y + text_row_h):
@@ -134,7 +155,8 @@ class TimelineHitTester:
             for track_idx, track in enumerate(self._w._bgm_tracks):
                 ty = self._w._bgm_track_y(track_idx)
                 if ty <= y < ty + _BGM_H:
-                    for i, clip in enumerate(track.clips):
+                    for i in self._candidates(bgm_lane(track_idx), x):
+                        clip = track.clips[i]
                         x1 = self._w._ms_to_x(clip.start_ms)
                         x2 = self._w._ms_to_x(clip.start_ms + clip.duration_ms)
                         if x < x1 - _EDGE_PX or x > x2 + _EDGE_PX:
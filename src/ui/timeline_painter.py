@@ -6,6 +6,7 @@ TimelineWidget은 이벤트 핸들링·공개 API에 집중한다.
 
 from __future__ import annotations
 
+import math
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import Qt, QPoint, QPointF, QRectF, QLineF
@@ -25,7 +26,14 @@ from PySide6.QtGui import (
 import numpy as np
 
 from src.models.video_clip import VideoClip, VideoClipTrack
-from src.services.waveform_service import WaveformData
+from src.services.waveform_service import LOUDNESS_HOP_MS, WaveformData
+from src.ui.timeline_tile_cache import (
+    TILE_W,
+    TileCache,
+    tile_origin_ms,
+    visible_tiles,
+    zoom_key,
+)
 from src.utils.time_utils import ms_to_display
 
 if TYPE_CHECKING:
@@ -39,6 +47,28 @@ _AUDIO_H = 34
 _WAVEFORM_H = 45
 _BGM_H = 34
 
+# ---- Level of detail ----
+# 타일 안 항목당 평균 폭이 이 값(px) 미만이면 개별 항목 대신 밀도 막대로 그린다
+_LOD_MIN_PX_PER_ITEM = 4.0
+# 밀도 막대에서 아주 짧은 항목도 보이도록 하는 최소 불투명도
+_LOD_MIN_ALPHA = 60
+
+# ---- 레인 ID — 레인별 캐시 버전(TimelineWidget._lane_versions)의 키 ----
+LANE_RULER = "ruler"
+LANE_WAVEFORM = "waveform"
+LANE_SUBTITLE = "subtitle"
+LANE_AUDIO = "audio"
+LANE_IMAGE = "image"
+LANE_TEXT = "text"
+
+
+def video_lane(track_index: int) -> tuple[str, int]:
+    return ("video", track_index)
+
+
+def bgm_lane(track_index: int) -> tuple[str, int]:
+    return ("bgm", track_index)
+
 
 class TimelinePainter:
     """TimelineWidget 전용 렌더러 — 모든 _draw_* 메서드를 소유."""
@@ -73,7 +103,7 @@ class TimelinePainter:
     _BGM_COLOR_BOT = QColor(60, 40, 160)
     _BGM_BORDER = QColor(130, 100, 240)
     _BGM_SELECTED_BORDER = QColor(100, 220, 255)
-    _BGM_SELECTED_COLOR = QColor(40, 20, 100)
+    _BGM_SELECTED_TINT = QColor(40, 20, 100, 110)
 
     # Color Correction Badge
     _CORRECTION_BADGE_BRUSH = QBrush(QColor(255, 210, 60, 220))
@@ -86,6 +116,10 @@ class TimelinePainter:
     _WAVEFORM_EDGE = QColor(255, 180, 80, 200)
     _WAVEFORM_CENTER = QColor(255, 220, 150)
 
+    # Loudness Overlay (short-term LUFS)
+    _LOUDNESS_LINE_COLOR = QColor(80, 230, 255, 220)
+    _LOUDNESS_FLOOR_LUFS = -60.0
+
     # Volume Envelope
     _VOLUME_LINE_COLOR = QColor(255, 255, 255, 200)
     _VOLUME_POINT_COLOR = QColor(255, 255, 255)
@@ -95,17 +129,17 @@ class TimelinePainter:
     _IMG_OVERLAY_COLOR = QColor(160, 90, 220, 180)
     _IMG_OVERLAY_BORDER = QColor(190, 120, 240)
     _IMG_OVERLAY_SELECTED_BORDER = QColor(100, 220, 255)
-    _IMG_OVERLAY_SELECTED_COLOR = QColor(0, 100, 140)
+    _IMG_OVERLAY_SELECTED_TINT = QColor(0, 100, 140, 110)
 
     # Text Overlay
     _TEXT_OVERLAY_COLOR = QColor(255, 180, 80, 180)
     _TEXT_OVERLAY_BORDER = QColor(255, 200, 120)
-    _TEXT_OVERLAY_SELECTED_COLOR = QColor(255, 140, 40)
+    _TEXT_OVERLAY_SELECTED_TINT = QColor(255, 140, 40, 110)
     _TEXT_OVERLAY_SELECTED_BORDER = QColor(255, 220, 160)
 
     # Clip Colors
     _CLIP_SELECTED_BORDER = QColor(100, 220, 255)
-    _CLIP_SELECTED_COLOR = QColor(0, 100, 140)
+    _CLIP_SELECTED_TINT = QColor(0, 100, 140, 110)  # 선택 틴트는 동적 레이어에서 반투명으로 덧그림
     _TRANSITION_MARKER_COLOR = QColor(255, 215, 0, 180)
 
     _SOURCE_COLORS = [
@@ -139,9 +173,18 @@ class TimelinePainter:
 
     def __init__(self, tw: TimelineWidget) -> None:
         self.tw = tw
-        # 웨이브폼 이미지 캐시
-        self._waveform_image_cache: QImage | None = None
-        self._waveform_cache_key: tuple | None = None
+        # 정적 레이어 타일 캐시 — 키: (레인, 줌 레벨, 타일 인덱스, 레인 높이, 레인 버전)
+        self._tiles = TileCache()
+        self._tiles_version: int = -1
+        # 레인별 콘텐츠 시그니처/마지막으로 본 버전 — 변경된 레인의 타일만 폐기
+        self._lane_sigs: dict = {}
+        self._lane_seen: dict = {}
+        self._priority_key: tuple | None = None
+        # 현재 렌더링 중인 타일의 좌표계 (왼쪽 경계 ms, 폭 px)
+        self._origin_ms: float = 0.0
+        self._view_w: int = TILE_W
+        # 소스별 화면 노출 시간(ms) — 웨이브폼 작업 우선순위
+        self._waveform_priorities: dict[str, int] = {}
 
     # ================================================================
     # 메인 페인트 엔트리
@@ -165,66 +208,50 @@ class TimelinePainter:
         visible_ms = tw._visible_range_ms()
         if visible_ms <= 0:
             visible_ms = tw._duration_ms
-        tw._px_per_ms = w / visible_ms
-
-        # 정적 레이어 캐시 키
-        seg_count = len(tw._track) if tw._track else 0
-        ovl_count = len(tw._image_overlay_track) if tw._image_overlay_track else 0
-        clip_count = (
-            tuple(len(vt.clips) for vt in tw._project.video_tracks)
-            if tw._project else ()
-        )
-        v_h = tw._clip_track.hidden if tw._clip_track else False
-        s_h = tw._track.hidden if tw._track else False
-        o_h = tw._image_overlay_track.hidden if tw._image_overlay_track else False
-
-        cache_key = (
-            w, h, tw._visible_start_ms, visible_ms,
-            tw._selected_index, tw._selected_overlay_index,
-            tw._selected_clip_index, tw._selected_clip_track_index,
-            frozenset(tw._selected_clips),
-            clip_count,
-            seg_count, ovl_count, tw._has_video,
-            id(tw._waveform_data),
-            v_h, s_h, o_h,
-        )
-
-        if tw._static_cache_key != cache_key or tw._static_cache is None:
-            pixmap = QPixmap(w, h)
-            pp = QPainter(pixmap)
-            pp.setRenderHint(QPainter.RenderHint.Antialiasing)
-            pp.fillRect(0, 0, w, h, self._BG_COLOR)
-
-            self._draw_ruler(pp, w, h, visible_ms)
-
-            if tw._project:
-                for idx, vt in enumerate(tw._project.video_tracks):
-                    if not vt.hidden:
-                        self._draw_track_clips(pp, idx, vt)
-                if not tw._project.video_tracks[0].hidden:
-                    self._draw_video_audio(pp, w, h)
-
-            if tw._track and not tw._track.hidden:
-                self._draw_audio_track(pp, h)
-                self._draw_segments(pp, h)
-
-            if tw._image_overlay_track and not tw._image_overlay_track.hidden:
-                self._draw_image_overlays(pp, h)
-
-            if tw._text_overlay_track:
-                self._draw_text_overlays(pp, h)
-
-            if hasattr(tw, "_bgm_tracks") and tw._bgm_tracks:
-                self._draw_bgm_tracks(pp, h)
-
-            pp.end()
-            tw._static_cache = pixmap
-            tw._static_cache_key = cache_key
+        # visible_ms = w / px_per_ms 이므로 재대입하면 부동소수 오차로 줌 키가 흔들린다
+        if tw._px_per_ms <= 0:
+            tw._px_per_ms = w / visible_ms
+        px_per_ms = tw._px_per_ms
 
-        # 캐시된 정적 레이어 블릿 + 동적 요소
+        if tw._static_version != self._tiles_version:
+            # 전체 무효화 — 이전 타일은 다시 쓰이지 않으므로 즉시 해제
+            self._tiles.clear()
+            self._lane_sigs.clear()
+            self._lane_seen.clear()
+            self._tiles_version = tw._static_version
+
+        lanes = self._collect_lanes(h, visible_ms)
+        lane_versions = tw._lane_versions
+        for lane_id, _y, _lh, sig, _draw in lanes:
+            # setter를 거치지 않은 변경(개수·트랙 교체 등)도 시그니처로 감지
+            if self._lane_sigs.get(lane_id) != sig:
+                if lane_id in self._lane_sigs:
+                    lane_versions[lane_id] = lane_versions.get(lane_id, 0) + 1
+                self._lane_sigs[lane_id] = sig
+            version = lane_versions.get(lane_id, 0)
+            if self._lane_seen.get(lane_id, version) != version:
+                self._tiles.evict(lambda key, lane=lane_id: key[0] == lane)
+            self._lane_seen[lane_id] = version
+
+        if tw._project:
+            self._update_waveform_priorities(visible_ms)
+
+        # 레인 타일 블릿 (없는 타일만 렌더링) + 동적 요소
         painter = QPainter(tw)
-        painter.drawPixmap(0, 0, tw._static_cache)
+        painter.fillRect(0, 0, w, h, self._BG_COLOR)
+        zkey = zoom_key(px_per_ms)
+        offset_px = round(tw._visible_start_ms * px_per_ms)
+        for idx in visible_tiles(tw._visible_start_ms, px_per_ms, w):
+            tile_x = idx * TILE_W - offset_px
+            for lane_id, lane_y, lane_h, _sig, draw in lanes:
+                key = (lane_id, zkey, idx, lane_h, lane_versions.get(lane_id, 0))
+                tile = self._tiles.get(key)
+                if tile is None:
+                    tile = self._render_tile(idx, lane_y, lane_h, draw)
+                    self._tiles.put(key, tile)
+                painter.drawPixmap(tile_x, lane_y, tile)
         painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        self._draw_selection(painter, w)
         self._draw_markers(painter, h)
         self._draw_playhead(painter, h)
         self._draw_track_highlight(painter, w)
@@ -232,6 +259,154 @@ class TimelinePainter:
         self._draw_drop_indicator(painter, h)
         painter.end()
 
+    def _collect_lanes(self, h: int, visible_ms: float) -> list[tuple]:
+        """그리기 순서대로 (레인 ID, y, 높이, 시그니처, 드로잉 함수) 목록. 숨김 트랙은 제외.
+
+        드로잉 함수는 절대 y 좌표로 그리며, 타일 렌더링 시 레인 y만큼 평행이동된다.
+        """
+        tw = self.tw
+        lanes: list[tuple] = [(
+            LANE_RULER, 0, _RULER_H, (self._nice_tick_interval(visible_ms),),
+            lambda p: self._draw_ruler(p, self._view_w, h, visible_ms),
+        )]
+
+        if tw._project:
+            for idx, vt in enumerate(tw._project.video_tracks):
+                if vt.hidden or not vt.clips:
+                    continue
+                lanes.append((
+                    video_lane(idx), tw._video_track_y(idx), _CLIP_H,
+                    (id(vt), len(vt.clips), tw._show_loudness),
+                    lambda p, i=idx, t=vt: self._draw_track_clips(p, i, t),
+                ))
+            # 클립이 없는 레거시 프로젝트에서만 전체 웨이브폼 레인을 그린다
+            has_clips = bool(tw._clip_track and tw._clip_track.clips)
+            if tw._has_video and not has_clips and not tw._project.video_tracks[0].hidden:
+                lanes.append((
+                    LANE_WAVEFORM, tw._waveform_y(), _WAVEFORM_H, (id(tw._waveform_data),),
+                    lambda p: self._draw_video_audio(p, self._view_w, h),
+                ))
+
+        if tw._track and not tw._track.hidden and len(tw._track):
+            sig = (id(tw._track), len(tw._track))
+            lanes.append((
+                LANE_AUDIO, tw._audio_track_y(), _AUDIO_H, sig,
+                lambda p: self._draw_audio_track(p, h),
+            ))
+            lanes.append((
+                LANE_SUBTITLE, tw._subtitle_track_y(), _SEG_H, sig,
+                lambda p: self._draw_segments(p, h),
+            ))
+
+        iot = tw._image_overlay_track
+        if iot and not iot.hidden and len(iot):
+            rows_h = tw._img_overlay_total_h(tw._compute_overlay_rows())
+            lanes.append((
+                LANE_IMAGE, tw._img_overlay_base_y(), rows_h, (id(iot), len(iot)),
+                lambda p: self._draw_image_overlays(p, h),
+            ))
+
+        tot = tw._text_overlay_track
+        if tot and len(tot):
+            rows_h = tw._get_num_text_rows() * (tw._TEXT_ROW_H + tw._TEXT_ROW_GAP)
+            lanes.append((
+                LANE_TEXT, tw._text_overlay_base_y(), rows_h, (id(tot), len(tot)),
+                lambda p: self._draw_text_overlays(p, h),
+            ))
+
+        for idx, track in enumerate(getattr(tw, "_bgm_tracks", None) or []):
+            if not track.clips:
+                continue
+            lanes.append((
+                bgm_lane(idx), tw._bgm_track_y(idx), _BGM_H, (id(track), len(track.clips)),
+                lambda p, i=idx, t=track: self._draw_bgm_track_clips(p, i, t),
+            ))
+        return lanes
+
+    def _render_tile(self, tile_index: int, lane_y: int, lane_h: int, draw) -> QPixmap:
+        """레인 타일 1장 렌더링 (투명 배경).
+
+        드로잉 메서드는 타일 좌표계(_origin_ms, _view_w)를 사용한다.
+        """
+        w = TILE_W
+        self._origin_ms = tile_origin_ms(tile_index, self.tw._px_per_ms)
+        self._view_w = w
+
+        pixmap = QPixmap(w, max(lane_h, 1))
+        pixmap.fill(Qt.GlobalColor.transparent)
+        pp = QPainter(pixmap)
+        pp.setRenderHint(QPainter.RenderHint.Antialiasing)
+        pp.translate(0, -lane_y)
+        draw(pp)
+        pp.end()
+        return pixmap
+
+    def _ms_to_x(self, ms: float) -> float:
+        """타임라인 ms → 현재 렌더링 중인 타일 내부 x 좌표."""
+        return (ms - self._origin_ms) * self.tw._px_per_ms
+
+    def _visible_indices(self, lane) -> np.ndarray:
+        """현재 타일 범위에 걸친 레인 항목 인덱스 (공간 인덱스 질의, 테두리용 2px 여유)."""
+        px_per_ms = self.tw._px_per_ms
+        pad = 2 / px_per_ms
+        lo = self._origin_ms - pad
+        hi = self._origin_ms + self._view_w / px_per_ms + pad
+        return self.tw._lane_index(lane).overlapping(lo, hi)
+
+    def _use_lod(self, n_items: int) -> bool:
+        """타일에 걸친 항목이 너무 촘촘하면(항목당 px < 임계값) 밀도 막대로 전환."""
+        return n_items * _LOD_MIN_PX_PER_ITEM > self._view_w
+
+    def _draw_density(
+        self, painter: QPainter, lane, indices: np.ndarray, y: float, h: float, color: QColor,
+    ) -> None:
+        """LOD 모드: 픽셀 열마다 항목이 덮는 비율을 불투명도로 표현한 막대 (텍스트 없음).
+
+        평균 밝기가 개별 항목을 그렸을 때와 같아 전환이 눈에 띄지 않는다.
+        항목 수와 무관하게 타일 폭 1줄 이미지 1장을 늘려 그리므로 비용이 O(k + 타일 폭)이다.
+        """
+        w = self._view_w
+        cov = self.tw._lane_index(lane).coverage(self._origin_ms, self.tw._px_per_ms, w, indices)
+        alpha = (np.minimum(cov, 1.0) * 255).astype(np.uint32)
+        alpha[(cov > 0) & (alpha < _LOD_MIN_ALPHA)] = _LOD_MIN_ALPHA
+        # ARGB32 premultiplied — 채널마다 알파를 곱해 둔다
+        r = alpha * color.red() // 255
+        g = alpha * color.green() // 255
+        b = alpha * color.blue() // 255
+        row = (alpha << 24) | (r << 16) | (g << 8) | b
+        img = QImage(row.tobytes(), w, 1, w * 4, QImage.Format.Format_ARGB32_Premultiplied)
+        painter.save()
+        # 세로로만 늘리므로 보간을 끄면 타일 경계에 번짐이 생기지 않는다
+        painter.setRenderHint(QPainter.RenderHint.SmoothPixmapTransform, False)
+        painter.drawImage(QRectF(0, y, w, h), img)
+        painter.restore()
+
+    def _update_waveform_priorities(self, visible_ms: float) -> None:
+        """뷰포트 노출 시간 기준으로 웨이브폼·프록시 대기열 우선순위 갱신 (제거된 소스의 웨이브폼은 취소)."""
+        tw = self.tw
+        if not tw._waveform_service:
+            return
+        vis_start = tw._visible_start_ms
+        # 뷰포트·콘텐츠가 그대로면 재계산 생략 (플레이헤드만 움직이는 프레임).
+        # 클립 이동·트림은 비디오 레인 버전만 올리므로 키에 함께 넣는다
+        lane_versions = tw._lane_versions
+        video_versions = tuple(lane_versions.get(video_lane(i), 0) for i in range(len(tw._project.video_tracks)))
+        key = (vis_start, visible_ms, self._tiles_version, video_versions, id(tw._waveform_service))
+        if key == self._priority_key:
+            return
+        self._priority_key = key
+        from src.services.timeline_waveform_service import compute_source_priorities
+        self._waveform_priorities = compute_source_priorities(
+            tw._project.video_tracks, vis_start, vis_start + visible_ms,
+        )
+        if tw._proxy_queue is not None:
+            tw._proxy_queue.update_priorities(self._waveform_priorities)
+        svc = tw._waveform_service
+        svc.update_priorities(self._waveform_priorities)
+        # 화면 밖 소스도 낮은 우선순위로 미리 대기열에 넣는다
+        for path, priority in self._waveform_priorities.items():
+            svc.request_waveform(path, priority)
+
     # ================================================================
     # 개별 드로잉 메서드
     # ================================================================
@@ -245,22 +420,21 @@ class TimelinePainter:
         if tick_ms <= 0:
             return
         # 로컬 변수 캐싱 — while 루프 내 속성 접근 최소화
-        vis_start = tw._visible_start_ms
-        ms_to_x = tw._ms_to_x
+        vis_start = self._origin_ms
+        ms_to_x = self._ms_to_x
         ruler_color = self._RULER_COLOR
         ruler_text = self._RULER_TEXT_COLOR
         ruler_h = _RULER_H
-        start_tick = int(vis_start / tick_ms) * tick_ms
-        if start_tick < vis_start:
-            start_tick += tick_ms
-        t = start_tick
-        end_ms = vis_start + visible_ms
+        # 왼쪽 타일에서 시작된 레이블이 경계에서 잘리지 않도록 경계 이전 틱부터 그린다
+        t = int(vis_start / tick_ms) * tick_ms
+        end_ms = vis_start + w / tw._px_per_ms
         while t <= end_ms:
-            x = ms_to_x(t)
+            # floor: 타일 경계 양쪽에서 같은 픽셀로 반올림되도록
+            x = math.floor(ms_to_x(t))
             painter.setPen(QPen(ruler_color, 1))
-            painter.drawLine(int(x), 0, int(x), ruler_h)
+            painter.drawLine(x, 0, x, ruler_h)
             painter.setPen(ruler_text)
-            painter.drawText(int(x) + 4, 11, ms_to_display(int(t)))
+            painter.drawText(x + 4, 11, ms_to_display(int(t)))
             t += tick_ms
 
     def _draw_snap_indicator(self, painter: QPainter, h: int) -> None:
@@ -306,25 +480,18 @@ class TimelinePainter:
             self._draw_video_audio_fallback(painter, w)
 
     def _draw_waveform(self, painter: QPainter, w: int) -> None:
-        """캐시된 QImage로 웨이브폼 그리기."""
+        """웨이브폼 QImage 그리기 (타일 단위로 렌더링되어 타일 캐시에 함께 저장)."""
         tw = self.tw
         wf = tw._waveform_data
         if wf is None or wf.duration_ms <= 0:
             return
         waveform_y = tw._waveform_y()
         waveform_h = _WAVEFORM_H
-        visible_ms = tw._visible_range_ms()
-        cache_key = (tw._visible_start_ms, visible_ms, w)
-
-        if self._waveform_cache_key != cache_key:
-            self._waveform_image_cache = self._render_waveform_image(w, waveform_h)
-            self._waveform_cache_key = cache_key
-
-        if self._waveform_image_cache is not None:
-            painter.drawImage(0, waveform_y, self._waveform_image_cache)
+        painter.drawImage(0, waveform_y, self._render_waveform_image(w, waveform_h))
 
-        label_x = max(5, int(tw._ms_to_x(0)) + 5)
-        if 0 < label_x < w - 80:
+        # 레이블은 타임라인 0ms 위치에 고정 (타일마다 반복되지 않도록)
+        label_x = int(self._ms_to_x(0)) + 5
+        if 0 < label_x < w:
             painter.setPen(QColor(255, 200, 100, 200))
             painter.setFont(QFont("Arial", 8))
             painter.drawText(label_x, waveform_y + 10, "Video Audio")
@@ -342,7 +509,7 @@ class TimelinePainter:
         half_h = h / 2.0
 
         # --- NumPy 벡터화: 모든 픽셀의 ms 범위를 한 번에 계산 ---
-        vis_start = tw._visible_start_ms
+        vis_start = self._origin_ms
         px_per_ms = tw._px_per_ms
         if px_per_ms <= 0:
             return img
@@ -425,8 +592,8 @@ class TimelinePainter:
         center_y = waveform_y + waveform_h // 2
         painter.setPen(QPen(QColor(80, 80, 80), 1))
         painter.drawLine(0, center_y, w, center_y)
-        label_x = max(5, int(tw._ms_to_x(0)) + 5)
-        if 0 < label_x < w - 120:
+        label_x = int(self._ms_to_x(0)) + 5
+        if 0 < label_x < w:
             painter.setPen(QColor(150, 150, 150, 150))
             painter.setFont(QFont("Arial", 8))
             painter.drawText(label_x, waveform_y + 10, "Video Audio (loading...)")
@@ -440,12 +607,19 @@ class TimelinePainter:
             return
         y = tw._audio_track_y()
         track_h = _AUDIO_H
-        for i, seg in enumerate(tw._track):
+        segments = tw._track.segments
+        indices = self._visible_indices(LANE_AUDIO)
+        if self._use_lod(len(indices)):
+            has_audio = tw._lane_cached(LANE_AUDIO, "has_audio", segments, self._audio_mask)
+            self._draw_density(painter, LANE_AUDIO, indices[has_audio[indices]], y, track_h, self._AUDIO_COLOR_TOP)
+            return
+        for i in indices.tolist():
+            seg = segments[i]
             if not seg.audio_file:
                 continue
-            x1 = tw._ms_to_x(seg.start_ms)
-            x2 = tw._ms_to_x(seg.end_ms)
-            if x2 < 0 or x1 > tw.width():
+            x1 = self._ms_to_x(seg.start_ms)
+            x2 = self._ms_to_x(seg.end_ms)
+            if x2 < 0 or x1 > self._view_w:
                 continue
             rect = QRectF(x1, y, x2 - x1, track_h)
             painter.setBrush(QBrush(self._AUDIO_COLOR_TOP))
@@ -460,41 +634,37 @@ class TimelinePainter:
         y = tw._subtitle_track_y()
         track_h = _SEG_H
         # 로컬 변수 캐싱 — self.tw._xxx 딕셔너리 룩업 체인 제거
-        ms_to_x = tw._ms_to_x
-        widget_w = tw.width()
-        selected_idx = tw._selected_index
+        ms_to_x = self._ms_to_x
+        widget_w = self._view_w
         seg_top = self._SEGMENT_COLOR_TOP
         seg_bot = self._SEGMENT_COLOR_BOT
         seg_border = self._SEGMENT_BORDER
-        sel_border = self._SELECTED_BORDER
-        sel_glow = self._SELECTED_GLOW
-        for i, seg in enumerate(tw._track):
+        segments = tw._track.segments
+        indices = self._visible_indices(LANE_SUBTITLE)
+        if self._use_lod(len(indices)):
+            self._draw_density(painter, LANE_SUBTITLE, indices, y, track_h, seg_top)
+            return
+        for i in indices.tolist():
+            seg = segments[i]
             x1 = ms_to_x(seg.start_ms)
             x2 = ms_to_x(seg.end_ms)
             if x2 < 0 or x1 > widget_w:
                 continue
             rect = QRectF(x1, y, x2 - x1, track_h)
-            is_selected = (selected_idx == i)
-            top = seg_top
-            bot = seg_bot
-            border = seg_border
-            if is_selected:
-                border = sel_border
-                painter.setBrush(QBrush(sel_glow))
-                painter.drawRect(rect.adjusted(-2, -2, 2, 2))
             grad = QLinearGradient(rect.topLeft(), rect.bottomLeft())
-            grad.setColorAt(0, top)
-            grad.setColorAt(1, bot)
+            grad.setColorAt(0, seg_top)
+            grad.setColorAt(1, seg_bot)
             painter.setBrush(grad)
-            painter.setPen(QPen(border, 1))
+            painter.setPen(QPen(seg_border, 1))
             painter.drawRoundedRect(rect, 4, 4)
-            painter.setPen(Qt.GlobalColor.white)
-            painter.setFont(QFont("Arial", 8))
-            painter.drawText(
-                rect.adjusted(5, 0, -5, 0),
-                Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
-                seg.text,
-            )
+            if x2 - x1 > 12:
+                painter.setPen(Qt.GlobalColor.white)
+                painter.setFont(QFont("Arial", 8))
+                painter.drawText(
+                    rect.adjusted(5, 0, -5, 0),
+                    Qt.AlignmentFlag.AlignVCenter | Qt.AlignmentFlag.AlignLeft,
+                    seg.text,
+                )
             # 애니메이션 배지 (파란 원형) — animation 설정된 세그먼트
             anim = getattr(seg, "animation", None)
             if anim is not None and anim.is_active and (x2 - x1) > 20:
@@ -541,10 +711,16 @@ class TimelinePainter:
         rows = tw._compute_overlay_rows()
         palette, border_palette = self._get_img_palettes()
         # 로컬 변수 캐싱
-        ms_to_x = tw._ms_to_x
-        widget_w = tw.width()
-        sel_ov_idx = tw._selected_overlay_index
-        for i, ov in enumerate(tw._image_overlay_track):
+        ms_to_x = self._ms_to_x
+        widget_w = self._view_w
+        overlays = tw._image_overlay_track.overlays
+        indices = self._visible_indices(LANE_IMAGE)
+        if self._use_lod(len(indices)):
+            rows_h = tw._img_overlay_total_h(rows) - img_gap
+            self._draw_density(painter, LANE_IMAGE, indices, img_base_y, rows_h, palette[0])
+            return
+        for i in indices.tolist():
+            ov = overlays[i]
             x1 = ms_to_x(ov.start_ms)
             x2 = ms_to_x(ov.end_ms)
             if x2 < 0 or x1 > widget_w:
@@ -553,12 +729,8 @@ class TimelinePainter:
             y = img_base_y + row * (img_h + img_gap)
             rect = QRectF(x1, y, max(x2 - x1, 2), img_h)
             color_idx = row % len(palette)
-            if i == sel_ov_idx:
-                painter.setPen(QPen(self._IMG_OVERLAY_SELECTED_BORDER, 2))
-                painter.setBrush(QBrush(self._IMG_OVERLAY_SELECTED_COLOR))
-            else:
-                painter.setPen(QPen(border_palette[color_idx], 1))
-                painter.setBrush(QBrush(palette[color_idx]))
+            painter.setPen(QPen(border_palette[color_idx], 1))
+            painter.setBrush(QBrush(palette[color_idx]))
             painter.drawRoundedRect(rect, 3, 3)
             if rect.width() > 30:
                 painter.setPen(QColor("white"))
@@ -583,20 +755,23 @@ class TimelinePainter:
         text_h = tw._TEXT_ROW_H
         text_gap = tw._TEXT_ROW_GAP
         rows = tw._compute_text_overlay_rows()
-        for i, overlay in enumerate(tw._text_overlay_track.overlays):
-            x1 = tw._ms_to_x(overlay.start_ms)
-            x2 = tw._ms_to_x(overlay.end_ms)
-            if x2 < 0 or x1 > tw.width():
+        overlays = tw._text_overlay_track.overlays
+        indices = self._visible_indices(LANE_TEXT)
+        if self._use_lod(len(indices)):
+            rows_h = tw._get_num_text_rows() * (text_h + text_gap) - text_gap
+            self._draw_density(painter, LANE_TEXT, indices, text_base_y, rows_h, self._TEXT_OVERLAY_COLOR)
+            return
+        for i in indices.tolist():
+            overlay = overlays[i]
+            x1 = self._ms_to_x(overlay.start_ms)
+            x2 = self._ms_to_x(overlay.end_ms)
+            if x2 < 0 or x1 > self._view_w:
                 continue
             row = rows[i]
             y = text_base_y + row * (text_h + text_gap)
             rect = QRectF(x1, y, max(x2 - x1, 2), text_h)
-            if i == tw._selected_text_overlay_index:
-                painter.setPen(QPen(self._TEXT_OVERLAY_SELECTED_BORDER, 2))
-                painter.setBrush(QBrush(self._TEXT_OVERLAY_SELECTED_COLOR))
-            else:
-                painter.setPen(QPen(self._TEXT_OVERLAY_BORDER, 1))
-                painter.setBrush(QBrush(self._TEXT_OVERLAY_COLOR))
+            painter.setPen(QPen(self._TEXT_OVERLAY_BORDER, 1))
+            painter.setBrush(QBrush(self._TEXT_OVERLAY_COLOR))
             painter.drawRoundedRect(rect, 3, 3)
             if rect.width() > 30:
                 painter.setPen(QColor("white"))
@@ -613,14 +788,6 @@ class TimelinePainter:
 
     # ---- BGM Tracks ----
 
-    def _draw_bgm_tracks(self, painter: QPainter, h: int) -> None:
-        """BGM 트랙 전체."""
-        tw = self.tw
-        if not hasattr(tw, "_bgm_tracks") or not tw._bgm_tracks:
-            return
-        for idx, track in enumerate(tw._bgm_tracks):
-            self._draw_bgm_track_clips(painter, idx, track)
-
     def _draw_bgm_track_clips(self, painter: QPainter, track_idx: int, trackObject) -> None:
         """BGM 트랙의 개별 클립."""
         from src.models.audio import AudioTrack
@@ -628,25 +795,23 @@ class TimelinePainter:
         track: AudioTrack = trackObject
         y = tw._bgm_track_y(track_idx)
         th = _BGM_H
-        for i, clip in enumerate(track.clips):
-            x1 = tw._ms_to_x(clip.start_ms)
-            x2 = tw._ms_to_x(clip.start_ms + clip.duration_ms)
-            if x2 < 0 or x1 > tw.width():
+        lane = bgm_lane(track_idx)
+        indices = self._visible_indices(lane)
+        if self._use_lod(len(indices)):
+            self._draw_density(painter, lane, indices, y, th, self._BGM_COLOR_TOP)
+            return
+        for i in indices.tolist():
+            clip = track.clips[i]
+            x1 = self._ms_to_x(clip.start_ms)
+            x2 = self._ms_to_x(clip.start_ms + clip.duration_ms)
+            if x2 < 0 or x1 > self._view_w:
                 continue
             rect = QRectF(x1, y, max(x2 - x1, 2), th)
             gradient = QLinearGradient(rect.topLeft(), rect.bottomLeft())
             gradient.setColorAt(0, self._BGM_COLOR_TOP)
             gradient.setColorAt(1, self._BGM_COLOR_BOT)
-            is_selected = (
-                tw._selected_bgm_track_index == track_idx
-                and tw._selected_bgm_clip_index == i
-            )
-            if is_selected:
-                painter.setPen(QPen(self._BGM_SELECTED_BORDER, 2))
-                painter.setBrush(QBrush(self._BGM_SELECTED_COLOR))
-            else:
-                painter.setPen(QPen(self._BGM_BORDER, 1))
-                painter.setBrush(QBrush(gradient))
+            painter.setPen(QPen(self._BGM_BORDER, 1))
+            painter.setBrush(QBrush(gradient))
             painter.drawRoundedRect(rect, 4, 4)
             if rect.width() > 40:
                 painter.setPen(Qt.GlobalColor.white)
@@ -658,6 +823,92 @@ class TimelinePainter:
                     label,
                 )
 
+    # ---- Selection (동적 레이어) ----
+
+    def _draw_selection(self, painter: QPainter, w: int) -> None:
+        """선택 하이라이트. 정적 레인 위에 덧그려 선택 변경이 레인 캐시를 무효화하지 않는다."""
+        tw = self.tw
+        ms_to_x = tw._ms_to_x
+
+        if tw._project and tw._selected_clips:
+            tracks = tw._project.video_tracks
+            starts_by_track: dict[int, list[int]] = {}
+            for t_idx, c_idx in tw._selected_clips:
+                if not 0 <= t_idx < len(tracks):
+                    continue
+                vt = tracks[t_idx]
+                if vt.hidden or not 0 <= c_idx < len(vt.clips):
+                    continue
+                if t_idx not in starts_by_track:
+                    starts_by_track[t_idx] = vt.clip_boundaries_ms()
+                start_ms = starts_by_track[t_idx][c_idx]
+                x1 = ms_to_x(start_ms)
+                x2 = ms_to_x(start_ms + vt.clips[c_idx].duration_ms)
+                rect = QRectF(x1, tw._video_track_y(t_idx), max(x2 - x1, 2), _CLIP_H)
+                self._draw_selected_rect(
+                    painter, rect, 6, self._CLIP_SELECTED_BORDER, self._CLIP_SELECTED_TINT, w,
+                )
+
+        track = tw._track
+        if track and not track.hidden and 0 <= tw._selected_index < len(track):
+            seg = track[tw._selected_index]
+            x1 = ms_to_x(seg.start_ms)
+            x2 = ms_to_x(seg.end_ms)
+            if x2 >= 0 and x1 <= w:
+                rect = QRectF(x1, tw._subtitle_track_y(), x2 - x1, _SEG_H)
+                painter.setPen(Qt.PenStyle.NoPen)
+                painter.setBrush(QBrush(self._SELECTED_GLOW))
+                painter.drawRect(rect.adjusted(-2, -2, 2, 2))
+                painter.setPen(QPen(self._SELECTED_BORDER, 1))
+                painter.setBrush(Qt.BrushStyle.NoBrush)
+                painter.drawRoundedRect(rect, 4, 4)
+
+        iot = tw._image_overlay_track
+        if iot and not iot.hidden and 0 <= tw._selected_overlay_index < len(iot):
+            ov = iot[tw._selected_overlay_index]
+            row = tw._compute_overlay_rows()[tw._selected_overlay_index]
+            y = tw._img_overlay_base_y() + row * (tw._IMG_ROW_H + tw._IMG_ROW_GAP)
+            x1 = ms_to_x(ov.start_ms)
+            x2 = ms_to_x(ov.end_ms)
+            rect = QRectF(x1, y, max(x2 - x1, 2), tw._IMG_ROW_H)
+            self._draw_selected_rect(
+                painter, rect, 3, self._IMG_OVERLAY_SELECTED_BORDER, self._IMG_OVERLAY_SELECTED_TINT, w,
+            )
+
+        tot = tw._text_overlay_track
+        if tot and 0 <= tw._selected_text_overlay_index < len(tot):
+            overlay = tot[tw._selected_text_overlay_index]
+            row = tw._compute_text_overlay_rows()[tw._selected_text_overlay_index]
+            y = tw._text_overlay_base_y() + row * (tw._TEXT_ROW_H + tw._TEXT_ROW_GAP)
+            x1 = ms_to_x(overlay.start_ms)
+            x2 = ms_to_x(overlay.end_ms)
+            rect = QRectF(x1, y, max(x2 - x1, 2), tw._TEXT_ROW_H)
+            self._draw_selected_rect(
+                painter, rect, 3, self._TEXT_OVERLAY_SELECTED_BORDER, self._TEXT_OVERLAY_SELECTED_TINT, w,
+            )
+
+        bgm_tracks = getattr(tw, "_bgm_tracks", None) or []
+        t_idx, c_idx = tw._selected_bgm_track_index, tw._selected_bgm_clip_index
+        if 0 <= t_idx < len(bgm_tracks) and 0 <= c_idx < len(bgm_tracks[t_idx].clips):
+            clip = bgm_tracks[t_idx].clips[c_idx]
+            x1 = ms_to_x(clip.start_ms)
+            x2 = ms_to_x(clip.start_ms + clip.duration_ms)
+            rect = QRectF(x1, tw._bgm_track_y(t_idx), max(x2 - x1, 2), _BGM_H)
+            self._draw_selected_rect(
+                painter, rect, 4, self._BGM_SELECTED_BORDER, self._BGM_SELECTED_TINT, w,
+            )
+
+    @staticmethod
+    def _draw_selected_rect(
+        painter: QPainter, rect: QRectF, radius: float, border: QColor, tint: QColor, w: int,
+    ) -> None:
+        """선택 항목 틴트 + 2px 테두리. 화면 밖이면 생략."""
+        if rect.right() < 0 or rect.left() > w:
+            return
+        painter.setPen(QPen(border, 2))
+        painter.setBrush(QBrush(tint))
+        painter.drawRoundedRect(rect, radius, radius)
+
     # ---- Markers ----
 
     def _draw_markers(self, painter: QPainter, h: int) -> None:
@@ -703,46 +954,40 @@ class TimelinePainter:
         if not track.clips:
             return
         tw = self.tw
-        w = tw.width()
+        w = self._view_w
         y = tw._video_track_y(track_idx)
         h = _CLIP_H
 
-        source_paths = {c.source_path for c in track.clips}
-        source_color_map = {}
-        for i, path in enumerate(sorted(source_paths, key=lambda x: str(x) if x is not None else "")):
-            source_color_map[path] = i
-
-        clip_starts = track.clip_boundaries_ms()
+        lane = video_lane(track_idx)
+        indices = self._visible_indices(lane)
+        if self._use_lod(len(indices)):
+            self._draw_density(painter, lane, indices, y, h, self._SOURCE_COLORS[0][0])
+            return
+        # 소스별 색 인덱스 — 레인이 바뀔 때만 재계산 (타일마다 O(n) 반복 방지)
+        source_color_map = tw._lane_cached(lane, "source_colors", track.clips, self._source_color_map)
+        clip_starts = tw._lane_index(lane).starts
         # 로컬 변수 캐싱
-        ms_to_x = tw._ms_to_x
-        selected_clips = tw._selected_clips
+        ms_to_x = self._ms_to_x
         source_colors = self._SOURCE_COLORS
 
-        for i, clip in enumerate(track.clips):
-            start_ms = clip_starts[i]
+        for i in indices.tolist():
+            clip = track.clips[i]
+            start_ms = int(clip_starts[i])
             x1 = ms_to_x(start_ms)
             x2 = ms_to_x(start_ms + clip.duration_ms)
             if x2 < 0 or x1 > w:
                 continue
             rect = QRectF(x1, y, max(x2 - x1, 2), h)
-            is_selected = (track_idx, i) in selected_clips
-            if is_selected:
-                painter.setPen(QPen(self._CLIP_SELECTED_BORDER, 2))
-                glow_gradient = QLinearGradient(0, y, 0, y + h)
-                glow_gradient.setColorAt(0, self._CLIP_SELECTED_COLOR)
-                glow_gradient.setColorAt(1, self._CLIP_SELECTED_COLOR.darker(120))
-                painter.setBrush(QBrush(glow_gradient))
+            label = getattr(clip, "color_label", "none")
+            if label != "none" and label in self._LABEL_COLORS:
+                c_top, c_bot, border_color = self._LABEL_COLORS[label]
             else:
-                label = getattr(clip, "color_label", "none")
-                if label != "none" and label in self._LABEL_COLORS:
-                    c_top, c_bot, border_color = self._LABEL_COLORS[label]
-                else:
-                    color_idx = source_color_map.get(clip.source_path, 0) % len(source_colors)
-                    c_top, c_bot, border_color = source_colors[color_idx]
-                gradient = QLinearGradient(0, y, 0, y + h)
-                gradient.setColorAt(0, c_top)
-                gradient.setColorAt(1, c_bot)
-                painter.setBrush(QBrush(gradient))
+                color_idx = source_color_map.get(clip.source_path, 0) % len(source_colors)
+                c_top, c_bot, border_color = source_colors[color_idx]
+            gradient = QLinearGradient(0, y, 0, y + h)
+            gradient.setColorAt(0, c_top)
+            gradient.setColorAt(1, c_bot)
+            painter.setBrush(QBrush(gradient))
             painter.setPen(Qt.PenStyle.NoPen)
             painter.drawRoundedRect(rect, 6, 6)
 
@@ -750,14 +995,18 @@ class TimelinePainter:
             if tw._waveform_service and clip.source_path:
                 wf = tw._waveform_service.get_waveform(clip.source_path)
                 if wf:
-                    self._draw_clip_waveform(painter, rect, clip, wf, tw)
+                    self._draw_clip_waveform(painter, rect, clip, start_ms, wf)
+                    if tw._show_loudness and wf.loudness is not None:
+                        self._draw_clip_loudness(painter, rect, clip, start_ms, wf)
                 else:
-                    tw._waveform_service.request_waveform(clip.source_path)
+                    tw._waveform_service.request_waveform(
+                        clip.source_path, self._waveform_priorities.get(clip.source_path, 0),
+                    )
 
             # 필름스트립 썸네일
             if tw._should_draw_thumbnails(rect.width()):
                 vis_x1 = max(int(x1), 0)
-                vis_x2 = min(int(x2), tw.width())
+                vis_x2 = min(int(x2), w)
                 if vis_x2 > vis_x1:
                     interval = tw._get_thumbnail_interval()
                     start_grid = (vis_x1 // interval) * interval
@@ -812,6 +1061,20 @@ class TimelinePainter:
                 self._draw_volume_envelope(painter, rect, clip)
                 self._draw_default_volume_line(painter, rect, clip)
 
+    @staticmethod
+    def _audio_mask(segments) -> np.ndarray:
+        """TTS 오디오가 있는 세그먼트 마스크 (LOD 밀도 막대용)."""
+        return np.fromiter((bool(seg.audio_file) for seg in segments), dtype=bool, count=len(segments))
+
+    @staticmethod
+    def _source_color_map(clips: list[VideoClip]) -> dict:
+        """source_path → 팔레트 인덱스 (경로 정렬 순)."""
+        source_paths = {c.source_path for c in clips}
+        return {
+            path: i
+            for i, path in enumerate(sorted(source_paths, key=lambda x: str(x) if x is not None else ""))
+        }
+
     def _draw_transition_marker(self, painter: QPainter, clip: VideoClip, rect: QRectF) -> None:
         """트랜지션 마커 그리기."""
         if not (hasattr(clip, "transition_out") and clip.transition_out):
@@ -843,9 +1106,10 @@ class TimelinePainter:
     # ---- Clip Waveform ----
 
     def _draw_clip_waveform(
-        self, painter: QPainter, rect: QRectF, clip: VideoClip, wf: WaveformData, tw: TimelineWidget
+        self, painter: QPainter, rect: QRectF, clip: VideoClip, clip_start_ms: int, wf: WaveformData
     ) -> None:
         """클립 내부 웨이브폼. NumPy 벡터화로 O(px) Python 루프 최소화."""
+        tw = self.tw
         rect_x = rect.x()
         rect_y = rect.y()
         rect_w = rect.width()
@@ -856,18 +1120,12 @@ class TimelinePainter:
         s_out = clip.source_out_ms
         speed = clip.speed
         p_start = max(0, int(rect_x))
-        p_end = min(tw.width(), int(rect_x + rect_w))
+        p_end = min(self._view_w, int(rect_x + rect_w))
         if p_start >= p_end:
             return
 
-        try:
-            cidx = tw._clip_track.clips.index(clip)
-            clip_start_ms = tw._clip_track.clip_timeline_start(cidx)
-        except (ValueError, AttributeError):
-            clip_start_ms = 0
-
         # --- NumPy 벡터화: 모든 픽셀의 source_ms를 한 번에 계산 ---
-        vis_start = tw._visible_start_ms
+        vis_start = self._origin_ms
         px_per_ms = tw._px_per_ms
         if px_per_ms <= 0:
             return
@@ -897,6 +1155,38 @@ class TimelinePainter:
         for i in range(len(valid_idx)):
             painter.drawLine(int(px_vals[i]), int(y_tops[i]), int(px_vals[i]), int(y_bots[i]))
 
+    def _draw_clip_loudness(
+        self, painter: QPainter, rect: QRectF, clip: VideoClip, clip_start_ms: int, wf: WaveformData
+    ) -> None:
+        """클립 내부 short-term 라우드니스 곡선 (floor~0 LUFS → 아래~위)."""
+        tw = self.tw
+        px_per_ms = tw._px_per_ms
+        p_start = max(0, int(rect.x()))
+        p_end = min(self._view_w, int(rect.x() + rect.width()))
+        if p_start >= p_end or px_per_ms <= 0 or len(wf.loudness) == 0:
+            return
+        step = 2  # 2px 간격 샘플링이면 곡선으로 충분
+        # 양끝 한 스텝씩 더 샘플링 — 타일 경계에서 곡선이 끊기지 않도록 (clipRect가 잘라냄)
+        px_arr = np.arange(p_start - step, p_end + step, step, dtype=np.float64)
+        local_ms = self._origin_ms + px_arr / px_per_ms - clip_start_ms
+        source_ms = clip.source_in_ms + local_ms * clip.speed
+        valid = (source_ms >= clip.source_in_ms) & (source_ms < clip.source_out_ms)
+        if not valid.any():
+            return
+        blocks = np.clip((source_ms[valid] // LOUDNESS_HOP_MS).astype(np.int64), 0, len(wf.loudness) - 1)
+        floor = self._LOUDNESS_FLOOR_LUFS
+        norm = np.clip((wf.loudness[blocks] - floor) / -floor, 0.0, 1.0)
+        ys = rect.bottom() - 2 - norm * (rect.height() - 4)
+        points = [QPointF(float(x), float(y)) for x, y in zip(px_arr[valid], ys)]
+        if len(points) < 2:
+            return
+        painter.save()
+        painter.setClipRect(rect)
+        painter.setPen(QPen(self._LOUDNESS_LINE_COLOR, 1.2))
+        painter.setBrush(Qt.BrushStyle.NoBrush)
+        painter.drawPolyline(QPolygonF(points))
+        painter.restore()
+
     # ---- Volume Envelope ----
 
     def _draw_volume_envelope(self, painter: QPainter, rect: QRectF, clip: VideoClip) -> None:
@@ -0,0 +1,103 @@
+"""타임라인 정적 레이어 타일 캐시.
+
+정적 레이어를 레인(트랙)별 고정 폭 타일로 나눠 (레인, 줌 레벨, 타일 인덱스, 버전) 키로 보관한다.
+가로 스크롤은 캐시된 타일을 블릿하고 새로 드러난 타일만 렌더링하면 된다.
+OrderedDict LRU (HPP Ch.4)로 메모리 예산을 넘으면 가장 오래 쓰지 않은 타일부터 퇴거.
+"""
+
+from __future__ import annotations
+
+import collections
+import math
+from typing import Callable, Hashable
+
+from PySide6.QtGui import QPixmap
+
+# 타일 폭(px) — 썸네일 간격(25/50/100/200px)의 배수여야 타일 경계에서 격자가 어긋나지 않는다
+TILE_W = 400
+
+# 기본 메모리 예산: 400x600 ARGB 타일 약 70장
+DEFAULT_BUDGET_BYTES = 64 * 1024 * 1024
+
+
+def zoom_key(px_per_ms: float) -> float:
+    """줌 레벨 키. 부동소수 오차(1ulp)로 타일 키가 달라지지 않도록 유효숫자 12자리로 정규화."""
+    return float(f"{px_per_ms:.12g}")
+
+
+def visible_tiles(visible_start_ms: float, px_per_ms: float, width: int) -> range:
+    """뷰포트 [start, start + width px)를 덮는 타일 인덱스 범위."""
+    if px_per_ms <= 0 or width <= 0:
+        return range(0)
+    start_px = visible_start_ms * px_per_ms
+    first = math.floor(start_px / TILE_W)
+    last = math.floor((start_px + width - 1) / TILE_W)
+    return range(first, last + 1)
+
+
+def tile_origin_ms(tile_index: int, px_per_ms: float) -> float:
+    """타일 왼쪽 경계의 타임라인 시간(ms)."""
+    return tile_index * TILE_W / px_per_ms
+
+
+class TileCache:
+    """타일 키 → QPixmap LRU 캐시 (바이트 예산 기반 퇴거)."""
+
+    def __init__(self, budget_bytes: int = DEFAULT_BUDGET_BYTES) -> None:
+        self._tiles: collections.OrderedDict[Hashable, QPixmap] = collections.OrderedDict()
+        self._sizes: dict[Hashable, int] = {}
+        self._bytes = 0
+        self._budget = budget_bytes
+        # 통계 (벤치마크/디버깅용)
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def nbytes(self) -> int:
+        return self._bytes
+
+    @property
+    def budget_bytes(self) -> int:
+        return self._budget
+
+    def __len__(self) -> int:
+        return len(self._tiles)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._tiles
+
+    def get(self, key: Hashable) -> QPixmap | None:
+        """타일 조회. 히트 시 LRU 맨 뒤로 이동."""
+        pm = self._tiles.get(key)
+        if pm is None:
+            self.misses += 1
+            return None
+        self._tiles.move_to_end(key)
+        self.hits += 1
+        return pm
+
+    def put(self, key: Hashable, pixmap: QPixmap) -> None:
+        """타일 저장 후 예산 초과분을 오래된 순서로 퇴거 (방금 넣은 타일은 유지)."""
+        if key in self._tiles:
+            self._bytes -= self._sizes.pop(key)
+            del self._tiles[key]
+        size = pixmap.width() * pixmap.height() * max(pixmap.depth(), 8) // 8
+        self._tiles[key] = pixmap
+        self._sizes[key] = size
+        self._bytes += size
+        while self._bytes > self._budget and len(self._tiles) > 1:
+            old_key, _ = self._tiles.popitem(last=False)
+            self._bytes -= self._sizes.pop(old_key)
+
+    def evict(self, predicate: Callable[[Hashable], bool]) -> int:
+        """조건에 맞는 키의 타일을 제거하고 제거 개수를 반환 (레인 단위 무효화용)."""
+        stale = [key for key in self._tiles if predicate(key)]
+        for key in stale:
+            del self._tiles[key]
+            self._bytes -= self._sizes.pop(key)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._tiles.clear()
+        self._sizes.clear()
+        self._bytes = 0
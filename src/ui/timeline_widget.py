@@ -13,19 +13,31 @@ from PySide6.QtGui import (
     QDropEvent,
     QMouseEvent,
     QPaintEvent,
-    QPixmap,
     QWheelEvent,
 )
 
 
 from PySide6.QtWidgets import QInputDialog, QMenu, QWidget
 
+import numpy as np
+
 from src.models.image_overlay import ImageOverlayTrack
 from src.models.subtitle import SubtitleTrack
 from src.models.video_clip import VideoClip, VideoClipTrack
 from src.services.waveform_service import WaveformData
 from src.services.timeline_waveform_service import TimelineWaveformService
-from src.ui.timeline_painter import TimelinePainter
+from src.ui.timeline_painter import (
+    LANE_AUDIO,
+    LANE_IMAGE,
+    LANE_SUBTITLE,
+    LANE_TEXT,
+    LANE_WAVEFORM,
+    TimelinePainter,
+    bgm_lane,
+    video_lane,
+)
+from src.utils.interval_index import IntervalIndex
+from src.utils.snap_index import SnapIndex
 from src.ui.timeline_drag import DragMode, TimelineDragManager
 from src.ui.timeline_hit_test import TimelineHitTester
 from src.utils.config import TIMELINE_HEIGHT, VIDEO_EXTENSIONS
@@ -81,6 +93,8 @@ class TimelineWidget(QWidget):
     text_overlay_moved = Signal(int, int, int)  # (index, old_start_ms, new_start_ms)
 
     status_message_requested = Signal(str, int)  # (message, timeout_ms)
+    scrub_started = Signal()   # 플레이헤드 드래그 시작 (스크럽 프록시 티어 사용)
+    scrub_finished = Signal()  # 플레이헤드 드래그 종료
     clip_volume_requested = Signal(int, int)   # (track_index, clip_index)
     clip_color_requested = Signal(int, int)    # (track_index, clip_index)
     clip_bulk_color_requested = Signal(int)    # (track_index) — 트랙 전체 일괄 색보정
@@ -175,8 +189,10 @@ class TimelineWidget(QWidget):
 
         # 웨이브폼 서비스 및 데이터 캐시
         self._waveform_service = None
+        self._proxy_queue = None  # 프록시 생성 대기열 — 웨이브폼과 같은 화면 우선순위를 받는다
         self._waveform_data = None  # Global project waveform (legacy)
-        # _waveform_image_cache, _waveform_cache_key → TimelinePainter에서 관리
+        self._show_loudness: bool = False  # 클립 웨이브폼 위 short-term 라우드니스 오버레이
+        # 웨이브폼 이미지는 TimelinePainter의 정적 레이어 타일에 함께 캐시된다
 
         # 썸네일 서비스
         from src.services.timeline_thumbnail_service import TimelineThumbnailService
@@ -186,9 +202,17 @@ class TimelineWidget(QWidget):
         # 리플 편집 모드
         self._ripple_enabled: bool = False
 
-        # 정적 레이어 캐시 (눈금자+세그먼트+오디오+이미지+웨이브폼)
-        self._static_cache: QPixmap | None = None
-        self._static_cache_key: tuple | None = None
+        # 정적 레이어 콘텐츠 버전 — 전체 버전 + 레인(트랙)별 버전.
+        # 타일 캐시는 TimelinePainter가 (레인, 줌, 타일 인덱스, 레인 버전) 키로 관리한다
+        self._static_version: int = 0
+        self._lane_versions: dict = {}
+        # set_project가 마지막으로 본 모델 객체들 — 바뀌었을 때만 전체 무효화
+        self._model_objects: tuple = ()
+        # 레인 파생 데이터 메모 (공간 인덱스, 오버레이 행 배치): (lane, kind) -> (key, value)
+        self._lane_memo: dict = {}
+        # 자석 스냅 편집 지점 인덱스 + 레인별로 반영해 둔 편집 지점 배열
+        self._snap_index = SnapIndex()
+        self._snap_applied: dict = {}
 
         # 드롭 표시
         self._drop_indicator_x: float = -1
@@ -257,11 +281,123 @@ class TimelineWidget(QWidget):
         return rows
 
     def _compute_overlay_rows(self) -> list[int]:
-        return self._pack_intervals(self._image_overlay_track)
+        return self._lane_cached(LANE_IMAGE, "rows", self._image_overlay_track, self._pack_intervals)
 
     def _compute_text_overlay_rows(self) -> list[int]:
         items = self._text_overlay_track.overlays if self._text_overlay_track else []
-        return self._pack_intervals(items)
+        return self._lane_cached(LANE_TEXT, "rows", items, self._pack_intervals)
+
+    # -------------------------------------------------------- 공간 인덱스
+
+    def _lane_cached(self, lane, kind: str, items, build):
+        """레인 항목에서 파생된 값을 (전체 버전, 레인 버전, 컨테이너, 개수) 키로 메모이즈.
+
+        레인 무효화(_invalidate_lane / _invalidate_static_cache) 또는 개수 변경 시에만 재계산.
+        """
+        key = (self._static_version, self._lane_versions.get(lane, 0), id(items), len(items) if items else 0)
+        cached = self._lane_memo.get((lane, kind))
+        if cached is not None and cached[0] == key:
+            return cached[1]
+        value = build(items)
+        self._lane_memo[(lane, kind)] = (key, value)
+        return value
+
+    def _lane_index(self, lane) -> IntervalIndex:
+        """레인 항목의 시간 구간 인덱스 — 화면 범위 컬링과 히트 테스트가 O(log n + k)로 질의.
+
+        자막/TTS 오디오 레인은 같은 세그먼트 목록을 공유하므로 LANE_SUBTITLE 인덱스를 쓴다.
+        """
+        if lane in (LANE_SUBTITLE, LANE_AUDIO):
+            items = self._track.segments if self._track else []
+            return self._lane_cached(LANE_SUBTITLE, "index", items, IntervalIndex.from_items)
+        if lane == LANE_IMAGE:
+            items = self._image_overlay_track.overlays if self._image_overlay_track else []
+            return self._lane_cached(lane, "index", items, IntervalIndex.from_items)
+        if lane == LANE_TEXT:
+            items = self._text_overlay_track.overlays if self._text_overlay_track else []
+            return self._lane_cached(lane, "index", items, IntervalIndex.from_items)
+        kind, idx = lane
+        if kind == "video":
+            track = self._project.video_tracks[idx]
+            return self._lane_cached(lane, "index", track.clips, lambda _clips: self._clip_index(track))
+        track = self._bgm_tracks[idx]
+        return self._lane_cached(
+            lane, "index", track.clips,
+            lambda clips: IntervalIndex.from_items(
+                clips, end=lambda c: c.start_ms + c.duration_ms,
+            ),
+        )
+
+    @staticmethod
+    def _clip_index(track: VideoClipTrack) -> IntervalIndex:
+        """비디오 클립은 연속 배치 — 누적 경계로 시작/끝 구성."""
+        bounds = track.clip_boundaries_ms()
+        return IntervalIndex(bounds[:-1], bounds[1:])
+
+    # -------------------------------------------------------- 스냅 인덱스
+
+    def _synced_snap_index(self) -> SnapIndex:
+        """레인별 편집 지점을 스냅 인덱스에 반영. 버전이 바뀐 레인의 지점만 빼고 다시 넣는다."""
+        current = self._snap_edges()
+        applied = self._snap_applied
+        index = self._snap_index
+        for lane in [lane for lane in applied if lane not in current]:
+            index.remove(applied.pop(lane))
+        for lane, edges in current.items():
+            old = applied.get(lane)
+            if old is edges:
+                continue
+            if old is not None:
+                if np.array_equal(old, edges):
+                    applied[lane] = edges
+                    continue
+                index.remove(old)
+            index.add(edges)
+            applied[lane] = edges
+        return index
+
+    def _snap_edges(self) -> dict:
+        """스냅 대상 레인 → 편집 지점 배열 (레인 메모 — 레인이 바뀔 때만 새 배열)."""
+        edges: dict = {}
+        track = self._clip_track
+        if track and track.clips:
+            tracks = self._project.video_tracks if self._project else []
+            idx = next((i for i, vt in enumerate(tracks) if vt is track), -1)
+            edges[video_lane(idx)] = self._lane_cached(
+                video_lane(idx), "snap", track.clips,
+                lambda _clips: np.asarray(track.clip_boundaries_ms(), dtype=np.int64),
+            )
+        if self._track and len(self._track):
+            segments = self._track.segments
+            edges[LANE_SUBTITLE] = self._lane_cached(
+                LANE_SUBTITLE, "snap", segments, lambda _segs: self._index_edges(LANE_SUBTITLE),
+            )
+            edges[LANE_AUDIO] = self._lane_cached(LANE_AUDIO, "snap", segments, self._audio_edges)
+        for i, bgm in enumerate(self._bgm_tracks):
+            if bgm.clips:
+                edges[bgm_lane(i)] = self._lane_cached(
+                    bgm_lane(i), "snap", bgm.clips, lambda _clips, i=i: self._index_edges(bgm_lane(i)),
+                )
+        if self._image_overlay_track and len(self._image_overlay_track):
+            edges[LANE_IMAGE] = self._lane_cached(
+                LANE_IMAGE, "snap", self._image_overlay_track.overlays,
+                lambda _ovs: self._index_edges(LANE_IMAGE),
+            )
+        return edges
+
+    def _index_edges(self, lane) -> np.ndarray:
+        index = self._lane_index(lane)
+        return np.concatenate([index.starts, index.ends]).astype(np.int64)
+
+    @staticmethod
+    def _audio_edges(segments) -> np.ndarray:
+        """세그먼트별 TTS 오디오 구간의 시작/끝."""
+        edges = []
+        for seg in segments:
+            if seg.audio_file:
+                edges.append(seg.audio_start_ms)
+                edges.append(seg.audio_start_ms + seg.audio_duration_ms)
+        return np.asarray(edges, dtype=np.int64)
 
     def _img_overlay_total_h(self, rows: list[int]) -> int:
         """이미지 오버레이 영역의 총 높이 (행 수 기반)."""
@@ -292,15 +428,30 @@ class TimelineWidget(QWidget):
     # -------------------------------------------------------- 공개 API
 
     def set_project(self, project) -> None:
-        """Set the current project and refresh."""
+        """Set the current project and refresh.
+
+        undo/redo 후 갱신도 이 경로로 온다 — 프로젝트나 트랙 객체가 그대로면 내용 레인만 무효화한다.
+        """
+        bgm_tracks = getattr(project, "bgm_tracks", [])
+        objects = (
+            project, project.video_clip_track, project.subtitle_track,
+            project.image_overlay_track, getattr(project, "text_overlay_track", None), *bgm_tracks,
+        )
+        same = len(objects) == len(self._model_objects) and all(
+            a is b for a, b in zip(objects, self._model_objects)
+        )
+        self._model_objects = objects
         self._project = project
         self._clip_track = project.video_clip_track
         self._track = project.subtitle_track
         self._image_overlay_track = project.image_overlay_track
-        self._bgm_tracks = getattr(project, "bgm_tracks", [])
+        self._bgm_tracks = bgm_tracks
         self._duration_ms = project.duration_ms
-        self._has_video = project.has_video
-        self._invalidate_static_cache()
+        if same and self._has_video == project.has_video:
+            self._invalidate_content_lanes()
+        else:
+            self._has_video = project.has_video
+            self._invalidate_static_cache()
         self.update()
 
     def set_waveform_service(self, service: TimelineWaveformService | None) -> None:
@@ -315,16 +466,21 @@ class TimelineWidget(QWidget):
             self._waveform_service.waveform_ready.connect(self._on_waveform_ready)
         self.update()
 
+    def set_proxy_queue(self, queue) -> None:
+        """프록시 대기열 등록 — 화면에 오래 보이는 소스의 프록시가 먼저 만들어진다."""
+        self._proxy_queue = queue
+        self.update()
+
     @Slot(str, int, object)
     def _on_thumbnail_ready(self, source_path: str, timestamp_ms: int, image: object) -> None:
-        """Handle thumbnail ready signal — invalidate static cache so paintEvent redraws."""
-        self._invalidate_static_cache()
+        """Handle thumbnail ready signal — invalidate lanes showing this source so paintEvent redraws."""
+        self._invalidate_lane(*self._video_lanes_for_source(source_path))
         self.update()
 
     @Slot(str, object)
     def _on_waveform_ready(self, source_path: str, data: WaveformData) -> None:
         """Handle waveform ready signal from service."""
-        self._invalidate_static_cache()
+        self._invalidate_lane(LANE_WAVEFORM, *self._video_lanes_for_source(source_path))
         self.update()
 
     def set_primary_video_path(self, path: str | None) -> None:
@@ -334,9 +490,12 @@ class TimelineWidget(QWidget):
 
     def set_clip_track(self, track: VideoClipTrack | None) -> None:
         """Set the current active video clip track."""
+        if track is self._clip_track and track is not None:
+            self._invalidate_content_lanes()
+        else:
+            self._invalidate_static_cache()
         self._clip_track = track
         self._selected_clip_index = -1
-        self._invalidate_static_cache()
         self.update()
 
     def set_snap_fps(self, fps: int) -> None:
@@ -367,14 +526,39 @@ class TimelineWidget(QWidget):
         return ms
 
     def _invalidate_static_cache(self) -> None:
-        """정적 레이어 캐시 무효화 — 데이터/줌/스크롤 변경 시 호출."""
-        self._static_cache = None
-        self._static_cache_key = None
+        """정적 레이어 전체 무효화 — 트랙 교체 등 여러 레인이 바뀔 때 호출.
+
+        스크롤·줌은 타일 키(줌 레벨, 타일 인덱스)가, 선택은 동적 레이어가 반영하므로 호출할 필요 없다.
+        """
+        self._static_version += 1
+
+    def _invalidate_lane(self, *lanes) -> None:
+        """지정 레인(timeline_painter.LANE_* / video_lane / bgm_lane)만 무효화. 나머지 레인 타일은 재사용."""
+        for lane in lanes:
+            self._lane_versions[lane] = self._lane_versions.get(lane, 0) + 1
+
+    def _invalidate_content_lanes(self) -> None:
+        """모델 내용을 그리는 레인(비디오·자막·오버레이·BGM)만 무효화. 눈금자·전체 웨이브폼 타일은 유지."""
+        lanes = [LANE_SUBTITLE, LANE_AUDIO, LANE_IMAGE, LANE_TEXT]
+        if self._project:
+            lanes += [video_lane(i) for i in range(len(self._project.video_tracks))]
+        lanes += [bgm_lane(i) for i in range(len(self._bgm_tracks or []))]
+        self._invalidate_lane(*lanes)
+
+    def _video_lanes_for_source(self, source_path: str) -> list:
+        """source_path를 참조하는 클립이 있는 비디오 트랙 레인 목록."""
+        if not self._project:
+            return []
+        return [
+            video_lane(idx)
+            for idx, vt in enumerate(self._project.video_tracks)
+            if any(str(c.source_path or self._primary_video_path or "") == source_path for c in vt.clips)
+        ]
 
     def set_track(self, track: SubtitleTrack | None) -> None:
         self._track = track
         self._selected_index = -1
-        self._invalidate_static_cache()
+        self._invalidate_lane(LANE_SUBTITLE, LANE_AUDIO)
         self.update()
 
     def set_bgm_tracks(self, tracks: list) -> None:
@@ -383,6 +567,8 @@ class TimelineWidget(QWidget):
         self.update()
 
     def set_duration(self, duration_ms: int, has_video: bool | None = None) -> None:
+        # 길이·비디오 여부가 그대로면 타일은 유효하다 (줌이 바뀌면 타일 키가 바뀐다)
+        changed = duration_ms != self._duration_ms or (has_video is not None and has_video != self._has_video)
         self._duration_ms = duration_ms
         if has_video is not None:
             self._has_video = has_video
@@ -390,7 +576,8 @@ class TimelineWidget(QWidget):
         # _px_per_ms 즉시 초기화 (paintEvent 전에도 set_playhead 등이 올바로 작동하도록)
         if duration_ms > 0 and self.width() > 0:
             self._px_per_ms = self.width() / float(duration_ms)
-        self._invalidate_static_cache()
+        if changed:
+            self._invalidate_static_cache()
         self.update()
 
     def get_playhead(self) -> int:
@@ -418,31 +605,28 @@ class TimelineWidget(QWidget):
 
     def select_segment(self, index: int) -> None:
         self._selected_index = index
-        self._invalidate_static_cache()
         self.update()
 
     def set_image_overlay_track(self, track: ImageOverlayTrack | None) -> None:
         self._image_overlay_track = track
         self._selected_overlay_index = -1
-        self._invalidate_static_cache()
+        self._invalidate_lane(LANE_IMAGE)
         self.update()
 
     def select_image_overlay(self, index: int) -> None:
         self._selected_overlay_index = index
-        self._invalidate_static_cache()
         self.update()
 
     def set_text_overlay_track(self, track) -> None:
         """Set the text overlay track for timeline display."""
         self._text_overlay_track = track
         self._selected_text_overlay_index = -1
-        self._invalidate_static_cache()
+        self._invalidate_lane(LANE_TEXT)
         self.update()
 
     def select_text_overlay(self, index: int) -> None:
         """Select a text overlay by index."""
         self._selected_text_overlay_index = index
-        self._invalidate_static_cache()
         self.update()
 
     def select_clip(self, track_index: int, clip_index: int) -> None:
@@ -452,7 +636,6 @@ class TimelineWidget(QWidget):
             self._selected_clips = {(track_index, clip_index)}
         else:
             self._selected_clips = set()
-        self._invalidate_static_cache()
         self.update()
 
     def get_selected_clips(self) -> list[tuple[int, int]]:
@@ -481,7 +664,6 @@ class TimelineWidget(QWidget):
             return
         self._visible_start_ms = 0
         self._px_per_ms = self.width() / float(self._duration_ms)
-        self._invalidate_static_cache()
         self.zoom_changed.emit(self.get_zoom_percent())
         self.update()
 
@@ -494,7 +676,6 @@ class TimelineWidget(QWidget):
         self._visible_start_ms = max(0.0, center_ms - new_range / 2.0)
         self._px_per_ms = self.width() / new_range
         self._clamp_visible_start(new_range)
-        self._invalidate_static_cache()
         self.zoom_changed.emit(self.get_zoom_percent())
         self.update()
 
@@ -512,7 +693,6 @@ class TimelineWidget(QWidget):
         self._visible_start_ms = max(0.0, center_ms - new_range / 2.0)
         self._px_per_ms = self.width() / new_range
         self._clamp_visible_start(new_range)
-        self._invalidate_static_cache()
         self.zoom_changed.emit(self.get_zoom_percent())
         self.update()
 
@@ -529,20 +709,30 @@ class TimelineWidget(QWidget):
     def set_waveform(self, waveform_data) -> None:
         """미리 계산된 웨이브폼 데이터 설정 후 표시."""
         self._waveform_data = waveform_data
-        self._painter._waveform_image_cache = None
-        self._painter._waveform_cache_key = None
-        self._invalidate_static_cache()
+        self._invalidate_lane(LANE_WAVEFORM)
         self.update()
 
+    def waveform(self):
+        """원본 비디오 오디오의 WaveformData (없으면 None)."""
+        return self._waveform_data
+
     def clear_waveform(self) -> None:
         """웨이브폼 제거."""
         self._waveform_service = None
         self._waveform_data = None  # Global project waveform (legacy)
-        self._painter._waveform_image_cache = None
-        self._painter._waveform_cache_key = None
         self._invalidate_static_cache()
         self.update()
 
+    def set_loudness_overlay(self, enabled: bool) -> None:
+        """클립 웨이브폼 위 라우드니스(LUFS) 곡선 표시 여부."""
+        self._show_loudness = enabled
+        if self._project:
+            self._invalidate_lane(*(video_lane(i) for i in range(len(self._project.video_tracks))))
+        self.update()
+
+    def is_loudness_overlay_enabled(self) -> bool:
+        return self._show_loudness
+
     def set_ripple_mode(self, enabled: bool) -> None:
         """Set ripple edit mode."""
         self._ripple_enabled = enabled
@@ -561,7 +751,6 @@ class TimelineWidget(QWidget):
         new_w = event.size().width()
         if old_w > 0 and new_w > 0 and self._px_per_ms > 0:
             self._px_per_ms = self._px_per_ms * new_w / old_w
-            self._invalidate_static_cache()
 
     def paintEvent(self, event: QPaintEvent) -> None:
         self._painter.paint()
@@ -656,7 +845,6 @@ class TimelineWidget(QWidget):
                     self._selected_clips = {(v_idx, seg_idx)}
                     self._selected_clip_track_index = v_idx
                     self._selected_clip_index = seg_idx
-                self._invalidate_static_cache()
                 self.update()
                 return
             dm.start_pan_view(x)
@@ -675,7 +863,7 @@ class TimelineWidget(QWidget):
 
         # 플레이헤드 드래그
         if hit == "playhead":
-            dm.start_playhead()
+            dm.start_playhead(x)
             return
 
         # 비디오 클립 영역
@@ -711,7 +899,6 @@ class TimelineWidget(QWidget):
                         self._selected_clips.add(key)
                         self._selected_clip_track_index = v_idx
                         self._selected_clip_index = seg_idx
-                    self._invalidate_static_cache()
                     self.update()
                     return
                 else:
@@ -1035,7 +1222,6 @@ class TimelineWidget(QWidget):
             state_msg = tr("Ripple Edit ON") if self._ripple_enabled else tr("Ripple Edit OFF")
             self.status_message_requested.emit(state_msg, 2000)
             # 리플 모드 상태에 따라 커서나 배경 등을 변경하여 시각적 피드백을 줄 수 있음
-            self._invalidate_static_cache()
             self.update()
 
     def wheelEvent(self, event: QWheelEvent) -> None:
@@ -1058,7 +1244,6 @@ class TimelineWidget(QWidget):
             self._visible_start_ms = max(0.0, mouse_ms - new_range * mouse_frac)
             self._clamp_visible_start(new_range)
             self.zoom_changed.emit(self.get_zoom_percent())
-        self._invalidate_static_cache()
         self.update()
 
     def _hit_test(self, x: float, y: float) -> tuple[int, str, int]:
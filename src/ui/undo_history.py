@@ -0,0 +1,164 @@
+"""QUndoStack 기록을 바이트 한도 안으로 유지한다."""
+
+from __future__ import annotations
+
+import weakref
+
+from PySide6.QtGui import QUndoCommand, QUndoStack
+
+from src.utils.undo_memory import UndoMemoryBudget, history_bytes, release_history
+
+
+def _command_bytes(command: QUndoCommand, seen: set[int]) -> int:
+    """매크로(beginMacro로 묶인 명령)는 자식 명령 크기를 합산."""
+    total = history_bytes(command, seen)
+    for i in range(command.childCount()):
+        total += _command_bytes(command.child(i), seen)
+    return total
+
+
+def _release(command: QUndoCommand) -> None:
+    release_history(command)
+    for i in range(command.childCount()):
+        _release(command.child(i))
+
+
+class UndoHistoryBudget:
+    """undo 기록이 limit_bytes를 넘으면 가장 오래된 명령부터 버린다.
+
+    버린 명령은 기록을 놓고 obsolete로 표시된다 — QUndoStack은 undo가 그 명령에 닿으면
+    실행하지 않고 스택에서 제거한다. 명령 크기는 스택에 쌓일 때 한 번만 재고 합계를 따로
+    유지한다(undo/redo 이동은 무시). 공유 스냅샷 청크는 처음 센 명령에 계상되므로, 그 명령이
+    버려지면 더 새 명령이 함께 쥔 청크는 set_limit_bytes가 다시 셀 때까지 합계에서 빠진다.
+    스택은 약한 참조로만 붙잡는다 (파괴 중인 스택이 보내는 indexChanged는 무시).
+    """
+
+    def __init__(self, stack: QUndoStack, limit_bytes: int) -> None:
+        self._stack_ref = weakref.ref(stack)
+        self._budget = UndoMemoryBudget(limit_bytes, _command_bytes)
+        # 스택 순서의 [명령, 바이트, 센 객체 id] — 버린 명령은 0바이트. 앞의 _dropped개가 버린 명령
+        self._entries: list[list] = []
+        self._dropped = 0
+        self._bytes = 0
+        self._seen: set[int] = set()
+        self._last_top = self._top(stack)
+        self._recount(stack)
+        stack.indexChanged.connect(self._on_index_changed)
+
+    @property
+    def limit_bytes(self) -> int:
+        return self._budget.limit_bytes
+
+    def set_limit_bytes(self, limit_bytes: int) -> None:
+        self._budget.limit_bytes = limit_bytes
+        stack = self._stack_ref()
+        if stack is not None:
+            self._recount(stack)
+        self.enforce()
+
+    def history_bytes(self) -> int:
+        """남은 undo 기록 크기 추정 (공유 스냅샷 청크는 한 번만 계상)."""
+        return self._bytes
+
+    def enforce(self) -> int:
+        """한도를 넘는 만큼 오래된 명령을 버리고 그 수를 반환."""
+        stack = self._stack_ref()
+        if stack is None:
+            return 0
+        self._sync(stack)
+        # 현재 위치 아래(undo 가능한) 명령만 버린다 — redo 쪽은 건드리지 않음
+        undoable = min(stack.index(), len(self._entries))
+        drop = 0
+        while self._bytes > self._budget.limit_bytes and self._dropped < undoable:
+            entry = self._entries[self._dropped]
+            _release(entry[0])
+            entry[0].setObsolete(True)
+            self._forget(entry)
+            self._dropped += 1
+            drop += 1
+        return drop
+
+    def _recount(self, stack: QUndoStack) -> None:
+        """스택 전체를 처음부터 다시 센다 (생성 시·한도 변경 시)."""
+        self._entries = []
+        self._dropped = 0
+        self._bytes = 0
+        self._seen = set()
+        for i in range(stack.count()):
+            cmd = stack.command(i)
+            if cmd.isObsolete() and self._dropped == len(self._entries):
+                self._entries.append([cmd, 0, ()])
+                self._dropped += 1
+            else:
+                self._add(cmd)
+
+    def _sync(self, stack: QUndoStack) -> None:
+        """지난 호출 뒤 스택 변화를 반영 — 사라진 명령은 빼고 새 명령만 잰다.
+
+        QUndoStack은 push할 때 redo 쪽 꼬리를 지우고, undo가 버린 명령에 닿으면 그것을 지운다.
+        버린 명령은 맨 앞 덩어리이고 undo는 위에서 내려오므로 그 덩어리의 끝부터 사라진다.
+        """
+        count = stack.count()
+        entries = self._entries
+        while self._dropped and (
+            self._dropped > count or stack.command(self._dropped - 1) is not entries[self._dropped - 1][0]
+        ):
+            del entries[self._dropped - 1]  # 이미 0바이트
+            self._dropped -= 1
+        # 남은 명령은 접두사 — 위에서부터 처음 일치하는 위치를 찾는다 (보통 한두 번 비교)
+        keep = min(len(entries), count)
+        while keep > self._dropped and stack.command(keep - 1) is not entries[keep - 1][0]:
+            keep -= 1
+        for entry in entries[keep:]:
+            self._forget(entry)
+        del entries[keep:]
+        for i in range(keep, count):
+            self._add(stack.command(i))
+
+    def _add(self, cmd: QUndoCommand) -> None:
+        claimed = _ClaimedIds(self._seen)
+        size = _command_bytes(cmd, claimed)
+        self._entries.append([cmd, size, claimed.ids])
+        self._bytes += size
+
+    def _forget(self, entry: list) -> None:
+        self._bytes -= entry[1]
+        self._seen.difference_update(entry[2])
+        entry[1], entry[2] = 0, ()
+
+    @staticmethod
+    def _top(stack: QUndoStack) -> tuple[int, int]:
+        count = stack.count()
+        return count, id(stack.command(count - 1)) if count else 0
+
+    def _on_index_changed(self, _index: int) -> None:
+        stack = self._stack_ref()
+        if stack is None:
+            return
+        try:
+            top = self._top(stack)
+        except RuntimeError:  # 파괴 중인 스택
+            return
+        if top != self._last_top:
+            self._last_top = top
+            self.enforce()
+
+
+class _ClaimedIds:
+    """approx_bytes용 seen — 전체 기록의 seen을 공유하면서 이 명령이 새로 센 id를 따로 모은다.
+
+    명령이 스택에서 사라지면 그 id를 돌려줘서, 재사용된 id의 새 객체가 빠지지 않게 한다.
+    """
+
+    __slots__ = ("_seen", "ids")
+
+    def __init__(self, seen: set[int]) -> None:
+        self._seen = seen
+        self.ids: list[int] = []
+
+    def __contains__(self, key: int) -> bool:
+        return key in self._seen
+
+    def add(self, key: int) -> None:
+        self._seen.add(key)
+        self.ids.append(key)
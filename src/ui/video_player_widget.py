@@ -23,6 +23,7 @@ from src.models.style import SubtitleStyle
 from src.models.subtitle import SubtitleSegment, SubtitleTrack
 from src.models.overlay_template import OverlayTemplate
 from src.models.text_overlay import TextOverlayTrack
+from src.utils.playback_cursor import PlaybackCursor
 
 
 class VideoPlayerWidget(QGraphicsView):
@@ -81,6 +82,10 @@ class VideoPlayerWidget(QGraphicsView):
         self._text_overlay_track: TextOverlayTrack | None = None
         self._text_overlay_items: dict[int, QGraphicsTextItem] = {}
         self._text_overlay_active_indices: set[int] = set()
+        self._text_overlay_applied: dict[int, tuple] = {}
+
+        # 트랙별 재생 커서: slot → ((id(track), version, id(list), len), PlaybackCursor)
+        self._playback_cursors: dict[str, tuple[tuple, PlaybackCursor]] = {}
 
         # PIP selection and dragging
         self._selected_pip_index: int = -1
@@ -113,6 +118,8 @@ class VideoPlayerWidget(QGraphicsView):
 
         # Connect player position to subtitle update
         self._player.positionChanged.connect(self._on_position_changed)
+        # 재생/정지 전환 시 커서를 새로 맞춘다 — 정지 중 직접 수정된 시간도 반영
+        self._player.playbackStateChanged.connect(self._reset_playback_cursors)
 
     def set_default_style(self, style: SubtitleStyle) -> None:
         """Set the default style used when a segment has no per-segment style."""
@@ -125,6 +132,7 @@ class VideoPlayerWidget(QGraphicsView):
         self._subtitle_track = track
         # Force update by clearing cache
         self._current_subtitle_text = ""
+        self._playback_cursors.pop("subtitle", None)
         try:
             self._update_subtitle(self._player.position())
         except RuntimeError:
@@ -140,13 +148,37 @@ class VideoPlayerWidget(QGraphicsView):
         self._update_image_overlays(position_ms)
         self._update_text_overlays(position_ms)
 
+    def _playback_cursor(self, slot: str, track, items: list) -> tuple[PlaybackCursor, bool]:
+        """slot의 재생 커서와 새로 만들었는지 여부. 트랙·목록·버전이 바뀌면 재구축."""
+        key = (id(track), track.version, id(items), len(items))
+        cached = self._playback_cursors.get(slot)
+        if cached is not None and cached[0] == key:
+            return cached[1], False
+        cursor = PlaybackCursor([x.start_ms for x in items], [x.end_ms for x in items])
+        self._playback_cursors[slot] = (key, cursor)
+        return cursor, True
+
+    def _reset_playback_cursors(self, *_args) -> None:
+        self._playback_cursors.clear()
+
     def _update_subtitle(self, position_ms: int) -> None:
         if not self._subtitle_track or self._subtitle_track.hidden:
             self._subtitle_item.setVisible(False)
             self._current_subtitle_text = ""
+            self._playback_cursors.pop("subtitle", None)
             return
 
-        seg = self._subtitle_track.segment_at(position_ms)
+        # 재생 커서가 활성 집합을 변화분만으로 유지 — 표시할 것은 가장 늦게 시작한 활성 세그먼트
+        segments = self._subtitle_track.segments
+        cursor, _ = self._playback_cursor("subtitle", self._subtitle_track, segments)
+        cursor.advance(position_ms)
+        seg = segments[max(cursor.active)] if cursor.active else None
+        if seg is not None and not seg.start_ms <= position_ms < seg.end_ms:
+            # 버전 갱신 없이 시간이 바뀐 세그먼트 — 커서를 다시 만든다
+            self._playback_cursors.pop("subtitle", None)
+            cursor, _ = self._playback_cursor("subtitle", self._subtitle_track, segments)
+            cursor.seek(position_ms)
+            seg = segments[max(cursor.active)] if cursor.active else None
         if seg:
             style = self._get_effective_style(seg)
             if seg.text != self._current_subtitle_text:
@@ -323,6 +355,7 @@ class VideoPlayerWidget(QGraphicsView):
             self._scene.removeItem(item)
         self._pip_items.clear()
         self._pip_active_indices.clear()
+        self._playback_cursors.pop("image", None)
         self._selected_pip_index = -1
         if self._selection_border:
             self._selection_border.setVisible(False)
@@ -339,42 +372,46 @@ class VideoPlayerWidget(QGraphicsView):
             for item in self._pip_items.values():
                 item.setVisible(False)
             self._pip_active_indices.clear()
+            self._playback_cursors.pop("image", None)
             return
 
-        active = self._image_overlay_track.overlays_at(position_ms)
-        active_indices = set()
-        for ov in active:
-            idx = self._image_overlay_track.overlays.index(ov)
-            active_indices.add(idx)
+        # 재생 커서의 진입/이탈 이벤트만 반영 — 틱마다 활성 집합을 다시 질의하지 않는다
+        overlays = self._image_overlay_track.overlays
+        cursor, fresh = self._playback_cursor("image", self._image_overlay_track, overlays)
+        entered, exited = cursor.advance(position_ms)
+        if fresh:
+            entered = sorted(cursor.active - self._pip_active_indices)
+            exited = sorted(self._pip_active_indices - cursor.active)
 
+        # Hide deactivated overlays
+        for idx in exited:
+            if idx in self._pip_items:
+                self._pip_items[idx].setVisible(False)
+
+        for idx in entered:
+            ov = overlays[idx]
             if idx not in self._pip_items:
                 pip = QGraphicsPixmapItem()
                 pip.setZValue(7)
                 self._scene.addItem(pip)
                 self._pip_items[idx] = pip
 
+            # Newly activated: load and position
             pip = self._pip_items[idx]
-            if idx not in self._pip_active_indices:
-                # Newly activated: load and position
-                pixmap = QPixmap(ov.image_path)
-                if pixmap.isNull():
-                    pip.setVisible(False)
-                    continue
-                view_w = self.viewport().width()
-                view_h = self.viewport().height()
-                target_w = max(1, int(view_w * ov.scale_percent / 100))
-                scaled = pixmap.scaledToWidth(target_w, Qt.TransformationMode.SmoothTransformation)
-                pip.setPixmap(scaled)
-                pip.setOpacity(ov.opacity)
-                pip.setPos(view_w * ov.x_percent / 100, view_h * ov.y_percent / 100)
-                pip.setVisible(True)
-
-        # Hide deactivated overlays
-        for idx in self._pip_active_indices - active_indices:
-            if idx in self._pip_items:
-                self._pip_items[idx].setVisible(False)
-
-        self._pip_active_indices = active_indices
+            pixmap = QPixmap(ov.image_path)
+            if pixmap.isNull():
+                pip.setVisible(False)
+                continue
+            view_w = self.viewport().width()
+            view_h = self.viewport().height()
+            target_w = max(1, int(view_w * ov.scale_percent / 100))
+            scaled = pixmap.scaledToWidth(target_w, Qt.TransformationMode.SmoothTransformation)
+            pip.setPixmap(scaled)
+            pip.setOpacity(ov.opacity)
+            pip.setPos(view_w * ov.x_percent / 100, view_h * ov.y_percent / 100)
+            pip.setVisible(True)
+
+        self._pip_active_indices = set(cursor.active)
 
         # Update selection border if selected PIP is visible
         if self._selected_pip_index >= 0:
@@ -390,6 +427,8 @@ class VideoPlayerWidget(QGraphicsView):
             self._scene.removeItem(item)
         self._text_overlay_items.clear()
         self._text_overlay_active_indices.clear()
+        self._text_overlay_applied.clear()
+        self._playback_cursors.pop("text", None)
         # Immediately render overlays at current position
         if self._player:
             try:
@@ -405,14 +444,31 @@ class VideoPlayerWidget(QGraphicsView):
             for item in self._text_overlay_items.values():
                 item.setVisible(False)
             self._text_overlay_active_indices.clear()
+            self._text_overlay_applied.clear()
+            self._playback_cursors.pop("text", None)
             return
 
-        active = self._text_overlay_track.overlays_at(position_ms)
-        active_indices = set()
+        overlays = self._text_overlay_track.overlays
+        cursor, fresh = self._playback_cursor("text", self._text_overlay_track, overlays)
+        entered, exited = cursor.advance(position_ms)
+        if fresh:
+            entered = sorted(cursor.active - self._text_overlay_active_indices)
+            exited = sorted(self._text_overlay_active_indices - cursor.active)
 
-        for overlay in active:
-            idx = self._text_overlay_track.overlays.index(overlay)
-            active_indices.add(idx)
+        # Hide deactivated overlays
+        for idx in exited:
+            if idx in self._text_overlay_items:
+                self._text_overlay_items[idx].setVisible(False)
+            self._text_overlay_applied.pop(idx, None)
+
+        entered_set = set(entered)
+        for idx in cursor.active:
+            overlay = overlays[idx]
+            # 내용/스타일은 진입 시 또는 편집으로 바뀌었을 때만 다시 적용 (폰트 생성 비용)
+            signature = (overlay.text, id(overlay.style), overlay.opacity, id(self._default_style))
+            if idx not in entered_set and self._text_overlay_applied.get(idx) == signature:
+                continue
+            self._text_overlay_applied[idx] = signature
 
             # Create text item if not exists
             if idx not in self._text_overlay_items:
@@ -437,7 +493,7 @@ class VideoPlayerWidget(QGraphicsView):
             text_item.setDefaultTextColor(QColor(style.font_color))
             text_item.setOpacity(overlay.opacity)
 
-            if idx not in self._text_overlay_active_indices:
+            if idx in entered_set:
                 # Newly activated: apply position based on percentage and alignment
                 view_w = self.viewport().width()
                 view_h = self.viewport().height()
@@ -464,12 +520,7 @@ class VideoPlayerWidget(QGraphicsView):
                 text_item.setPos(x_px + off_x, y_px + off_y)
                 text_item.setVisible(True)
 
-        # Hide deactivated overlays
-        for idx in self._text_overlay_active_indices - active_indices:
-            if idx in self._text_overlay_items:
-                self._text_overlay_items[idx].setVisible(False)
-
-        self._text_overlay_active_indices = active_indices
+        self._text_overlay_active_indices = set(cursor.active)
         
         # Update selection border if selected text is affected
         if self._selected_text_index >= 0:
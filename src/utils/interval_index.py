@@ -0,0 +1,95 @@
+"""구간 범위 질의 인덱스 (Qt 의존 없음).
+
+시작 시간으로 정렬한 배열 + 끝 시간의 prefix-max 배열로 겹침 질의를 처리한다
+(CLRS Ch.14 구간 트리의 정적 배열판). 이진 탐색 2회로 후보 구간을 좁힌 뒤
+NumPy로 벡터 필터링하므로 질의 비용은 O(log n + 후보 수)이다.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Iterable, Sequence
+
+import numpy as np
+
+
+class IntervalIndex:
+    """정적 구간 [start, end] 집합. 항목이 바뀌면 새로 생성한다 (생성 O(n log n))."""
+
+    __slots__ = ("starts", "ends", "_order", "_sorted_starts", "_sorted_ends", "_max_end")
+
+    def __init__(self, starts: Sequence[float], ends: Sequence[float]) -> None:
+        # 원래 순서의 시작/끝 (인덱스로 직접 조회용)
+        self.starts = np.asarray(starts, dtype=np.float64)
+        self.ends = np.asarray(ends, dtype=np.float64)
+        self._order = np.argsort(self.starts, kind="stable")
+        self._sorted_starts = self.starts[self._order]
+        self._sorted_ends = self.ends[self._order]
+        # prefix-max: 정렬 순서상 앞쪽 구간들의 끝 최댓값 — 단조 증가이므로 이진 탐색 가능
+        self._max_end = (
+            np.maximum.accumulate(self._sorted_ends) if len(self._sorted_ends) else self._sorted_ends
+        )
+
+    @classmethod
+    def from_items(
+        cls,
+        items: Iterable,
+        start: Callable[[object], float] = lambda item: item.start_ms,
+        end: Callable[[object], float] = lambda item: item.end_ms,
+    ) -> IntervalIndex:
+        items = list(items)
+        return cls([start(it) for it in items], [end(it) for it in items])
+
+    def __len__(self) -> int:
+        return len(self.starts)
+
+    def overlapping(self, lo: float, hi: float) -> np.ndarray:
+        """start <= hi 이고 end >= lo 인 항목 인덱스를 원래 순서(오름차순)로 반환."""
+        if len(self.starts) == 0 or hi < lo:
+            return np.empty(0, dtype=np.intp)
+        # 시작이 hi 이하인 후보: 정렬 배열의 [0, k)
+        k = int(np.searchsorted(self._sorted_starts, hi, side="right"))
+        # 그 중 prefix-max 끝이 lo 미만인 앞부분은 어떤 항목도 lo에 닿지 않는다
+        j = int(np.searchsorted(self._max_end[:k], lo, side="left"))
+        if j >= k:
+            return np.empty(0, dtype=np.intp)
+        hit = self._sorted_ends[j:k] >= lo
+        return np.sort(self._order[j:k][hit])
+
+    def at(self, ms: float) -> np.ndarray:
+        """ms를 포함하는(start <= ms <= end) 항목 인덱스."""
+        return self.overlapping(ms, ms)
+
+    def coverage(
+        self, origin: float, units_per_bin: float, n_bins: int, indices: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """bin i = [origin + i/units_per_bin, origin + (i+1)/units_per_bin)을 항목이 덮는 비율의 합.
+
+        구간이 bin을 완전히 덮으면 1, 일부만 덮으면 그 비율 (겹치는 항목은 합산되어 1을 넘을 수 있음).
+        완전히 덮는 bin은 차분 배열, 양 끝 부분 bin은 np.add.at으로 누적 — O(k + n_bins).
+        indices를 주면 그 항목만 센다 (기본: 범위와 겹치는 전체 항목).
+        """
+        cov = np.zeros(max(n_bins, 0), dtype=np.float64)
+        if n_bins <= 0 or units_per_bin <= 0:
+            return cov
+        if indices is None:
+            indices = self.overlapping(origin, origin + n_bins / units_per_bin)
+        if len(indices) == 0:
+            return cov
+        x1 = np.clip((self.starts[indices] - origin) * units_per_bin, 0, n_bins)
+        x2 = np.clip((self.ends[indices] - origin) * units_per_bin, 0, n_bins)
+        b1 = np.floor(x1).astype(np.intp)
+        b2 = np.floor(x2).astype(np.intp)
+        same = b1 == b2
+        # 한 bin 안에 들어가는 항목: 길이만큼
+        inside = same & (b1 < n_bins)
+        np.add.at(cov, b1[inside], x2[inside] - x1[inside])
+        # 여러 bin에 걸친 항목: 앞쪽 부분 bin + 완전히 덮는 bin들 + 뒤쪽 부분 bin
+        span = ~same
+        np.add.at(cov, b1[span], (b1[span] + 1) - x1[span])
+        tail = span & (b2 < n_bins)
+        np.add.at(cov, b2[tail], x2[tail] - b2[tail])
+        diff = np.zeros(n_bins + 1, dtype=np.float64)
+        np.add.at(diff, b1[span] + 1, 1.0)
+        np.add.at(diff, b2[span], -1.0)
+        cov += np.cumsum(diff[:n_bins])
+        return cov
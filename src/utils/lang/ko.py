@@ -176,6 +176,7 @@ STRINGS: dict[str, str] = {
     "Background volume:": "배경 볼륨:",
     "TTS volume:": "TTS 볼륨:",
     "Apply per-segment volumes": "세그먼트별 볼륨 적용",
+    "Normalize loudness (-14 LUFS)": "라우드니스 정규화 (-14 LUFS)",
     "BGM Ducking": "BGM 덕킹",
     "Enable Auto-Ducking": "자동 덕킹 활성화",
     "Duck Level:": "덕킹 레벨:",
@@ -462,6 +463,9 @@ STRINGS: dict[str, str] = {
     "The file": "파일",
     "no longer exists.": "이(가) 더 이상 존재하지 않습니다.",
     "Autosaved": "자동 저장됨",
+    "Autosave failed": "자동 저장 실패",
+    "Loading project": "프로젝트 불러오는 중",
+    "Relinked moved media": "옮겨진 미디어 다시 연결됨",
     "Do you want to import this SRT file as a new track?":
         "이 SRT 파일을 새 트랙으로 가져오시겠습니까?",
     "Waveform loaded": "웨이브폼 로드됨",
@@ -519,6 +523,7 @@ STRINGS: dict[str, str] = {
     "Playback Speed": "재생 속도",
     "Edit Clip Properties": "클립 속성 편집",
     "Proxy generated": "프록시 생성 완료",
+    "Resuming proxy generation": "프록시 생성 이어서 진행",
     "Generate Proxy": "프록시 생성",
     "Cancel Proxy Generation": "프록시 생성 취소",
     "Proxy generation canceled": "프록시 생성이 취소되었습니다",
@@ -526,6 +531,13 @@ STRINGS: dict[str, str] = {
     "Extracting frames for preview...": "미리보기용 프레임 추출 중...",
     "Frame cache ready": "프레임 캐시 준비 완료",
     "Frame cache unavailable": "프레임 캐시 사용 불가",
+    "Importing media": "미디어 가져오는 중",
+    "Media ready": "미디어 준비 완료",
+    "proxy": "프록시",
+    "frames": "프레임",
+    "thumbnails": "썸네일",
+    "poster": "포스터",
+    "waveform": "파형",
     "Copy Log": "로그 복사",
     "Log copied to clipboard": "로그가 클립보드에 복사되었습니다",
     "Generating...": "생성 중...",
@@ -537,6 +549,7 @@ STRINGS: dict[str, str] = {
     "Ripple Edit Mode": "리플 편집 모드",
     "Ripple Edit ON": "리플 편집 켜짐",
     "Ripple Edit OFF": "리플 편집 꺼짐",
+    "Show &Loudness Overlay": "라우드니스 오버레이 표시(&L)",
     "Frame Snap ON": "프레임 스냅 켜짐",
     "Frame Snap OFF": "프레임 스냅 꺼짐",
     "When enabled, deleting or trimming clips will move subsequent clips and subtitles.": "활성화 시, 클립을 삭제하거나 조절하면 뒤에 있는 클립과 자막이 함께 이동합니다.",
@@ -0,0 +1,98 @@
+"""Monotonic playback cursor over a static interval set (pure Python, no Qt dependency).
+
+재생 중 플레이헤드는 앞으로만 움직이므로, 틱마다 "지금 활성인 항목"을 새로 질의하는 대신
+시작/끝 이벤트를 미리 정렬해 두고 포인터 두 개로 쓸어 간다(sweep line, de Berg Ch.2).
+틱 비용은 그 사이에 들어오고 나간 항목 수 O(changes)이며, 뒤로 가거나 멀리 건너뛰면
+이진 탐색 한 번으로 포인터를 다시 맞춘다(seek). 구간은 반열린 [start, end), 길이 0은 무시.
+"""
+
+from __future__ import annotations
+
+import bisect
+from typing import Sequence
+
+# 한 틱에 이보다 많은 시작 이벤트를 건너뛰면 쓸기 대신 seek (점프·빨리감기)
+_MAX_SWEEP_EVENTS = 64
+
+
+class PlaybackCursor:
+    """구간 목록의 활성 집합을 재생 위치에 따라 유지.
+
+    seek/advance는 (entered, exited) 인덱스 목록(오름차순)을 돌려준다 —
+    소비자는 폴링 대신 이 변화분만 반영하면 된다.
+    """
+
+    __slots__ = (
+        "_starts", "_ends", "_enter", "_enter_starts", "_max_end",
+        "_exit", "_exit_ends", "_next_enter", "_next_exit", "_pos", "active",
+    )
+
+    def __init__(self, starts: Sequence[int], ends: Sequence[int]) -> None:
+        self._starts = list(starts)
+        self._ends = list(ends)
+        live = [i for i in range(len(self._starts)) if self._ends[i] > self._starts[i]]
+        self._enter = sorted(live, key=lambda i: self._starts[i])
+        self._enter_starts = [self._starts[i] for i in self._enter]
+        # 시작 순서 기준 끝의 누적 최댓값 — seek 시 아직 끝나지 않았을 수 있는 첫 항목을 이진 탐색
+        self._max_end: list[int] = []
+        running = None
+        for i in self._enter:
+            end = self._ends[i]
+            running = end if running is None or end > running else running
+            self._max_end.append(running)
+        self._exit = sorted(live, key=lambda i: self._ends[i])
+        self._exit_ends = [self._ends[i] for i in self._exit]
+        self._next_enter = 0
+        self._next_exit = 0
+        self._pos: int | None = None
+        self.active: set[int] = set()
+
+    def __len__(self) -> int:
+        return len(self._starts)
+
+    @property
+    def position(self) -> int | None:
+        return self._pos
+
+    def seek(self, position: int) -> tuple[list[int], list[int]]:
+        """position에서 활성 집합을 다시 계산 — O(log n + k)."""
+        hi = bisect.bisect_right(self._enter_starts, position)
+        lo = bisect.bisect_right(self._max_end, position, hi=hi)
+        ends = self._ends
+        active = {i for i in self._enter[lo:hi] if ends[i] > position}
+        self._next_enter = hi
+        self._next_exit = bisect.bisect_right(self._exit_ends, position)
+        self._pos = position
+        old, self.active = self.active, active
+        return sorted(active - old), sorted(old - active)
+
+    def advance(self, position: int) -> tuple[list[int], list[int]]:
+        """앞으로 이동하며 들어오고 나간 항목만 처리. 뒤로 가거나 멀리 건너뛰면 seek."""
+        if self._pos is None or position < self._pos:
+            return self.seek(position)
+        stop = bisect.bisect_right(self._enter_starts, position, lo=self._next_enter)
+        if stop - self._next_enter > _MAX_SWEEP_EVENTS:
+            return self.seek(position)
+        entered: list[int] = []
+        exited: list[int] = []
+        active = self.active
+        ends = self._ends
+        for i in self._enter[self._next_enter:stop]:
+            # 한 틱 안에 시작하고 끝난 항목은 들어오지도 나가지도 않은 것으로 본다
+            if ends[i] > position:
+                active.add(i)
+                entered.append(i)
+        self._next_enter = stop
+        exit_ends = self._exit_ends
+        j = self._next_exit
+        while j < len(exit_ends) and exit_ends[j] <= position:
+            i = self._exit[j]
+            if i in active:
+                active.discard(i)
+                exited.append(i)
+            j += 1
+        self._next_exit = j
+        self._pos = position
+        entered.sort()
+        exited.sort()
+        return entered, exited
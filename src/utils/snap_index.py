@@ -0,0 +1,101 @@
+"""자석 스냅 후보 인덱스 (Qt 의존 없음).
+
+편집 지점(ms)을 정렬된 NumPy 배열 + 참조 카운트로 보관한다. 같은 시각을 여러 항목이
+공유할 수 있으므로(맞닿은 클립 경계 등) 카운트가 0이 될 때만 시각이 사라진다.
+갱신은 바뀐 항목들의 시각만 병합하며, 배열은 매번 새로 만들어지므로
+스냅샷(SnapCandidates)은 이후 갱신의 영향을 받지 않는다.
+"""
+
+from __future__ import annotations
+
+from collections import Counter
+from typing import Iterable
+
+import numpy as np
+
+
+class SnapIndex:
+    """편집 지점 멀티셋 — times는 정렬·중복 없음, counts[i]는 times[i]의 참조 수."""
+
+    __slots__ = ("times", "counts")
+
+    def __init__(self) -> None:
+        self.times = np.empty(0, dtype=np.int64)
+        self.counts = np.empty(0, dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.times)
+
+    def add(self, times: Iterable[int] | np.ndarray) -> None:
+        self._apply(np.asarray(times, dtype=np.int64), 1)
+
+    def remove(self, times: Iterable[int] | np.ndarray) -> None:
+        """참조 수를 줄이고 0이 된 시각은 제거. 없는 시각은 무시."""
+        self._apply(np.asarray(times, dtype=np.int64), -1)
+
+    def _apply(self, times: np.ndarray, sign: int) -> None:
+        if times.size == 0:
+            return
+        values, mult = np.unique(times, return_counts=True)
+        pos = np.searchsorted(self.times, values)
+        found = pos < len(self.times)
+        found[found] = self.times[pos[found]] == values[found]
+        counts = self.counts.copy()
+        counts[pos[found]] += sign * mult[found]
+        times_out = self.times
+        if sign > 0 and not found.all():
+            new = ~found
+            times_out = np.insert(times_out, pos[new], values[new])
+            counts = np.insert(counts, pos[new], mult[new])
+        keep = counts > 0
+        if not keep.all():
+            times_out = times_out[keep]
+            counts = counts[keep]
+        self.times = times_out
+        self.counts = counts
+
+    def snapshot(self, exclude: Iterable[int] = (), extra: Iterable[int] = ()) -> SnapCandidates:
+        return SnapCandidates(self.times, self.counts, exclude, extra)
+
+
+class SnapCandidates:
+    """스냅 질의용 고정 스냅샷.
+
+    exclude: 드래그 중인 항목 자신의 편집 지점 — 인덱스를 고치지 않고 질의 때 카운트에서 뺀다.
+    extra: 인덱스 밖의 후보 (0, 길이, 플레이헤드 등).
+    """
+
+    __slots__ = ("_times", "_counts", "_exclude", "_extra")
+
+    def __init__(
+        self, times: np.ndarray, counts: np.ndarray,
+        exclude: Iterable[int] = (), extra: Iterable[int] = (),
+    ) -> None:
+        self._times = times
+        self._counts = counts
+        self._exclude = Counter(int(t) for t in exclude)
+        self._extra = np.unique(np.asarray(list(extra), dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self._times) + len(self._extra)
+
+    def nearest(self, ms: float) -> int | None:
+        """ms에 가장 가까운 후보 (동률이면 작은 쪽). 후보가 없으면 None.
+
+        제외 시각은 최대 len(exclude)개이므로 삽입 위치 양옆으로 그만큼만 더 보면 된다 — O(log n).
+        """
+        times = self._times
+        k = len(self._exclude) + 1
+        pos = int(np.searchsorted(times, ms))
+        lo, hi = max(pos - k, 0), min(pos + k, len(times))
+        window = times[lo:hi]
+        if self._exclude:
+            avail = self._counts[lo:hi].copy()
+            for i, t in enumerate(window.tolist()):
+                avail[i] -= self._exclude.get(t, 0)
+            window = window[avail > 0]
+        if len(self._extra):
+            window = np.union1d(window, self._extra)
+        if len(window) == 0:
+            return None
+        return int(window[np.argmin(np.abs(window - ms))])
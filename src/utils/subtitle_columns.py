@@ -0,0 +1,114 @@
+"""Columnar (NumPy) view of subtitle segment times for bulk edits (no Qt dependency).
+
+세그먼트 목록의 start_ms/end_ms를 int64 열 두 개로 떼어 내 일괄 이동·겹침 검출·간격 정렬·
+범위 제한을 벡터 연산으로 처리하고, 실제로 값이 바뀐 행만 세그먼트 객체에 되쓴다.
+세그먼트 객체(명령·선택 상태가 참조로 붙잡는 단위)는 그대로 두므로 기존 API와 공존한다.
+"""
+
+from __future__ import annotations
+
+from typing import Sequence
+
+import numpy as np
+
+from src.models.subtitle import SubtitleSegment
+
+
+def time_columns(segments: Sequence[SubtitleSegment]) -> tuple[np.ndarray, np.ndarray]:
+    """(starts, ends) int64 배열."""
+    n = len(segments)
+    starts = np.fromiter((s.start_ms for s in segments), dtype=np.int64, count=n)
+    ends = np.fromiter((s.end_ms for s in segments), dtype=np.int64, count=n)
+    return starts, ends
+
+
+def write_times(
+    segments: Sequence[SubtitleSegment], starts: np.ndarray, ends: np.ndarray,
+) -> int:
+    """현재 값과 다른 행만 되쓴다. 바뀐 세그먼트 수 반환."""
+    cur_starts, cur_ends = time_columns(segments)
+    rows = np.flatnonzero((cur_starts != starts) | (cur_ends != ends))
+    new_starts = starts[rows].tolist()
+    new_ends = ends[rows].tolist()
+    for i, s, e in zip(rows.tolist(), new_starts, new_ends):
+        seg = segments[i]
+        seg.start_ms = s
+        seg.end_ms = e
+    return len(rows)
+
+
+class SubtitleColumns:
+    """세그먼트 목록의 시간 열 사본. 연산은 열만 바꾸고 commit()이 변경분을 되쓴다."""
+
+    __slots__ = ("segments", "start_ms", "end_ms")
+
+    def __init__(self, segments: Sequence[SubtitleSegment]) -> None:
+        self.segments = segments
+        self.start_ms, self.end_ms = time_columns(segments)
+
+    def __len__(self) -> int:
+        return len(self.start_ms)
+
+    def times(self) -> list[tuple[int, int]]:
+        return list(zip(self.start_ms.tolist(), self.end_ms.tolist()))
+
+    def shift(self, offset_ms: int, min_start_ms: int = 0) -> None:
+        """전체 이동. 시작은 min_start_ms 이상, 길이는 최소 1ms로 제한."""
+        self.start_ms = np.maximum(self.start_ms + offset_ms, min_start_ms)
+        self.end_ms = np.maximum(self.end_ms + offset_ms, self.start_ms + 1)
+
+    def overlapping_pairs(self) -> np.ndarray:
+        """end[i] > start[i+1] 인 i 배열 — 겹치는 인접 쌍 (i, i+1)."""
+        return np.flatnonzero(self.end_ms[:-1] > self.start_ms[1:])
+
+    def close_gaps(self, gap_ms: int) -> None:
+        """앞 세그먼트 끝 + gap보다 이르게 시작하는 세그먼트를 뒤로 밀어 정렬 (연쇄 적용).
+
+        이동량 재귀 shift[i] = max(0, shift[i-1] + end[i-1] + gap - start[i])는
+        C[0] = 0인 누적합 C에 대해 shift = C - (C의 누적 최솟값)으로 풀린다 (Lindley 재귀).
+        """
+        if len(self) < 2:
+            return
+        step = self.end_ms[:-1] + gap_ms - self.start_ms[1:]
+        walk = np.concatenate(([0], np.cumsum(step)))
+        shift = walk - np.minimum.accumulate(walk)
+        self.start_ms = self.start_ms + shift
+        self.end_ms = self.end_ms + shift
+
+    def clamp(self, lo_ms: int, hi_ms: int) -> None:
+        """[lo_ms, hi_ms] 범위로 자른다. 길이는 가능한 한 최소 1ms 유지."""
+        self.start_ms = np.clip(self.start_ms, lo_ms, max(lo_ms, hi_ms - 1))
+        self.end_ms = np.clip(self.end_ms, self.start_ms + 1, max(lo_ms + 1, hi_ms))
+
+    def commit(self) -> int:
+        """바뀐 행만 세그먼트에 되쓰고 그 수를 반환."""
+        return write_times(self.segments, self.start_ms, self.end_ms)
+
+
+# 'HH:MM:SS,mmm'에서 숫자가 들어가는 바이트 위치
+_SRT_DIGIT_COLS = [0, 1, 3, 4, 6, 7, 9, 10, 11]
+
+
+def srt_times(ms: np.ndarray) -> list[str]:
+    """ms 배열 → 'HH:MM:SS,mmm' 문자열 목록 (ms_to_srt_time과 동일 결과).
+
+    자리 분해와 문자 배치를 (n, 12) 바이트 행렬에서 한 번에 처리한다.
+    100시간 이상(세 자리 시)은 행 단위 포맷으로 처리.
+    """
+    ms = np.maximum(np.asarray(ms, dtype=np.int64), 0)
+    hours, rem = np.divmod(ms, 3_600_000)
+    minutes, rem = np.divmod(rem, 60_000)
+    seconds, millis = np.divmod(rem, 1000)
+    if len(ms) and hours.max() >= 100:
+        return [
+            "%02d:%02d:%02d,%03d" % row
+            for row in zip(hours.tolist(), minutes.tolist(), seconds.tolist(), millis.tolist())
+        ]
+    digits = np.stack([
+        hours // 10, hours % 10, minutes // 10, minutes % 10, seconds // 10, seconds % 10,
+        millis // 100, millis // 10 % 10, millis % 10,
+    ], axis=1)
+    out = np.full((len(ms), 12), ord(":"), dtype=np.uint8)
+    out[:, _SRT_DIGIT_COLS] = digits + ord("0")
+    out[:, 8] = ord(",")
+    return out.view("S12").ravel().astype(str).tolist()
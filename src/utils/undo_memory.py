@@ -0,0 +1,193 @@
+"""Structurally shared time snapshots and memory accounting for undo history (no Qt dependency).
+
+편집 명령이 "변경 전 상태"를 통째로 복사하면 긴 세션에서 undo 기록이 한없이 커진다.
+TimeSnapshot은 목록을 내용 기반 경계(content-defined chunking)로 자른 불변 청크의 튜플로
+저장하고, 같은 목록의 직전 스냅샷과 내용이 같은 청크는 새로 만들지 않고 그대로 공유한다.
+연속된 명령의 스냅샷은 바뀐 청크만큼만 메모리를 더 쓰며, 되돌리기는 목록 멤버십을 한 번의
+슬라이스 대입으로 바꾸고 값이 다른 항목만 되쓴다.
+
+approx_bytes / UndoMemoryBudget은 공유 객체를 한 번만 세는 기록 크기 추정과
+바이트 한도를 넘을 때 버릴 가장 오래된 명령 수를 계산한다.
+"""
+
+from __future__ import annotations
+
+import sys
+from array import array
+from collections import OrderedDict
+from typing import Callable, Sequence
+
+import numpy as np
+
+_SPAN_FIELDS = ("start_ms", "end_ms")
+
+# 청크 경계: 항목 id 해시의 상위 5비트가 0일 때 (평균 32개). 삽입·삭제가 있어도
+# 그 주변 청크만 달라지고 나머지 경계는 그대로라 직전 스냅샷과 공유된다.
+_BOUNDARY_MASK = 31
+_MAX_CHUNK = 256
+_HASH_MUL = 0x9E3779B97F4A7C15
+_HASH_BITS = (1 << 64) - 1
+
+# 목록별 최신 스냅샷 — 다음 capture의 공유 기준 (LRU, 목록 참조를 함께 보관해 id 재사용 방지)
+_REGISTRY_SIZE = 32
+_latest: OrderedDict[int, tuple[list, TimeSnapshot]] = OrderedDict()
+
+
+class _Chunk:
+    """불변 청크: 항목 튜플 + 필드 값(int64, 항목별로 필드 순서대로 나열)."""
+
+    __slots__ = ("items", "values")
+
+    def __init__(self, items: tuple, values: array) -> None:
+        self.items = items
+        self.values = values
+
+
+class TimeSnapshot:
+    """목록의 멤버십(순서 포함)과 항목 시간 필드의 불변 스냅샷."""
+
+    __slots__ = ("fields", "chunks", "length")
+
+    def __init__(self, fields: tuple[str, ...], chunks: tuple[_Chunk, ...], length: int) -> None:
+        self.fields = fields
+        self.chunks = chunks
+        self.length = length
+
+    def __len__(self) -> int:
+        return self.length
+
+    @classmethod
+    def capture(
+        cls, items: list, fields: tuple[str, ...] = _SPAN_FIELDS,
+        base: TimeSnapshot | None = None,
+    ) -> TimeSnapshot:
+        """items의 현재 상태를 캡처. base(기본: 같은 목록의 직전 스냅샷)와 같은 청크는 공유."""
+        if base is None:
+            entry = _latest.get(id(items))
+            if entry is not None and entry[0] is items:
+                base = entry[1]
+        shared = {}
+        if base is not None and base.fields == fields:
+            shared = {id(c.items[0]): c for c in base.chunks}
+
+        chunks: list[_Chunk] = []
+        run: list = []
+        values = array("q")
+
+        def flush() -> None:
+            nonlocal run, values
+            key = tuple(run)
+            cand = shared.get(id(key[0]))
+            if cand is not None and cand.items == key and cand.values == values:
+                chunks.append(cand)
+            else:
+                chunks.append(_Chunk(key, values))
+            run = []
+            values = array("q")
+
+        for item in items:
+            run.append(item)
+            for name in fields:
+                values.append(getattr(item, name))
+            if ((id(item) * _HASH_MUL) & _HASH_BITS) >> 58 & _BOUNDARY_MASK == 0 or len(run) >= _MAX_CHUNK:
+                flush()
+        if run:
+            flush()
+
+        snap = cls(fields, tuple(chunks), len(items))
+        _remember(items, snap)
+        return snap
+
+    def items(self) -> list:
+        return [item for chunk in self.chunks for item in chunk.items]
+
+    def restore(self, target: list) -> int:
+        """target을 스냅샷 상태로 되돌린다. 값이 바뀐 항목 수 반환."""
+        target[:] = self.items()
+        fields = self.fields
+        width = len(fields)
+        changed = 0
+        for chunk in self.chunks:
+            values = chunk.values
+            for j, item in enumerate(chunk.items):
+                dirty = False
+                for k, name in enumerate(fields):
+                    value = values[j * width + k]
+                    if getattr(item, name) != value:
+                        setattr(item, name, value)
+                        dirty = True
+                changed += dirty
+        _remember(target, self)
+        return changed
+
+
+def _remember(items: list, snap: TimeSnapshot) -> None:
+    _latest[id(items)] = (items, snap)
+    _latest.move_to_end(id(items))
+    if len(_latest) > _REGISTRY_SIZE:
+        _latest.popitem(last=False)
+
+
+def approx_bytes(obj, seen: set[int]) -> int:
+    """obj가 붙잡고 있는 메모리 추정. seen에 있는 객체(다른 기록과 공유)는 세지 않는다.
+
+    컨테이너·배열·스냅샷은 내용까지, 그 밖의 객체(모델 항목 등)는 얕은 크기만 센다.
+    """
+    if obj is None or id(obj) in seen:
+        return 0
+    seen.add(id(obj))
+    size = sys.getsizeof(obj)
+    if isinstance(obj, TimeSnapshot):
+        return size + sys.getsizeof(obj.chunks) + sum(approx_bytes(c, seen) for c in obj.chunks)
+    if isinstance(obj, _Chunk):
+        items = obj.items
+        size += sys.getsizeof(items) + sys.getsizeof(obj.values)
+        return size + sum(approx_bytes(item, seen) for item in items)
+    if isinstance(obj, np.ndarray):
+        return size if obj.base is None else size + obj.nbytes
+    if isinstance(obj, (list, tuple, set, frozenset)):
+        return size + sum(approx_bytes(item, seen) for item in obj)
+    if isinstance(obj, dict):
+        return size + sum(approx_bytes(k, seen) + approx_bytes(v, seen) for k, v in obj.items())
+    return size
+
+
+def history_bytes(command, seen: set[int]) -> int:
+    """명령의 undo 기록 크기 — 명령 클래스의 _history_attrs에 든 속성만 센다."""
+    total = sys.getsizeof(command)
+    for name in getattr(command, "_history_attrs", ()):
+        total += approx_bytes(getattr(command, name, None), seen)
+    return total
+
+
+def release_history(command) -> None:
+    """버려진 명령의 기록을 놓아 메모리를 돌려준다 (이후 undo 불가)."""
+    for name in getattr(command, "_history_attrs", ()):
+        setattr(command, name, None)
+
+
+class UndoMemoryBudget:
+    """undo 기록 바이트 한도. 넘치면 가장 오래된 명령부터 버린다."""
+
+    __slots__ = ("limit_bytes", "size_of")
+
+    def __init__(
+        self, limit_bytes: int,
+        size_of: Callable[[object, set[int]], int] = history_bytes,
+    ) -> None:
+        self.limit_bytes = limit_bytes
+        self.size_of = size_of
+
+    def sizes(self, commands: Sequence, seen: set[int] | None = None) -> list[int]:
+        """명령별 크기(오래된 것 → 최신 순). 공유 객체는 가장 오래된 명령에 한 번만 계상."""
+        seen = set() if seen is None else seen
+        return [self.size_of(cmd, seen) for cmd in commands]
+
+    def drop_count(self, sizes: Sequence[int]) -> int:
+        """남은 합계가 한도 이하가 되도록 앞(오래된 쪽)에서 버릴 개수."""
+        total = sum(sizes)
+        drop = 0
+        while total > self.limit_bytes and drop < len(sizes):
+            total -= sizes[drop]
+            drop += 1
+        return drop
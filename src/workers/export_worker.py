@@ -44,6 +44,7 @@ class ExportWorker(QObject):
         video_volume: float = 1.0,
         audio_volume: float = 1.0,
         audio_bitrate: str = "192k",
+        loudness_gain_db: float = 0.0,
     ):
         super().__init__()
         self._video_path = video_path
@@ -64,6 +65,7 @@ class ExportWorker(QObject):
         self._video_volume = video_volume
         self._audio_volume = audio_volume
         self._audio_bitrate = audio_bitrate
+        self._loudness_gain_db = loudness_gain_db
 
     def run(self) -> None:
         try:
@@ -88,6 +90,7 @@ class ExportWorker(QObject):
                 video_volume=self._video_volume,
                 audio_volume=self._audio_volume,
                 audio_bitrate=self._audio_bitrate,
+                loudness_gain_db=self._loudness_gain_db,
             )
             self.finished.emit(str(self._output_path))
         except Exception as e:
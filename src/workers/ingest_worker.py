@@ -0,0 +1,76 @@
+"""Worker for the single-pass media ingest in a background thread."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from src.services.media_ingest import plan_ingest, run_ingest
+
+
+class IngestWorker(QObject):
+    """Runs one ingest pass for a source. ProxyQueue-compatible signals.
+
+    Signals:
+        progress(int): slowest product's percent.
+        product_progress(str, str, int): source_path, product, percent.
+        ingested(str, object): source_path, IngestResult — emitted before finished.
+        finished(str): source_path, or empty string if failed/cancelled.
+        error(str): error message.
+    """
+
+    progress = Signal(int)
+    product_progress = Signal(str, str, int)
+    ingested = Signal(str, object)
+    finished = Signal(str)
+    error = Signal(str)
+
+    def __init__(
+        self,
+        source_path: str,
+        encoder: str | None = None,
+        frames_dir: Path | None = None,
+        proxy: bool = False,
+        waveform: bool = False,
+        frame_quality: int = 5,
+    ):
+        super().__init__()
+        self._source_path = source_path
+        self._encoder = encoder
+        self._frames_dir = frames_dir
+        self._proxy = proxy
+        self._waveform = waveform
+        self._frame_quality = frame_quality
+        self._is_cancelled = False
+        self._product_pct: dict[str, int] = {}
+
+    def run(self) -> None:
+        try:
+            src = Path(self._source_path)
+            plan = plan_ingest(
+                src, proxy=self._proxy, frames_dir=self._frames_dir,
+                waveform=self._waveform, encoder=self._encoder, frame_quality=self._frame_quality,
+            )
+            self._product_pct = dict.fromkeys(plan.products, 0)
+            result = run_ingest(src, plan, on_progress=self._on_progress, cancel_check=self.check_cancelled)
+            if result is None or self._is_cancelled:
+                self.finished.emit("")
+                return
+            self.ingested.emit(self._source_path, result)
+            self.finished.emit(self._source_path)
+        except Exception as e:
+            if not self._is_cancelled:
+                self.error.emit(str(e))
+            self.finished.emit("")
+
+    def _on_progress(self, product: str, pct: int) -> None:
+        self._product_pct[product] = pct
+        self.product_progress.emit(self._source_path, product, pct)
+        self.progress.emit(min(self._product_pct.values()))
+
+    def cancel(self) -> None:
+        self._is_cancelled = True
+
+    def check_cancelled(self) -> bool:
+        return self._is_cancelled
@@ -0,0 +1,77 @@
+"""Background worker that loads a project file section by section."""
+
+from __future__ import annotations
+
+import time
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from src.services.media_fingerprint import get_media_fingerprint
+from src.services.project_io import iter_load_project
+
+# 섹션이 끝났을 때의 진행률 — 읽기·파싱이 가장 무겁다
+_SECTION_PERCENT = {"video": 40, "subtitles": 85, "overlays": 100}
+
+
+class ProjectLoadWorker(QObject):
+    """Parses a project in a background thread and publishes ProjectState sections.
+
+    Sections arrive in UI order (see project_io.iter_project_sections): "video"
+    carries the ProjectState itself, later ones are attached to it with
+    apply_project_section. The worker never touches a section after emitting it.
+
+    Media recorded in the project that no longer exists at its path is looked up
+    by content fingerprint under the project folder before the "video" section
+    is emitted, so the first paint already uses the new locations.
+
+    Signals:
+        progress(int, str): Percent done and the section that just finished.
+        section_ready(str, object): (section name, payload).
+        relinked(object): {old path: new path} for moved media (only if any).
+        finished(float): Total load time in milliseconds.
+        error(str): Emitted with error message on failure.
+    """
+
+    progress = Signal(int, str)
+    section_ready = Signal(str, object)
+    relinked = Signal(object)
+    finished = Signal(float)
+    error = Signal(str)
+
+    def __init__(self, path: Path):
+        super().__init__()
+        self._path = path
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        self._cancelled = True
+
+    def run(self) -> None:
+        started = time.perf_counter()
+        try:
+            self.progress.emit(0, "read")
+            relinked: dict[str, str] = {}
+            for name, payload in iter_load_project(self._path):
+                if self._cancelled:
+                    return
+                if name == "video":
+                    relinked = self._relink(payload)
+                elif name == "overlays" and relinked:
+                    for ov in payload[0].overlays:
+                        ov.image_path = relinked.get(ov.image_path, ov.image_path)
+                self.section_ready.emit(name, payload)
+                self.progress.emit(_SECTION_PERCENT.get(name, 0), name)
+            if not self._cancelled:
+                if relinked:
+                    self.relinked.emit(relinked)
+                self.finished.emit((time.perf_counter() - started) * 1000)
+        except Exception as e:
+            if not self._cancelled:
+                self.error.emit(str(e))
+
+    def _relink(self, project) -> dict[str, str]:
+        """옮겨진 미디어를 프로젝트 폴더 아래에서 지문으로 찾아 헤더에 반영한다."""
+        mapping = get_media_fingerprint().relink(project.media_fingerprints, [self._path.parent])
+        project.relink_media(mapping)
+        return mapping
@@ -16,9 +16,10 @@ class ProxyWorker(QObject):
     finished = Signal(str)  # proxy_path or empty string if failed/cancelled
     error = Signal(str)
 
-    def __init__(self, source_path: str):
+    def __init__(self, source_path: str, encoder: str | None = None):
         super().__init__()
         self._source_path = source_path
+        self._encoder = encoder
         self._is_cancelled = False
 
     def run(self) -> None:
@@ -31,7 +32,8 @@ class ProxyWorker(QObject):
                 src,
                 dst,
                 on_progress=self.progress.emit,
-                cancel_check=self.check_cancelled
+                cancel_check=self.check_cancelled,
+                encoder=self._encoder,
             )
 
             if self._is_cancelled:
@@ -0,0 +1,46 @@
+"""Worker for building the scrub proxy tier in a background thread."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from PySide6.QtCore import QObject, Signal
+
+from src.services.scrub_proxy import generate_scrub_tier, get_scrub_paths
+
+
+class ScrubProxyWorker(QObject):
+    """Worker to build (or continue) a scrub tier. Same signals as ProxyWorker."""
+
+    progress = Signal(int)
+    finished = Signal(str)  # scrub tier path or empty string if failed/cancelled
+    error = Signal(str)
+
+    def __init__(self, source_path: str, height: int):
+        super().__init__()
+        self._source_path = source_path
+        self._height = height
+        self._is_cancelled = False
+
+    def run(self) -> None:
+        try:
+            src = Path(self._source_path)
+            complete = generate_scrub_tier(
+                src, self._height, on_progress=self.progress.emit, cancel_check=self.check_cancelled,
+            )
+            if complete and not self._is_cancelled:
+                self.finished.emit(str(get_scrub_paths(src)[0]))
+                return
+            if not self._is_cancelled:
+                self.error.emit(f"Scrub proxy generation failed for {self._source_path}")
+            self.finished.emit("")
+        except Exception as e:
+            if not self._is_cancelled:
+                self.error.emit(str(e))
+            self.finished.emit("")
+
+    def cancel(self) -> None:
+        self._is_cancelled = True
+
+    def check_cancelled(self) -> bool:
+        return self._is_cancelled
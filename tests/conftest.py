@@ -0,0 +1,22 @@
+"""공용 픽스처 — 테스트가 ~/.fastmoviemaker의 실제 상태 파일을 읽거나 쓰지 않게 한다."""
+
+from __future__ import annotations
+
+import pytest
+
+
+@pytest.fixture(autouse=True)
+def _memory_metadata_store(monkeypatch):
+    """probe_media 캐시를 sqlite 없는 메모리 저장소로 바꾼다."""
+    import src.services.media_metadata as mm
+
+    monkeypatch.setattr(mm, "_default_store", mm.MediaMetadataStore())
+
+
+@pytest.fixture(autouse=True)
+def _isolated_queue_state(monkeypatch, tmp_path):
+    """MediaController가 만드는 proxy/scrub/ingest 큐의 상태 파일을 tmp_path 아래로."""
+    import src.services.proxy_queue as pq
+
+    state_dir = tmp_path / ".fastmoviemaker"
+    monkeypatch.setattr(pq, "default_state_path", lambda name="proxy_queue.json": state_dir / name)
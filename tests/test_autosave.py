@@ -0,0 +1,210 @@
+"""자동 저장 테스트 — 편집 세대 추적, 작업 스레드 저장, 복구 파일 회전."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from src.models.project import ProjectState
+from src.models.subtitle import SubtitleSegment
+
+
+@pytest.fixture
+def manager(qapp, tmp_path, monkeypatch):
+    from src.services.autosave import AutoSaveManager
+
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    mgr = AutoSaveManager()
+    project = ProjectState()
+    project.subtitle_track.add_segment(SubtitleSegment(0, 1000, "hello"))
+    mgr.set_project(project)
+    yield mgr
+    mgr._timer.stop()
+    mgr.deleteLater()
+
+
+def _wait(qapp) -> None:
+    from PySide6.QtCore import QThreadPool
+
+    QThreadPool.globalInstance().waitForDone(5000)
+    qapp.processEvents()
+
+
+def _files(mgr) -> list[str]:
+    return sorted(p.name for p in mgr._autosave_dir.glob("*.fmm.json"))
+
+
+class TestAutoSaveManager:
+    def test_clean_project_is_not_saved(self, manager, qapp):
+        manager._on_timer()
+        manager.save_now()
+        _wait(qapp)
+        assert _files(manager) == []
+
+    def test_dirty_save_runs_off_thread_and_round_trips(self, manager, qapp):
+        saved = []
+        manager.save_completed.connect(saved.append)
+        manager.notify_edit()
+        manager._on_timer()
+        assert manager._in_flight
+        _wait(qapp)
+        assert len(saved) == 1 and not manager.is_dirty
+        assert manager.last_save_latency_ms > 0
+        assert manager.load_recovery(saved[0]).subtitle_track[0].text == "hello"
+
+        manager._on_timer()  # 변경 없음 → 다시 저장하지 않음
+        _wait(qapp)
+        assert len(saved) == 1
+
+    def test_edit_during_save_stays_dirty(self, manager, qapp):
+        manager.notify_edit()
+        manager._do_autosave()
+        manager.notify_edit()
+        _wait(qapp)
+        assert manager.is_dirty
+        manager.save_now()
+        assert not manager.is_dirty
+
+    def test_rotation_keeps_newest_per_project(self, manager, qapp):
+        manager._max_recovery_files = 2
+        manager._active_file_path = Path("/p/demo.mp4")  # 최근 파일 설정은 건드리지 않음
+        for stamp in (100, 200, 300):
+            (manager._autosave_dir / f"demo_autosave_{stamp}.fmm.json").write_bytes(b"{}")
+        (manager._autosave_dir / "other_autosave_50.fmm.json").write_bytes(b"{}")
+        manager.notify_edit()
+        manager.save_now()
+        files = _files(manager)
+        assert "other_autosave_50.fmm.json" in files
+        assert len([f for f in files if f.startswith("demo_")]) == 2
+        assert "demo_autosave_300.fmm.json" in files
+        assert not list(manager._autosave_dir.glob(".*.tmp"))
+
+
+@pytest.fixture
+def journaled(manager):
+    from PySide6.QtGui import QUndoStack
+
+    stack = QUndoStack()
+    manager._journal_enabled = True
+    manager.attach_undo_stack(stack)
+    yield manager, stack
+    manager._close_journal()
+
+
+def _state(project) -> dict:
+    from src.services.project_io import project_to_dict
+
+    return project_to_dict(project)
+
+
+class TestEditJournal:
+    def test_subtitle_edits_replay_onto_snapshot(self, journaled):
+        from src.models.style import SubtitleStyle
+        from src.ui.commands import (
+            AddSegmentCommand, DeleteSegmentCommand, EditStyleCommand, EditTextCommand, EditTimeCommand,
+        )
+
+        manager, stack = journaled
+        project = manager._project
+        track = project.subtitle_track
+        stack.push(AddSegmentCommand(track, SubtitleSegment(2000, 2500, "b")))
+        assert manager.is_dirty  # 아직 기준 스냅샷이 없다
+        manager.save_now()
+        snapshot = sorted(manager._autosave_dir.glob("*.fmm.json"))[-1]
+
+        stack.push(EditTextCommand(track, 0, "hello", "안녕"))
+        stack.push(EditTimeCommand(track, 0, 0, 1000, 3000, 3500))
+        stack.push(AddSegmentCommand(track, SubtitleSegment(500, 800, "c")))
+        stack.push(DeleteSegmentCommand(track, 1, track[1]))
+        stack.undo()
+        stack.undo()
+        stack.redo()
+        stack.push(EditStyleCommand(track, 0, None, SubtitleStyle(font_size=30)))
+        assert not manager.is_dirty
+        assert manager.journal_entries == 8
+
+        assert _state(manager.load_recovery(snapshot)) == _state(project)
+
+    def test_track_commands_journal_whole_track(self, journaled):
+        from src.ui.commands import BatchShiftCommand
+
+        manager, stack = journaled
+        manager.notify_edit()
+        manager.save_now()
+        snapshot = sorted(manager._autosave_dir.glob("*.fmm.json"))[-1]
+        stack.push(BatchShiftCommand(manager._project.subtitle_track, 250))
+        assert not manager.is_dirty
+        assert _state(manager.load_recovery(snapshot)) == _state(manager._project)
+
+    def test_project_commands_and_direct_edits_need_snapshot(self, journaled, qapp):
+        from src.ui.commands import AddVideoTrackCommand
+
+        manager, stack = journaled
+        manager.notify_edit()
+        manager.save_now()
+        stack.push(AddVideoTrackCommand(manager._project))
+        assert manager.is_dirty and manager.journal_entries == 0
+        manager.save_now()
+        manager._project.subtitle_track[0].text = "direct"
+        manager.notify_edit()
+        assert manager.is_dirty
+
+    def test_echo_of_journaled_command_is_not_an_edit(self, journaled):
+        from src.ui.commands import EditTextCommand
+
+        manager, stack = journaled
+        manager.notify_edit()
+        manager.save_now()
+        track = manager._project.subtitle_track
+        cmd = EditTextCommand(track, 0, "hello", "journaled")
+        stack.push(cmd)
+        manager.notify_edit(cmd)
+        assert not manager.is_dirty
+        # 같은 턴이라도 명령 밖의 직접 편집은 스냅샷이 필요하다
+        manager._project.duration_ms = 5000
+        manager.notify_edit()
+        assert manager.is_dirty
+
+    def test_media_table_filled_by_writer(self, journaled, tmp_path):
+        from src.models.image_overlay import ImageOverlay
+        from src.services.project_io import read_project_data
+
+        manager, _ = journaled
+        image = tmp_path / "a.png"
+        image.write_bytes(b"png")
+        manager._project.image_overlay_track.add_overlay(ImageOverlay(0, 100, str(image)))
+        _, data, media = manager._take_snapshot()
+        assert data["media"] == {} and media[0] == [str(image)]
+        manager.notify_edit()
+        manager.save_now()
+        snapshot = sorted(manager._autosave_dir.glob("*.fmm.json"))[-1]
+        assert list(read_project_data(snapshot)["media"]) == [str(image)]
+
+    def test_compaction_starts_new_journal(self, journaled, qapp, monkeypatch):
+        import src.services.autosave as autosave
+        from src.ui.commands import EditTextCommand
+
+        manager, stack = journaled
+        monkeypatch.setattr(autosave, "_JOURNAL_COMPACT_ENTRIES", 3)
+        manager.notify_edit()
+        manager.save_now()
+        track = manager._project.subtitle_track
+        for i in range(3):
+            stack.push(EditTextCommand(track, 0, track[0].text, f"t{i}"))
+        manager._on_timer()
+        stack.push(EditTextCommand(track, 0, track[0].text, "after"))
+        _wait(qapp)
+        assert manager.journal_entries == 1
+        newest = sorted(manager._autosave_dir.glob("*.fmm.json"))[-1]
+        assert manager.load_recovery(newest).subtitle_track[0].text == "after"
+
+    def test_torn_last_line_is_ignored(self, tmp_path):
+        from src.services.edit_journal import EditJournal, read_journal
+
+        journal = EditJournal(tmp_path / "a.fmm.journal")
+        journal.append(1, [])
+        journal.close()
+        with open(tmp_path / "a.fmm.journal", "ab") as f:
+            f.write(b'{"g": 2, "ops": [')
+        assert read_journal(tmp_path / "a.fmm.journal") == [{"g": 1, "ops": []}]
@@ -134,6 +134,7 @@ class TestMediaController:
         ctx = MagicMock(spec=AppContext)
         ctx.window = None  # QObject requires None or real QObject as parent
         ctrl = MediaController(ctx)
+        queue = ctrl.proxy_queue
 
         # Mock workers
         mock_thread1 = MagicMock()
@@ -144,8 +145,9 @@ class TestMediaController:
         mock_thread1.isRunning.return_value = True
         mock_thread2.isRunning.return_value = True
 
-        ctrl._proxy_workers["video1.mp4"] = (mock_thread1, mock_worker1)
-        ctrl._proxy_workers["video2.mp4"] = (mock_thread2, mock_worker2)
+        queue._workers["video1.mp4"] = (mock_thread1, mock_worker1, MagicMock())
+        queue._workers["video2.mp4"] = (mock_thread2, mock_worker2, MagicMock())
+        assert ctrl.is_proxy_generating()
 
         ctrl.cancel_all_proxies()
 
@@ -153,4 +155,4 @@ class TestMediaController:
         mock_worker2.cancel.assert_called_once()
         mock_thread1.quit.assert_called_once()
         mock_thread2.quit.assert_called_once()
-        assert len(ctrl._proxy_workers) == 0
+        assert not ctrl.is_proxy_generating()
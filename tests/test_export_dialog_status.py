@@ -10,3 +10,22 @@ def test_export_dialog_worker_status_updates_label(qtbot):
 
     dialog._on_worker_status("GPU export failed, retrying with software encoder...")
     assert "retrying with software encoder" in dialog._status_label.text().lower()
+
+
+def test_export_dialog_loudness_gain_from_waveform(qtbot):
+    import numpy as np
+
+    from src.services.waveform_service import WaveformData
+
+    empty = np.zeros(0, dtype=np.float32)
+    waveform = WaveformData(empty, empty, 0, 16000, integrated_lufs=-20.0)
+    dialog = ExportDialog(Path("video.mp4"), SubtitleTrack(), video_has_audio=True, waveform=waveform)
+    qtbot.addWidget(dialog)
+
+    assert dialog._loudness_checkbox.isEnabled() and dialog._loudness_gain_db() == 0.0
+    dialog._loudness_checkbox.setChecked(True)
+    assert dialog._loudness_gain_db() == 6.0
+
+    unmeasured = ExportDialog(Path("video.mp4"), SubtitleTrack(), video_has_audio=True)
+    qtbot.addWidget(unmeasured)
+    assert not unmeasured._loudness_checkbox.isEnabled()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import inspect
 import json
+import random
 from pathlib import Path
 
 import pytest
@@ -136,6 +137,26 @@ class TestImageOverlayTrack:
         # end_ms is exclusive
         assert len(track.overlays_at(2000)) == 0
 
+    def test_indices_at_match_brute_force(self):
+        rng = random.Random(11)
+        track = ImageOverlayTrack()
+        for _ in range(400):
+            start = rng.randint(0, 60_000)
+            track.add_overlay(ImageOverlay(start, start + rng.choice([0, 50, 2_000, 40_000]), "/tmp/x.png"))
+        for pos in range(-100, 110_000, 997):
+            expected = [i for i, ov in enumerate(track) if ov.start_ms <= pos < ov.end_ms]
+            assert track.indices_at(pos) == expected
+
+    def test_index_rebuilt_after_mark_modified(self):
+        track = ImageOverlayTrack()
+        track.add_overlay(ImageOverlay(0, 1000, "/tmp/a.png"))
+        track.add_overlay(ImageOverlay(2000, 3000, "/tmp/b.png"))
+        assert track.indices_at(2500) == [1]
+        assert track._interval_tree() is track._interval_tree()  # 변경 없으면 재사용
+        track[0].end_ms = 2600
+        track.mark_modified()
+        assert track.indices_at(2500) == [0, 1]
+
     def test_iter(self):
         track = ImageOverlayTrack()
         track.add_overlay(ImageOverlay(0, 1000, "/tmp/a.png"))
@@ -216,3 +237,28 @@ class TestExportSignatures:
         from src.workers.export_worker import ExportWorker
         sig = inspect.signature(ExportWorker.__init__)
         assert "image_overlays" in sig.parameters
+
+
+class TestTimelineDragRelease:
+    def test_release_restores_start_order(self, qtbot):
+        """드래그 중에는 인덱스를 지키고, 놓으면 시작 순으로 정렬하며 선택이 따라간다."""
+        from src.ui.timeline_drag import DragMode
+        from src.ui.timeline_widget import TimelineWidget
+
+        tw = TimelineWidget()
+        qtbot.addWidget(tw)
+        track = ImageOverlayTrack()
+        track.add_overlay(ImageOverlay(start_ms=1000, end_ms=2000, image_path="a.png"))
+        track.add_overlay(ImageOverlay(start_ms=3000, end_ms=4000, image_path="b.png"))
+        tw.set_image_overlay_track(track)
+        tw.select_image_overlay(0)
+        moved = track[0]
+
+        tw._drag_mgr.start_image(DragMode.IMAGE_MOVE, 0, 0)
+        moved.start_ms, moved.end_ms = 5000, 6000
+        version = track.version
+        tw._drag_mgr.on_release()
+
+        assert [o.start_ms for o in track] == [3000, 5000]
+        assert track[1] is moved and tw._selected_overlay_index == 1
+        assert track.version > version
@@ -0,0 +1,76 @@
+"""IntervalIndex 단위 테스트 — 겹침 질의, prefix-max 가지치기, 원래 순서 보존, 구간 밀도."""
+
+from __future__ import annotations
+
+import random
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.utils.interval_index import IntervalIndex
+
+
+def _brute(starts, ends, lo, hi):
+    return [i for i, (s, e) in enumerate(zip(starts, ends)) if s <= hi and e >= lo]
+
+
+class TestOverlapping:
+    def test_matches_brute_force(self):
+        rng = random.Random(7)
+        starts = [rng.randint(0, 100_000) for _ in range(500)]
+        ends = [s + rng.randint(0, 5_000) for s in starts]
+        index = IntervalIndex(starts, ends)
+        for _ in range(200):
+            lo = rng.randint(-1_000, 105_000)
+            hi = lo + rng.randint(0, 3_000)
+            assert index.overlapping(lo, hi).tolist() == _brute(starts, ends, lo, hi)
+
+    def test_long_interval_found_far_from_its_start(self):
+        index = IntervalIndex([0, 100, 200, 300], [10_000, 110, 210, 310])
+        assert index.overlapping(5_000, 5_001).tolist() == [0]
+
+    def test_result_in_original_order(self):
+        # 시작 시간 역순으로 넣어도 결과는 원래 인덱스 오름차순
+        index = IntervalIndex([300, 200, 100], [400, 300, 200])
+        assert index.overlapping(0, 1_000).tolist() == [0, 1, 2]
+
+    def test_boundaries_inclusive(self):
+        index = IntervalIndex([0, 100], [100, 200])
+        assert index.at(100).tolist() == [0, 1]
+        assert index.at(201).tolist() == []
+
+    def test_empty(self):
+        index = IntervalIndex([], [])
+        assert len(index) == 0
+        assert index.overlapping(0, 100).tolist() == []
+
+    def test_from_items(self):
+        items = [SimpleNamespace(start_ms=0, end_ms=50), SimpleNamespace(start_ms=60, end_ms=90)]
+        index = IntervalIndex.from_items(items)
+        assert index.at(70).tolist() == [1]
+        assert index.starts.tolist() == [0, 60]
+
+
+class TestCoverage:
+    def test_matches_brute_force(self):
+        rng = random.Random(3)
+        starts = [rng.randint(0, 10_000) for _ in range(300)]
+        ends = [s + rng.randint(0, 400) for s in starts]
+        index = IntervalIndex(starts, ends)
+        origin, per_ms, n = 2_000.0, 0.05, 200  # bin = 20ms
+        cov = index.coverage(origin, per_ms, n)
+        for b in range(n):
+            lo = origin + b / per_ms
+            hi = origin + (b + 1) / per_ms
+            covered = sum(max(0.0, min(e, hi) - max(s, lo)) for s, e in zip(starts, ends))
+            assert cov[b] == pytest.approx(covered * per_ms)
+
+    def test_partial_and_clipped(self):
+        index = IntervalIndex([-500, 55], [5_000, 60])
+        assert index.coverage(0, 0.1, 10).tolist() == pytest.approx([1, 1, 1, 1, 1, 1.5, 1, 1, 1, 1])
+
+    def test_subset(self):
+        index = IntervalIndex([0, 0], [50, 100])
+        assert index.coverage(0, 0.01, 1, indices=np.array([0])).tolist() == [0.5]
+        assert index.coverage(0, 0.01, 1, indices=np.array([], dtype=np.intp)).tolist() == [0]
@@ -0,0 +1,169 @@
+"""MediaFingerprint — 내용 기반 캐시 키, 옮겨진 미디어 다시 연결."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from unittest.mock import patch
+
+from src.models.image_overlay import ImageOverlay
+from src.models.project import ProjectState
+from src.models.video_clip import VideoClip
+from src.services.media_fingerprint import MediaFingerprint, compute_fingerprint, fingerprint_size
+from src.services.project_io import load_project, save_project
+from src.workers.project_load_worker import ProjectLoadWorker
+
+
+def _write(path: Path, data: bytes) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(data)
+    return path
+
+
+class TestFingerprint:
+    def test_same_content_same_key(self, tmp_path):
+        data = os.urandom(300_000)
+        a = _write(tmp_path / "a.mp4", data)
+        b = _write(tmp_path / "sub" / "b.mp4", data)
+        assert compute_fingerprint(a) == compute_fingerprint(b)
+        assert fingerprint_size(compute_fingerprint(a)) == 300_000
+
+    def test_changed_content_same_size_new_key(self, tmp_path):
+        path = _write(tmp_path / "a.mp4", b"\0" * 1000)
+        before = compute_fingerprint(path)
+        _write(path, b"\1" * 1000)
+        assert compute_fingerprint(path) != before
+
+    def test_memo_survives_rename(self, tmp_path):
+        fps = MediaFingerprint()
+        path = _write(tmp_path / "a.mp4", b"x" * 100)
+        first = fps.fingerprint(path)
+        moved = path.rename(tmp_path / "b.mp4")
+        assert fps.fingerprint(moved) == first and fps.hash_count == 1
+
+    def test_cache_key_falls_back_to_path(self, tmp_path):
+        assert MediaFingerprint().cache_key(tmp_path / "missing.mp4") == str(tmp_path / "missing.mp4")
+
+
+class TestCacheKeyMemo:
+    def test_lookups_skip_stat_until_forgotten_or_relinked(self, tmp_path):
+        from src.services.media_fingerprint import CacheKeyMemo, get_media_fingerprint
+
+        path = _write(tmp_path / "a.mp4", b"a" * 100)
+        added = []
+        memo = CacheKeyMemo(on_added=added.append)
+        first = memo.key(path)
+        with patch("src.services.media_fingerprint.os.stat", side_effect=AssertionError("stat")):
+            assert memo.key(str(path)) == first
+        assert added == [str(path)]
+
+        _write(path, b"b" * 100)
+        memo.forget(path)
+        assert memo.key(path) != first
+
+        changed = memo.key(path)
+        _write(path, b"c" * 100)
+        get_media_fingerprint().relink_epoch += 1
+        assert memo.key(path) != changed
+
+    def test_missing_file_key_not_remembered(self, tmp_path):
+        from src.services.media_fingerprint import CacheKeyMemo
+
+        memo = CacheKeyMemo()
+        path = tmp_path / "late.mp4"
+        assert memo.key(path) == str(path)
+        _write(path, b"x" * 10)
+        assert memo.key(path) == compute_fingerprint(path)
+
+
+class TestRelink:
+    def test_finds_moved_files_and_skips_hidden_dirs(self, tmp_path):
+        fps = MediaFingerprint()
+        old = _write(tmp_path / "a.mp4", b"clip a")
+        hidden = _write(tmp_path / "b.png", b"image b")
+        wanted = {str(old): fps.fingerprint(old), str(hidden): fps.fingerprint(hidden)}
+        (tmp_path / "media").mkdir()
+        (tmp_path / ".cache").mkdir()
+        new = old.rename(tmp_path / "media" / "a.mp4")
+        hidden.rename(tmp_path / ".cache" / "b.png")
+        assert fps.relink(wanted, [tmp_path]) == {str(old): str(new)}
+
+    def test_existing_paths_are_not_searched(self, tmp_path):
+        fps = MediaFingerprint()
+        path = _write(tmp_path / "a.mp4", b"clip")
+        assert fps.relink({str(path): fps.fingerprint(path)}, [tmp_path]) == {}
+        assert fps.hash_count == 1
+
+
+class TestCaches:
+    def test_proxy_survives_move(self, tmp_path):
+        from src.services.proxy_service import get_proxy_path
+
+        with patch("src.services.proxy_service.get_proxy_dir", return_value=tmp_path / "proxies"):
+            path = _write(tmp_path / "a.mp4", b"video")
+            before = get_proxy_path(path)
+            assert get_proxy_path(path.rename(tmp_path / "moved.mp4")) == before
+
+    def test_frame_cache_shares_dir_for_same_content(self, tmp_path):
+        from src.services.frame_cache_service import FrameCacheService
+
+        svc = FrameCacheService()
+        try:
+            a = _write(tmp_path / "a.mp4", b"same")
+            b = _write(tmp_path / "b.mp4", b"same")
+            c = _write(tmp_path / "c.mp4", b"diff")
+            assert svc.source_cache_dir(str(a)) == svc.source_cache_dir(str(b))
+            assert svc.source_cache_dir(str(a)) != svc.source_cache_dir(str(c))
+        finally:
+            svc.cleanup()
+
+
+class TestProjectMedia:
+    def _project(self, tmp_path) -> ProjectState:
+        project = ProjectState()
+        project.video_path = _write(tmp_path / "footage" / "main.mp4", b"main video")
+        second = _write(tmp_path / "footage" / "b.mp4", b"b roll")
+        project.video_clip_track.clips = [VideoClip(0, 1000), VideoClip(0, 500, source_path=str(second))]
+        logo = _write(tmp_path / "logo.png", b"png")
+        project.image_overlay_track.overlays.append(ImageOverlay(0, 1000, str(logo)))
+        return project
+
+    def test_media_table_round_trip(self, tmp_path):
+        project = self._project(tmp_path)
+        path = tmp_path / "p.fmm.json"
+        save_project(project, path)
+        loaded = load_project(path)
+        assert set(loaded.media_fingerprints) == set(project.all_media_paths())
+
+        # 읽을 수 없게 된 파일은 이전 지문을 유지한다
+        project.video_path.unlink()
+        save_project(loaded, path)
+        assert load_project(path).media_fingerprints == loaded.media_fingerprints
+
+    def test_relink_media_rewrites_every_reference(self, tmp_path):
+        project = self._project(tmp_path)
+        project.media_fingerprints = {p: "fp" for p in project.all_media_paths()}
+        mapping = {p: p.replace("footage", "moved") for p in project.all_media_paths()}
+        mapping[project.image_overlay_track.overlays[0].image_path] = "/new/logo.png"
+        assert project.relink_media(mapping) == 3
+        assert set(project.all_media_paths()) == set(mapping.values())
+        assert set(project.media_fingerprints) == set(mapping.values())
+
+    def test_load_worker_relinks_moved_folder(self, qapp, tmp_path):
+        project = self._project(tmp_path)
+        path = tmp_path / "p.fmm"
+        save_project(project, path)
+        (tmp_path / "footage").rename(tmp_path / "renamed")
+        (tmp_path / "logo.png").rename(tmp_path / "renamed" / "logo.png")
+
+        worker = ProjectLoadWorker(path)
+        sections, relinked = [], []
+        worker.section_ready.connect(lambda name, payload: sections.append(payload))
+        worker.relinked.connect(relinked.append)
+        worker.run()
+
+        loaded = sections[0]
+        assert loaded.video_path == tmp_path / "renamed" / "main.mp4"
+        assert loaded.video_clip_track.clips[1].source_path == str(tmp_path / "renamed" / "b.mp4")
+        assert sections[2][0].overlays[0].image_path == str(tmp_path / "renamed" / "logo.png")
+        assert len(relinked) == 1 and len(relinked[0]) == 3
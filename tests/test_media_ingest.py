@@ -0,0 +1,178 @@
+"""Single-pass media ingest — split/asplit 그래프 하나로 모든 파생 결과를 만든다."""
+
+from __future__ import annotations
+
+import io
+import json
+import wave
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+import src.services.media_ingest as mi
+from src.services.media_ingest import IngestPlan, build_ingest_args, find_strip_thumbnail, plan_ingest, run_ingest
+from src.services.waveform_service import compute_peaks_from_wav
+
+
+def _pcm(seconds: float = 2.0, rate: int = 16000) -> bytes:
+    t = np.arange(int(seconds * rate)) / rate
+    return (np.sin(2 * np.pi * 440 * t) * 16000).astype(np.int16).tobytes()
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"video")
+    proxy_dir = tmp_path / "proxies"
+    proxy_dir.mkdir()
+    meta = SimpleNamespace(duration_ms=2000, has_audio=True, has_video=True)
+    with patch.object(mi, "get_proxy_dir", return_value=proxy_dir), \
+            patch("src.services.proxy_service.get_proxy_dir", return_value=proxy_dir), \
+            patch.object(mi, "probe_media", return_value=meta):
+        yield path
+
+
+def _runner(returncode: int = 0, pcm: bytes = b"") -> MagicMock:
+    """Fake FFmpeg: writes every output named in the args."""
+
+    def run_async(args, **kwargs):
+        if returncode == 0:
+            for arg in args:
+                if arg.endswith("_%06d.jpg"):
+                    for i in range(1, 4):
+                        Path(arg.replace("%06d", f"{i:06d}")).write_bytes(b"jpg")
+                elif arg.endswith((".part.mp4", ".part.png")):
+                    Path(arg).write_bytes(b"media")
+        proc = MagicMock()
+        proc.stdout = io.BytesIO(pcm)
+        proc.stderr = iter([b"out_time_us=1000000\n", b"progress=continue\n"]
+                           + ([] if returncode == 0 else [b"Invalid filter graph\n"]))
+        proc.returncode = returncode
+        return proc
+
+    runner = MagicMock()
+    runner.is_available.return_value = True
+    runner.run_async.side_effect = run_async
+    return runner
+
+
+class TestIngestArgs:
+    def test_one_decode_feeds_every_product(self, tmp_path):
+        plan = IngestPlan(
+            duration_ms=5000, has_audio=True,
+            proxy_path=tmp_path / "proxy.mp4", frames_dir=tmp_path / "frames",
+            thumbs_dir=tmp_path / "thumbs", poster_path=tmp_path / "poster.png", waveform=True,
+        )
+        args = build_ingest_args(Path("in.mp4"), plan)
+        graph = args[args.index("-filter_complex") + 1]
+        assert args.count("-i") == 1
+        assert "[0:v:0]split=4" in graph and "[0:a:0]asplit=2" in graph
+        assert args[-3:] == ["-f", "s16le", "pipe:1"]
+        assert args[args.index("-progress") + 1] == "pipe:2"
+        assert str(tmp_path / "proxy.part.mp4") in args
+
+    def test_single_product_has_no_split(self, tmp_path):
+        plan = IngestPlan(duration_ms=5000, has_audio=False, thumbs_dir=tmp_path / "thumbs")
+        graph = build_ingest_args(Path("in.mp4"), plan)
+        graph = graph[graph.index("-filter_complex") + 1]
+        assert "split" not in graph and graph.startswith("[0:v:0]fps=")
+
+
+class TestRunIngest:
+    def test_products_are_finalized(self, source, tmp_path):
+        pcm = _pcm()
+        frames_dir = tmp_path / "frames"
+        frames_dir.mkdir()
+        plan = plan_ingest(source, proxy=True, frames_dir=frames_dir, waveform=True)
+        assert plan.products == ["proxy", "frames", "thumbnails", "poster", "waveform"]
+
+        progress = []
+        with patch.object(mi, "get_ffmpeg_runner", return_value=_runner(pcm=pcm)):
+            result = run_ingest(source, plan, on_progress=lambda p, pct: progress.append((p, pct)))
+
+        assert Path(result.proxy_path).read_bytes() == b"media"
+        assert result.frame_count == 3
+        assert sorted(p.name for p in frames_dir.glob("frame_*.jpg"))[-1] == "frame_000002000.jpg"
+        assert not (frames_dir / ".ingest").exists()
+        assert find_strip_thumbnail(source, 1400).name == "thumb_000001000.jpg"
+        assert find_strip_thumbnail(source, 9000).name == "thumb_000002000.jpg"
+        assert mi.find_poster(source) is not None
+        assert ("frames", 50) in progress and ("waveform", 100) in progress
+
+        # PCM 파이프 결과 = 같은 샘플의 WAV 결과
+        wav_path = tmp_path / "same.wav"
+        with wave.open(str(wav_path), "wb") as wf:
+            wf.setnchannels(1)
+            wf.setsampwidth(2)
+            wf.setframerate(16000)
+            wf.writeframes(pcm)
+        expected = compute_peaks_from_wav(wav_path)
+        assert result.waveform.duration_ms == expected.duration_ms == 2000
+        np.testing.assert_array_equal(result.waveform.peaks_pos, expected.peaks_pos)
+        np.testing.assert_allclose(result.waveform.rms, expected.rms)
+
+        # 다시 가져오면 남은 결과만 만든다
+        assert plan_ingest(source, proxy=True).products == []
+
+    def test_failure_removes_partial_outputs(self, source, tmp_path):
+        plan = plan_ingest(source, proxy=True)
+        with patch.object(mi, "get_ffmpeg_runner", return_value=_runner(returncode=1)), \
+                pytest.raises(RuntimeError, match="Invalid filter graph"):
+            run_ingest(source, plan)
+        assert not plan.thumbs_staging.exists()
+        assert find_strip_thumbnail(source, 0) is None
+        assert not mi.partial_proxy_path(plan.proxy_path).exists()
+
+
+class TestIngestRouting:
+    @pytest.fixture
+    def ctrl(self):
+        from src.ui.controllers.app_context import AppContext
+        from src.ui.controllers.media_controller import MediaController
+
+        ctx = MagicMock(spec=AppContext)
+        ctx.window = None
+        ctrl = MediaController(ctx)
+        yield ctrl
+        ctrl.ingest_queue._workers.clear()
+
+    def test_started_reports_proxy_only_when_requested(self, ctrl):
+        started = []
+        ctrl.proxy_started.connect(started.append)
+        ctrl._ingest_requests.update({"a.mp4": (None, True, False), "b.mp4": (None, False, True)})
+        ctrl.ingest_queue.started.emit("a.mp4")
+        ctrl.ingest_queue.started.emit("b.mp4")
+        assert started == ["a.mp4"]
+
+    def test_cancel_proxy_stops_ingest_pass(self, ctrl):
+        thread, worker = MagicMock(), MagicMock()
+        ctrl.ingest_queue._workers["a.mp4"] = (thread, worker, MagicMock())
+        ctrl._ingest_requests["a.mp4"] = (None, True, False)
+        with patch.object(ctrl, "_start_product_jobs") as fallback:
+            ctrl.cancel_proxy_generation("a.mp4")
+        worker.cancel.assert_called_once()
+        assert not ctrl.ingest_queue.is_queued("a.mp4") and not ctrl.is_proxy_generating()
+        fallback.assert_called_once_with("a.mp4", None, False, False)
+
+    def test_resume_requeues_interrupted_ingest(self, ctrl, tmp_path):
+        src = tmp_path / "a.mp4"
+        src.write_bytes(b"video")
+        state = tmp_path / "ingest_queue.json"
+        state.write_text(json.dumps({"version": 1, "jobs": [{"source": str(src)}, {"source": str(tmp_path / "gone.mp4")}]}))
+        ctrl.ingest_queue._state_path = state
+        ctrl.ctx.use_proxies = True
+        with patch.object(ctrl.proxy_queue, "resume", return_value=0), \
+                patch.object(ctrl.scrub_queue, "resume"), patch.object(ctrl, "start_ingest") as start:
+            ctrl.resume_proxy_jobs()
+        start.assert_called_once_with(src, proxy=True)
+
+    def test_queues_share_one_encode_cap(self, ctrl):
+        assert ctrl.ingest_queue._slots is ctrl.proxy_queue._slots is ctrl.scrub_queue._slots
+
+    def test_queue_state_stays_out_of_home(self, ctrl, tmp_path):
+        # conftest가 상태 파일을 tmp_path 아래로 돌린다
+        for queue in (ctrl.proxy_queue, ctrl.scrub_queue, ctrl.ingest_queue):
+            assert queue._state_path.is_relative_to(tmp_path)
@@ -0,0 +1,156 @@
+"""MediaMetadataStore — 한 파일당 ffprobe 한 번, 영구 저장, 동시 요청 합치기."""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import threading
+import time
+
+import pytest
+
+from src.services.media_metadata import MediaMetadataStore, MediaProbeError, parse_ffprobe_output
+
+_PROBE_JSON = json.dumps({
+    "streams": [
+        {
+            "index": 0, "codec_type": "video", "codec_name": "h264", "width": 1920, "height": 1080,
+            "avg_frame_rate": "30000/1001", "side_data_list": [{"rotation": -90}],
+        },
+        {
+            "index": 1, "codec_type": "audio", "codec_name": "aac", "channels": 2,
+            "channel_layout": "stereo", "sample_rate": "48000",
+        },
+    ],
+    "format": {"format_name": "mov,mp4,m4a,3gp,3g2,mj2", "duration": "12.345000"},
+})
+
+
+class _FakeRunner:
+    ffprobe_path = "ffprobe"
+
+    def __init__(self, stdout: str = _PROBE_JSON, returncode: int = 0, delay: float = 0.0):
+        self.stdout = stdout
+        self.returncode = returncode
+        self.delay = delay
+        self.calls = 0
+
+    def run_ffprobe(self, args, **kwargs):
+        self.calls += 1
+        time.sleep(self.delay)
+        return subprocess.CompletedProcess(args, self.returncode, stdout=self.stdout, stderr="boom")
+
+
+@pytest.fixture
+def media(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"\0" * 64)
+    return path
+
+
+class TestParse:
+    def test_streams_fps_rotation_and_audio_layout(self):
+        meta = parse_ffprobe_output(_PROBE_JSON, "/a.mp4", 1, 2)
+        assert (meta.width, meta.height, meta.rotation) == (1920, 1080, 270)
+        assert meta.fps == pytest.approx(29.97, abs=0.01)
+        assert meta.duration_ms == 12345 and meta.has_audio and meta.has_video
+        assert (meta.audio.channels, meta.audio.channel_layout, meta.audio.sample_rate) == (2, "stereo", 48000)
+
+    def test_audio_only_and_missing_duration(self):
+        meta = parse_ffprobe_output(
+            json.dumps({"streams": [{"index": 0, "codec_type": "audio"}], "format": {"duration": "N/A"}}),
+            "/a.mp3", 1, 2,
+        )
+        assert not meta.has_video and meta.width == 0 and meta.duration_s == 0.0
+
+    def test_garbage_raises(self):
+        with pytest.raises(MediaProbeError):
+            parse_ffprobe_output("duration=5.0", "/a.mp4", 1, 2)
+
+
+class TestMediaMetadataStore:
+    def test_probes_once_per_file_version(self, media):
+        runner = _FakeRunner()
+        store = MediaMetadataStore()
+        first = store.get(media, runner)
+        assert store.get(media, runner) is first and runner.calls == 1
+
+        media.write_bytes(b"\0" * 128)  # 크기 변경 → 다시 probe
+        assert store.get(media, runner).size == 128 and runner.calls == 2
+
+    def test_persistent_store_survives_restart(self, media, tmp_path):
+        db = tmp_path / "meta.sqlite3"
+        runner = _FakeRunner()
+        MediaMetadataStore(db).get(media, runner)
+        restarted = MediaMetadataStore(db)
+        assert restarted.get(media, runner).duration_ms == 12345
+        assert runner.calls == 1 and restarted.probe_count == 0
+
+        os.utime(media, ns=(0, 1_000_000_000))  # mtime 변경 → 저장된 항목 무효
+        assert MediaMetadataStore(db).get(media, runner).mtime_ns == 1_000_000_000
+        assert runner.calls == 2
+
+    def test_concurrent_callers_share_one_probe(self, media):
+        runner = _FakeRunner(delay=0.1)
+        store = MediaMetadataStore()
+        results = []
+        threads = [threading.Thread(target=lambda: results.append(store.get(media, runner))) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        assert runner.calls == 1 and len(results) == 8
+        assert all(r is results[0] for r in results)
+
+    def test_failures_are_not_cached(self, media):
+        store = MediaMetadataStore()
+        with pytest.raises(MediaProbeError):
+            store.get(media, _FakeRunner(returncode=1))
+        assert store.get(media, _FakeRunner()).has_audio
+
+    def test_missing_file_and_missing_ffprobe(self, media, tmp_path):
+        store = MediaMetadataStore()
+        with pytest.raises(FileNotFoundError):
+            store.get(tmp_path / "nope.mp4", _FakeRunner())
+        runner = _FakeRunner()
+        runner.ffprobe_path = None
+        with pytest.raises(MediaProbeError):
+            store.get(media, runner)
+
+    def test_lru_evicts_oldest(self, tmp_path):
+        runner = _FakeRunner()
+        store = MediaMetadataStore(max_entries=2)
+        paths = []
+        for i in range(3):
+            p = tmp_path / f"{i}.mp4"
+            p.write_bytes(b"x")
+            paths.append(p)
+            store.get(p, runner)
+        store.get(paths[2], runner)
+        assert runner.calls == 3
+        store.get(paths[0], runner)
+        assert runner.calls == 4
+
+
+class TestCallSites:
+    @pytest.fixture
+    def shared(self, monkeypatch):
+        import src.services.media_metadata as mm
+
+        runner = _FakeRunner()
+        monkeypatch.setattr(mm, "_default_store", MediaMetadataStore())
+        monkeypatch.setattr(mm, "get_ffmpeg_runner", lambda: runner)
+        return runner
+
+    def test_all_helpers_share_one_probe(self, shared, media):
+        from src.services.audio_merger import AudioMerger
+        from src.services.media_library_service import MediaLibraryService
+        from src.services.video_probe import probe_video
+
+        info = probe_video(media)
+        assert (info.width, info.height, info.duration_ms, info.has_audio) == (1920, 1080, 12345, True)
+        assert AudioMerger.has_audio_stream(media)
+        assert AudioMerger.get_audio_duration(media) == pytest.approx(12.345)
+        assert MediaLibraryService._get_video_info(None, media) == (1920, 1080, 12345)
+        assert shared.calls == 1
@@ -202,8 +202,9 @@ class TestGetSelectedClips:
 # ── 9. 멀티 삭제 + Undo 확인 ─────────────────────────────────────────────────
 
 class TestDeleteMultipleClipsUndo:
-    def test_delete_multiple_clips_calls_beginMacro(self):
-        """on_delete_selected_clips()는 beginMacro/endMacro를 호출한다."""
+    def test_delete_multiple_clips_pushes_one_batch_command(self):
+        """on_delete_selected_clips()는 DeleteClipsCommand 하나만 push한다 (매크로 없음)."""
+        from src.ui.commands import DeleteClipsCommand
         from src.ui.controllers.clip_controller import ClipController
 
         project = _make_project(num_tracks=1, clips_per_track=3)
@@ -213,22 +214,11 @@ class TestDeleteMultipleClipsUndo:
         ctrl = ClipController(ctx)
         ctrl.on_delete_selected_clips()
 
-        ctx.undo_stack.beginMacro.assert_called_once()
-        ctx.undo_stack.endMacro.assert_called_once()
-
-    def test_delete_multiple_clips_pushes_commands(self):
-        """on_delete_selected_clips()는 각 클립에 대해 push()를 호출한다."""
-        from src.ui.controllers.clip_controller import ClipController
-
-        project = _make_project(num_tracks=1, clips_per_track=3)
-        selected = [(0, 0), (0, 1)]
-        ctx = _make_ctx(project, selected_clips=selected)
-
-        ctrl = ClipController(ctx)
-        ctrl.on_delete_selected_clips()
-
-        # 2개 클립 삭제 → push 2번
-        assert ctx.undo_stack.push.call_count == 2
+        ctx.undo_stack.beginMacro.assert_not_called()
+        ctx.undo_stack.push.assert_called_once()
+        cmd = ctx.undo_stack.push.call_args[0][0]
+        assert isinstance(cmd, DeleteClipsCommand)
+        assert len(cmd._removed_clips) == 2
 
     def test_delete_clears_selection_after(self):
         """on_delete_selected_clips() 이후 _clear_selection()이 호출된다."""
@@ -58,6 +58,7 @@ class _MockCtx:
         self.pending_seek_ms: int | None = None
         self.pending_auto_play: bool = False
         self.play_intent: bool = False
+        self.scrubbing: bool = False
         self.frame_cache_service = None
         self.showing_cached_frame = False
         self.render_pause_timer = MagicMock()
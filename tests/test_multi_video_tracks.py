@@ -88,13 +88,13 @@ class TestBlendModeSerialization:
         assert loaded_vt.chroma_blend == pytest.approx(0.25)
 
     def test_project_version_11(self, tmp_path):
-        """저장 시 version=12 (hue 필드 추가로 v12 업데이트)."""
+        """저장 시 현재 PROJECT_VERSION으로 기록."""
         project = _make_project_with_two_tracks()
         path = tmp_path / "test.fmm.json"
         save_project(project, path)
         raw = path.read_bytes()
         data = json.loads(gzip.decompress(raw).decode("utf-8") if raw[:2] == b'\x1f\x8b' else raw.decode("utf-8"))
-        assert data["version"] == 12
+        assert data["version"] == PROJECT_VERSION
 
     def test_backward_compat_v10(self, tmp_path):
         """v10 파일 로드 → blend_mode 기본값 'normal'."""
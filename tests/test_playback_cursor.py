@@ -0,0 +1,75 @@
+"""재생 커서 테스트 — 전수 비교, 진입/이탈 이벤트, seek·역방향·점프, 트랙 버전."""
+
+from __future__ import annotations
+
+import random
+
+from src.models.subtitle import SubtitleSegment, SubtitleTrack
+from src.utils.playback_cursor import PlaybackCursor
+
+
+def _brute(starts, ends, pos) -> set[int]:
+    return {i for i, (s, e) in enumerate(zip(starts, ends)) if s <= pos < e}
+
+
+class TestPlaybackCursor:
+    def test_matches_brute_force_while_playing(self):
+        rng = random.Random(7)
+        starts = [rng.randrange(0, 100_000) for _ in range(400)]
+        ends = [s + rng.randrange(0, 5_000) for s in starts]
+        cursor = PlaybackCursor(starts, ends)
+        pos = 0
+        while pos < 110_000:
+            prev = set(cursor.active)
+            entered, exited = cursor.advance(pos)
+            expected = _brute(starts, ends, pos)
+            assert cursor.active == expected
+            assert set(entered) == expected - prev
+            assert set(exited) == prev - expected
+            pos += rng.randrange(1, 400)
+
+    def test_events_at_half_open_boundaries(self):
+        cursor = PlaybackCursor([100, 200], [200, 300])
+        assert cursor.advance(99) == ([], [])
+        assert cursor.advance(100) == ([0], [])
+        assert cursor.advance(200) == ([1], [0])
+        assert cursor.advance(300) == ([], [1])
+
+    def test_item_inside_one_tick_is_skipped(self):
+        cursor = PlaybackCursor([10, 0], [20, 1_000])
+        cursor.advance(5)
+        assert cursor.advance(30) == ([], [])
+        assert cursor.active == {1}
+
+    def test_zero_length_never_active(self):
+        cursor = PlaybackCursor([50, 50], [50, 60])
+        assert cursor.seek(50) == ([1], [])
+
+    def test_backward_move_falls_back_to_seek(self):
+        cursor = PlaybackCursor([0, 1_000], [500, 2_000])
+        cursor.advance(1_500)
+        entered, exited = cursor.advance(100)
+        assert (entered, exited) == ([0], [1])
+        assert cursor.position == 100
+
+    def test_seek_finds_long_items(self):
+        starts = [0] + list(range(100, 10_000, 100))
+        ends = [50_000] + [s + 50 for s in starts[1:]]
+        cursor = PlaybackCursor(starts, ends)
+        cursor.seek(9_925)
+        assert cursor.active == {0, len(starts) - 1}
+        # 먼 점프도 같은 결과
+        cursor.seek(0)
+        cursor.advance(9_925)
+        assert cursor.active == {0, len(starts) - 1}
+
+    def test_track_version_bumped_by_mutators(self):
+        track = SubtitleTrack()
+        v0 = track.version
+        track.add_segment(SubtitleSegment(0, 100, "a"))
+        track.update_segment_time(0, 10, 110)
+        track.remove_segment(0)
+        track.clear()
+        track.mark_modified()
+        assert track.version == v0 + 5
+        assert track == SubtitleTrack()  # 버전은 비교에서 제외
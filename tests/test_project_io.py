@@ -46,7 +46,7 @@ class TestSaveLoadV2:
         save_project(sample_project, path)
         raw = path.read_bytes()
         data = json.loads(gzip.decompress(raw).decode("utf-8") if raw[:2] == b'\x1f\x8b' else raw.decode("utf-8"))
-        assert data["version"] == 12  # Updated from v11 → v12 (hue 필드)
+        assert data["version"] == 13  # v12 → v13 (스타일 표)
         assert "tracks" in data
         assert "default_style" in data
 
@@ -316,7 +316,7 @@ class TestVideoClipTrack:
         raw = path.read_bytes()
         data = json.loads(gzip.decompress(raw).decode("utf-8") if raw[:2] == b'\x1f\x8b' else raw.decode("utf-8"))
 
-        assert data["version"] == 12  # Updated from v11 → v12 (hue 필드)
+        assert data["version"] == 13  # v12 → v13 (스타일 표)
         assert "video_clips" in data
         vc = data["video_clips"]
         # v7: video_clips is a dict with "items" key (single track serialization)
@@ -365,3 +365,227 @@ class TestVideoClipTrack:
         loaded = load_project(path)
         assert loaded.video_clip_track is not None
         assert loaded.video_clip_track.clips[0].source_path is None
+
+
+class TestWriteProjectData:
+    def test_compact_write_loads_and_leaves_no_temp(self, sample_project, tmp_path):
+        from src.services.project_io import project_to_dict, write_project_data
+
+        path = tmp_path / "compact.fmm.json"
+        write_project_data(project_to_dict(sample_project), path, indent=None, compresslevel=1)
+        assert load_project(path).subtitle_track[1].text == "반갑습니다"
+        assert [p.name for p in tmp_path.iterdir()] == ["compact.fmm.json"]
+
+    def test_failed_write_keeps_previous_file(self, sample_project, tmp_path):
+        from src.services.project_io import project_to_dict, write_project_data
+
+        path = tmp_path / "p.fmm.json"
+        save_project(sample_project, path)
+        before = path.read_bytes()
+        data = project_to_dict(sample_project)
+        data["bad"] = object()
+        with pytest.raises(TypeError):
+            write_project_data(data, path)
+        assert path.read_bytes() == before
+        assert [p.name for p in tmp_path.iterdir()] == ["p.fmm.json"]
+
+
+def _rich_project(n_segments: int = 6) -> ProjectState:
+    from src.models.image_overlay import ImageOverlay
+    from src.models.subtitle_animation import SubtitleAnimation
+
+    project = ProjectState()
+    project.video_path = Path("/fake/video.mp4")
+    project.duration_ms = 60_000
+    track = SubtitleTrack(name="Korean", language="ko", audio_path="/tts.wav", locked=True)
+    for i in range(n_segments):
+        track.add_segment(SubtitleSegment(
+            i * 1000, i * 1000 + 800, f"줄 {i % 3}",
+            style=SubtitleStyle(font_size=20 + i % 2) if i % 2 else None,
+            audio_file=f"/seg{i}.mp3" if i % 3 == 0 else None,
+            volume=0.5 if i == 1 else 1.0,
+            voice="" if i == 2 else ("ko-KR" if i % 2 else None),
+            speed=1.25 if i == 4 else None,
+            animation=SubtitleAnimation(in_effect="fade") if i == 5 else None,
+        ))
+    project.subtitle_tracks = [track, SubtitleTrack(name="Empty")]
+    project.image_overlay_track.add_overlay(ImageOverlay(100, 900, "/a.png"))
+    return project
+
+
+class TestBinaryProject:
+    def test_roundtrip_matches_json(self, tmp_path):
+        from src.services.project_io import project_to_dict
+
+        project = _rich_project()
+        save_project(project, tmp_path / "p.fmm", binary=True)
+        assert (tmp_path / "p.fmm").read_bytes()[:4] == b"FMMB"
+        loaded = load_project(tmp_path / "p.fmm")
+        assert loaded.subtitle_tracks[1].segments_loaded is False
+        assert loaded.subtitle_track.segments == project.subtitle_track.segments
+        assert project_to_dict(loaded) == project_to_dict(project)
+
+    def test_tracks_load_on_first_access(self, tmp_path):
+        save_project(_rich_project(), tmp_path / "p.fmm", binary=True)
+        track = load_project(tmp_path / "p.fmm").subtitle_track
+        assert not track.segments_loaded and track.name == "Korean" and track.locked
+        assert track[4].speed == 1.25 and track.segments_loaded
+        assert track[1].style is track[3].style  # 같은 스타일은 인터닝된 한 객체를 공유
+
+    def test_json_in_fmm_extension_still_loads(self, sample_project, tmp_path):
+        path = tmp_path / "old.fmm"
+        save_project(sample_project, path)
+        assert path.read_bytes()[:2] == b"\x1f\x8b"  # 확장자와 상관없이 기본은 JSON
+        assert load_project(path).subtitle_track[0].text == "안녕하세요"
+
+    def test_newer_format_version_rejected(self, tmp_path):
+        path = tmp_path / "p.fmm"
+        save_project(_rich_project(), path, binary=True)
+        raw = bytearray(path.read_bytes())
+        raw[4:6] = (99).to_bytes(2, "little")
+        path.write_bytes(bytes(raw))
+        with pytest.raises(ValueError, match="Unsupported"):
+            load_project(path)
+
+
+
+def _styled_project(n: int) -> ProjectState:
+    project = ProjectState()
+    project.subtitle_track.segments = [
+        SubtitleSegment(i * 100, i * 100 + 80, f"s{i}", style=SubtitleStyle(font_size=20 + i % 2))
+        for i in range(n)
+    ]
+    return project
+
+
+class TestStyleInterning:
+    def test_registry_returns_canonical_instance(self):
+        from src.models.style import StyleRegistry
+
+        registry = StyleRegistry()
+        a = registry.intern(SubtitleStyle(font_size=30))
+        assert registry.intern(SubtitleStyle(font_size=30)) is a
+        assert registry.intern(SubtitleStyle(font_size=31)) is not a
+        assert len(registry) == 2
+
+    def test_json_stores_style_table_with_refs(self, tmp_path):
+        path = tmp_path / "p.fmm.json"
+        save_project(_styled_project(2_000), path, binary=False)
+        raw = path.read_bytes()
+        data = json.loads(gzip.decompress(raw) if raw[:2] == b"\x1f\x8b" else raw)
+        assert len(data["styles"]) == 2
+        assert {seg["style"] for seg in data["tracks"][0]["segments"]} == {0, 1}
+
+        track = load_project(path).subtitle_track
+        assert len({id(seg.style) for seg in track}) == 2
+        assert track[0].style == SubtitleStyle(font_size=20)
+
+    def test_v12_inline_styles_are_interned(self, tmp_path):
+        path = tmp_path / "old.fmm.json"
+        style = {"font_family": "Arial", "font_size": 40}
+        path.write_text(json.dumps({
+            "version": 12,
+            "tracks": [{"name": "", "segments": [
+                {"start_ms": 0, "end_ms": 100, "text": "a", "style": dict(style)},
+                {"start_ms": 200, "end_ms": 300, "text": "b", "style": dict(style)},
+            ]}],
+        }), encoding="utf-8")
+        project = load_project(path)
+        track = project.subtitle_track
+        assert track[0].style is track[1].style and track[0].style.font_size == 40
+        assert len(project.style_registry) == 1
+
+    def test_export_ass_names_shared_styles_once(self, tmp_path):
+        from src.services.subtitle_exporter import export_ass
+
+        track = load_project(self._saved(tmp_path)).subtitle_track
+        export_ass(track, tmp_path / "out.ass")
+        text = (tmp_path / "out.ass").read_text(encoding="utf-8")
+        assert text.count("Style: Style") == 2
+        assert ",Style1,," in text and ",Style2,," in text
+
+    @staticmethod
+    def _saved(tmp_path) -> Path:
+        path = tmp_path / "p.fmm"
+        save_project(_styled_project(10), path)
+        return path
+
+
+class TestStreamingLoad:
+    @pytest.mark.parametrize("name", ["p.fmm.json", "p.fmm"])
+    def test_sections_arrive_in_ui_order(self, tmp_path, name):
+        from src.services.project_io import build_project, iter_load_project, project_to_dict
+
+        project = _rich_project()
+        project.active_track_index = 1
+        save_project(project, tmp_path / name, binary=name == "p.fmm")
+        sections = list(iter_load_project(tmp_path / name))
+        assert [n for n, _ in sections] == ["video", "subtitles", "overlays"]
+        header = sections[0][1]
+        assert header.video_path == Path("/fake/video.mp4")
+        assert len(header.image_overlay_track) == 0  # 뒤 섹션은 붙이기 전까지 영향 없음
+        assert project_to_dict(build_project(sections)) == project_to_dict(project)
+
+    def test_unknown_section_rejected(self):
+        from src.services.project_io import apply_project_section
+
+        with pytest.raises(ValueError):
+            apply_project_section(ProjectState(), "thumbnails", None)
+
+@pytest.mark.slow
+def test_binary_vs_json_100k_segments(tmp_path):
+    import time
+
+    project = ProjectState()
+    project.subtitle_track.segments = [
+        SubtitleSegment(
+            i * 100, i * 100 + 80, f"line {i % 5_000}",
+            style=SubtitleStyle(font_size=20) if i % 3 == 0 else None,
+            voice="ko-KR" if i % 2 else None,
+        )
+        for i in range(100_000)
+    ]
+    timings = {}
+    for name in ("p.fmm.json", "p.fmm"):
+        path = tmp_path / name
+        t0 = time.perf_counter()
+        save_project(project, path, binary=name == "p.fmm")
+        t1 = time.perf_counter()
+        loaded = load_project(path)
+        t2 = time.perf_counter()
+        assert len(loaded.subtitle_track) == 100_000
+        t3 = time.perf_counter()
+        timings[name] = (path.stat().st_size, t1 - t0, t2 - t1, t3 - t2)
+    for name, (size, save, load, first) in timings.items():
+        print(f"\n{name}: {size / 1e6:.2f}MB, save {save * 1000:.0f}ms, "
+              f"open {load * 1000:.0f}ms, first track access {first * 1000:.0f}ms")
+    json_size, json_save, json_load, _ = timings["p.fmm.json"]
+    bin_size, bin_save, bin_load, bin_first = timings["p.fmm"]
+    assert bin_size < json_size
+    assert bin_save < json_save
+    assert bin_load < json_load / 10
+    assert bin_load + bin_first < json_load
+
+
+@pytest.mark.slow
+def test_time_to_first_section_1k_clips_50k_segments(tmp_path):
+    import time
+
+    from src.models.video_clip import VideoClip
+    from src.services.project_io import build_project, iter_load_project
+
+    project = _styled_project(50_000)
+    project.video_path = Path("/fake/video.mp4")
+    project.video_clip_track.clips = [VideoClip(i * 1000, i * 1000 + 900) for i in range(1_000)]
+    for name in ("p.fmm.json", "p.fmm"):
+        path = tmp_path / name
+        save_project(project, path)
+        t0 = time.perf_counter()
+        sections = iter_load_project(path)
+        first = next(sections)
+        t1 = time.perf_counter()
+        loaded = build_project([first, *sections])
+        len(loaded.subtitle_track)
+        t2 = time.perf_counter()
+        assert len(loaded.video_clip_track.clips) == 1_000 and len(loaded.subtitle_track) == 50_000
+        print(f"\n{name}: first section {(t1 - t0) * 1000:.0f}ms, complete {(t2 - t0) * 1000:.0f}ms")
@@ -0,0 +1,132 @@
+"""ProjectLoadWorker — 섹션 순서, 진행률, 오류."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+from src.models.project import ProjectState
+from src.models.subtitle import SubtitleSegment
+from src.services.project_io import apply_project_section, save_project
+from src.workers.project_load_worker import ProjectLoadWorker
+
+
+def _saved(tmp_path) -> Path:
+    project = ProjectState()
+    project.video_path = Path("/fake/video.mp4")
+    project.subtitle_track.add_segment(SubtitleSegment(0, 1000, "hello"))
+    path = tmp_path / "p.fmm"
+    save_project(project, path)
+    return path
+
+
+def _collect(worker: ProjectLoadWorker) -> dict[str, list]:
+    got: dict[str, list] = {"progress": [], "sections": [], "finished": [], "error": []}
+    worker.progress.connect(lambda p, name: got["progress"].append(p))
+    worker.section_ready.connect(lambda name, payload: got["sections"].append((name, payload)))
+    worker.finished.connect(got["finished"].append)
+    worker.error.connect(got["error"].append)
+    return got
+
+
+class TestProjectLoadWorker:
+    def test_emits_sections_then_finished(self, qapp, tmp_path):
+        worker = ProjectLoadWorker(_saved(tmp_path))
+        got = _collect(worker)
+        worker.run()
+        assert [name for name, _ in got["sections"]] == ["video", "subtitles", "overlays"]
+        assert got["progress"] == sorted(got["progress"]) and got["progress"][-1] == 100
+        assert len(got["finished"]) == 1 and not got["error"]
+
+        project = got["sections"][0][1]
+        for name, payload in got["sections"][1:]:
+            apply_project_section(project, name, payload)
+        assert project.subtitle_track[0].text == "hello"
+
+    def test_cancel_stops_publishing(self, qapp, tmp_path):
+        worker = ProjectLoadWorker(_saved(tmp_path))
+        got = _collect(worker)
+        worker.section_ready.connect(lambda *_: worker.cancel())
+        worker.run()
+        assert [name for name, _ in got["sections"]] == ["video"]
+        assert not got["finished"] and not got["error"]
+
+    def test_missing_file_reports_error(self, qapp, tmp_path):
+        worker = ProjectLoadWorker(tmp_path / "missing.fmm")
+        got = _collect(worker)
+        worker.run()
+        assert len(got["error"]) == 1 and not got["sections"]
+
+    def test_runs_on_thread(self, qtbot, tmp_path):
+        from PySide6.QtCore import QThread
+
+        thread = QThread()
+        worker = ProjectLoadWorker(_saved(tmp_path))
+        got = _collect(worker)
+        worker.moveToThread(thread)
+        thread.started.connect(worker.run)
+        worker.finished.connect(thread.quit)
+        thread.start()
+        qtbot.waitUntil(thread.isFinished, timeout=5000)
+        assert len(got["sections"]) == 3 and len(got["finished"]) == 1
+
+
+class TestProjectControllerLoad:
+    def test_panels_locked_until_loaded(self, qtbot, tmp_path):
+        from unittest.mock import MagicMock
+
+        from PySide6.QtWidgets import QWidget
+
+        from src.ui.controllers.project_controller import ProjectController
+        from src.ui.subtitle_panel import SubtitlePanel
+
+        ctx = MagicMock()
+        ctx.subtitle_panel = SubtitlePanel()
+        ctx.templates_panel = QWidget()
+        qtbot.addWidget(ctx.subtitle_panel)
+        qtbot.addWidget(ctx.templates_panel)
+        ctrl = ProjectController(ctx)
+        ctrl.update_recent_menu = MagicMock()
+        ctrl._start_project_load(_saved(tmp_path))
+        assert ctx.subtitle_panel.is_read_only() and not ctx.templates_panel.isEnabled()
+        qtbot.waitUntil(lambda: ctrl._load_job is None, timeout=5000)
+        assert not ctx.subtitle_panel.is_read_only() and ctx.templates_panel.isEnabled()
+        ctrl.cleanup()
+
+    def test_load_error_restores_previous_project(self, qapp, tmp_path):
+        from unittest.mock import MagicMock, patch
+
+        import src.ui.controllers.project_controller as pc
+
+        ctx = MagicMock()
+        ctx.subtitle_panel = ctx.templates_panel = None
+        previous = ctx.project = ProjectState()
+        ctrl = pc.ProjectController(ctx)
+        with patch.object(pc, "QThread"), patch.object(pc, "ProjectLoadWorker"), \
+                patch.object(pc, "_ProjectLoadRelay"):
+            ctrl._start_project_load(tmp_path / "p.fmm")
+        relay = ctrl._load_job[2]
+        ctrl._on_project_section(relay, "video", ProjectState())
+        assert ctx.project is not previous
+        ctx.autosave.set_project.assert_called_with(None)
+
+        # 비디오 섹션 뒤 실패 — 부분 프로젝트를 버리고 로딩 전 프로젝트에 자동 저장을 다시 건다
+        with patch.object(pc, "QMessageBox"):
+            ctrl._on_project_load_error(relay, "boom")
+        assert ctx.project is previous
+        ctx.autosave.set_project.assert_called_with(previous)
+
+    def test_cleanup_stops_every_thread(self, qapp, tmp_path):
+        from unittest.mock import MagicMock
+
+        from src.ui.controllers.project_controller import ProjectController
+
+        ctx = MagicMock()
+        ctx.subtitle_panel = ctx.templates_panel = None
+        ctrl = ProjectController(ctx)
+        path = _saved(tmp_path)
+        ctrl._start_project_load(path)
+        ctrl._start_project_load(path)
+        threads = [thread for thread, _, _ in ctrl._load_jobs]
+        ctrl.cleanup()
+        assert ctrl._load_job is None and not ctrl._load_jobs
+        assert all(thread.isFinished() for thread in threads)
@@ -10,10 +10,17 @@ from src.services.proxy_service import (
     generate_proxy,
     get_proxy_path,
     is_proxy_valid,
+    partial_proxy_path,
 )
 from src.workers.proxy_worker import ProxyWorker
 
 
+def _fake_encode(args, process):
+    """FFmpeg 대신 출력 파일(마지막 인자)만 만든다."""
+    Path(args[-1]).write_bytes(b"proxy")
+    return process
+
+
 class TestProxyService:
     @patch("src.services.proxy_service.get_proxy_dir")
     def test_get_proxy_path(self, mock_get_dir, tmp_path):
@@ -34,35 +41,36 @@ class TestProxyService:
         # Same path should yield same proxy path
         assert get_proxy_path(video_path) == proxy_path
 
-    def test_is_proxy_valid(self, tmp_path):
+    @patch("src.services.proxy_service.get_proxy_dir")
+    def test_is_proxy_valid(self, mock_get_dir, tmp_path):
+        mock_get_dir.return_value = tmp_path / "proxies"
         video_path = tmp_path / "source.mp4"
-        proxy_path = tmp_path / "proxy.mp4"
-        
-        video_path.touch()
-        
+        video_path.write_bytes(b"frame data")
+        proxy_path = get_proxy_path(video_path)
+
         # Case 1: Proxy doesn't exist
         assert not is_proxy_valid(video_path, proxy_path)
-        
-        # Case 2: Proxy exists but is older than source
+
+        # Case 2: Proxy made from the current content
+        proxy_path.parent.mkdir(parents=True, exist_ok=True)
         proxy_path.touch()
-        # Set proxy mtime to 10 seconds ago
-        old_time = time.time() - 10
+        assert is_proxy_valid(video_path, proxy_path)
+
+        # Case 3: Touching the source does not change its content
+        old_time = time.time() + 10
         import os
-        os.utime(proxy_path, (old_time, old_time))
-        # Set source mtime to now
-        video_path.touch() 
-        
-        # Ensure filesystem timestamp resolution is handled
-        assert video_path.stat().st_mtime > proxy_path.stat().st_mtime
-        assert not is_proxy_valid(video_path, proxy_path)
-        
-        # Case 3: Proxy is newer than source
-        # Set source to old
         os.utime(video_path, (old_time, old_time))
-        proxy_path.touch() # Now
-        
         assert is_proxy_valid(video_path, proxy_path)
 
+        # Case 4: Source content changed → stale proxy
+        video_path.write_bytes(b"other data")
+        assert not is_proxy_valid(video_path, proxy_path)
+
+        # Case 5: A proxy not named after the source fingerprint
+        other = tmp_path / "proxy.mp4"
+        other.touch()
+        assert not is_proxy_valid(video_path, other)
+
     @patch("src.services.proxy_service.probe_video")
     @patch("src.services.proxy_service.get_ffmpeg_runner")
     def test_generate_proxy_success(self, mock_get_runner, mock_probe, tmp_path):
@@ -84,7 +92,7 @@ class TestProxyService:
         mock_process.returncode = 0
         mock_process.wait.return_value = None
         
-        mock_runner.run_async.return_value = mock_process
+        mock_runner.run_async.side_effect = lambda args, **kw: _fake_encode(args, mock_process)
         mock_get_runner.return_value = mock_runner
         
         progress_cb = MagicMock()
@@ -94,7 +102,9 @@ class TestProxyService:
         mock_runner.run_async.assert_called_once()
         args = mock_runner.run_async.call_args[0][0]
         assert str(video_path) in args
-        assert str(proxy_path) in args
+        # 작업 중 파일에 쓰고 성공하면 이름을 바꾼다
+        assert str(partial_proxy_path(proxy_path)) in args
+        assert proxy_path.exists() and not partial_proxy_path(proxy_path).exists()
         assert "-progress" in args
         
         # Check progress calls
@@ -171,7 +181,7 @@ class TestProxyService:
         mock_process.stdout = iter([])
         mock_process.returncode = 0
         mock_process.wait.return_value = None
-        mock_runner.run_async.return_value = mock_process
+        mock_runner.run_async.side_effect = lambda args, **kw: _fake_encode(args, mock_process)
         mock_get_runner.return_value = mock_runner
         
         result = generate_proxy(video_path, proxy_path, force=True)
@@ -0,0 +1,168 @@
+"""ProxyQueue — 동시 실행 제한, 화면 우선순위, 중단된 작업 이어서 생성. 하드웨어 인코더 폴백."""
+
+from __future__ import annotations
+
+import json
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+import pytest
+from PySide6.QtCore import QObject, Signal
+
+import src.services.proxy_queue as pq
+import src.services.proxy_service as ps
+from src.services.proxy_queue import EncodeSlots, ProxyQueue, default_proxy_concurrency
+
+
+class _FakeWorker(QObject):
+    """ProxyWorker 대역 — release될 때까지 '인코딩'한다."""
+
+    progress = Signal(int)
+    finished = Signal(str)
+    error = Signal(str)
+    gates: dict[str, threading.Event] = {}
+
+    def __init__(self, source_path: str, encoder: str | None = None):
+        super().__init__()
+        self.source = source_path
+        self.encoder = encoder
+        self.gate = self.gates.setdefault(source_path, threading.Event())
+
+    def run(self) -> None:
+        self.gate.wait(5)
+        self.finished.emit(f"{self.source}.proxy")
+
+    def cancel(self) -> None:
+        self.gate.set()
+
+
+@pytest.fixture
+def fake_worker(monkeypatch):
+    _FakeWorker.gates = {}
+    monkeypatch.setattr(pq, "ProxyWorker", _FakeWorker)
+    return _FakeWorker
+
+
+def _queue(**kwargs) -> ProxyQueue:
+    kwargs.setdefault("encoder", lambda: "libx264")
+    return ProxyQueue(**kwargs)
+
+
+class TestConcurrency:
+    @pytest.mark.parametrize("encoder, cpu, expected", [
+        ("libx264", 16, 4), ("libx264", 2, 1), ("h264_nvenc", 16, 3),
+        ("h264_nvenc", 2, 1), ("h264_videotoolbox", 8, 2),
+    ])
+    def test_default_concurrency(self, encoder, cpu, expected):
+        assert default_proxy_concurrency(encoder, cpu) == expected
+
+
+class TestProxyQueue:
+    def test_cap_and_priority_order(self, qtbot, fake_worker):
+        queue = _queue(max_workers=1)
+        started, finished = [], []
+        queue.started.connect(started.append)
+        queue.finished.connect(lambda src, proxy: finished.append((src, proxy)))
+
+        for name, priority in (("a", 0), ("b", 0), ("c", 5)):
+            queue.request(name, priority)
+        assert started == ["a"] and queue.pending_sources() == ["c", "b"]
+        queue.update_priorities({"b": 10})
+        assert queue.pending_sources() == ["b", "c"]
+
+        for name in ("a", "b", "c"):
+            fake_worker.gates.setdefault(name, threading.Event()).set()
+        qtbot.waitUntil(lambda: len(finished) == 3, timeout=5000)
+        assert started == ["a", "b", "c"]
+        assert finished[0] == ("a", "a.proxy") and not queue.is_busy()
+        qtbot.waitUntil(lambda: not queue._retired, timeout=5000)
+
+    def test_state_survives_shutdown_and_resumes(self, qtbot, fake_worker, tmp_path):
+        state = tmp_path / "proxy_queue.json"
+        sources = [tmp_path / f"{n}.mp4" for n in ("a", "b", "done")]
+        for p in sources:
+            p.write_bytes(p.name.encode())
+        done_proxy = tmp_path / "done_proxy.mp4"
+        done_proxy.touch()
+
+        queue = _queue(state_path=state, max_workers=1)
+        for p in sources:
+            queue.request(str(p))
+        queue.request(str(tmp_path / "gone.mp4"))
+        queue.cancel(str(sources[1]))
+        queue.shutdown()
+        saved = [j["source"] for j in json.loads(state.read_text())["jobs"]]
+        assert saved == [str(sources[0]), str(sources[2]), str(tmp_path / "gone.mp4")]
+
+        # 이미 만든 프록시와 사라진 소스는 건너뛴다
+        def fake_proxy_path(src: Path) -> Path:
+            return done_proxy if src == sources[2] else tmp_path / f"{src.stem}_proxy.mp4"
+
+        with patch.object(pq, "get_proxy_path", fake_proxy_path), \
+                patch.object(pq, "is_proxy_valid", lambda src, proxy: proxy.exists()):
+            resumed = _queue(state_path=state, max_workers=1)
+            started = []
+            resumed.started.connect(started.append)
+            assert resumed.resume() == 1
+        assert started == [str(sources[0])]
+        fake_worker.gates[str(sources[0])].set()
+        qtbot.waitUntil(lambda: not resumed.is_busy(), timeout=5000)
+        assert json.loads(state.read_text())["jobs"] == []
+        qtbot.waitUntil(lambda: not resumed._retired, timeout=5000)
+
+
+    def test_shared_slots_cap_all_queues(self, qtbot, fake_worker):
+        slots = EncodeSlots(max_workers=2)
+        proxies = _queue(slots=slots)
+        scrub = _queue(slots=slots, max_workers=1, worker_factory=lambda src, _enc: _FakeWorker(f"scrub:{src}"))
+        finished = []
+        scrub.finished.connect(lambda src, _proxy: finished.append(src))
+        for name in ("a", "b", "c"):
+            proxies.request(name)
+        scrub.request("a")
+        assert (proxies.active_count(), scrub.active_count()) == (2, 0)
+
+        # 프록시 하나가 끝나면 빈 슬롯은 먼저 등록된 대기열부터 채운다
+        fake_worker.gates["a"].set()
+        qtbot.waitUntil(lambda: proxies.is_queued("c") and "c" not in proxies.pending_sources(), timeout=5000)
+        assert scrub.active_count() == 0
+        fake_worker.gates["b"].set()
+        qtbot.waitUntil(lambda: scrub.active_count() == 1, timeout=5000)
+        assert slots.active_count() == 2
+        for gate in ("c", "scrub:a"):
+            fake_worker.gates[gate].set()
+        qtbot.waitUntil(lambda: finished == ["a"] and not proxies.is_busy(), timeout=5000)
+        qtbot.waitUntil(lambda: not proxies._retired and not scrub._retired, timeout=5000)
+
+class TestEncoderFallback:
+    def test_proxy_encoder_falls_back_after_hw_failure(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(ps, "_hw_encoder_failed", False)
+        source, proxy = tmp_path / "src.mp4", tmp_path / "proxy.mp4"
+        source.write_bytes(b"video")
+
+        def run_async(args, **kwargs):
+            process = MagicMock()
+            process.stdout = iter([])
+            if "h264_nvenc" in args:
+                process.stderr = iter(["[h264_nvenc] No capable devices found\n"])
+                process.returncode = 1
+            else:
+                Path(args[-1]).write_bytes(b"proxy")
+                process.stderr = iter([])
+                process.returncode = 0
+            return process
+
+        runner = MagicMock()
+        runner.run_async.side_effect = run_async
+        with patch.object(ps, "get_ffmpeg_runner", return_value=runner):
+            assert ps.generate_proxy(source, proxy, encoder="h264_nvenc")
+        encoders = [call.args[0][call.args[0].index("-c:v") + 1] for call in runner.run_async.call_args_list]
+        assert encoders == ["h264_nvenc", "libx264"]
+        assert proxy.read_bytes() == b"proxy"
+        assert ps.proxy_encoder() == "libx264"
+
+    def test_vaapi_uploads_scaled_frames(self):
+        args = ps._proxy_args(Path("in.mp4"), Path("out.mp4"), "h264_vaapi")
+        assert args[args.index("-vf") + 1].endswith("hwupload")
+        assert args.index("-vaapi_device") < args.index("-i")
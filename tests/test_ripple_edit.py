@@ -2,6 +2,9 @@
 
 from __future__ import annotations
 
+import random
+import time
+
 import pytest
 
 from src.models.audio import AudioClip, AudioTrack
@@ -10,7 +13,7 @@ from src.models.project import ProjectState
 from src.models.subtitle import SubtitleSegment, SubtitleTrack
 from src.models.text_overlay import TextOverlay, TextOverlayTrack
 from src.models.video_clip import VideoClip, VideoClipTrack
-from src.services.ripple_edit_service import RippleEditService
+from src.services.ripple_edit_service import RangeShiftMap, RippleEditService
 
 
 # ── Helpers ──────────────────────────────────────────────────────────────────
@@ -204,3 +207,210 @@ class TestDeleteClipCommandBGMRipple:
         cmd.redo()
 
         assert project.bgm_tracks[0].clips[0].start_ms == 6000  # 변화 없음
+
+
+# ── Suffix deltas ─────────────────────────────────────────────────────────────
+
+class TestRippleDeltas:
+    def test_ripple_revert_round_trip(self):
+        project = _make_project_with_bgm_and_text()
+        snap = (
+            [(s.start_ms, s.end_ms) for s in project.subtitle_tracks[0]],
+            [c.start_ms for c in project.bgm_tracks[0].clips],
+            [(o.start_ms, o.end_ms) for o in project.text_overlay_track.overlays],
+        )
+        deltas = RippleEditService.ripple(project, 3000, -700)
+        assert [d.start for d in deltas] == [1, 1, 1]
+        RippleEditService.revert(deltas)
+        assert snap == (
+            [(s.start_ms, s.end_ms) for s in project.subtitle_tracks[0]],
+            [c.start_ms for c in project.bgm_tracks[0].clips],
+            [(o.start_ms, o.end_ms) for o in project.text_overlay_track.overlays],
+        )
+
+    def test_only_suffix_touched(self):
+        track = SubtitleTrack()
+        track.segments = [_make_segment(i * 100, i * 100 + 50) for i in range(10)]
+        version = track.version
+        delta = RippleEditService.shift_suffix(track.segments, 700, 25, owner=track)
+        assert (delta.start, delta.count) == (7, 3)
+        assert [s.start_ms for s in track][6:] == [600, 725, 825, 925]
+        assert track.version == version + 1
+        assert RippleEditService.shift_suffix(track.segments, 5_000, 25) is None
+
+    def test_delete_clip_undo_is_exact(self):
+        from src.ui.commands import DeleteClipCommand
+
+        project = ProjectState()
+        project.video_tracks[0].clips = [VideoClip(0, 1000), VideoClip(0, 1000), VideoClip(0, 1000)]
+        track = project.subtitle_tracks[0]
+        for s, e in [(100, 900), (900, 1100), (1100, 1900), (1900, 2100), (2100, 2900)]:
+            track.add_segment(_make_segment(s, e))
+        iot = ImageOverlayTrack()
+        iot.add_overlay(ImageOverlay(1200, 1800, "o.png"))
+        iot.add_overlay(ImageOverlay(2500, 2600, "p.png"))
+        project.image_overlay_track = iot
+        before = ([(s.start_ms, s.end_ms) for s in track], [(o.start_ms, o.end_ms) for o in iot])
+
+        cmd = DeleteClipCommand(project, 0, 1, project.video_tracks[0].clips[1], track, iot, 1000, 2000)
+        cmd.redo()
+        assert [(s.start_ms, s.end_ms) for s in track] == [(100, 900), (900, 1000), (1000, 1100), (1100, 1900)]
+        assert [(o.start_ms, o.end_ms) for o in iot] == [(1500, 1600)]
+        cmd.undo()
+        assert ([(s.start_ms, s.end_ms) for s in track], [(o.start_ms, o.end_ms) for o in iot]) == before
+
+
+    def test_moves_keep_start_order(self):
+        """이동/트림 명령은 시작 순으로 다시 정렬한다 — 리플의 이진 탐색이 뒤 항목을 모두 찾는다."""
+        from src.ui.commands import MoveAudioClipCommand, MoveTextOverlayCommand, TrimAudioClipCommand
+
+        project = ProjectState()
+        bgm = project.bgm_tracks[0]
+        bgm.clips = [_make_bgm_clip(10_000), _make_bgm_clip(20_000)]
+        tt = TextOverlayTrack()
+        tt.overlays = [_make_text_overlay(10_000, 11_000), _make_text_overlay(20_000, 21_000)]
+        project.text_overlay_track = tt
+        first = bgm.clips[0]
+        MoveAudioClipCommand(first, 10_000, 30_000, bgm).redo()
+        MoveTextOverlayCommand(tt.overlays[0], 10_000, 11_000, 30_000, 31_000, tt).redo()
+        assert [c.start_ms for c in bgm.clips] == [20_000, 30_000]
+        assert [(o.start_ms, o.end_ms) for o in tt] == [(20_000, 21_000), (30_000, 31_000)]
+
+        deltas = RippleEditService.ripple(project, 15_000, 1_000)
+        assert [c.start_ms for c in bgm.clips] == [21_000, 31_000]
+        assert [o.start_ms for o in tt] == [21_000, 31_000]
+        RippleEditService.revert(deltas)
+
+        trim = TrimAudioClipCommand(first, 30_000, 2000, 5_000, 2000, bgm)
+        trim.redo()
+        assert bgm.clips[0] is first
+        trim.undo()
+        assert bgm.clips[1] is first
+
+
+# ── Batch delete ──────────────────────────────────────────────────────────────
+
+def _random_timeline(n_clips: int, n_items: int, seed: int) -> ProjectState:
+    rng = random.Random(seed)
+    project = ProjectState()
+    project.video_tracks[0].clips = [VideoClip(0, rng.randrange(200, 3_000)) for _ in range(n_clips)]
+    total = project.video_tracks[0].output_duration_ms
+    track = project.subtitle_tracks[0]
+    iot = ImageOverlayTrack()
+    tt = TextOverlayTrack()
+    for _ in range(n_items):
+        s = rng.randrange(0, total)
+        track.add_segment(_make_segment(s, s + rng.randrange(1, 4_000)))
+        s = rng.randrange(0, total)
+        iot.add_overlay(ImageOverlay(s, s + rng.randrange(1, 6_000), "o.png"))
+        s = rng.randrange(0, total)
+        tt.add_overlay(_make_text_overlay(s, s + 500))
+    project.image_overlay_track = iot
+    project.text_overlay_track = tt
+    project.bgm_tracks[0].clips = sorted(
+        (_make_bgm_clip(rng.randrange(0, total)) for _ in range(n_items // 4)), key=lambda c: c.start_ms,
+    )
+    return project
+
+
+def _state(project: ProjectState):
+    return (
+        [c.duration_ms for c in project.video_tracks[0].clips],
+        [(s.start_ms, s.end_ms) for s in project.subtitle_tracks[0]],
+        [(o.start_ms, o.end_ms) for o in project.image_overlay_track],
+        # 시작이 같은 항목의 순서는 정렬 경로에 따라 다를 수 있다
+        sorted((o.start_ms, o.end_ms) for o in project.text_overlay_track),
+        sorted(c.start_ms for c in project.bgm_tracks[0].clips),
+    )
+
+
+class TestRangeShiftMap:
+    def test_merges_and_maps(self):
+        shift_map = RangeShiftMap([(500, 700), (100, 200), (150, 300), (700, 800)])
+        assert (shift_map.starts, shift_map.ends, shift_map.total_ms) == ([100, 500, 700], [300, 700, 800], 500)
+        assert [shift_map.map(t) for t in (50, 100, 250, 300, 499, 600, 750, 800, 1_000)] == [
+            50, 100, 100, 100, 299, 300, 300, 300, 500,
+        ]
+        assert shift_map.overlaps(250, 260) and not shift_map.overlaps(300, 500)
+
+
+class TestDeleteClipsCommand:
+    @pytest.mark.parametrize("seed", [1, 2, 3])
+    def test_matches_sequential_deletes_and_undo_is_exact(self, seed):
+        from src.ui.commands import DeleteClipCommand, DeleteClipsCommand
+
+        targets = sorted(random.Random(seed).sample(range(40), 12))
+
+        seq = _random_timeline(40, 300, seed)
+        vt = seq.video_tracks[0]
+        for ci in reversed(targets):
+            start = vt.clip_timeline_start(ci)
+            DeleteClipCommand(
+                seq, 0, ci, vt.clips[ci], seq.subtitle_tracks[0], seq.image_overlay_track,
+                start, start + vt.clips[ci].duration_ms,
+            ).redo()
+
+        batch = _random_timeline(40, 300, seed)
+        before = _state(batch)
+        cmd = DeleteClipsCommand(
+            batch, [(0, ci) for ci in targets], batch.subtitle_tracks[0], batch.image_overlay_track,
+        )
+        cmd.redo()
+        assert _state(batch) == _state(seq)
+        cmd.undo()
+        assert _state(batch) == before
+        cmd.redo()
+        assert _state(batch) == _state(seq)
+
+
+    def test_after_moves(self):
+        from src.ui.commands import DeleteClipsCommand, MoveAudioClipCommand, MoveTextOverlayCommand
+
+        project = ProjectState()
+        project.video_tracks[0].clips = [VideoClip(0, 10_000) for _ in range(4)]
+        bgm = project.bgm_tracks[0]
+        bgm.clips = [_make_bgm_clip(10_000), _make_bgm_clip(20_000)]
+        tt = TextOverlayTrack()
+        tt.overlays = [_make_text_overlay(10_000, 11_000), _make_text_overlay(20_000, 21_000)]
+        project.text_overlay_track = tt
+        MoveAudioClipCommand(bgm.clips[0], 10_000, 30_000, bgm).redo()
+        MoveTextOverlayCommand(tt.overlays[0], 10_000, 11_000, 30_000, 31_000, tt).redo()
+        before = ([c.start_ms for c in bgm.clips], [(o.start_ms, o.end_ms) for o in tt])
+
+        cmd = DeleteClipsCommand(project, [(0, 1)], project.subtitle_tracks[0], None)
+        cmd.redo()
+        assert [c.start_ms for c in bgm.clips] == [10_000, 20_000]
+        assert [(o.start_ms, o.end_ms) for o in tt] == [(10_000, 11_000), (20_000, 21_000)]
+        cmd.undo()
+        assert ([c.start_ms for c in bgm.clips], [(o.start_ms, o.end_ms) for o in tt]) == before
+
+@pytest.mark.slow
+class TestRippleBenchmark:
+    """5만 세그먼트 — 끝부분 리플은 이동하는 접미사만큼만 비용이 든다."""
+
+    def test_tail_ripple_50k(self):
+        track = SubtitleTrack()
+        track.segments = [_make_segment(i * 100, i * 100 + 80) for i in range(50_000)]
+        best = float("inf")
+        for _ in range(5):
+            t0 = time.perf_counter()
+            delta = RippleEditService.shift_suffix(track.segments, 4_999_000, 500, owner=track)
+            RippleEditService.revert([delta])
+            best = min(best, time.perf_counter() - t0)
+        print(f"\n50k tail ripple + revert: {best * 1e6:.0f}us")
+        assert best < 0.001
+
+    def test_batch_delete_200_clips(self):
+        from src.ui.commands import DeleteClipsCommand
+
+        project = _random_timeline(1_000, 20_000, 7)
+        targets = [(0, ci) for ci in range(0, 1_000, 5)]
+        cmd = DeleteClipsCommand(project, targets, project.subtitle_tracks[0], project.image_overlay_track)
+        t0 = time.perf_counter()
+        cmd.redo()
+        elapsed = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        cmd.undo()
+        undo_elapsed = time.perf_counter() - t0
+        print(f"\n200-clip batch delete over 20k items/track: redo {elapsed * 1000:.1f}ms, undo {undo_elapsed * 1000:.1f}ms")
+        assert elapsed < 0.5
@@ -0,0 +1,119 @@
+"""Scrub proxy tier — all-intra 조각을 이어 붙이고, 준비된 앞부분만 스크럽에 쓴다."""
+
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+import src.services.scrub_proxy as sp
+from src.services.scrub_proxy import ScrubManifest, find_scrub_tier, generate_scrub_tier, scrub_height_for_widget
+
+
+@pytest.fixture
+def source(tmp_path):
+    path = tmp_path / "clip.mp4"
+    path.write_bytes(b"video")
+    with patch.object(sp, "get_proxy_dir", return_value=tmp_path / "proxies"):
+        (tmp_path / "proxies").mkdir()
+        yield path
+
+
+def _runner(fail_at_ms: int | None = None) -> MagicMock:
+    """Fake FFmpeg: writes a chunk named after its start time."""
+
+    def run(args, **kwargs):
+        start = args[args.index("-ss") + 1]
+        if fail_at_ms is not None and float(start) * 1000 >= fail_at_ms:
+            return SimpleNamespace(returncode=1, stderr="boom")
+        Path(args[-1]).write_bytes(f"[{start}]".encode())
+        return SimpleNamespace(returncode=0, stderr="")
+
+    runner = MagicMock()
+    runner.is_available.return_value = True
+    runner.run.side_effect = run
+    return runner
+
+
+def _generate(path, runner, duration_ms=25_000, height=360):
+    with patch.object(sp, "get_ffmpeg_runner", return_value=runner), \
+            patch.object(sp, "probe_media", return_value=SimpleNamespace(duration_ms=duration_ms)):
+        return generate_scrub_tier(path, height)
+
+
+class TestScrubHeight:
+    @pytest.mark.parametrize("height, dpr, expected", [(300, 1.0, 300), (300, 2.0, 540), (50, 1.0, 144), (301, 1.0, 300)])
+    def test_clamped_even(self, height, dpr, expected):
+        assert scrub_height_for_widget(height, dpr) == expected
+
+
+class TestGenerate:
+    def test_chunks_are_intra_and_keep_source_time(self, source):
+        runner = _runner()
+        assert _generate(source, runner)
+        ts_path, manifest_path = sp.get_scrub_paths(source)
+        assert ts_path.read_bytes() == b"[0.000][10.000][20.000]"
+        args = runner.run.call_args_list[1].args[0]
+        assert args[args.index("-g") + 1] == "1"
+        assert args[args.index("-output_ts_offset") + 1] == "10.000"
+        assert args[args.index("-t") + 1] == "10.000"
+        assert runner.run.call_args_list[2].args[0][args.index("-t") + 1] == "5.000"
+        assert ScrubManifest.load(manifest_path).complete
+
+    def test_prefix_usable_and_resume_continues(self, source):
+        assert not _generate(source, _runner(fail_at_ms=20_000))
+        # 준비된 앞부분 안에서만 스크럽 티어를 쓴다
+        assert find_scrub_tier(source, 15_000)
+        assert find_scrub_tier(source, 20_000) is None
+
+        ts_path, _ = sp.get_scrub_paths(source)
+        with open(ts_path, "ab") as f:
+            f.write(b"half a chunk")  # 붙이다 중단된 조각
+        runner = _runner()
+        assert _generate(source, runner)
+        assert runner.run.call_count == 1
+        assert ts_path.read_bytes() == b"[0.000][10.000][20.000]"
+        assert find_scrub_tier(source, 24_000) == str(ts_path)
+
+    def test_larger_preview_rebuilds(self, source):
+        assert _generate(source, _runner(), height=200)
+        runner = _runner()
+        assert _generate(source, runner, height=540)
+        assert runner.run.call_count == 3
+        _, manifest_path = sp.get_scrub_paths(source)
+        assert ScrubManifest.load(manifest_path).height == 540
+
+
+class TestTimelineScrubSignals:
+    def test_playhead_drag_emits_after_threshold(self, qtbot):
+        from src.ui.timeline_widget import TimelineWidget
+
+        tw = TimelineWidget()
+        qtbot.addWidget(tw)
+        events = []
+        tw.scrub_started.connect(lambda: events.append("start"))
+        tw.scrub_finished.connect(lambda: events.append("finish"))
+        tw.resize(800, 100)
+        tw.set_duration(60_000)
+        drag = tw._drag_mgr
+        drag.start_playhead(100)
+        drag.on_move(101, 10)
+        assert events == []
+        drag.on_move(300, 10)
+        drag.on_move(320, 10)
+        drag.on_release()
+        assert events == ["start", "finish"]
+
+    def test_plain_click_seeks_without_scrub(self, qtbot):
+        from src.ui.timeline_widget import TimelineWidget
+
+        tw = TimelineWidget()
+        qtbot.addWidget(tw)
+        events = []
+        tw.scrub_started.connect(lambda: events.append("start"))
+        tw.scrub_finished.connect(lambda: events.append("finish"))
+        tw._drag_mgr.start_seek(50)
+        tw._drag_mgr.on_release()
+        assert events == []
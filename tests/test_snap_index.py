@@ -0,0 +1,142 @@
+"""자석 스냅 인덱스 테스트 — 참조 카운트, 스냅샷, 자기 경계 제외, 레인 단위 갱신, 10만 지점 규모."""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtWidgets import QApplication
+
+from src.models.project import ProjectState
+from src.models.subtitle import SubtitleSegment
+from src.models.video_clip import VideoClip, VideoClipTrack
+from src.ui.timeline_drag import DragMode
+from src.ui.timeline_painter import LANE_SUBTITLE
+from src.utils.snap_index import SnapIndex
+
+_app = QApplication.instance() or QApplication([])
+
+
+class TestSnapIndex:
+    def test_shared_time_kept_until_last_reference(self):
+        index = SnapIndex()
+        index.add([100, 200, 200, 300])
+        index.remove([200])
+        assert index.times.tolist() == [100, 200, 300]
+        index.remove([200])
+        assert index.times.tolist() == [100, 300]
+
+    def test_remove_missing_ignored(self):
+        index = SnapIndex()
+        index.add([10])
+        index.remove([10, 20])
+        assert len(index) == 0
+
+    def test_snapshot_unaffected_by_later_updates(self):
+        index = SnapIndex()
+        index.add([100, 500])
+        snap = index.snapshot()
+        index.remove([100])
+        index.add([110])
+        assert snap.nearest(104) == 100
+
+    def test_exclude_skips_own_edges_only(self):
+        index = SnapIndex()
+        index.add([100, 200, 200, 400])
+        # 200은 두 항목이 공유 — 한 번 제외해도 남는다
+        assert index.snapshot(exclude=[200]).nearest(190) == 200
+        assert index.snapshot(exclude=[200, 200]).nearest(190) == 100
+        assert index.snapshot(exclude=[100, 200, 200]).nearest(190) == 400
+
+    def test_extra_candidates_and_tie(self):
+        index = SnapIndex()
+        index.add([100, 300])
+        snap = index.snapshot(extra=[0, 205])
+        assert snap.nearest(200) == 205
+        assert snap.nearest(200 - 100) == 100
+        assert index.snapshot().nearest(200) == 100  # 동률이면 작은 쪽
+        assert SnapIndex().snapshot().nearest(50) is None
+
+
+def _make_timeline(n_segments: int = 100):
+    from src.ui.timeline_widget import TimelineWidget
+
+    project = ProjectState()
+    project.video_tracks = [VideoClipTrack(clips=[VideoClip(0, 10_000) for _ in range(10)])]
+    project.duration_ms = 100_000
+    for i in range(n_segments):
+        project.subtitle_track.add_segment(SubtitleSegment(i * 1_000, i * 1_000 + 600, f"s{i}"))
+    tw = TimelineWidget()
+    tw.resize(1000, 300)
+    tw.set_project(project)
+    tw.set_track(project.subtitle_track)
+    tw.set_duration(project.duration_ms, has_video=True)
+    tw._playhead_ms = 55_555
+    return tw
+
+
+class TestTimelineSnap:
+    def test_dragged_segment_excludes_own_edges(self):
+        tw = _make_timeline()
+        drag = tw._drag_mgr
+        drag.mode = DragMode.MOVE
+        candidates = drag.get_snap_candidates(skip_seg_index=5)
+        # 세그먼트 5(5000~5600) 자신의 경계는 제외 → 이웃 세그먼트 경계로
+        assert candidates.nearest(5_050) == 4_600
+        assert candidates.nearest(5_550) == 6_000
+        assert candidates.nearest(55_500) == 55_555
+
+    def test_snapshot_reused_during_drag(self):
+        tw = _make_timeline()
+        drag = tw._drag_mgr
+        drag.mode = DragMode.MOVE
+        first = drag.get_snap_candidates(skip_seg_index=5)
+        tw._track[5].start_ms += 100
+        tw._invalidate_lane(LANE_SUBTITLE)
+        assert drag.get_snap_candidates(skip_seg_index=5) is first
+        drag.on_release()
+        assert drag._snap_candidates is None
+
+    def test_subtitle_drag_marks_track_modified(self):
+        """드래그가 세그먼트 시간을 직접 바꾸므로 버전 키 캐시(오버레이·재생 커서)를 무효화한다."""
+        tw = _make_timeline()
+        drag = tw._drag_mgr
+        track = tw._track
+        x = tw._ms_to_x(5_000)
+        for mode in (DragMode.MOVE, DragMode.RESIZE_LEFT, DragMode.RESIZE_RIGHT):
+            drag.start_subtitle(mode, 5, x)
+            version = track.version
+            drag.on_move(x + 20, 10)
+            assert track.version > version
+            drag.on_release()
+
+    def test_lane_edit_updates_index(self):
+        tw = _make_timeline()
+        assert 3_600 in tw._synced_snap_index().times
+        tw._track[3].end_ms = 3_700
+        tw._invalidate_lane(LANE_SUBTITLE)
+        times = tw._synced_snap_index().times
+        assert 3_700 in times and 3_600 not in times
+        # 클립 경계(3만)는 자막 세그먼트 시작과 공유 — 다른 레인 갱신에도 유지
+        assert 30_000 in times
+
+    def test_unchanged_lanes_not_reapplied(self):
+        tw = _make_timeline()
+        index = tw._synced_snap_index()
+        before = index.times
+        tw._synced_snap_index()
+        assert index.times is before
+
+    def test_drag_start_scales_to_100k_edges(self):
+        tw = _make_timeline(50_000)
+        tw._synced_snap_index()
+        tw._track[10].end_ms += 10
+        tw._invalidate_lane(LANE_SUBTITLE)
+        drag = tw._drag_mgr
+        drag.mode = DragMode.MOVE
+        t0 = time.perf_counter()
+        candidates = drag.get_snap_candidates(skip_seg_index=10)
+        for ms in range(0, 50_000_000, 500_000):
+            candidates.nearest(ms)
+        elapsed = time.perf_counter() - t0
+        assert len(candidates) >= 100_000
+        assert elapsed < 0.25
@@ -0,0 +1,125 @@
+"""자막 시간 열(SubtitleColumns) 테스트 — 선형 루프와의 결과 일치, 변경 행만 되쓰기, 10만 세그먼트 벤치마크."""
+
+from __future__ import annotations
+
+import random
+import time
+
+import numpy as np
+import pytest
+
+from src.models.subtitle import SubtitleSegment, SubtitleTrack
+from src.utils.subtitle_columns import SubtitleColumns, srt_times, write_times
+from src.utils.time_utils import ms_to_srt_time
+
+
+def _random_track(n: int, seed: int = 1) -> SubtitleTrack:
+    rng = random.Random(seed)
+    track = SubtitleTrack()
+    pos = 0
+    segments = []
+    for i in range(n):
+        pos += rng.randrange(0, 1_500)
+        segments.append(SubtitleSegment(pos, pos + rng.randrange(200, 3_000), f"s{i}"))
+    track.segments = segments
+    return track
+
+
+def _loop_align(times: list[tuple[int, int]], gap_ms: int) -> list[tuple[int, int]]:
+    new_times = list(times)
+    for i in range(1, len(new_times)):
+        prev_end = new_times[i - 1][1]
+        s, e = new_times[i]
+        if s < prev_end + gap_ms:
+            shift = prev_end + gap_ms - s
+            new_times[i] = (s + shift, e + shift)
+    return new_times
+
+
+class TestSubtitleColumns:
+    def test_close_gaps_matches_loop(self):
+        track = _random_track(2_000)
+        old = [(s.start_ms, s.end_ms) for s in track]
+        cols = SubtitleColumns(track.segments)
+        cols.close_gaps(50)
+        assert cols.times() == _loop_align(old, 50)
+
+    def test_overlapping_pairs_matches_loop(self):
+        track = _random_track(2_000)
+        segs = track.segments
+        expected = [(i, i + 1) for i in range(len(segs) - 1) if segs[i].end_ms > segs[i + 1].start_ms]
+        assert expected
+        assert track.find_overlapping_pairs() == expected
+
+    def test_shift_clamps_start_and_length(self):
+        cols = SubtitleColumns([SubtitleSegment(100, 400, "a"), SubtitleSegment(1_000, 1_200, "b")])
+        cols.shift(-300)
+        assert cols.times() == [(0, 100), (700, 900)]
+
+    def test_clamp_to_range(self):
+        cols = SubtitleColumns([
+            SubtitleSegment(-50, 100, "a"), SubtitleSegment(900, 1_500, "b"), SubtitleSegment(2_000, 2_500, "c"),
+        ])
+        cols.clamp(0, 1_000)
+        assert cols.times() == [(0, 100), (900, 1_000), (999, 1_000)]
+
+    def test_commit_writes_changed_rows_only(self):
+        segments = [SubtitleSegment(0, 100, "a"), SubtitleSegment(50, 150, "b")]
+        cols = SubtitleColumns(segments)
+        cols.close_gaps(0)
+        assert cols.commit() == 1
+        assert (segments[1].start_ms, segments[1].end_ms) == (100, 200)
+        assert write_times(segments, cols.start_ms, cols.end_ms) == 0
+
+    def test_srt_times_match_scalar_format(self):
+        values = [0, -5, 999, 61_001, 3_599_999, 3_600_000, 99 * 3_600_000 + 1, 100 * 3_600_000 + 7]
+        assert srt_times(np.array(values)) == [ms_to_srt_time(v) for v in values]
+        assert srt_times(np.array(values[:-1])) == [ms_to_srt_time(v) for v in values[:-1]]
+
+
+class TestBatchShiftCommand:
+    def test_undo_restores_clamped_times(self):
+        from src.ui.commands import BatchShiftCommand
+
+        track = SubtitleTrack()
+        track.add_segment(SubtitleSegment(100, 400, "a"))
+        cmd = BatchShiftCommand(track, -300)
+        cmd.redo()
+        assert (track[0].start_ms, track[0].end_ms) == (0, 100)
+        cmd.undo()
+        assert (track[0].start_ms, track[0].end_ms) == (100, 400)
+
+
+@pytest.mark.slow
+class TestColumnarBenchmark:
+    """10만 세그먼트 일괄 편집 — 객체 루프 대비."""
+
+    def test_bulk_ops_100k(self):
+        track = _random_track(100_000)
+        old = [(s.start_ms, s.end_ms) for s in track]
+
+        t0 = time.perf_counter()
+        expected = _loop_align(old, 50)
+        loop_align = time.perf_counter() - t0
+
+        t0 = time.perf_counter()
+        cols = SubtitleColumns(track.segments)
+        cols.close_gaps(50)
+        pairs = cols.overlapping_pairs()
+        cols_align = time.perf_counter() - t0
+        assert cols.times() == expected and len(pairs) == 0
+
+        starts = np.array([s for s, _ in old], dtype=np.int64)
+        t0 = time.perf_counter()
+        loop_srt = [ms_to_srt_time.__wrapped__(s) for s in starts.tolist()]
+        loop_fmt = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        assert srt_times(starts) == loop_srt
+        cols_fmt = time.perf_counter() - t0
+
+        print(
+            f"\n100k align: loop {loop_align * 1000:.1f}ms, columns {cols_align * 1000:.1f}ms; "
+            f"srt times: loop {loop_fmt * 1000:.1f}ms, columns {cols_fmt * 1000:.1f}ms"
+        )
+        assert cols_align < loop_align
+        assert cols_fmt < loop_fmt
@@ -96,3 +96,17 @@ def test_text_overlay_from_dict_defaults():
     assert ov.x_percent == 10.0
     assert ov.alignment == "center" # Default
     assert ov.v_alignment == "middle" # Default
+
+def test_text_overlay_track_indices_at():
+    """Interval tree lookup returns indices and follows add/remove/mark_modified."""
+    track = TextOverlayTrack()
+    track.add_overlay(TextOverlay(start_ms=0, end_ms=10_000, text="long"))
+    for i in range(1, 6):
+        track.add_overlay(TextOverlay(start_ms=i * 1000, end_ms=i * 1000 + 500, text=f"t{i}"))
+    assert track.indices_at(3200) == [0, 3]
+    assert track.indices_at(3600) == [0]
+    track.remove_overlay(0)
+    assert track.indices_at(3200) == [2]
+    track[2].start_ms = 3600
+    track.mark_modified()
+    assert track.indices_at(3200) == []
@@ -17,6 +17,7 @@ def _make_service(cache_size: int = 5):
 
     QObject.__init__ 및 QThreadPool은 mock으로 대체.
     """
+    from src.services.media_fingerprint import CacheKeyMemo
     from src.services.timeline_thumbnail_service import TimelineThumbnailService
 
     with (
@@ -27,6 +28,7 @@ def _make_service(cache_size: int = 5):
         svc._cache = collections.OrderedDict()
         svc._cache_size = cache_size
         svc._pending_requests = set()
+        svc._keys = CacheKeyMemo()
         svc._thread_pool = MagicMock()
         # thumbnail_ready는 실제 Signal이 아니므로 mock 처리
         svc.thumbnail_ready = MagicMock()
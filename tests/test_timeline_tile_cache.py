@@ -0,0 +1,326 @@
+"""타임라인 정적 레이어 타일 캐시 테스트 — LRU 예산, 타일 범위, 스크롤 재사용, 레인별 무효화, LOD, 스크롤 벤치마크."""
+
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+from PySide6.QtGui import QPixmap
+from PySide6.QtWidgets import QApplication
+
+from src.models.project import ProjectState
+from src.models.subtitle import SubtitleSegment
+from src.models.video_clip import VideoClip, VideoClipTrack
+from src.ui.timeline_painter import LANE_AUDIO, LANE_RULER, LANE_SUBTITLE, video_lane
+from src.ui.timeline_tile_cache import (
+    TILE_W,
+    TileCache,
+    tile_origin_ms,
+    visible_tiles,
+    zoom_key,
+)
+
+# QApplication 인스턴스 보장
+_app = QApplication.instance() or QApplication([])
+
+
+def _make_timeline(duration_ms: int, n_segments: int, n_clips: int = 24):
+    from src.ui.timeline_widget import TimelineWidget
+
+    project = ProjectState()
+    clip_ms = duration_ms // n_clips
+    project.video_tracks = [VideoClipTrack(clips=[VideoClip(0, clip_ms) for _ in range(n_clips)])]
+    project.duration_ms = duration_ms
+    step = duration_ms // n_segments
+    for i in range(n_segments):
+        project.subtitle_track.add_segment(
+            SubtitleSegment(i * step, i * step + step * 3 // 4, f"segment {i}")
+        )
+    tw = TimelineWidget()
+    tw.resize(1200, 300)
+    tw.set_project(project)
+    tw.set_track(project.subtitle_track)
+    tw.set_duration(duration_ms, has_video=True)
+    tw.set_zoom_percent(2000)
+    return tw
+
+
+class TestTileCache:
+    def test_lru_eviction_under_budget(self):
+        one_tile = 100 * 100 * 4
+        cache = TileCache(budget_bytes=one_tile * 3)
+        for i in range(3):
+            cache.put(i, QPixmap(100, 100))
+        cache.get(0)  # 0을 최근 사용으로 갱신 → 1이 가장 오래됨
+        cache.put(3, QPixmap(100, 100))
+        assert 1 not in cache
+        assert 0 in cache and 3 in cache
+        assert cache.nbytes <= cache.budget_bytes
+
+    def test_newest_tile_kept_even_if_over_budget(self):
+        cache = TileCache(budget_bytes=10)
+        cache.put("a", QPixmap(100, 100))
+        assert "a" in cache and len(cache) == 1
+
+    def test_replace_same_key_does_not_leak_bytes(self):
+        cache = TileCache()
+        cache.put("a", QPixmap(100, 100))
+        size = cache.nbytes
+        cache.put("a", QPixmap(100, 100))
+        assert cache.nbytes == size
+
+    def test_clear(self):
+        cache = TileCache()
+        cache.put("a", QPixmap(10, 10))
+        cache.clear()
+        assert len(cache) == 0 and cache.nbytes == 0
+
+
+class TestTileGeometry:
+    def test_visible_tiles_cover_viewport(self):
+        ppm = 0.1  # 1px = 10ms
+        # 뷰포트 시작 1000px, 폭 1200px → 1000..2199px
+        tiles = visible_tiles(10_000, ppm, 1200)
+        assert tiles[0] == 1000 // TILE_W
+        assert tiles[-1] == 2199 // TILE_W
+
+    def test_tile_origin_round_trip(self):
+        ppm = 0.037
+        assert tile_origin_ms(5, ppm) * ppm == pytest.approx(5 * TILE_W)
+
+    def test_zoom_key_ignores_float_noise(self):
+        ppm = 1200 / 7_200_000
+        assert zoom_key(ppm) == zoom_key(1200 / (1200 / ppm))
+
+    def test_degenerate_viewport(self):
+        assert len(visible_tiles(0, 0.0, 1200)) == 0
+        assert len(visible_tiles(0, 0.1, 0)) == 0
+
+
+def _lane_count(tw) -> int:
+    return len({key[0] for key in tw._painter._tiles._tiles})
+
+
+class TestTimelineTiles:
+    def test_pan_renders_only_exposed_tiles(self):
+        tw = _make_timeline(600_000, 500)
+        tw.grab()
+        tiles = tw._painter._tiles
+        misses = tiles.misses
+        # 반 타일만큼 스크롤 → 레인마다 새 타일은 최대 1장
+        tw._visible_start_ms += (TILE_W / 2) / tw._px_per_ms
+        tw.grab()
+        assert tiles.misses - misses <= _lane_count(tw)
+
+    def test_scroll_back_hits_cache(self):
+        tw = _make_timeline(600_000, 500)
+        start = tw._visible_start_ms
+        tw.grab()
+        tw._visible_start_ms = start + 3 * TILE_W / tw._px_per_ms
+        tw.grab()
+        misses = tw._painter._tiles.misses
+        tw._visible_start_ms = start
+        tw.grab()
+        assert tw._painter._tiles.misses == misses
+
+
+class TestLaneInvalidation:
+    """레인별 버전 — 한 레인의 변경은 그 레인의 타일만 다시 렌더링한다."""
+
+    @staticmethod
+    def _rendered_lanes(tw, action) -> set:
+        tw.grab()
+        before = set(tw._painter._tiles._tiles)
+        action()
+        tw.grab()
+        return {key[0] for key in set(tw._painter._tiles._tiles) - before}
+
+    def test_selection_does_not_rerender(self):
+        tw = _make_timeline(600_000, 500)
+        tw.grab()
+        first = tw._painter._tiles.misses
+        tw.select_segment(3)
+        tw.select_clip(0, 1)
+        tw.grab()
+        assert tw._painter._tiles.misses == first
+
+    def test_segment_edit_rerenders_subtitle_lanes_only(self):
+        tw = _make_timeline(600_000, 500)
+
+        def move():
+            tw._track[0].end_ms += 100
+            tw._invalidate_lane(LANE_SUBTITLE, LANE_AUDIO)
+
+        assert self._rendered_lanes(tw, move) == {LANE_SUBTITLE, LANE_AUDIO}
+
+    def test_count_change_detected_without_invalidate_call(self):
+        tw = _make_timeline(600_000, 500)
+
+        def add():
+            tw._track.add_segment(SubtitleSegment(10, 20, "new"))
+
+        assert self._rendered_lanes(tw, add) == {LANE_SUBTITLE, LANE_AUDIO}
+
+    def test_clip_edit_rerenders_one_video_track(self):
+        tw = _make_timeline(600_000, 500)
+        tw._project.video_tracks.append(VideoClipTrack(clips=[VideoClip(0, 60_000)]))
+
+        def trim():
+            tw._project.video_tracks[0].clips[0].source_out_ms -= 100
+            tw._invalidate_lane(video_lane(0))
+
+        assert self._rendered_lanes(tw, trim) == {video_lane(0)}
+
+    def test_hidden_lane_not_drawn(self):
+        tw = _make_timeline(600_000, 500)
+        tw.grab()
+        tw._track.hidden = True
+        tw._painter._tiles.clear()
+        tw.grab()
+        assert LANE_SUBTITLE not in {key[0] for key in tw._painter._tiles._tiles}
+
+    def test_full_invalidate_clears_all(self):
+        tw = _make_timeline(600_000, 500)
+        tw.grab()
+        tw.refresh()
+        misses = tw._painter._tiles.misses
+        tw.grab()
+        assert tw._painter._tiles.misses - misses == len(tw._painter._tiles)
+
+
+    def test_command_refresh_keeps_unchanged_lanes(self):
+        """undo/redo 후 _refresh_all_widgets 순서 — 같은 객체면 내용 레인만 다시 그린다."""
+        tw = _make_timeline(600_000, 500)
+        project = tw._project
+
+        def refresh():
+            tw.set_clip_track(project.video_clip_track)
+            tw.set_duration(project.duration_ms, has_video=project.has_video)
+            tw.set_project(project)
+
+        refresh()
+        version = tw._static_version
+        lanes = self._rendered_lanes(tw, refresh)
+        assert tw._static_version == version
+        assert LANE_RULER not in lanes and {LANE_SUBTITLE, video_lane(0)} <= lanes
+
+        tw.set_project(ProjectState())
+        assert tw._static_version == version + 1
+
+    def test_clip_move_refreshes_waveform_priorities(self):
+        """클립 이동은 비디오 레인 버전만 올린다 — 웨이브폼 우선순위도 다시 계산해야 한다."""
+        tw = _make_timeline(600_000, 50)
+        svc = MagicMock()
+        tw._waveform_service = svc
+        painter = tw._painter
+        painter._update_waveform_priorities(60_000)
+        painter._update_waveform_priorities(60_000)
+        assert svc.update_priorities.call_count == 1
+
+        tw._invalidate_lane(video_lane(0))
+        painter._update_waveform_priorities(60_000)
+        assert svc.update_priorities.call_count == 2
+
+@pytest.mark.slow
+class TestScrollBenchmark:
+    """2시간·5000 세그먼트 프로젝트 패닝 프레임 시간."""
+
+    def test_pan_frame_time(self):
+        tw = _make_timeline(2 * 60 * 60 * 1000, 5000, n_clips=120)
+        step_ms = 40 / tw._px_per_ms  # 프레임당 40px 패닝
+        tw.grab()
+
+        frames = []
+        for _ in range(120):
+            tw._visible_start_ms += step_ms
+            t0 = time.perf_counter()
+            tw.grab()
+            frames.append(time.perf_counter() - t0)
+
+        tiles = tw._painter._tiles
+        frames.sort()
+        median_ms = frames[len(frames) // 2] * 1000
+        p95_ms = frames[int(len(frames) * 0.95)] * 1000
+        print(
+            f"\npan frame: median {median_ms:.2f}ms, p95 {p95_ms:.2f}ms, "
+            f"tiles rendered {tiles.misses}, reused {tiles.hits}, cache {tiles.nbytes / 1e6:.1f}MB"
+        )
+        # 40px씩 120프레임 = 4800px → 레인마다 새로 드러나는 타일은 약 12장 + 초기 화면
+        per_lane = 4800 // TILE_W + len(visible_tiles(0, 1.0, tw.width())) + 2
+        assert tiles.misses <= per_lane * _lane_count(tw)
+        assert tiles.hits > tiles.misses
+
+
+class TestSpatialIndex:
+    """레인 공간 인덱스 — 화면/커서 범위 질의와 모델 편집 후 갱신."""
+
+    def test_hit_test_uses_index_on_large_track(self):
+        tw = _make_timeline(6_000_000, 10_000)
+        tw._playhead_ms = 0
+        tw._px_per_ms = 0.5  # 세그먼트 600ms = 300px
+        seg = tw._track[7_000]
+        tw._visible_start_ms = seg.start_ms - 1_000
+        y = tw._subtitle_track_y() + 5
+        mid_x = tw._ms_to_x((seg.start_ms + seg.end_ms) / 2)
+        assert tw._hit_test(mid_x, y) == (7_000, "body", 0)
+        assert tw._hit_test(tw._ms_to_x(seg.start_ms) + 1, y) == (7_000, "left_edge", 0)
+
+    def test_index_follows_lane_invalidation(self):
+        tw = _make_timeline(600_000, 500)
+        tw._playhead_ms = 0
+        seg = tw._track[100]
+        index = tw._lane_index(LANE_SUBTITLE)
+        assert tw._lane_index(LANE_SUBTITLE) is index
+        seg.start_ms += 50
+        tw._invalidate_lane(LANE_SUBTITLE)
+        assert tw._lane_index(LANE_SUBTITLE).starts[100] == seg.start_ms
+
+    def test_tile_draws_only_visible_items(self):
+        tw = _make_timeline(6_000_000, 10_000)
+        tw.grab()
+        painter = tw._painter
+        visible = painter._visible_indices(LANE_SUBTITLE)
+        assert 0 < len(visible) < len(tw._track) // 20
+
+
+class TestLevelOfDetail:
+    """촘촘한 레인은 밀도 막대 1장으로, 확대하면 개별 항목으로 그린다."""
+
+    @staticmethod
+    def _draw_subtitle_tile(tw, tile_index: int = 0) -> MagicMock:
+        painter = tw._painter
+        painter._origin_ms = tile_index * TILE_W / tw._px_per_ms
+        painter._view_w = TILE_W
+        mock = MagicMock()
+        painter._draw_segments(mock, tw.height())
+        return mock
+
+    def test_dense_lane_collapses_to_density_bar(self):
+        tw = _make_timeline(3 * 60 * 60 * 1000, 8_000)
+        mock = self._draw_subtitle_tile(tw)
+        mock.drawImage.assert_called_once()
+        mock.drawText.assert_not_called()
+        mock.drawRoundedRect.assert_not_called()
+
+    def test_zoom_in_restores_detail(self):
+        tw = _make_timeline(3 * 60 * 60 * 1000, 8_000)
+        tw._px_per_ms = 0.2
+        mock = self._draw_subtitle_tile(tw)
+        mock.drawImage.assert_not_called()
+        assert mock.drawRoundedRect.call_count >= 1
+        assert mock.drawText.call_count >= 1
+
+    def test_paint_time_flat_as_items_grow(self):
+        def tile_time(n_segments: int) -> float:
+            tw = _make_timeline(3 * 60 * 60 * 1000, n_segments)
+            best = float("inf")
+            for _ in range(5):
+                t0 = time.perf_counter()
+                self._draw_subtitle_tile(tw)
+                best = min(best, time.perf_counter() - t0)
+            return best
+
+        small, large = tile_time(8_000), tile_time(80_000)
+        # 항목 10배 → 타일 비용은 질의/히스토그램(O(k))만 늘어난다
+        assert large < small * 5 + 0.002
@@ -0,0 +1,144 @@
+"""TimelineWaveformService 단위 테스트 — 동시 작업 제한, 우선순위, 중복 제거, 취소."""
+
+from __future__ import annotations
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.models.video_clip import VideoClip, VideoClipTrack
+from src.services.timeline_waveform_service import (
+    TimelineWaveformService,
+    compute_source_priorities,
+)
+
+
+@pytest.fixture
+def media(tmp_path):
+    paths = []
+    for name in ("a.mp4", "b.mp4", "c.mp4", "d.mp4"):
+        p = tmp_path / name
+        p.write_bytes(b"\x00")
+        paths.append(str(p))
+    return paths
+
+
+def _make_service(max_workers: int = 2) -> TimelineWaveformService:
+    """스레드를 띄우지 않도록 _start_worker를 가짜 작업 등록으로 대체."""
+    svc = TimelineWaveformService(max_workers=max_workers)
+    svc.started: list[str] = []
+
+    def _fake_start(path: str) -> None:
+        svc._workers[path] = MagicMock()
+        svc._threads[path] = MagicMock()
+        svc.started.append(path)
+
+    svc._start_worker = _fake_start
+    return svc
+
+
+class TestPoolLimit:
+    def test_default_pool_size_bounded(self):
+        with patch("src.services.timeline_waveform_service.os.cpu_count", return_value=32):
+            assert TimelineWaveformService().max_workers == 4
+        with patch("src.services.timeline_waveform_service.os.cpu_count", return_value=1):
+            assert TimelineWaveformService().max_workers == 1
+
+    def test_only_max_workers_started(self, media):
+        svc = _make_service(max_workers=2)
+        for p in media:
+            svc.request_waveform(p)
+        assert svc.started == media[:2]
+        assert svc.pending_sources() == media[2:]
+
+    def test_finished_slot_starts_next(self, media):
+        svc = _make_service(max_workers=1)
+        for p in media[:2]:
+            svc.request_waveform(p)
+        thread = svc._threads[media[0]]
+        svc._cleanup_worker(media[0], thread)
+        assert svc.started == media[:2]
+
+
+class TestPriority:
+    def test_highest_priority_dispatched_first(self, media):
+        svc = _make_service(max_workers=1)
+        svc.request_waveform(media[0], priority=0)
+        svc.request_waveform(media[1], priority=10)
+        svc.request_waveform(media[2], priority=500)
+        svc._cleanup_worker(media[0], svc._threads[media[0]])
+        assert svc.started == [media[0], media[2]]
+
+    def test_duplicate_request_raises_priority(self, media):
+        svc = _make_service(max_workers=1)
+        svc.request_waveform(media[0])
+        svc.request_waveform(media[1], priority=1)
+        svc.request_waveform(media[2], priority=5)
+        svc.request_waveform(media[1], priority=50)
+        svc.request_waveform(media[1], priority=3)  # 낮은 값은 무시
+        assert svc.pending_sources() == [media[1], media[2]]
+
+    def test_update_priorities_reorders_pending(self, media):
+        svc = _make_service(max_workers=1)
+        for p in media:
+            svc.request_waveform(p)
+        svc.update_priorities({media[0]: 0, media[1]: 1, media[2]: 0, media[3]: 900})
+        assert svc.pending_sources()[0] == media[3]
+
+
+class TestCancel:
+    def test_removed_sources_cancelled(self, media):
+        svc = _make_service(max_workers=1)
+        for p in media[:3]:
+            svc.request_waveform(p)
+        running_worker = svc._workers[media[0]]
+        svc.update_priorities({media[2]: 0})
+        running_worker.cancel.assert_called_once()
+        assert media[0] not in svc._workers
+        assert svc.pending_sources() == [media[2]]
+
+    def test_cancelled_job_keeps_slot_until_thread_exits(self, media):
+        svc = _make_service(max_workers=1)
+        svc.request_waveform(media[0])
+        svc.request_waveform(media[1])
+        thread = svc._threads[media[0]]
+        svc.cancel(media[0])
+        assert svc.active_count() == 1
+        assert svc.started == [media[0]]
+        svc._cleanup_worker(media[0], thread)
+        assert svc.started == [media[0], media[1]]
+
+    def test_status_reported(self, media):
+        svc = _make_service(max_workers=1)
+        messages = []
+        svc.status_updated.connect(lambda p, m: messages.append((p, m)))
+        svc.request_waveform(media[0])
+        svc.request_waveform(media[1])
+        svc.cancel(media[1])
+        assert (media[1], "Waveform queued") in messages
+        assert (media[1], "Waveform cancelled") in messages
+
+
+class TestCacheKeys:
+    def test_cache_lookups_do_not_stat(self, media):
+        svc = _make_service()
+        svc.put_waveform(media[0], MagicMock())
+        with patch("src.services.media_fingerprint.os.stat", side_effect=AssertionError("stat")):
+            assert svc.get_waveform(media[0]) is not None
+            svc.request_waveform(media[0])
+        assert svc.started == []
+        assert media[0] in svc._watcher.files()
+
+
+class TestSourcePriorities:
+    def test_on_screen_duration_per_source(self):
+        track = VideoClipTrack(clips=[
+            VideoClip(0, 10_000, source_path="a.mp4"),
+            VideoClip(0, 10_000, source_path="b.mp4"),
+            VideoClip(0, 10_000, source_path="a.mp4"),
+            VideoClip(0, 10_000, source_path=None),
+        ])
+        prio = compute_source_priorities([track], 5_000, 15_000)
+        assert prio == {"a.mp4": 5_000, "b.mp4": 5_000}
+        prio = compute_source_priorities([track], 0, 5_000)
+        assert prio == {"a.mp4": 5_000, "b.mp4": 0}
@@ -0,0 +1,168 @@
+"""undo 기록 메모리 테스트 — 스냅샷 청크 공유·정확 복원, 바이트 한도로 오래된 기록 버리기."""
+
+from __future__ import annotations
+
+import pytest
+
+from src.models.image_overlay import ImageOverlay, ImageOverlayTrack
+from src.models.project import ProjectState
+from src.models.subtitle import SubtitleSegment, SubtitleTrack
+from src.models.video_clip import VideoClip
+from src.utils.undo_memory import TimeSnapshot, UndoMemoryBudget, approx_bytes
+
+
+def _segments(n: int) -> list[SubtitleSegment]:
+    return [SubtitleSegment(i * 100, i * 100 + 80, f"s{i}") for i in range(n)]
+
+
+def _times(items) -> list[tuple[int, int]]:
+    return [(it.start_ms, it.end_ms) for it in items]
+
+
+class TestTimeSnapshot:
+    def test_restore_membership_and_times(self):
+        segs = _segments(500)
+        before = list(segs)
+        snap = TimeSnapshot.capture(segs)
+        old_times = _times(segs)
+        segs[10].start_ms += 7
+        del segs[200:210]
+        segs.insert(0, SubtitleSegment(0, 5, "new"))
+        assert snap.restore(segs) == 1
+        assert segs == before and all(a is b for a, b in zip(segs, before))
+        assert _times(segs) == old_times
+
+    def test_consecutive_snapshots_share_unchanged_chunks(self):
+        segs = _segments(5_000)
+        first = TimeSnapshot.capture(segs)
+        segs[4_000].end_ms += 10
+        segs.insert(2_500, SubtitleSegment(250_000, 250_050, "x"))
+        second = TimeSnapshot.capture(segs)
+        shared = {id(c) for c in first.chunks} & {id(c) for c in second.chunks}
+        assert len(shared) >= len(second.chunks) - 3
+
+        seen: set[int] = set()
+        first_bytes = approx_bytes(first, seen)
+        second_bytes = approx_bytes(second, seen)
+        assert second_bytes < first_bytes // 10
+
+    def test_empty_list(self):
+        segs: list = []
+        snap = TimeSnapshot.capture(segs)
+        segs.append(SubtitleSegment(0, 1, "a"))
+        snap.restore(segs)
+        assert segs == []
+
+
+class TestUndoMemoryBudget:
+    def test_drop_count_keeps_newest_within_limit(self):
+        budget = UndoMemoryBudget(100)
+        assert budget.drop_count([40, 40, 40]) == 1
+        assert budget.drop_count([10, 20]) == 0
+        assert budget.drop_count([10, 500]) == 2
+
+
+class TestMoveVideoClipSnapshot:
+    def test_linked_move_undo_restores_order(self):
+        from src.ui.commands import MoveVideoClipCommand
+
+        project = ProjectState()
+        project.video_tracks[0].clips = [VideoClip(0, 1000), VideoClip(0, 1000), VideoClip(0, 1000)]
+        track = project.subtitle_tracks[0]
+        for s, e in [(100, 900), (1100, 1900), (2100, 2900)]:
+            track.add_segment(SubtitleSegment(s, e, "x"))
+        iot = ImageOverlayTrack()
+        iot.add_overlay(ImageOverlay(1200, 1800, "o.png"))
+        project.image_overlay_track = iot
+        before = _times(track)
+
+        # 두 번째 클립을 맨 뒤로 — 연결된 자막·오버레이가 +1000ms
+        cmd = MoveVideoClipCommand(project, 0, 1, 0, 3, track, iot, move_linked=True)
+        cmd.redo()
+        assert _times(track) == [(100, 900), (2100, 2900), (2100, 2900)]
+        assert _times(iot) == [(2200, 2800)]
+        cmd.undo()
+        assert _times(track) == before
+        assert _times(iot) == [(1200, 1800)]
+
+
+class TestUndoHistoryBudget:
+    def test_oldest_history_dropped_over_limit(self, qapp):
+        from PySide6.QtGui import QUndoStack
+
+        from src.ui.commands import BatchShiftCommand
+        from src.ui.undo_history import UndoHistoryBudget
+
+        stack = QUndoStack()
+        track = SubtitleTrack(segments=_segments(2_000))
+        budget = UndoHistoryBudget(stack, 10**9)
+        stack.push(BatchShiftCommand(track, 10))
+        one = budget.history_bytes()
+        assert one > 0
+
+        budget.set_limit_bytes(int(one * 2.5))
+        for _ in range(4):
+            stack.push(BatchShiftCommand(track, 10))
+        assert sum(not stack.command(i).isObsolete() for i in range(stack.count())) == 2
+        assert budget.history_bytes() <= budget.limit_bytes
+        assert stack.command(0)._old_columns is None  # 기록을 놓았다
+
+        # 버려진 명령에 닿으면 실행하지 않고 제거된다
+        for _ in range(stack.count()):
+            stack.undo()
+        assert track[0].start_ms == 30
+
+    def test_macro_children_counted(self, qapp):
+        from PySide6.QtGui import QUndoStack
+
+        from src.ui.commands import BatchShiftCommand
+        from src.ui.undo_history import UndoHistoryBudget
+
+        stack = QUndoStack()
+        track = SubtitleTrack(segments=_segments(1_000))
+        budget = UndoHistoryBudget(stack, 10**9)
+        stack.push(BatchShiftCommand(track, 5))
+        single = budget.history_bytes()
+        stack.beginMacro("two")
+        stack.push(BatchShiftCommand(track, 5))
+        stack.push(BatchShiftCommand(track, 5))
+        stack.endMacro()
+        assert budget.history_bytes() > 2 * single
+
+
+    def test_each_command_measured_once(self, qapp, monkeypatch):
+        from PySide6.QtGui import QUndoStack
+
+        import src.ui.undo_history as uh
+        from src.ui.commands import BatchShiftCommand
+
+        measured = []
+        size_of = uh._command_bytes
+        monkeypatch.setattr(uh, "_command_bytes", lambda cmd, seen: measured.append(cmd) or size_of(cmd, seen))
+        stack = QUndoStack()
+        track = SubtitleTrack(segments=_segments(500))
+        budget = uh.UndoHistoryBudget(stack, 10**9)
+        for _ in range(5):
+            stack.push(BatchShiftCommand(track, 10))
+        assert len(measured) == 5
+        five = budget.history_bytes()
+
+        # undo 후 새 명령 — redo 쪽 명령은 스택과 합계에서 함께 빠진다
+        stack.undo()
+        stack.undo()
+        stack.push(BatchShiftCommand(track, 10))
+        assert len(measured) == 6
+        assert budget.history_bytes() == pytest.approx(five * 4 / 5, rel=0.05)
+
+@pytest.mark.slow
+def test_snapshot_history_memory_is_sublinear():
+    """같은 트랙을 100번 조금씩 고친 기록 — 전체 복사 100개보다 훨씬 작다."""
+    segs = _segments(20_000)
+    seen: set[int] = set()
+    full = approx_bytes(TimeSnapshot.capture(segs), set())
+    total = 0
+    for k in range(100):
+        segs[(k * 197) % len(segs)].end_ms += 1
+        total += approx_bytes(TimeSnapshot.capture(segs), seen)
+    print(f"\n100 snapshots of 20k items: {total / 1e6:.1f}MB shared vs {100 * full / 1e6:.1f}MB copied")
+    assert total < 100 * full / 5
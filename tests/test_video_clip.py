@@ -357,3 +357,142 @@ class TestVideoClipTrack:
         assert len(track) == 2
         assert list(track)[0].source_in_ms == 0
         assert track[1].source_in_ms == 8000
+
+
+# ------------------------------------------------------------------ Prefix cache
+
+
+class TestPrefixCache:
+    """접두사 합 캐시 — 재사용, 그리고 클립을 직접 수정해도 낡은 값을 돌려주지 않는지."""
+
+    @staticmethod
+    def _track() -> VideoClipTrack:
+        return VideoClipTrack(clips=[VideoClip(0, 1000), VideoClip(0, 2000), VideoClip(0, 3000)])
+
+    def test_reused_until_changed(self):
+        track = self._track()
+        assert track._build_prefix() is track._build_prefix()
+
+    def test_direct_trim_and_speed(self):
+        track = self._track()
+        assert track.clip_timeline_start(2) == 3000
+        track.clips[0].source_out_ms = 500
+        assert track.clip_timeline_start(2) == 2500
+        track.clips[1].speed = 2.0
+        assert track.clip_timeline_start(2) == 1500
+        assert track.output_duration_ms == 4500
+
+    def test_direct_transition_edit(self):
+        from src.models.video_clip import TransitionInfo
+
+        track = self._track()
+        track.clips[0].transition_out = TransitionInfo(duration_ms=100)
+        assert track.output_duration_ms == 5900
+        track.clips[0].transition_out.duration_ms = 300
+        assert track.output_duration_ms == 5700
+
+    def test_reorder_without_length_change(self):
+        track = self._track()
+        assert track.clip_timeline_start(1) == 1000
+        clip = track.clips.pop(0)
+        track.clips.append(clip)
+        assert track.clip_timeline_start(1) == 2000
+        track.clips[0], track.clips[2] = track.clips[2], track.clips[0]
+        assert track.clip_boundaries_ms() == [0, 1000, 4000, 6000]
+
+    def test_assigned_plain_list_tracked(self):
+        track = self._track()
+        track.output_duration_ms
+        track.clips = [VideoClip(0, 100)]
+        assert track.output_duration_ms == 100
+        track.clips.insert(0, track.clips[0])
+        assert track.output_duration_ms == 200
+
+    def test_mark_modified(self):
+        track = self._track()
+        prefix = track._build_prefix()
+        track.mark_modified()
+        assert track._build_prefix() is not prefix
+
+
+# ------------------------------------------------------------------ Source index
+
+
+def _linear_source_to_timeline(track, source_ms, source_path):
+    """인덱스 도입 전의 선형 탐색 — 결과 비교용."""
+    prefix = track.clip_boundaries_ms()
+    last = None
+    for i, clip in enumerate(track.clips):
+        if clip.source_path != source_path:
+            continue
+        if clip.source_in_ms <= source_ms < clip.source_out_ms:
+            return prefix[i] + int((source_ms - clip.source_in_ms) / clip.speed)
+        last = i
+    if last is not None and source_ms == track.clips[last].source_out_ms:
+        return prefix[last] + track.clips[last].duration_ms
+    return None
+
+
+class TestSourceIndex:
+    @staticmethod
+    def _multicam(n_clips: int, n_sources: int, seed: int = 3) -> VideoClipTrack:
+        import random
+
+        rng = random.Random(seed)
+        clips = []
+        for _ in range(n_clips):
+            start = rng.randrange(0, 600_000, 10)
+            clips.append(VideoClip(
+                start, start + rng.randrange(500, 20_000, 10),
+                source_path=f"cam{rng.randrange(n_sources)}.mp4",
+                speed=rng.choice([1.0, 1.0, 2.0, 0.5]),
+            ))
+        return VideoClipTrack(clips=clips)
+
+    def test_matches_linear_scan(self):
+        import random
+
+        track = self._multicam(300, 5)
+        rng = random.Random(9)
+        for _ in range(2_000):
+            src = f"cam{rng.randrange(5)}.mp4"
+            ms = rng.randrange(-1_000, 650_000)
+            assert track.source_to_timeline(ms, source_path=src) == _linear_source_to_timeline(track, ms, src)
+
+    def test_next_clip_source_in_keeps_timeline_order(self):
+        track = VideoClipTrack(clips=[VideoClip(5000, 6000), VideoClip(2000, 3000), VideoClip(8000, 9000)])
+        # 타임라인 순서상 첫 번째로 source_in이 더 큰 클립
+        assert track.next_clip_source_in(1000) == 5000
+        assert track.next_clip_source_in(5500) == 8000
+        assert track.next_clip_source_in(9000) is None
+
+    def test_tolerance_and_first_in_timeline_order(self):
+        track = VideoClipTrack(clips=[
+            VideoClip(0, 1000, source_path="a.mp4"),
+            VideoClip(5000, 6000, source_path="a.mp4"),
+            VideoClip(5000, 6000, source_path="b.mp4"),
+        ])
+        assert track.clip_index_at_source(5500, "b.mp4") == 2
+        assert track.clip_index_at_source(4950, "a.mp4") is None
+        assert track.clip_index_at_source(4950, "a.mp4", tolerance_ms=100) == 1
+        assert track.clip_index_at_source(5500) == 1
+
+    def test_index_follows_direct_edits(self):
+        track = VideoClipTrack(clips=[VideoClip(0, 1000, source_path="a.mp4")])
+        assert track.source_to_timeline(1500, source_path="a.mp4") is None
+        track.clips[0].source_out_ms = 2000
+        assert track.source_to_timeline(1500, source_path="a.mp4") == 1500
+        track.clips.append(VideoClip(3000, 4000, source_path="a.mp4"))
+        assert track.source_to_timeline(3500, source_path="a.mp4") == 2500
+
+    def test_multicam_lookup_scales(self):
+        import time
+
+        track = self._multicam(2_000, 20)
+        track.source_to_timeline(0, source_path="cam0.mp4")  # 인덱스 구축
+        t0 = time.perf_counter()
+        for ms in range(0, 600_000, 60):
+            track.source_to_timeline(ms, source_path="cam7.mp4")
+        elapsed = time.perf_counter() - t0
+        # 1만 번 질의 — 선형 탐색(클립 2000개)이라면 수 초
+        assert elapsed < 0.5
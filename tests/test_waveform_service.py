@@ -8,7 +8,12 @@ from pathlib import Path
 import numpy as np
 import pytest
 
-from src.services.waveform_service import WaveformData, compute_peaks_from_wav
+from src.services.waveform_service import (
+    RMS_WINDOW_MS,
+    WaveformData,
+    compute_peaks_from_wav,
+    loudness_gain_db,
+)
 
 
 def _create_test_wav(
@@ -16,11 +21,12 @@ def _create_test_wav(
     duration_ms: int = 1000,
     frequency: float = 440.0,
     sample_rate: int = 16000,
+    amplitude: float = 1.0,
 ) -> None:
     """Create a test WAV file with a sine wave."""
     n_samples = int(sample_rate * duration_ms / 1000)
     t = np.arange(n_samples) / sample_rate
-    samples = (np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
+    samples = (amplitude * np.sin(2 * np.pi * frequency * t) * 32767).astype(np.int16)
 
     with wave.open(str(path), "wb") as wf:
         wf.setnchannels(1)
@@ -124,3 +130,70 @@ class TestComputePeaks:
         assert result.duration_ms == 5000
         assert len(result.peaks_pos) == 5000
         assert len(result.peaks_neg) == 5000
+
+
+class TestLevels:
+    def test_rms_envelope_resolution(self, tmp_path):
+        wav_path = tmp_path / "sine.wav"
+        _create_test_wav(wav_path, duration_ms=1000, frequency=1000.0)
+        result = compute_peaks_from_wav(wav_path)
+
+        assert len(result.rms) == 1000 // RMS_WINDOW_MS
+        # 사인파 RMS = 1/sqrt(2)
+        assert np.allclose(result.rms, 1 / np.sqrt(2), atol=0.01)
+        assert result.rms_at(500) == pytest.approx(1 / np.sqrt(2), abs=0.01)
+
+    @pytest.mark.parametrize("sample_rate", [16000, 44100, 48000])
+    def test_full_scale_1khz_sine_is_minus_3_lufs(self, tmp_path, sample_rate):
+        """BS.1770: 0 dBFS 1 kHz 사인파 ≈ -3.01 LUFS."""
+        wav_path = tmp_path / "sine.wav"
+        _create_test_wav(wav_path, duration_ms=5000, frequency=1000.0, sample_rate=sample_rate)
+        result = compute_peaks_from_wav(wav_path)
+
+        assert result.integrated_lufs == pytest.approx(-3.01, abs=0.2)
+        assert result.loudness_at(4000) == pytest.approx(-3.01, abs=0.2)
+
+    def test_loudness_scales_with_level(self, tmp_path):
+        loud, quiet = tmp_path / "loud.wav", tmp_path / "quiet.wav"
+        _create_test_wav(loud, duration_ms=3000, frequency=1000.0)
+        _create_test_wav(quiet, duration_ms=3000, frequency=1000.0, amplitude=0.1)
+        diff = (
+            compute_peaks_from_wav(loud).integrated_lufs
+            - compute_peaks_from_wav(quiet).integrated_lufs
+        )
+        assert diff == pytest.approx(20.0, abs=0.3)
+
+    def test_stereo_loudness_sums_channels(self, tmp_path):
+        """BS.1770: 같은 신호가 두 채널에 있으면 한 채널보다 +3 LU."""
+        t = np.arange(3 * 16000) / 16000
+        tone = (0.5 * np.sin(2 * np.pi * 1000.0 * t) * 32767).astype(np.int16)
+        levels = {}
+        for name, right in (("left_only", np.zeros_like(tone)), ("both", tone)):
+            path = tmp_path / f"{name}.wav"
+            with wave.open(str(path), "wb") as wf:
+                wf.setnchannels(2)
+                wf.setsampwidth(2)
+                wf.setframerate(16000)
+                wf.writeframes(np.column_stack([tone, right]).tobytes())
+            levels[name] = compute_peaks_from_wav(path)
+        assert levels["both"].integrated_lufs - levels["left_only"].integrated_lufs == pytest.approx(3.01, abs=0.1)
+        # 웨이브폼은 여전히 첫 채널
+        np.testing.assert_array_equal(levels["both"].peaks_pos, levels["left_only"].peaks_pos)
+
+    def test_silence_has_no_integrated_loudness(self, tmp_path):
+        wav_path = tmp_path / "silent.wav"
+        _create_test_wav(wav_path, duration_ms=2000, amplitude=0.0)
+        result = compute_peaks_from_wav(wav_path)
+        assert result.integrated_lufs is None
+        assert loudness_gain_db(result, -14.0) == 0.0
+
+    def test_loudness_gain_db_clamped(self):
+        data = WaveformData(
+            peaks_pos=np.zeros(0, dtype=np.float32),
+            peaks_neg=np.zeros(0, dtype=np.float32),
+            duration_ms=0,
+            sample_rate=16000,
+            integrated_lufs=-23.0,
+        )
+        assert loudness_gain_db(data, -14.0) == pytest.approx(9.0)
+        assert loudness_gain_db(data, 20.0, max_gain_db=6.0) == pytest.approx(6.0)